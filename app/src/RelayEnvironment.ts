@@ -2,44 +2,115 @@ import { createFetchMultipartSubscription } from "@apollo/client/utilities/subsc
 import {
   Environment,
   FetchFunction,
+  GraphQLResponse,
   Network,
   Observable,
   RecordSource,
+  Sink,
   Store,
+  SubscribeFunction,
+  Variables,
 } from "relay-runtime";
 
 import { authFetch } from "@phoenix/authFetch";
-import { BASE_URL } from "@phoenix/config";
+import { BASE_URL, WS_BASE_URL } from "@phoenix/config";
 
 import { isObject } from "./typeUtils";
 
 const graphQLPath = BASE_URL + "/graphql";
+const graphQLWebSocketUrl = WS_BASE_URL + "/graphql";
 
 const isAuthenticationEnabled = window.Config.authenticationEnabled;
 const graphQLFetch = isAuthenticationEnabled ? authFetch : fetch;
 
 /**
- * Create an observable that fetches JSON from the given input and returns an error if
- * the data has errors.
+ * The SHA-256 hashes of the query texts, which are sent in place of the texts once the
+ * server has seen them, i.e. automatic persisted queries. See
+ * https://www.apollographql.com/docs/apollo-server/performance/apq for the protocol.
+ */
+const persistedQueryHashes = new Map<string, Promise<string | null>>();
+
+function getPersistedQueryHash(query: string): Promise<string | null> {
+  let hash = persistedQueryHashes.get(query);
+  if (hash === undefined) {
+    // crypto.subtle is only available in secure contexts, i.e. over HTTPS or on localhost
+    hash = window.crypto?.subtle
+      ? window.crypto.subtle
+          .digest("SHA-256", new TextEncoder().encode(query))
+          .then((digest) =>
+            Array.from(new Uint8Array(digest), (byte) =>
+              byte.toString(16).padStart(2, "0")
+            ).join("")
+          )
+          .catch(() => null)
+      : Promise.resolve(null);
+    persistedQueryHashes.set(query, hash);
+  }
+  return hash;
+}
+
+function isPersistedQueryNotFound(data: unknown): boolean {
+  return (
+    isObject(data) &&
+    "errors" in data &&
+    Array.isArray(data.errors) &&
+    data.errors.some(
+      (error) =>
+        isObject(error) &&
+        "message" in error &&
+        error.message === "PersistedQueryNotFound"
+    )
+  );
+}
+
+/**
+ * Posts a GraphQL query with the hash of its text, and posts the text as well only if the
+ * server has not seen it yet.
+ */
+async function fetchGraphQLJson(
+  query: string | null | undefined,
+  variables: Variables,
+  signal: AbortSignal
+): Promise<unknown> {
+  const post = (body: object) =>
+    graphQLFetch(graphQLPath, {
+      method: "POST",
+      headers: {
+        "Content-Type": "application/json",
+      },
+      body: JSON.stringify(body),
+      signal,
+    }).then((response) => response.json());
+  const sha256Hash = query ? await getPersistedQueryHash(query) : null;
+  if (!sha256Hash) {
+    return post({ query, variables });
+  }
+  const extensions = { persistedQuery: { version: 1, sha256Hash } };
+  const data = await post({ variables, extensions });
+  if (!isPersistedQueryNotFound(data)) {
+    return data;
+  }
+  return post({ query, variables, extensions });
+}
+
+/**
+ * Create an observable that fetches JSON and returns an error if the data has errors.
  *
  * The observable aborts in-flight network requests when the unsubscribe function is
  * called.
  *
- * @param input - The input to fetch from.
- * @param init - The request init options.
+ * @param fetchJson - A function that fetches the JSON, given the signal to abort with.
  * @param hasErrors - A function that returns an error if the data has errors.
  * @returns An observable that emits the data or an error.
  */
 function fetchJsonObservable<T>(
-  input: RequestInfo | URL,
-  init?: RequestInit,
+  fetchJson: (signal: AbortSignal) => Promise<unknown>,
   hasErrors?: (data: unknown) => Error | undefined
 ): Observable<T> {
   return Observable.create((sink) => {
     const controller = new AbortController();
 
-    graphQLFetch(input, { ...init, signal: controller.signal })
-      .then((response) => response.json())
+    fetchJson(controller.signal)
       .then((data) => {
         const error = hasErrors?.(data);
         if (error) {
@@ -73,17 +144,7 @@ function fetchJsonObservable<T>(
  */
 const fetchRelay: FetchFunction = (params, variables, _cacheConfig) =>
   fetchJsonObservable(
-    graphQLPath,
-    {
-      method: "POST",
-      headers: {
-        "Content-Type": "application/json",
-      },
-      body: JSON.stringify({
-        query: params.text,
-        variables,
-      }),
-    },
+    (signal) => fetchGraphQLJson(params.text, variables, signal),
     // GraphQL returns exceptions (for example, a missing required variable) in the "errors"
     // property of the response. If any exceptions occurred when processing the request,
     // throw an error to indicate to the developer what went wrong.
@@ -101,10 +162,147 @@ const fetchRelay: FetchFunction = (params, variables, _cacheConfig) =>
     }
   );
 
-const subscribe = createFetchMultipartSubscription(graphQLPath, {
+const subscribeOverHttp = createFetchMultipartSubscription(graphQLPath, {
   fetch: graphQLFetch,
 });
 
+/**
+ * Creates a subscribe function that multiplexes subscriptions over a single websocket per tab
+ * using the graphql-transport-ws protocol, see
+ * https://github.com/enisdenjo/graphql-ws/blob/master/PROTOCOL.md. The websocket is opened by
+ * the first subscription and closed once the last one is disposed.
+ *
+ * Unlike a multipart HTTP subscription, which holds one of the browser's few connections to the
+ * server for as long as it lasts, a long-lived subscription over the websocket holds none.
+ */
+function createWebSocketSubscribe(url: string): SubscribeFunction {
+  let socket: WebSocket | null = null;
+  let isAcknowledged = false;
+  let nextId = 0;
+  const sinks = new Map<string, Sink<GraphQLResponse>>();
+  const pendingMessages = new Map<string, string>();
+
+  const closeSocket = (error?: Error) => {
+    const closingSocket = socket;
+    socket = null;
+    isAcknowledged = false;
+    pendingMessages.clear();
+    const closedSinks = [...sinks.values()];
+    sinks.clear();
+    for (const sink of closedSinks) {
+      if (error) {
+        sink.error(error);
+      } else {
+        sink.complete();
+      }
+    }
+    if (
+      closingSocket &&
+      closingSocket.readyState !== WebSocket.CLOSING &&
+      closingSocket.readyState !== WebSocket.CLOSED
+    ) {
+      closingSocket.close(1000, "Normal Closure");
+    }
+  };
+
+  const openSocket = (): WebSocket => {
+    const newSocket = new WebSocket(url, "graphql-transport-ws");
+    newSocket.onopen = () =>
+      newSocket.send(JSON.stringify({ type: "connection_init", payload: {} }));
+    newSocket.onmessage = (event) => {
+      if (newSocket !== socket) {
+        return;
+      }
+      const message = JSON.parse(event.data);
+      const sink = message.id != null ? sinks.get(message.id) : undefined;
+      switch (message.type) {
+        case "connection_ack":
+          isAcknowledged = true;
+          pendingMessages.forEach((pendingMessage) =>
+            newSocket.send(pendingMessage)
+          );
+          pendingMessages.clear();
+          break;
+        case "ping":
+          newSocket.send(JSON.stringify({ type: "pong" }));
+          break;
+        case "next":
+          if (sink && Array.isArray(message.payload?.errors)) {
+            sinks.delete(message.id);
+            sink.error(
+              new Error(
+                `Error in GraphQL subscription: ${JSON.stringify(message.payload.errors)}`
+              )
+            );
+          } else {
+            sink?.next(message.payload);
+          }
+          break;
+        case "error":
+          sinks.delete(message.id);
+          sink?.error(
+            new Error(
+              `Error in GraphQL subscription: ${JSON.stringify(message.payload)}`
+            )
+          );
+          break;
+        case "complete":
+          sinks.delete(message.id);
+          sink?.complete();
+          break;
+      }
+    };
+    newSocket.onclose = (event) => {
+      if (newSocket === socket) {
+        closeSocket(
+          new Error(`GraphQL websocket closed: ${event.code} ${event.reason}`)
+        );
+      }
+    };
+    return newSocket;
+  };
+
+  return (params, variables) =>
+    Observable.create<GraphQLResponse>((sink) => {
+      const id = String(nextId++);
+      const message = JSON.stringify({
+        id,
+        type: "subscribe",
+        payload: { query: params.text, variables, operationName: params.name },
+      });
+      const currentSocket = socket ?? openSocket();
+      socket = currentSocket;
+      sinks.set(id, sink);
+      if (isAcknowledged) {
+        currentSocket.send(message);
+      } else {
+        pendingMessages.set(id, message);
+      }
+      return () => {
+        pendingMessages.delete(id);
+        // the sink is gone already if the server completed or errored the subscription
+        if (sinks.delete(id) && isAcknowledged) {
+          socket?.send(JSON.stringify({ id, type: "complete" }));
+        }
+        if (sinks.size === 0) {
+          closeSocket();
+        }
+      };
+    });
+}
+
+const subscribeOverWebSocket = createWebSocketSubscribe(graphQLWebSocketUrl);
+
+/**
+ * Subscriptions are made over HTTP unless they ask for the websocket, i.e. long-lived ones that
+ * would otherwise exhaust the browser's connections to the server when opened in several tabs,
+ * by setting `cacheConfig: { metadata: { transport: "websocket" } }`.
+ */
+const subscribe: SubscribeFunction = (params, variables, cacheConfig) =>
+  cacheConfig?.metadata?.transport === "websocket"
+    ? subscribeOverWebSocket(params, variables, cacheConfig)
+    : subscribeOverHttp(params, variables);
+
 // Export a singleton instance of Relay Environment configured with our network layer:
 export default new Environment({
   network: Network.create(fetchRelay, subscribe),
@@ -1,6 +1,17 @@
-import { startTransition, useCallback, useEffect, useRef } from "react";
-import { graphql, useRefetchableFragment } from "react-relay";
+import {
+  startTransition,
+  useCallback,
+  useEffect,
+  useRef,
+  useState,
+} from "react";
+import {
+  graphql,
+  useRefetchableFragment,
+  useRelayEnvironment,
+} from "react-relay";
 import { useLocation } from "react-router";
+import { GraphQLSubscriptionConfig, requestSubscription } from "relay-runtime";
 
 import { Switch } from "@arizeai/components";
 
@@ -8,9 +19,10 @@ import { useStreamState } from "@phoenix/contexts/StreamStateContext";
 import { useInterval } from "@phoenix/hooks/useInterval";
 
 import { StreamToggle_data$key } from "./__generated__/StreamToggle_data.graphql";
+import { StreamToggleSubscription } from "./__generated__/StreamToggleSubscription.graphql";
 
 /**
- * Check every few seconds for new data
+ * Check every few seconds for new data when the subscription is unavailable
  */
 const REFRESH_INTERVAL_MS = 2000;
 
@@ -26,6 +38,7 @@ export function StreamToggle(props: { project: StreamToggle_data$key }) {
     setFetchKey,
   } = useStreamState();
   const location = useLocation();
+  const environment = useRelayEnvironment();
   const currentPathTail = location.pathname.split("/").pop() || "";
   // Take into account both the current path and the streaming state for whether streaming is enabled
   // E.g. we don't want to stream when there is a sub-route active
@@ -46,14 +59,43 @@ export function StreamToggle(props: { project: StreamToggle_data$key }) {
     lastUpdatedAt.streamingLastUpdatedAt
   );
 
-  // Refetch lastUpdatedAt if the streaming toggle is on to detect when the underlying data changes
-  const refetchCountsIfStreaming = useCallback(() => {
-    if (isStreamingEnabled) {
+  // Subscribe to the changes of the project if the streaming toggle is on. The server pushes
+  // the project's lastUpdatedAt when its data changes, which updates the fragment above. The
+  // subscription goes over the websocket, so that it holds no HTTP connection while it lasts.
+  const projectId = lastUpdatedAt.id;
+  const [isSubscriptionUnavailable, setIsSubscriptionUnavailable] =
+    useState(false);
+  useEffect(() => {
+    if (!isStreamingEnabled || isSubscriptionUnavailable) {
+      return;
+    }
+    const config: GraphQLSubscriptionConfig<StreamToggleSubscription> = {
+      subscription: graphql`
+        subscription StreamToggleSubscription($projectId: GlobalID!) {
+          projectChanges(projectIds: [$projectId]) {
+            id
+            streamingLastUpdatedAt
+          }
+        }
+      `,
+      variables: { projectId },
+      cacheConfig: { metadata: { transport: "websocket" } },
+      // e.g. when a proxy does not let websockets through
+      onError: () => setIsSubscriptionUnavailable(true),
+    };
+    const subscription = requestSubscription(environment, config);
+    return subscription.dispose;
+  }, [environment, isStreamingEnabled, isSubscriptionUnavailable, projectId]);
+
+  // Fall back to refetching lastUpdatedAt if the subscription is unavailable
+  const refetchIfPolling = useCallback(() => {
+    if (isStreamingEnabled && isSubscriptionUnavailable) {
       startTransition(() => {
         refetchLastUpdatedAt({}, { fetchPolicy: "store-and-network" });
       });
     }
-  }, [isStreamingEnabled, refetchLastUpdatedAt]);
+  }, [isStreamingEnabled, isSubscriptionUnavailable, refetchLastUpdatedAt]);
+  useInterval(refetchIfPolling, REFRESH_INTERVAL_MS);
 
   // We want to refetch higher up the render tree when lastUpdatedAt changes
   const currentLastUpdatedAt = lastUpdatedAt.streamingLastUpdatedAt;
@@ -69,8 +111,6 @@ export function StreamToggle(props: { project: StreamToggle_data$key }) {
     }
   }, [setFetchKey, currentLastUpdatedAt]);
 
-  useInterval(refetchCountsIfStreaming, REFRESH_INTERVAL_MS);
-
   return (
     <Switch
       labelPlacement="start"
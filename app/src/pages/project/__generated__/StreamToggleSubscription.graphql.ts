@@ -0,0 +1,103 @@
+/**
+ * @generated SignedSource<<1d9d02e91d6b6dfde8ba38b3b295d2b2>>
+ * @lightSyntaxTransform
+ * @nogrep
+ */
+
+/* tslint:disable */
+/* eslint-disable */
+// @ts-nocheck
+
+import { ConcreteRequest } from 'relay-runtime';
+export type StreamToggleSubscription$variables = {
+  projectId: string;
+};
+export type StreamToggleSubscription$data = {
+  readonly projectChanges: ReadonlyArray<{
+    readonly id: string;
+    readonly streamingLastUpdatedAt: string | null;
+  }>;
+};
+export type StreamToggleSubscription = {
+  response: StreamToggleSubscription$data;
+  variables: StreamToggleSubscription$variables;
+};
+
+const node: ConcreteRequest = (function(){
+var v0 = [
+  {
+    "defaultValue": null,
+    "kind": "LocalArgument",
+    "name": "projectId"
+  }
+],
+v1 = [
+  {
+    "alias": null,
+    "args": [
+      {
+        "items": [
+          {
+            "kind": "Variable",
+            "name": "projectIds.0",
+            "variableName": "projectId"
+          }
+        ],
+        "kind": "ListValue",
+        "name": "projectIds"
+      }
+    ],
+    "concreteType": "Project",
+    "kind": "LinkedField",
+    "name": "projectChanges",
+    "plural": true,
+    "selections": [
+      {
+        "alias": null,
+        "args": null,
+        "kind": "ScalarField",
+        "name": "id",
+        "storageKey": null
+      },
+      {
+        "alias": null,
+        "args": null,
+        "kind": "ScalarField",
+        "name": "streamingLastUpdatedAt",
+        "storageKey": null
+      }
+    ],
+    "storageKey": null
+  }
+];
+return {
+  "fragment": {
+    "argumentDefinitions": (v0/*: any*/),
+    "kind": "Fragment",
+    "metadata": null,
+    "name": "StreamToggleSubscription",
+    "selections": (v1/*: any*/),
+    "type": "Subscription",
+    "abstractKey": null
+  },
+  "kind": "Request",
+  "operation": {
+    "argumentDefinitions": (v0/*: any*/),
+    "kind": "Operation",
+    "name": "StreamToggleSubscription",
+    "selections": (v1/*: any*/)
+  },
+  "params": {
+    "cacheID": "7cd1c3d1308aa4eefaa37347b53c25e0",
+    "id": null,
+    "metadata": {},
+    "name": "StreamToggleSubscription",
+    "operationKind": "subscription",
+    "text": "subscription StreamToggleSubscription(\n  $projectId: GlobalID!\n) {\n  projectChanges(projectIds: [$projectId]) {\n    id\n    streamingLastUpdatedAt\n  }\n}\n"
+  }
+};
+})();
+
+(node as any).hash = "815352c4b4df72cf490ba5861c94f2f1";
+
+export default node;
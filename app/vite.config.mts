@@ -1,14 +1,63 @@
 import { lezer } from "@lezer/generator/rollup";
 import react from "@vitejs/plugin-react";
-import { resolve } from "path";
+import { readdirSync, readFileSync, statSync, writeFileSync } from "fs";
+import { join, resolve } from "path";
 // Uncomment below to visualize the bundle size after running the build command, also uncomment plugins.push(visualizer());
 // import { visualizer } from "rollup-plugin-visualizer";
 /// <reference types="vitest/config" />
-import { defineConfig } from "vite";
+import { defineConfig, type Plugin } from "vite";
 import relay from "vite-plugin-relay";
+import { brotliCompressSync, constants, gzipSync } from "zlib";
+
+const COMPRESSIBLE_FILE = /\.(css|html|js|json|map|mjs|svg|txt|wasm)$/;
+const MIN_COMPRESSIBLE_SIZE = 1024;
+
+/**
+ * Writes brotli and gzip compressed copies of the text files of the build next to them,
+ * which the server sends in place of the originals to the clients that accept them
+ */
+function precompress(outDir: string): Plugin {
+  const compress = (dir: string) => {
+    for (const entry of readdirSync(dir, { withFileTypes: true })) {
+      const path = join(dir, entry.name);
+      if (entry.isDirectory()) {
+        compress(path);
+        continue;
+      }
+      if (
+        !COMPRESSIBLE_FILE.test(entry.name) ||
+        statSync(path).size < MIN_COMPRESSIBLE_SIZE
+      ) {
+        continue;
+      }
+      const content = readFileSync(path);
+      const brotli = brotliCompressSync(content, {
+        params: {
+          [constants.BROTLI_PARAM_QUALITY]: constants.BROTLI_MAX_QUALITY,
+          [constants.BROTLI_PARAM_SIZE_HINT]: content.length,
+        },
+      });
+      if (brotli.length < content.length) {
+        writeFileSync(`${path}.br`, brotli);
+      }
+      const gzip = gzipSync(content, { level: constants.Z_BEST_COMPRESSION });
+      if (gzip.length < content.length) {
+        writeFileSync(`${path}.gz`, gzip);
+      }
+    }
+  };
+  return {
+    name: "precompress",
+    apply: "build",
+    closeBundle() {
+      compress(outDir);
+    },
+  };
+}
 
 export default defineConfig(() => {
-  const plugins = [react(), relay, lezer()];
+  const outDir = resolve(__dirname, "../src/phoenix/server/static");
+  const plugins = [react(), relay, lezer(), precompress(outDir)];
   // Uncomment below to visualize the bundle size after running the build command also uncomment import { visualizer } from "rollup-plugin-visualizer";
   // plugins.push(visualizer());
   return {
@@ -43,7 +92,7 @@ export default defineConfig(() => {
     },
     build: {
       manifest: true,
-      outDir: resolve(__dirname, "../src/phoenix/server/static"),
+      outDir,
       emptyOutDir: true,
       rollupOptions: {
         input: resolve(__dirname, "src/index.tsx"),
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from importlib.util import find_spec
 from typing import Mapping, Optional
 
 import httpx
@@ -120,14 +121,15 @@ class AsyncClient:
                 Defaults to None. This is ignored if http_client is provided. Additional headers
                 may be added from the environment variables, but won't override specified values.
             http_client (Optional[httpx.AsyncClient]): An instance of httpx.AsyncClient to be used
-                for making HTTP requests. If not provided, a new instance will be created. Defaults
-                to None.
+                for making HTTP requests. If not provided, a new instance will be created,
+                negotiating HTTP/2 when the `h2` package is installed. Defaults to None.
         """  # noqa: E501
         if http_client is None:
             base_url = base_url or get_base_url()
             http_client = httpx.AsyncClient(
                 base_url=base_url,
                 headers=_update_headers(headers, api_key),
+                http2=_is_http2_available(),
             )
         self._client = http_client
 
@@ -204,6 +206,11 @@ def _update_headers(
     return headers
 
 
+def _is_http2_available() -> bool:
+    # httpx negotiates HTTP/2 only if the optional `h2` package is installed
+    return find_spec("h2") is not None
+
+
 class _WrappedClient(httpx.Client):
     def __del__(self) -> None:
         try:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import logging
 from typing import TYPE_CHECKING, Any, Iterable, Iterator, Literal, Optional, cast, get_args
 
@@ -7,6 +8,11 @@ import httpx
 from typing_extensions import TypeAlias
 
 from phoenix.client.__generated__ import v1
+from phoenix.client.utils.concurrency import (
+    DEFAULT_MAX_CONCURRENCY,
+    gather_with_max_concurrency,
+    send_with_retries,
+)
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -334,12 +340,14 @@ class AsyncAnnotations:
         annotation_name: Optional[str] = None,
         annotator_kind: Optional[Literal["LLM", "CODE", "HUMAN"]] = None,
         sync: bool = False,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ) -> Optional[list[v1.InsertedSpanAnnotation]]:
         """Log multiple span annotations from a pandas DataFrame asynchronously.
 
         This method allows you to create multiple span annotations at once by providing the data in a pandas DataFrame.
         The DataFrame can either include `name` and `annotator_kind` columns or you can specify global values for all rows.
-        The data is processed in chunks of 100 rows for efficient batch processing.
+        The data is processed in chunks of 100 rows for efficient batch processing, and up to `max_concurrency` chunks
+        are sent concurrently over the pooled connections of the client.
 
         Args:
             dataframe: A pandas DataFrame containing the annotation data. Must include either a "name" column or provide
@@ -353,13 +361,17 @@ class AsyncAnnotations:
                 for all rows and the DataFrame does not need to include a "name" column.
             sync: If True, the request will be fulfilled synchronously and the response will contain
                 the inserted annotation IDs. If False, the request will be processed asynchronously.
+            max_concurrency: The maximum number of chunks in flight at once. Defaults to 8.
 
         Returns:
-            If sync is True, a list of all inserted span annotations. If sync is False, None.
+            If sync is True, a list of all inserted span annotations, in the order of the rows of the DataFrame.
+            If sync is False, None.
 
         Raises:
             ImportError: If pandas is not installed.
             ValueError: If the DataFrame is missing required columns or if no valid annotation data is provided.
+            httpx.HTTPError: If a request fails after retries. Chunks in flight are cancelled, but chunks that
+                were already sent are not rolled back.
 
         Example:
             ```python
@@ -385,20 +397,23 @@ class AsyncAnnotations:
             )
             ```
         """  # noqa: E501
-        # Process DataFrame chunks using iterator
-        all_responses: list[v1.InsertedSpanAnnotation] = []
-        for chunk in _chunk_dataframe(
+        # Send DataFrame chunks concurrently, delegating each to log_span_annotations
+        chunks = _chunk_dataframe(
             dataframe=dataframe,
             annotation_name=annotation_name,
             annotator_kind=annotator_kind,
             chunk_size=_DATAFRAME_CHUNK_SIZE,
-        ):
-            # Delegate to log_span_annotations
-            response = await self.log_span_annotations(span_annotations=chunk, sync=sync)
-            if sync and response:
-                all_responses.extend(response)
-
-        return all_responses if sync else None
+        )
+        responses = await gather_with_max_concurrency(
+            (
+                functools.partial(self.log_span_annotations, span_annotations=chunk, sync=sync)
+                for chunk in chunks
+            ),
+            max_concurrency=max_concurrency,
+        )
+        if not sync:
+            return None
+        return [annotation for response in responses if response for annotation in response]
 
     async def log_span_annotations(
         self,
@@ -459,7 +474,10 @@ class AsyncAnnotations:
         url = "v1/span_annotations"
         params = {"sync": sync} if sync else {}
         json_ = v1.AnnotateSpansRequestBody(data=list(span_annotations))
-        response = await self._client.post(url=url, json=json_, params=params)
+        # annotations are upserted, so the request can be retried on transient errors
+        response = await send_with_retries(
+            functools.partial(self._client.post, url=url, json=json_, params=params)
+        )
         response.raise_for_status()
         if not sync:
             return None
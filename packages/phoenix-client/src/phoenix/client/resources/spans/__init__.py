@@ -1,8 +1,9 @@
 import base64
+import functools
 import logging
 from datetime import datetime, timezone, tzinfo
 from io import StringIO
-from typing import TYPE_CHECKING, Iterable, Optional, Sequence, Union, cast
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Sequence, Union, cast
 
 import httpx
 
@@ -13,6 +14,11 @@ from phoenix.client.__generated__ import v1
 from phoenix.client.types.spans import (
     SpanQuery,
 )
+from phoenix.client.utils.concurrency import (
+    DEFAULT_MAX_CONCURRENCY,
+    gather_with_max_concurrency,
+    send_with_retries,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -107,7 +113,7 @@ class Spans:
 
             response = self._client.post(
                 url="v1/spans",
-                headers={"accept": "application/json"},
+                headers={"accept": _get_span_dataframe_media_type()},
                 params={"project_name": project_name} if project_name else None,
                 json=request_body,
                 timeout=timeout,
@@ -370,7 +376,7 @@ class AsyncSpans:
 
             response = await self._client.post(
                 url="v1/spans",
-                headers={"accept": "application/json"},
+                headers={"accept": _get_span_dataframe_media_type()},
                 params={"project_name": project_name} if project_name else None,
                 json=request_body,
                 timeout=timeout,
@@ -406,6 +412,7 @@ class AsyncSpans:
         project_identifier: str,
         limit: int = 1000,
         timeout: Optional[int] = DEFAULT_TIMEOUT_IN_SECONDS,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ) -> "pd.DataFrame":
         """
         Fetches span annotations and returns them as a pandas DataFrame.
@@ -419,6 +426,7 @@ class AsyncSpans:
             project_identifier: The project identifier (name or ID) used in the API path.
             limit: Maximum number of annotations returned per request page.
             timeout: Optional request timeout in seconds.
+            max_concurrency: Maximum number of batches of span IDs fetched concurrently.
 
         Returns:
             A DataFrame where each row corresponds to a single span annotation.
@@ -454,33 +462,13 @@ class AsyncSpans:
         if not span_ids_list:
             return pd.DataFrame()
 
-        annotations: list[v1.SpanAnnotation] = []
-        path = f"v1/projects/{project_identifier}/span_annotations"
-
-        for i in range(0, len(span_ids_list), _MAX_SPAN_IDS_PER_REQUEST):
-            batch_ids = span_ids_list[i : i + _MAX_SPAN_IDS_PER_REQUEST]
-            cursor: Optional[str] = None
-            while True:
-                params: dict[str, Union[int, str, Sequence[str]]] = {
-                    "span_ids": batch_ids,
-                    "limit": limit,
-                }
-                if cursor:
-                    params["cursor"] = cursor
-                response = await self._client.get(
-                    url=path,
-                    params=params,
-                    headers={"accept": "application/json"},
-                    timeout=timeout,
-                )
-                response.raise_for_status()
-                payload = response.json()
-                payload = cast(v1.SpanAnnotationsResponseBody, payload)
-                batch = cast(list[v1.SpanAnnotation], payload.get("data", []))
-                annotations.extend(batch)
-                cursor = payload.get("next_cursor")
-                if not cursor:
-                    break
+        annotations = await self._get_span_annotations(
+            span_ids=span_ids_list,
+            project_identifier=project_identifier,
+            limit=limit,
+            timeout=timeout,
+            max_concurrency=max_concurrency,
+        )
 
         df = pd.DataFrame(annotations)
         df = _flatten_nested_column(df, "result")
@@ -495,6 +483,7 @@ class AsyncSpans:
         project_identifier: str,
         limit: int = 1000,
         timeout: Optional[int] = DEFAULT_TIMEOUT_IN_SECONDS,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ) -> list[v1.SpanAnnotation]:
         """
         Fetches span annotations and returns them as a list of SpanAnnotation objects.
@@ -504,6 +493,7 @@ class AsyncSpans:
             project_identifier: The project identifier (name or ID) used in the API path.
             limit: Maximum number of annotations returned per request page.
             timeout: Optional request timeout in seconds.
+            max_concurrency: Maximum number of batches of span IDs fetched concurrently.
 
         Returns:
             A list of SpanAnnotation objects.
@@ -516,11 +506,27 @@ class AsyncSpans:
         if not span_ids_list:
             return []
 
-        annotations: list[v1.SpanAnnotation] = []
+        return await self._get_span_annotations(
+            span_ids=span_ids_list,
+            project_identifier=project_identifier,
+            limit=limit,
+            timeout=timeout,
+            max_concurrency=max_concurrency,
+        )
+
+    async def _get_span_annotations(
+        self,
+        *,
+        span_ids: Sequence[str],
+        project_identifier: str,
+        limit: int,
+        timeout: Optional[int],
+        max_concurrency: int,
+    ) -> list[v1.SpanAnnotation]:
         path = f"v1/projects/{project_identifier}/span_annotations"
 
-        for i in range(0, len(span_ids_list), _MAX_SPAN_IDS_PER_REQUEST):
-            batch_ids = span_ids_list[i : i + _MAX_SPAN_IDS_PER_REQUEST]
+        async def get_batch(batch_ids: Sequence[str]) -> list[v1.SpanAnnotation]:
+            annotations: list[v1.SpanAnnotation] = []
             cursor: Optional[str] = None
             while True:
                 params: dict[str, Union[int, str, Sequence[str]]] = {
@@ -529,11 +535,14 @@ class AsyncSpans:
                 }
                 if cursor:
                     params["cursor"] = cursor
-                response = await self._client.get(
-                    url=path,
-                    params=params,
-                    headers={"accept": "application/json"},
-                    timeout=timeout,
+                response = await send_with_retries(
+                    functools.partial(
+                        self._client.get,
+                        url=path,
+                        params=params,
+                        headers={"accept": "application/json"},
+                        timeout=timeout,
+                    )
                 )
                 response.raise_for_status()
                 payload = response.json()
@@ -542,9 +551,16 @@ class AsyncSpans:
                 annotations.extend(batch)
                 cursor = payload.get("next_cursor")
                 if not cursor:
-                    break
-
-        return annotations
+                    return annotations
+
+        batches = await gather_with_max_concurrency(
+            (
+                functools.partial(get_batch, span_ids[i : i + _MAX_SPAN_IDS_PER_REQUEST])
+                for i in range(0, len(span_ids), _MAX_SPAN_IDS_PER_REQUEST)
+            ),
+            max_concurrency=max_concurrency,
+        )
+        return [annotation for batch in batches for annotation in batch]
 
 
 def _to_iso_format(value: Optional[datetime]) -> Optional[str]:
@@ -575,13 +591,76 @@ def _normalize_datetime(
     return dt.astimezone(timezone.utc)
 
 
+def _get_span_dataframe_media_type() -> str:
+    """
+    Returns the media type to accept for span dataframes: Arrow IPC when pyarrow is installed,
+    with Zstd-compressed buffers when pyarrow has the codec, and JSON otherwise. Servers that
+    don't support compression ignore the parameter and send uncompressed Arrow IPC.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return "application/json"
+    if pa.Codec.is_available("zstd"):
+        return "application/x-pandas-arrow; compression=zstd"
+    return "application/x-pandas-arrow"
+
+
+def _decode_df_from_arrow_stream(content: bytes) -> "pd.DataFrame":
+    import pandas as pd
+    import pyarrow as pa
+
+    # the buffer wraps the response content without a copy, and the table is released column
+    # by column as it is converted, so the stream is not held in memory twice
+    with pa.ipc.open_stream(pa.py_buffer(content)) as reader:
+        table = reader.read_all()
+    # list columns, e.g. events and documents, are converted to lists like the JSON format's,
+    # instead of the numpy arrays pandas would make of them, and are left out of `to_pandas`
+    lists = {
+        field.name: [_drop_none_values(value) for value in table.column(field.name).to_pylist()]
+        for field in table.schema
+        if pa.types.is_list(field.type) or pa.types.is_large_list(field.type)
+    }
+    names = table.schema.names
+    if lists:
+        table = table.select([name for name in names if name not in lists])
+    df = table.to_pandas(split_blocks=True, self_destruct=True)
+    # the list columns are inserted back at their positions, i.e. among the columns that are
+    # not index columns
+    columns = [name for name in names if name in lists or name in df.columns]
+    for loc, name in enumerate(columns):
+        if name in lists:
+            df.insert(loc, name, pd.Series(lists[name], index=df.index, dtype=object))
+    return df
+
+
+def _drop_none_values(value: Any) -> Any:
+    """
+    Drops the keys that Arrow adds to the dictionaries converted from structs, with None values,
+    for the fields of the struct type that the dictionaries did not have, e.g. the fields of
+    other documents. Span attributes have no None values, so no value sent is dropped.
+    """
+    if isinstance(value, dict):
+        return {k: _drop_none_values(v) for k, v in value.items() if v is not None}
+    if isinstance(value, list):
+        return [_drop_none_values(v) for v in value]
+    return value
+
+
 def _process_span_dataframe(response: httpx.Response) -> "pd.DataFrame":
-    """Processes the httpx response to extract a pandas DataFrame, handling multipart responses."""
+    """
+    Processes the httpx response to extract a pandas DataFrame, handling Arrow IPC and
+    multipart responses.
+    """
     import pandas as pd
 
     content_type = response.headers.get("Content-Type")
     dfs: list["pd.DataFrame"] = []
-    if isinstance(content_type, str) and "multipart/mixed" in content_type:
+    if isinstance(content_type, str) and "application/x-pandas-arrow" in content_type:
+        response.raise_for_status()
+        # only passing in one query, so only the first stream is read
+        dfs.append(_decode_df_from_arrow_stream(response.content))
+    elif isinstance(content_type, str) and "multipart/mixed" in content_type:
         if "boundary=" in content_type:
             boundary_token = content_type.split("boundary=")[1].split(";", 1)[0]
         else:
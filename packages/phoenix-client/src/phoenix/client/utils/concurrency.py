@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+from typing import Awaitable, Callable, Iterable, Optional, TypeVar
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_INITIAL_BACKOFF_IN_SECONDS = 0.5
+_MAX_BACKOFF_IN_SECONDS = 30.0
+_RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+async def gather_with_max_concurrency(
+    factories: Iterable[Callable[[], Awaitable[T]]],
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> list[T]:
+    """
+    Awaits the awaitables made by the factories with at most `max_concurrency` of them in flight,
+    and returns their results in the order of the factories. The factories are consumed lazily,
+    so a generator of requests is only advanced as the in-flight window frees up. If any awaitable
+    fails, the ones in flight are cancelled and the error is raised.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be a positive integer")
+    results: dict[int, T] = {}
+    pending: dict[asyncio.Task[T], int] = {}
+
+    async def wait(return_when: str) -> None:
+        done, _ = await asyncio.wait(pending, return_when=return_when)
+        for task in done:
+            index = pending.pop(task)
+            results[index] = task.result()
+
+    try:
+        for index, factory in enumerate(factories):
+            if len(pending) >= max_concurrency:
+                await wait(asyncio.FIRST_COMPLETED)
+            pending[asyncio.ensure_future(factory())] = index
+        if pending:
+            await wait(asyncio.ALL_COMPLETED)
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+    return [results[index] for index in range(len(results))]
+
+
+async def send_with_retries(
+    send: Callable[[], Awaitable[httpx.Response]],
+    *,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    initial_backoff: float = DEFAULT_INITIAL_BACKOFF_IN_SECONDS,
+) -> httpx.Response:
+    """
+    Sends a request, retrying on transport errors and on responses that signal a transient
+    condition (429, 502, 503 and 504) with exponential backoff and jitter, honoring a numeric
+    `Retry-After` header when present. The last response is returned without raising on its
+    status, and the last transport error is raised once the retries are exhausted.
+    """
+    for attempt in range(max_retries + 1):
+        retry_after: Optional[float] = None
+        try:
+            response = await send()
+        except httpx.TransportError:
+            if attempt == max_retries:
+                raise
+            logger.debug("Retrying request after transport error", exc_info=True)
+        else:
+            if response.status_code not in _RETRYABLE_STATUS_CODES or attempt == max_retries:
+                return response
+            retry_after = _parse_retry_after(response)
+            await response.aclose()
+        backoff = min(_MAX_BACKOFF_IN_SECONDS, initial_backoff * 2**attempt)
+        await asyncio.sleep(
+            retry_after if retry_after is not None else backoff * random.uniform(0.5, 1.0)
+        )
+    raise AssertionError("unreachable")
+
+
+def _parse_retry_after(response: httpx.Response) -> Optional[float]:
+    try:
+        return min(_MAX_BACKOFF_IN_SECONDS, max(0.0, float(response.headers["retry-after"])))
+    except (KeyError, ValueError):
+        return None
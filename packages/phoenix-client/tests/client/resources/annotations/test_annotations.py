@@ -1,9 +1,17 @@
 # pyright: reportPrivateUsage=false
 
+import asyncio
+import json
+
+import httpx
 import pandas as pd
 import pytest
 
-from phoenix.client.resources.annotations import _chunk_dataframe, _validate_dataframe
+from phoenix.client.resources.annotations import (
+    AsyncAnnotations,
+    _chunk_dataframe,
+    _validate_dataframe,
+)
 
 
 class TestDataFrameValidation:
@@ -464,3 +472,74 @@ class TestChunkDataFrame:
             ValueError, match="DataFrame cannot have both 'span_id' and 'context.span_id' columns"
         ):
             list(_chunk_dataframe(dataframe=df))
+
+
+class TestAsyncLogSpanAnnotationsDataframe:
+    """Test suite for sending DataFrame chunks concurrently with AsyncAnnotations."""
+
+    @staticmethod
+    def _dataframe(num_rows: int) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "name": ["sentiment"] * num_rows,
+                "annotator_kind": ["HUMAN"] * num_rows,
+                "span_id": [f"id{i}" for i in range(num_rows)],
+                "label": ["positive"] * num_rows,
+            }
+        )
+
+    async def test_chunks_are_sent_concurrently_and_results_keep_row_order(self) -> None:
+        """Test that at most max_concurrency chunks are in flight and results are in row order."""
+        in_flight = max_in_flight = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            data = json.loads(request.content)["data"]
+            # respond to later chunks sooner, so that responses arrive out of order
+            await asyncio.sleep(0.01 / (int(data[0]["span_id"][2:]) + 1))
+            in_flight -= 1
+            return httpx.Response(200, json={"data": [{"id": a["span_id"]} for a in data]})
+
+        client = httpx.AsyncClient(base_url="http://test", transport=httpx.MockTransport(handler))
+        result = await AsyncAnnotations(client).log_span_annotations_dataframe(
+            dataframe=self._dataframe(1050), sync=True, max_concurrency=4
+        )
+        assert result is not None
+        assert [a["id"] for a in result] == [f"id{i}" for i in range(1050)]
+        assert max_in_flight == 4
+
+    async def test_transient_errors_are_retried(self) -> None:
+        """Test that a chunk is retried when the server is temporarily unavailable."""
+        num_requests = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal num_requests
+            num_requests += 1
+            if num_requests == 1:
+                return httpx.Response(503, headers={"retry-after": "0"})
+            return httpx.Response(200, json={"data": []})
+
+        client = httpx.AsyncClient(base_url="http://test", transport=httpx.MockTransport(handler))
+        await AsyncAnnotations(client).log_span_annotations_dataframe(dataframe=self._dataframe(1))
+        assert num_requests == 2
+
+    async def test_error_cancels_chunks_in_flight(self) -> None:
+        """Test that a failed chunk raises and the remaining chunks are not sent."""
+        num_requests = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal num_requests
+            num_requests += 1
+            if num_requests == 1:
+                return httpx.Response(400)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"data": []})
+
+        client = httpx.AsyncClient(base_url="http://test", transport=httpx.MockTransport(handler))
+        with pytest.raises(httpx.HTTPStatusError):
+            await AsyncAnnotations(client).log_span_annotations_dataframe(
+                dataframe=self._dataframe(1000), max_concurrency=2
+            )
+        assert num_requests == 2
@@ -0,0 +1,92 @@
+# pyright: reportPrivateUsage=false
+
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+import httpx
+import pandas as pd
+import pytest
+
+from phoenix.client.resources.spans import _process_span_dataframe
+from phoenix.server.api.routers.utils import df_to_bytes
+from phoenix.utilities.json import encode_df_as_json_string
+
+_REQUEST = httpx.Request("POST", "http://localhost/v1/spans")
+
+
+@pytest.fixture
+def spans_dataframe() -> pd.DataFrame:
+    start_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return pd.DataFrame(
+        {
+            "name": ["query", "retrieve", "llm"],
+            "start_time": [
+                start_time,
+                start_time + timedelta(microseconds=1),
+                start_time + timedelta(seconds=1),
+            ],
+            "attributes.llm.token_count.total": [None, None, 30.0],
+            "events": [[{"name": "exception", "attributes": {"message": "x"}}], [], None],
+            "attributes.retrieval.documents": [
+                None,
+                [
+                    {"document.content": "a", "document.score": 0.5},
+                    {"document.content": "b", "document.metadata": {"source": "c"}},
+                ],
+                None,
+            ],
+            "status_code": ["OK", "OK", "ERROR"],
+        },
+        index=pd.Index(["a1", "b2", "c3"], name="context.span_id"),
+    )
+
+
+def _arrow_response(df: pd.DataFrame, compression: Optional[str] = None) -> httpx.Response:
+    return httpx.Response(
+        200,
+        headers={"Content-Type": "application/x-pandas-arrow"},
+        content=df_to_bytes(df, compression),  # type: ignore[arg-type]
+        request=_REQUEST,
+    )
+
+
+def _json_response(df: pd.DataFrame) -> httpx.Response:
+    boundary_token = "boundary"
+    content = (
+        f"--{boundary_token}\r\n"
+        "Content-Type: application/json\r\n\r\n"
+        f"{encode_df_as_json_string(df)}\r\n"
+        f"--{boundary_token}--\r\n"
+    )
+    return httpx.Response(
+        200,
+        headers={"Content-Type": f"multipart/mixed; boundary={boundary_token}"},
+        content=content.encode(),
+        request=_REQUEST,
+    )
+
+
+@pytest.mark.parametrize("compression", [None, "zstd"])
+def test_arrow_and_json_responses_are_decoded_alike(
+    spans_dataframe: pd.DataFrame,
+    compression: Optional[str],
+) -> None:
+    from_arrow = _process_span_dataframe(_arrow_response(spans_dataframe, compression))
+    from_json = _process_span_dataframe(_json_response(spans_dataframe))
+    pd.testing.assert_frame_equal(from_arrow, from_json)
+    pd.testing.assert_index_equal(from_arrow.index, spans_dataframe.index)
+    assert from_arrow["start_time"].dtype == "datetime64[ns, UTC]"
+    assert from_arrow["start_time"].tolist() == spans_dataframe["start_time"].tolist()
+    # list columns are lists, as sent, instead of numpy arrays
+    assert from_arrow["events"].tolist() == spans_dataframe["events"].tolist()
+    assert (
+        from_arrow["attributes.retrieval.documents"].tolist()
+        == spans_dataframe["attributes.retrieval.documents"].tolist()
+    )
+
+
+def test_arrow_response_without_list_columns(spans_dataframe: pd.DataFrame) -> None:
+    df = spans_dataframe.drop(columns=["events", "attributes.retrieval.documents"])
+    from_arrow = _process_span_dataframe(_arrow_response(df))
+    from_json = _process_span_dataframe(_json_response(df))
+    pd.testing.assert_frame_equal(from_arrow, from_json)
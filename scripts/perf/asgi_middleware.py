@@ -0,0 +1,208 @@
+# /// script
+# dependencies = [
+#   "arize-phoenix",
+#   "asgi-lifespan",
+# ]
+# ///
+"""
+Measures the throughput (requests/sec) of the server for OTLP trace exports to `/v1/traces` and
+for a small GraphQL query, with the server's own middlewares implemented as pure ASGI middleware
+(the default) and, for comparison, as the `BaseHTTPMiddleware` subclasses they used to be, which
+run each response in an extra task and memory stream. Requests are sent in-process through
+`httpx.ASGITransport`, so the numbers exclude the network and the HTTP server, and exported spans
+are discarded instead of being inserted, so that the database does not dominate.
+
+Usage:
+
+    python scripts/perf/asgi_middleware.py --duration 10 --concurrency 16
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import tempfile
+from contextlib import AsyncExitStack
+from pathlib import Path
+from secrets import token_bytes
+from time import perf_counter, time_ns
+from typing import Any
+from urllib.parse import urlparse
+
+import httpx
+from asgi_lifespan import LifespanManager
+from fastapi import FastAPI
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+from opentelemetry.proto.common.v1.common_pb2 import AnyValue, KeyValue
+from opentelemetry.proto.resource.v1.resource_pb2 import Resource
+from opentelemetry.proto.trace.v1.trace_pb2 import ResourceSpans, ScopeSpans, Span
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.requests import Request
+from starlette.responses import Response
+
+from phoenix.db.bulk_inserter import BulkInserter
+
+_GRAPHQL_QUERY = {"query": "query { projects(first: 1) { edges { node { name } } } }"}
+
+
+class _LegacyHeadersMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        from phoenix.utilities.client import PHOENIX_SERVER_VERSION_HEADER
+        from phoenix.version import __version__ as phoenix_version
+
+        response = await call_next(request)
+        response.headers["x-colab-notebook-cache-control"] = "no-cache"
+        response.headers[PHOENIX_SERVER_VERSION_HEADER] = phoenix_version
+        return response
+
+
+class _LegacyRequestOriginHostnameValidator(BaseHTTPMiddleware):
+    def __init__(self, *args: Any, trusted_hostnames: list[str], **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._trusted_hostnames = trusted_hostnames
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        for key in "origin", "referer":
+            if not (url := request.headers.get(key)):
+                continue
+            if urlparse(url).hostname not in self._trusted_hostnames:
+                return Response(f"untrusted {key}", status_code=401)
+        return await call_next(request)
+
+
+class _DiscardingBulkInserter(BulkInserter):
+    async def _queue_span(self, *_: Any) -> None:
+        pass
+
+
+def _export_trace_service_request(num_spans: int) -> bytes:
+    now = time_ns()
+    trace_id = token_bytes(16)
+    spans = [
+        Span(
+            trace_id=trace_id,
+            span_id=token_bytes(8),
+            name="llm",
+            start_time_unix_nano=now,
+            end_time_unix_nano=now + 1_000_000,
+            attributes=[
+                KeyValue(key="openinference.span.kind", value=AnyValue(string_value="LLM")),
+                KeyValue(key="input.value", value=AnyValue(string_value="hello " * 50)),
+            ],
+        )
+        for _ in range(num_spans)
+    ]
+    resource = Resource(
+        attributes=[KeyValue(key="openinference.project.name", value=AnyValue(string_value="b"))]
+    )
+    request = ExportTraceServiceRequest(
+        resource_spans=[ResourceSpans(resource=resource, scope_spans=[ScopeSpans(spans=spans)])]
+    )
+    return request.SerializeToString()
+
+
+async def _create_app(temp_dir: str, legacy: bool) -> tuple[FastAPI, AsyncEngine]:
+    import phoenix.server.app as app
+    from phoenix.core.model_schema_adapter import create_model_from_inferences
+    from phoenix.db import models
+    from phoenix.db.engines import aio_sqlite_engine
+    from phoenix.inferences.inferences import EMPTY_INFERENCES
+    from phoenix.pointcloud.umap_parameters import get_umap_parameters
+    from phoenix.server.types import DbSessionFactory
+
+    url = make_url(f"sqlite+aiosqlite:///{os.path.join(temp_dir, f'{legacy}.db')}")
+    engine = aio_sqlite_engine(url, migrate=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(models.Base.metadata.create_all)
+    fastapi_app = app.create_app(
+        db=DbSessionFactory(db=app._db(engine), dialect=engine.dialect.name),
+        export_path=Path(temp_dir),
+        model=create_model_from_inferences(EMPTY_INFERENCES, None),
+        authentication_enabled=False,
+        umap_params=get_umap_parameters(None),
+        serve_ui=False,
+        bulk_inserter_factory=_DiscardingBulkInserter,
+    )
+    if legacy:
+        replacements: dict[Any, Any] = {
+            app.HeadersMiddleware: _LegacyHeadersMiddleware,
+            app.RequestOriginHostnameValidator: _LegacyRequestOriginHostnameValidator,
+        }
+        fastapi_app.user_middleware = [
+            Middleware(replacements.get(m.cls, m.cls), *m.args, **m.kwargs)
+            for m in fastapi_app.user_middleware
+        ]
+    return fastapi_app, engine
+
+
+async def _throughput(
+    client: httpx.AsyncClient,
+    request: dict[str, Any],
+    duration: float,
+    concurrency: int,
+) -> float:
+    num_requests = 0
+    deadline = perf_counter() + duration
+
+    async def worker() -> None:
+        nonlocal num_requests
+        while perf_counter() < deadline:
+            response = await client.request(**request)
+            assert response.status_code == 200, response.text
+            num_requests += 1
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return num_requests / duration
+
+
+async def main(duration: float, concurrency: int, num_spans: int) -> None:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        os.environ["PHOENIX_GRPC_PORT"] = str(sock.getsockname()[1])
+    # so that the origin validator is part of the middleware stack
+    os.environ["PHOENIX_CSRF_TRUSTED_ORIGINS"] = "http://localhost"
+    requests = {
+        "/graphql": dict(
+            method="POST",
+            url="/graphql",
+            json=_GRAPHQL_QUERY,
+            headers={"origin": "http://localhost"},
+        ),
+        "/v1/traces": dict(
+            method="POST",
+            url="/v1/traces",
+            content=_export_trace_service_request(num_spans),
+            headers={"content-type": "application/x-protobuf", "origin": "http://localhost"},
+        ),
+    }
+    print(f"{concurrency} concurrent clients for {duration}s each, {num_spans} spans per export")
+    print(f"{'endpoint':<14}{'middleware':<16}{'requests/s':>12}")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for legacy in (True, False):
+            fastapi_app, engine = await _create_app(temp_dir, legacy)
+            async with AsyncExitStack() as stack:
+                manager = await stack.enter_async_context(LifespanManager(fastapi_app))
+                client = await stack.enter_async_context(
+                    httpx.AsyncClient(
+                        transport=httpx.ASGITransport(manager.app),
+                        base_url="http://localhost",
+                    )
+                )
+                for endpoint, request in requests.items():
+                    rate = await _throughput(client, request, duration, concurrency)
+                    middleware = "BaseHTTP" if legacy else "pure ASGI"
+                    print(f"{endpoint:<14}{middleware:<16}{rate:>12.0f}")
+            await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--num-spans", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.duration, args.concurrency, args.num_spans))
@@ -0,0 +1,208 @@
+# /// script
+# dependencies = [
+#   "arize-phoenix",
+# ]
+# ///
+"""
+Benchmarks representative experiment run filter conditions (see
+`phoenix.server.api.helpers.experiment_run_filters`) on a comparison of three experiments with
+two repetitions each over a dataset with 50k examples on a SQLite database, timing both the
+compilation of each condition (cold and cached) and the query for the matching examples.
+
+Usage:
+
+    python scripts/perf/experiment_run_filters.py --num-examples 50000
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+from datetime import datetime, timedelta, timezone
+from time import perf_counter
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from phoenix.db import models
+from phoenix.db.engines import aio_sqlite_engine
+from phoenix.server.api.helpers.experiment_run_filters import (
+    compile_sqlalchemy_filter_condition,
+    update_examples_query_with_filter_condition,
+)
+
+FILTER_CONDITIONS = (
+    "experiments[0].evals['correctness'].score > 0.5",
+    "evals['correctness'].score > 0.5 and evals['relevance'].label == 'relevant'",
+    "experiments[0].evals['correctness'].score > experiments[1].evals['correctness'].score",
+    "experiments[2].error is not None or experiments[2].latency_ms > 900",
+    "output['answer'] == 'yes' and 'cite' in experiments[1].evals['relevance'].explanation",
+    "input['question'] == 'question-42' and reference_output['answer'] == 'no'",
+)
+
+
+async def _populate(
+    engine: AsyncEngine,
+    num_examples: int,
+    num_experiments: int,
+    repetitions: int,
+    batch_size: int = 10_000,
+) -> list[int]:
+    now = datetime.now(timezone.utc)
+    async with engine.begin() as conn:
+        dataset_id = await conn.scalar(
+            insert(models.Dataset)
+            .values(name="benchmark", metadata_={})
+            .returning(models.Dataset.id)
+        )
+        version_id = await conn.scalar(
+            insert(models.DatasetVersion)
+            .values(dataset_id=dataset_id, metadata_={})
+            .returning(models.DatasetVersion.id)
+        )
+        experiment_ids = list(
+            await conn.scalars(
+                insert(models.Experiment)
+                .values(
+                    [
+                        dict(
+                            dataset_id=dataset_id,
+                            dataset_version_id=version_id,
+                            name=f"experiment-{i}",
+                            repetitions=repetitions,
+                            metadata_={},
+                        )
+                        for i in range(num_experiments)
+                    ]
+                )
+                .returning(models.Experiment.id)
+            )
+        )
+        for start in range(0, num_examples, batch_size):
+            n = min(batch_size, num_examples - start)
+            example_ids = list(
+                await conn.scalars(
+                    insert(models.DatasetExample)
+                    .values([dict(dataset_id=dataset_id) for _ in range(n)])
+                    .returning(models.DatasetExample.id)
+                )
+            )
+            await conn.execute(
+                insert(models.DatasetExampleRevision),
+                [
+                    dict(
+                        dataset_example_id=example_id,
+                        dataset_version_id=version_id,
+                        input={"question": f"question-{random.randrange(100)}"},
+                        output={"answer": random.choice(("yes", "no"))},
+                        metadata={},
+                        revision_kind="CREATE",
+                    )
+                    for example_id in example_ids
+                ],
+            )
+            for experiment_id in experiment_ids:
+                run_ids = list(
+                    await conn.scalars(
+                        insert(models.ExperimentRun)
+                        .values(
+                            [
+                                dict(
+                                    experiment_id=experiment_id,
+                                    dataset_example_id=example_id,
+                                    repetition_number=repetition_number,
+                                    output={
+                                        "task_output": {"answer": random.choice(("yes", "no"))}
+                                    },
+                                    start_time=now,
+                                    end_time=now + timedelta(milliseconds=random.randrange(1000)),
+                                    error="timeout" if random.random() < 0.05 else None,
+                                )
+                                for example_id in example_ids
+                                for repetition_number in range(1, repetitions + 1)
+                            ]
+                        )
+                        .returning(models.ExperimentRun.id)
+                    )
+                )
+                await conn.execute(
+                    insert(models.ExperimentRunAnnotation),
+                    [
+                        dict(
+                            experiment_run_id=run_id,
+                            name=name,
+                            annotator_kind="CODE",
+                            label=random.choice(("relevant", "irrelevant")),
+                            score=random.random(),
+                            explanation=random.choice(("cites sources", "no sources")),
+                            metadata={},
+                            start_time=now,
+                            end_time=now,
+                        )
+                        for run_id in run_ids
+                        for name in ("correctness", "relevance")
+                    ],
+                )
+    return experiment_ids
+
+
+async def _time_filter(
+    engine: AsyncEngine, filter_condition: str, experiment_ids: list[int]
+) -> tuple[float, float, int, float]:
+    start_time = perf_counter()
+    compile_sqlalchemy_filter_condition(filter_condition, experiment_ids)
+    cold_compile_time = perf_counter() - start_time
+    start_time = perf_counter()
+    examples_query = update_examples_query_with_filter_condition(
+        select(models.DatasetExample.id)
+        .distinct()
+        .join(
+            models.DatasetExampleRevision,
+            models.DatasetExampleRevision.dataset_example_id == models.DatasetExample.id,
+        ),
+        filter_condition,
+        experiment_ids,
+    )
+    cached_compile_time = perf_counter() - start_time
+    async with engine.connect() as conn:
+        start_time = perf_counter()
+        count = await conn.scalar(select(func.count()).select_from(examples_query.subquery()))
+        query_time = perf_counter() - start_time
+    return cold_compile_time, cached_compile_time, count or 0, query_time
+
+
+async def main(num_examples: int, num_experiments: int, repetitions: int, seed: int) -> None:
+    random.seed(seed)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        url = make_url(f"sqlite+aiosqlite:///{os.path.join(temp_dir, 'benchmark.db')}")
+        engine = aio_sqlite_engine(url, migrate=False)
+        async with engine.begin() as conn:
+            await conn.run_sync(models.Base.metadata.create_all)
+        start_time = perf_counter()
+        experiment_ids = await _populate(engine, num_examples, num_experiments, repetitions)
+        print(
+            f"Inserted {num_examples} examples with {num_experiments} experiments of "
+            f"{repetitions} repetitions in {perf_counter() - start_time:.1f}s"
+        )
+        for filter_condition in FILTER_CONDITIONS:
+            cold, cached, count, elapsed = await _time_filter(
+                engine, filter_condition, experiment_ids
+            )
+            print(filter_condition)
+            print(
+                f"    compiled in {cold * 1000:.2f}ms (cached: {cached * 1000:.2f}ms), "
+                f"{count} matches in {elapsed:.3f}s"
+            )
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-examples", type=int, default=50_000)
+    parser.add_argument("--num-experiments", type=int, default=3)
+    parser.add_argument("--repetitions", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    asyncio.run(main(args.num_examples, args.num_experiments, args.repetitions, args.seed))
@@ -0,0 +1,116 @@
+# /// script
+# dependencies = [
+#   "arize-phoenix",
+# ]
+# ///
+"""
+Measures the cost of making the context of a GraphQL request, whose data loaders are made on
+first access, against making every data loader up front as the server used to, along with the
+end-to-end latency of a trivial query that only touches one of them.
+
+Usage:
+
+    python scripts/perf/graphql_context.py --repeat 2000
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable
+
+from sqlalchemy import insert
+from sqlalchemy.engine import make_url
+
+import phoenix.server.app as app
+from phoenix.core.model_schema_adapter import create_model_from_inferences
+from phoenix.db import models
+from phoenix.db.engines import aio_sqlite_engine
+from phoenix.inferences.inferences import EMPTY_INFERENCES
+from phoenix.server.api.context import Context, DataLoaders
+from phoenix.server.api.dataloaders import CacheForDataLoaders
+from phoenix.server.api.schema import build_graphql_schema
+from phoenix.server.types import DbSessionFactory
+
+_QUERY = "query { projects(first: 10) { edges { node { name traceCount } } } }"
+_LOADERS = [name for name in vars(DataLoaders) if not name.startswith("_")]
+
+
+def _make_context(db: DbSessionFactory, model: Any, cache: CacheForDataLoaders) -> Context:
+    return Context(
+        db=db,
+        model=model,
+        export_path=Path(tempfile.gettempdir()),
+        data_loaders=DataLoaders(db.reader, cache),
+        cache_for_dataloaders=cache,
+    )
+
+
+def _make_context_eagerly(db: DbSessionFactory, model: Any, cache: CacheForDataLoaders) -> Context:
+    context = _make_context(db, model, cache)
+    for name in _LOADERS:
+        getattr(context.data_loaders, name)
+    return context
+
+
+async def _time(fns: tuple[Callable[[], Any], ...], repeat: int) -> list[list[float]]:
+    # The functions take turns, so that drift over the run affects them alike.
+    timings: list[list[float]] = [[] for _ in fns]
+    for _ in range(repeat):
+        for fn, fn_timings in zip(fns, timings):
+            start_time = perf_counter()
+            result = fn()
+            if asyncio.iscoroutine(result):
+                await result
+            fn_timings.append(perf_counter() - start_time)
+    return timings
+
+
+async def main(repeat: int) -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        url = make_url(f"sqlite+aiosqlite:///{os.path.join(temp_dir, 'benchmark.db')}")
+        engine = aio_sqlite_engine(url, migrate=False)
+        async with engine.begin() as conn:
+            await conn.run_sync(models.Base.metadata.create_all)
+            await conn.execute(
+                insert(models.Project), [{"name": f"project-{i}"} for i in range(10)]
+            )
+        db = DbSessionFactory(db=app._db(engine, bypass_lock=True), dialect="sqlite")
+        model = create_model_from_inferences(EMPTY_INFERENCES, None)
+        cache = CacheForDataLoaders()
+        schema = build_graphql_schema()
+
+        async def execute(make_context: Callable[..., Context]) -> None:
+            result = await schema.execute(_QUERY, context_value=make_context(db, model, cache))
+            assert not result.errors, result.errors
+
+        print(f"{len(_LOADERS)} data loaders, {repeat} repetitions")
+        print(f"{'':<24}{'eager (us)':>12}{'lazy (us)':>12}")
+        for name, eager, lazy in (
+            (
+                "context creation",
+                lambda: _make_context_eagerly(db, model, cache),
+                lambda: _make_context(db, model, cache),
+            ),
+            (
+                "trivial query",
+                lambda: execute(_make_context_eagerly),
+                lambda: execute(_make_context),
+            ),
+        ):
+            eager_timings, lazy_timings = await _time((eager, lazy), repeat)
+            print(
+                f"{name:<24}{statistics.median(eager_timings) * 1e6:>12.1f}"
+                f"{statistics.median(lazy_timings) * 1e6:>12.1f}"
+            )
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=2_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.repeat))
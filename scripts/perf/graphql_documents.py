@@ -0,0 +1,166 @@
+# /// script
+# dependencies = [
+#   "arize-phoenix",
+# ]
+# ///
+"""
+Measures the server time of the spans table's GraphQL query with the parsed and validated
+documents of queries cached, against parsing and validating the query for every request as the
+server used to, along with the size of the request body with the query text and with only its
+hash, i.e. as an automatic persisted query. The query is read from its Relay artifact.
+
+Usage:
+
+    python scripts/perf/graphql_documents.py --repeat 500 --num-spans 30
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import tempfile
+from datetime import datetime, timedelta, timezone
+from hashlib import sha256
+from pathlib import Path
+from secrets import token_hex
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.engine import make_url
+from strawberry.relay import GlobalID
+
+import phoenix.server.app as app
+from phoenix.core.model_schema_adapter import create_model_from_inferences
+from phoenix.db import models
+from phoenix.db.engines import aio_sqlite_engine
+from phoenix.inferences.inferences import EMPTY_INFERENCES
+from phoenix.server.api.context import Context, DataLoaders
+from phoenix.server.api.dataloaders import CacheForDataLoaders
+from phoenix.server.api.schema import build_graphql_schema
+from phoenix.server.types import DbSessionFactory
+
+_RELAY_ARTIFACT = (
+    Path(__file__).parents[2]
+    / "app/src/pages/project/__generated__/SpansTableSpansQuery.graphql.ts"
+)
+
+
+def _read_query() -> str:
+    for line in _RELAY_ARTIFACT.read_text().splitlines():
+        if (line := line.strip()).startswith('"text": '):
+            return str(json.loads(line.removeprefix('"text": ').rstrip(",")))
+    raise ValueError(f"No query text in {_RELAY_ARTIFACT}")
+
+
+async def _insert_spans(db: DbSessionFactory, num_spans: int) -> int:
+    now = datetime.now(timezone.utc)
+    async with db() as session:
+        project_rowid = await session.scalar(
+            insert(models.Project).values(name="benchmark").returning(models.Project.id)
+        )
+        for i in range(num_spans):
+            trace_rowid = await session.scalar(
+                insert(models.Trace)
+                .values(
+                    trace_id=token_hex(16),
+                    project_rowid=project_rowid,
+                    start_time=now - timedelta(seconds=i),
+                    end_time=now - timedelta(seconds=i) + timedelta(seconds=1),
+                )
+                .returning(models.Trace.id)
+            )
+            await session.execute(
+                insert(models.Span).values(
+                    trace_rowid=trace_rowid,
+                    span_id=token_hex(8),
+                    parent_id=None,
+                    name="llm",
+                    span_kind="LLM",
+                    start_time=now - timedelta(seconds=i),
+                    end_time=now - timedelta(seconds=i, milliseconds=-random.randrange(1000)),
+                    attributes={
+                        "input": {"value": token_hex(256)},
+                        "output": {"value": token_hex(256)},
+                        "llm": {"token_count": {"prompt": 100, "completion": 20}},
+                    },
+                    events=[],
+                    status_code="OK",
+                    status_message="",
+                    cumulative_error_count=0,
+                    cumulative_llm_token_count_prompt=100,
+                    cumulative_llm_token_count_completion=20,
+                    llm_token_count_prompt=100,
+                    llm_token_count_completion=20,
+                )
+            )
+    assert project_rowid is not None
+    return project_rowid
+
+
+async def main(repeat: int, num_spans: int) -> None:
+    query = _read_query()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        url = make_url(f"sqlite+aiosqlite:///{os.path.join(temp_dir, 'benchmark.db')}")
+        engine = aio_sqlite_engine(url, migrate=False)
+        async with engine.begin() as conn:
+            await conn.run_sync(models.Base.metadata.create_all)
+        db = DbSessionFactory(db=app._db(engine, bypass_lock=True), dialect="sqlite")
+        project_rowid = await _insert_spans(db, num_spans)
+        variables = {"id": str(GlobalID("Project", str(project_rowid)))}
+        model = create_model_from_inferences(EMPTY_INFERENCES, None)
+        cached = build_graphql_schema()
+        uncached = build_graphql_schema()
+        # the document cache is the extension made by `get_document_cache_extension`
+        uncached.extensions = [
+            extension
+            for extension in uncached.extensions
+            if getattr(extension, "__name__", None) != "DocumentCache"
+        ]
+
+        async def execute(schema: Any) -> None:
+            cache = CacheForDataLoaders()
+            context = Context(
+                db=db,
+                model=model,
+                export_path=Path(temp_dir),
+                data_loaders=DataLoaders(db.reader, cache),
+                cache_for_dataloaders=cache,
+            )
+            result = await schema.execute(query, variable_values=variables, context_value=context)
+            assert not result.errors, result.errors
+
+        timings: dict[str, list[float]] = {"uncached": [], "cached": []}
+        for schema in uncached, cached:  # warm up
+            await execute(schema)
+        # The schemas take turns, so that drift over the run affects them alike.
+        for _ in range(repeat):
+            for name, schema in ("uncached", uncached), ("cached", cached):
+                start_time = perf_counter()
+                await execute(schema)
+                timings[name].append(perf_counter() - start_time)
+        await engine.dispose()
+
+    extensions = {
+        "persistedQuery": {"version": 1, "sha256Hash": sha256(query.encode()).hexdigest()}
+    }
+    with_query = json.dumps({"query": query, "variables": variables})
+    with_hash = json.dumps({"variables": variables, "extensions": extensions})
+    print(f"SpansTableSpansQuery, {num_spans} spans, {repeat} repetitions")
+    print(f"{'':<28}{'uncached':>12}{'cached':>12}")
+    print(
+        f"{'median server time (ms)':<28}"
+        f"{statistics.median(timings['uncached']) * 1e3:>12.2f}"
+        f"{statistics.median(timings['cached']) * 1e3:>12.2f}"
+    )
+    print(f"{'request body (bytes)':<28}{len(with_query):>12}{len(with_hash):>12}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=500)
+    parser.add_argument("--num-spans", type=int, default=30)
+    args = parser.parse_args()
+    asyncio.run(main(args.repeat, args.num_spans))
@@ -0,0 +1,122 @@
+# /// script
+# dependencies = [
+#   "arize-phoenix",
+# ]
+# ///
+"""
+Measures the time and the peak growth of the resident memory of exporting all rows of a primary
+and a reference inference set with an embedding column to a Parquet file, written in row groups
+by `Model.export_rows_as_parquet_file`, against concatenating copies of the subsets with pandas
+and writing them in one go as the export used to. Each export runs in its own process, so that
+the memory of one is not reused by the other, and the resident memory is sampled while the
+export runs. Linux only.
+
+Usage:
+
+    python scripts/perf/parquet_export.py --num-rows 200000 --dimension 256
+"""
+
+import argparse
+import multiprocessing
+import os
+import tempfile
+import threading
+from pathlib import Path
+from time import perf_counter
+from typing import BinaryIO
+
+import numpy as np
+import pandas as pd
+
+from phoenix.core.model_schema import PRIMARY, REFERENCE, Embedding, Model, Schema
+
+
+def _create_model(num_rows: int, dimension: int) -> Model:
+    rng = np.random.default_rng(0)
+    return Schema(
+        prediction_id="id",
+        features=["score", "text", Embedding("embedding")],
+    )(
+        *(
+            (
+                name,
+                pd.DataFrame(
+                    {
+                        "id": [f"{name}-{i}" for i in range(num_rows)],
+                        "score": rng.random(num_rows),
+                        "text": [f"text {i}" for i in range(num_rows)],
+                        "embedding": list(rng.random((num_rows, dimension), dtype=np.float32)),
+                    }
+                ),
+            )
+            for name in ("primary", "reference")
+        )
+    )
+
+
+def _export_with_pandas(model: Model, parquet_file: BinaryIO, num_rows: int) -> None:
+    dataframes = [pd.DataFrame()]
+    for role in PRIMARY, REFERENCE:
+        df = model[role]
+        columns = [df.columns.get_loc(name) for name in ("id", "score", "text", "embedding")]
+        subset = df.iloc[pd.Series(range(num_rows)), columns].reset_index(drop=True)
+        subset["__phoenix_dataset_name__"] = df.display_name
+        dataframes.append(subset)
+    pd.concat(dataframes).to_parquet(
+        parquet_file,
+        index=False,
+        allow_truncated_timestamps=True,
+        coerce_timestamps="ms",
+    )
+
+
+def _rss() -> int:
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def _run(streaming: bool, num_rows: int, dimension: int, path: Path) -> tuple[float, float]:
+    model = _create_model(num_rows, dimension)
+    before = peak = _rss()
+    done = threading.Event()
+
+    def sample() -> None:
+        nonlocal peak
+        while not done.wait(0.01):
+            peak = max(peak, _rss())
+
+    sampler = threading.Thread(target=sample)
+    sampler.start()
+    start_time = perf_counter()
+    with open(path, "wb") as parquet_file:
+        if streaming:
+            model.export_rows_as_parquet_file(
+                {role: range(num_rows) for role in (PRIMARY, REFERENCE)}, parquet_file
+            )
+        else:
+            _export_with_pandas(model, parquet_file, num_rows)
+    elapsed = perf_counter() - start_time
+    done.set()
+    sampler.join()
+    return elapsed, (max(peak, _rss()) - before) / 2**20
+
+
+def main(num_rows: int, dimension: int) -> None:
+    context = multiprocessing.get_context("spawn")
+    print(f"{num_rows} rows x 2 inference sets, {dimension}-dimensional embeddings")
+    print(f"{'':<12}{'seconds':>10}{'peak memory growth (MiB)':>28}")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for name, streaming in ("pandas", False), ("streaming", True):
+            with context.Pool(1) as pool:
+                elapsed, growth = pool.apply(
+                    _run, (streaming, num_rows, dimension, Path(temp_dir) / f"{name}.parquet")
+                )
+            print(f"{name:<12}{elapsed:>10.2f}{growth:>28.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-rows", type=int, default=200_000)
+    parser.add_argument("--dimension", type=int, default=256)
+    args = parser.parse_args()
+    main(args.num_rows, args.dimension)
@@ -0,0 +1,64 @@
+# /// script
+# dependencies = [
+#   "arize-phoenix",
+# ]
+# ///
+"""
+Measures how long `ProjectChangeNotifier` takes to deliver the changes of a time window to many
+subscribers, each listening to one of many projects as the UI's stream toggle does, from the
+moment the window's notification is published until every subscriber has received it. Every
+project changes in every window, so every subscriber is woken each time.
+
+Usage:
+
+    python scripts/perf/project_change_fanout.py --num-subscribers 10000 --num-projects 50
+"""
+
+import argparse
+import asyncio
+import statistics
+from time import perf_counter
+
+from phoenix.server.project_change_notifier import ProjectChangeNotifier
+
+
+async def main(num_subscribers: int, num_projects: int, num_windows: int) -> None:
+    notifier = ProjectChangeNotifier(sleep_seconds=3600)  # windows are published by hand below
+    received = 0
+    all_received = asyncio.Event()
+
+    async def subscriber(project_id: int) -> None:
+        nonlocal received
+        async for _ in notifier.subscribe([project_id]):
+            received += 1
+            if received == num_subscribers:
+                all_received.set()
+
+    tasks = [asyncio.create_task(subscriber(i % num_projects)) for i in range(num_subscribers)]
+    await asyncio.sleep(0)
+    timings = []
+    for _ in range(num_windows):
+        received = 0
+        all_received.clear()
+        for project_id in range(num_projects):
+            notifier.put(project_id)
+        start_time = perf_counter()
+        await notifier()
+        notifier._batch.clear()
+        await all_received.wait()
+        timings.append(perf_counter() - start_time)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    print(f"{num_subscribers} subscribers of {num_projects} projects, {num_windows} windows")
+    print(f"median time to notify all subscribers: {statistics.median(timings) * 1e3:.1f} ms")
+    print(f"per subscriber: {statistics.median(timings) / num_subscribers * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-subscribers", type=int, default=10_000)
+    parser.add_argument("--num-projects", type=int, default=50)
+    parser.add_argument("--num-windows", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.num_subscribers, args.num_projects, args.num_windows))
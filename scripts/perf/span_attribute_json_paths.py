@@ -0,0 +1,171 @@
+# /// script
+# dependencies = [
+#   "arize-phoenix",
+# ]
+# ///
+"""
+Compares loading a few span attributes by fetching the entire `attributes` column and reading
+them in Python against extracting them with JSON paths in SQL (see the span attribute hybrid
+properties of `phoenix.db.models.Span`), on a SQLite database of LLM spans whose attributes are
+padded to about 200KB with a long message history.
+
+Usage:
+
+    python scripts/perf/span_attribute_json_paths.py --num-spans 1000 --attributes-size 200000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import string
+import tempfile
+from datetime import datetime, timezone
+from secrets import token_hex
+from time import perf_counter
+from typing import Any, Awaitable, Callable
+
+from openinference.semconv.trace import SpanAttributes
+from sqlalchemy import insert, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from phoenix.db import models
+from phoenix.db.engines import aio_sqlite_engine
+from phoenix.trace.attributes import get_attribute_value
+
+_MESSAGE_SIZE = 2_000
+
+
+def _attributes(size: int) -> dict[str, Any]:
+    content = "".join(random.choices(string.ascii_letters + " ", k=_MESSAGE_SIZE))
+    return {
+        "input": {"value": content[:500], "mime_type": "text/plain"},
+        "output": {"value": content[:200], "mime_type": "text/plain"},
+        "llm": {
+            "provider": "openai",
+            "model_name": "gpt-4o",
+            "invocation_parameters": json.dumps({"temperature": 0.5}),
+            "input_messages": [
+                {"message": {"role": "user", "content": content}}
+                for _ in range(max(1, size // _MESSAGE_SIZE))
+            ],
+        },
+    }
+
+
+async def _populate(
+    engine: AsyncEngine,
+    num_spans: int,
+    attributes_size: int,
+    batch_size: int = 100,
+) -> list[int]:
+    now = datetime.now(timezone.utc)
+    span_rowids: list[int] = []
+    async with engine.begin() as conn:
+        project_rowid = await conn.scalar(
+            insert(models.Project).values(name="benchmark").returning(models.Project.id)
+        )
+        trace_rowid = await conn.scalar(
+            insert(models.Trace)
+            .values(
+                trace_id=token_hex(16), project_rowid=project_rowid, start_time=now, end_time=now
+            )
+            .returning(models.Trace.id)
+        )
+        for start in range(0, num_spans, batch_size):
+            span_rowids.extend(
+                await conn.scalars(
+                    insert(models.Span)
+                    .values(
+                        [
+                            dict(
+                                trace_rowid=trace_rowid,
+                                span_id=token_hex(8),
+                                name="llm",
+                                span_kind="LLM",
+                                start_time=now,
+                                end_time=now,
+                                attributes=_attributes(attributes_size),
+                                events=[],
+                                status_code="OK",
+                                status_message="",
+                                cumulative_error_count=0,
+                                cumulative_llm_token_count_prompt=0,
+                                cumulative_llm_token_count_completion=0,
+                            )
+                            for _ in range(min(batch_size, num_spans - start))
+                        ]
+                    )
+                    .returning(models.Span.id)
+                )
+            )
+    return span_rowids
+
+
+async def _from_entire_attributes(engine: AsyncEngine, span_rowids: list[int]) -> list[Any]:
+    async with engine.connect() as conn:
+        rows = await conn.execute(
+            select(models.Span.attributes).where(models.Span.id.in_(span_rowids))
+        )
+        return [
+            (
+                get_attribute_value(attributes, SpanAttributes.LLM_PROVIDER),
+                get_attribute_value(attributes, SpanAttributes.LLM_MODEL_NAME),
+                get_attribute_value(attributes, SpanAttributes.LLM_INVOCATION_PARAMETERS),
+            )
+            for (attributes,) in rows
+        ]
+
+
+async def _from_json_paths(engine: AsyncEngine, span_rowids: list[int]) -> list[Any]:
+    async with engine.connect() as conn:
+        rows = await conn.execute(
+            select(
+                models.Span.llm_provider,
+                models.Span.llm_model_name,
+                models.Span.llm_invocation_parameters,
+            ).where(models.Span.id.in_(span_rowids))
+        )
+        return [tuple(row) for row in rows]
+
+
+async def _time(fn: Callable[[], Awaitable[Any]], repeat: int) -> tuple[Any, float]:
+    best = float("inf")
+    for _ in range(repeat):
+        start_time = perf_counter()
+        result = await fn()
+        best = min(best, perf_counter() - start_time)
+    return result, best
+
+
+async def main(num_spans: int, attributes_size: int, page_size: int, repeat: int) -> None:
+    random.seed(0)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        url = make_url(f"sqlite+aiosqlite:///{os.path.join(temp_dir, 'benchmark.db')}")
+        engine = aio_sqlite_engine(url, migrate=False)
+        async with engine.begin() as conn:
+            await conn.run_sync(models.Base.metadata.create_all)
+        span_rowids = await _populate(engine, num_spans, attributes_size)
+        print(
+            f"{num_spans} spans with ~{attributes_size // 1000}KB of attributes, "
+            f"pages of {page_size}, best of {repeat}"
+        )
+        page = random.sample(span_rowids, min(page_size, num_spans))
+        expected, entire_time = await _time(lambda: _from_entire_attributes(engine, page), repeat)
+        actual, json_paths_time = await _time(lambda: _from_json_paths(engine, page), repeat)
+        assert sorted(actual) == sorted(expected)
+        print(f"{'entire attributes':<20}{entire_time * 1000:>10.1f}ms")
+        print(f"{'json paths':<20}{json_paths_time * 1000:>10.1f}ms")
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-spans", type=int, default=1_000)
+    parser.add_argument("--attributes-size", type=int, default=200_000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.num_spans, args.attributes_size, args.page_size, args.repeat))
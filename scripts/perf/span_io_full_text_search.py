@@ -0,0 +1,136 @@
+# /// script
+# dependencies = [
+#   "arize-phoenix",
+# ]
+# ///
+"""
+Benchmarks substring filters on span input and output values with and without the full-text
+search index (see `phoenix.db.full_text_search`) on a SQLite database with 1M spans.
+
+Usage:
+
+    python scripts/perf/span_io_full_text_search.py --num-spans 1000000
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import string
+import tempfile
+from datetime import datetime, timezone
+from time import perf_counter
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from phoenix.db import models
+from phoenix.db.engines import aio_sqlite_engine
+from phoenix.db.full_text_search import ensure_span_io_index, span_io_contains
+from phoenix.db.helpers import SupportedSQLDialect
+
+_WORDS = [
+    "".join(random.choices(string.ascii_lowercase, k=random.randint(3, 9))) for _ in range(5000)
+]
+
+
+def _text(num_words: int) -> str:
+    return " ".join(random.choices(_WORDS, k=num_words))
+
+
+async def _populate(
+    engine: AsyncEngine,
+    num_spans: int,
+    project_name: str = "benchmark",
+    batch_size: int = 10_000,
+) -> None:
+    now = datetime.now(timezone.utc)
+    async with engine.begin() as conn:
+        project_id = await conn.scalar(
+            insert(models.Project).values(name=project_name).returning(models.Project.id)
+        )
+        for start in range(0, num_spans, batch_size):
+            n = min(batch_size, num_spans - start)
+            trace_rowids = list(
+                await conn.scalars(
+                    insert(models.Trace)
+                    .values(
+                        [
+                            dict(
+                                project_rowid=project_id,
+                                trace_id=f"{project_name}-{start + i}",
+                                start_time=now,
+                                end_time=now,
+                            )
+                            for i in range(n)
+                        ]
+                    )
+                    .returning(models.Trace.id)
+                )
+            )
+            await conn.execute(
+                insert(models.Span),
+                [
+                    dict(
+                        trace_rowid=trace_rowid,
+                        span_id=f"{project_name}-{start + i}",
+                        name="llm",
+                        span_kind="LLM",
+                        start_time=now,
+                        end_time=now,
+                        attributes={
+                            "input": {"value": _text(50)},
+                            "output": {"value": _text(100)},
+                        },
+                        events=[],
+                        status_code="OK",
+                        status_message="",
+                        cumulative_error_count=0,
+                        cumulative_llm_token_count_prompt=0,
+                        cumulative_llm_token_count_completion=0,
+                    )
+                    for i, trace_rowid in enumerate(trace_rowids)
+                ],
+            )
+
+
+async def _time_query(engine: AsyncEngine, substring: str, indexed: bool) -> tuple[int, float]:
+    stmt = select(func.count(models.Span.id)).where(
+        span_io_contains(substring, SupportedSQLDialect.SQLITE, indexed=indexed)
+    )
+    async with engine.connect() as conn:
+        start_time = perf_counter()
+        count = await conn.scalar(stmt)
+        return count or 0, perf_counter() - start_time
+
+
+async def main(num_spans: int) -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        url = make_url(f"sqlite+aiosqlite:///{os.path.join(temp_dir, 'benchmark.db')}")
+        engine = aio_sqlite_engine(url, migrate=False)
+        async with engine.begin() as conn:
+            await conn.run_sync(models.Base.metadata.create_all)
+        start_time = perf_counter()
+        await _populate(engine, num_spans)
+        print(f"Inserted {num_spans} spans without index in {perf_counter() - start_time:.1f}s")
+        start_time = perf_counter()
+        async with AsyncSession(engine) as session, session.begin():
+            await ensure_span_io_index(session, SupportedSQLDialect.SQLITE, enabled=True)
+        print(f"Built index in {perf_counter() - start_time:.1f}s")
+        start_time = perf_counter()
+        await _populate(engine, num_spans // 10, project_name="benchmark-indexed")
+        print(f"Inserted {num_spans // 10} spans with index in {perf_counter() - start_time:.1f}s")
+        for substring in ("zzzzzz", random.choice(_WORDS), " ".join(random.choices(_WORDS, k=2))):
+            for indexed in (False, True):
+                count, elapsed = await _time_query(engine, substring, indexed)
+                label = "indexed" if indexed else "scan"
+                print(f"{substring!r:>24} {label:>8}: {count:>8} matches in {elapsed:.3f}s")
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-spans", type=int, default=1_000_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.num_spans))
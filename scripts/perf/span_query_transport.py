@@ -0,0 +1,119 @@
+# /// script
+# dependencies = [
+#   "arize-phoenix",
+# ]
+# ///
+"""
+Compares the formats in which `/v1/spans` can send a span dataframe to `phoenix.client`: JSON
+(as multipart/mixed, which is not gzipped), Arrow IPC (gzipped by the server's middleware
+when the client accepts it) and Arrow IPC with Zstd- or LZ4-compressed buffers. For each format
+it reports the size on the wire, the time to encode on the server, and the time to decode on the
+client, for a synthetic dataframe shaped like a span query's result.
+
+Usage:
+
+    python scripts/perf/span_query_transport.py --num-spans 100000
+"""
+
+import argparse
+import gzip
+import random
+from datetime import datetime, timedelta, timezone
+from time import perf_counter
+from typing import Any, Callable
+
+import pandas as pd
+
+from phoenix.client.resources.spans import (
+    _decode_df_from_arrow_stream,
+    _decode_df_from_json_string,
+)
+from phoenix.server.api.routers.utils import df_to_bytes
+from phoenix.utilities.json import encode_df_as_json_string
+
+_WORDS = "the quick brown fox jumps over a lazy dog while some spans are slow".split()
+
+
+def _text(num_words: int) -> str:
+    return " ".join(random.choices(_WORDS, k=num_words))
+
+
+def _spans_dataframe(num_spans: int) -> pd.DataFrame:
+    start_time = datetime.now(timezone.utc)
+    rows: list[dict[str, Any]] = []
+    for i in range(num_spans):
+        span_start_time = start_time + timedelta(milliseconds=i)
+        rows.append(
+            {
+                "context.span_id": f"{random.getrandbits(64):016x}",
+                "context.trace_id": f"{random.getrandbits(128):032x}",
+                "parent_id": None if i % 4 == 0 else f"{random.getrandbits(64):016x}",
+                "name": random.choice(("llm", "retriever", "chain", "tool")),
+                "span_kind": random.choice(("LLM", "RETRIEVER", "CHAIN", "TOOL")),
+                "start_time": span_start_time,
+                "end_time": span_start_time + timedelta(milliseconds=random.randrange(1000)),
+                "status_code": "OK",
+                "status_message": "",
+                "events": [],
+                "attributes.input.value": _text(50),
+                "attributes.output.value": _text(100),
+                "attributes.llm.token_count.total": random.randrange(10_000),
+                "attributes.retrieval.documents": [
+                    {"document.content": _text(30), "document.score": random.random()}
+                    for _ in range(random.randrange(3))
+                ],
+            }
+        )
+    return pd.DataFrame(rows).set_index("context.span_id", drop=False)
+
+
+def _time(fn: Callable[[], Any], repeat: int) -> tuple[Any, float]:
+    best = float("inf")
+    for _ in range(repeat):
+        start_time = perf_counter()
+        result = fn()
+        best = min(best, perf_counter() - start_time)
+    return result, best
+
+
+def main(num_spans: int, repeat: int, seed: int) -> None:
+    random.seed(seed)
+    df = _spans_dataframe(num_spans)
+    formats: dict[str, tuple[Callable[[], bytes], Callable[[bytes], pd.DataFrame]]] = {
+        "json": (
+            lambda: encode_df_as_json_string(df).encode(),
+            lambda content: _decode_df_from_json_string(content.decode()),
+        ),
+        "arrow+gzip": (
+            lambda: gzip.compress(df_to_bytes(df), compresslevel=9),
+            lambda content: _decode_df_from_arrow_stream(gzip.decompress(content)),
+        ),
+        "arrow+zstd": (
+            lambda: df_to_bytes(df, "zstd"),
+            _decode_df_from_arrow_stream,
+        ),
+        "arrow+lz4": (
+            lambda: df_to_bytes(df, "lz4"),
+            _decode_df_from_arrow_stream,
+        ),
+        "arrow": (
+            lambda: df_to_bytes(df),
+            _decode_df_from_arrow_stream,
+        ),
+    }
+    print(f"{num_spans} spans, best of {repeat}")
+    print(f"{'format':<12}{'size (MB)':>12}{'encode (s)':>12}{'decode (s)':>12}")
+    for name, (encode, decode) in formats.items():
+        content, encode_time = _time(encode, repeat)
+        decoded, decode_time = _time(lambda: decode(content), repeat)
+        assert len(decoded) == num_spans
+        print(f"{name:<12}{len(content) / 1e6:>12.1f}{encode_time:>12.3f}{decode_time:>12.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-spans", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    main(args.num_spans, args.repeat, args.seed)
@@ -0,0 +1,168 @@
+# /// script
+# dependencies = [
+#   "arize-phoenix",
+# ]
+# ///
+"""
+Measures the latency of queries on a SQLite database file while spans are being ingested
+continuously, with reads sharing the single writer connection (the default) and with reads
+served by a pool of read-only connections (see `PHOENIX_SQL_DATABASE_READER_POOL_SIZE`). Sessions
+are made the way the server makes them, i.e. those on the writer connection take turns on the
+server's database mutex.
+
+Usage:
+
+    python scripts/perf/sqlite_reader_pool.py --duration 10 --num-readers 8 --pool-size 4
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+from datetime import datetime, timedelta, timezone
+from secrets import token_hex
+from time import perf_counter
+
+from sqlalchemy import func, insert, select
+
+import phoenix.server.app as app
+from phoenix.db import models
+from phoenix.db.engines import aio_sqlite_engine, create_reader_engine, get_async_db_url
+from phoenix.server.types import DbSessionFactory
+
+
+async def _ingest(db: DbSessionFactory, project_rowid: int, stop: asyncio.Event) -> int:
+    num_spans = 0
+    while not stop.is_set():
+        now = datetime.now(timezone.utc)
+        async with db() as session:
+            trace_rowid = await session.scalar(
+                insert(models.Trace)
+                .values(
+                    trace_id=token_hex(16),
+                    project_rowid=project_rowid,
+                    start_time=now,
+                    end_time=now + timedelta(seconds=1),
+                )
+                .returning(models.Trace.id)
+            )
+            await session.execute(
+                insert(models.Span),
+                [
+                    dict(
+                        trace_rowid=trace_rowid,
+                        span_id=token_hex(8),
+                        name="span",
+                        span_kind="LLM",
+                        start_time=now,
+                        end_time=now + timedelta(milliseconds=random.randrange(1000)),
+                        attributes={"input": {"value": token_hex(512)}},
+                        events=[],
+                        status_code="OK",
+                        status_message="",
+                        cumulative_error_count=0,
+                        cumulative_llm_token_count_prompt=0,
+                        cumulative_llm_token_count_completion=0,
+                    )
+                    for _ in range(100)
+                ],
+            )
+        num_spans += 100
+        await asyncio.sleep(0)
+    return num_spans
+
+
+async def _query(db: DbSessionFactory, stop: asyncio.Event) -> list[float]:
+    latencies: list[float] = []
+    while not stop.is_set():
+        start_time = perf_counter()
+        async with db() as session:
+            span_rowids = await session.scalars(
+                select(models.Span.id).order_by(models.Span.start_time.desc()).limit(50)
+            )
+            await session.execute(
+                select(
+                    models.Span.id, models.Span.name, models.Span.input_value_first_101_chars
+                ).where(models.Span.id.in_(list(span_rowids)))
+            )
+        latencies.append(perf_counter() - start_time)
+    return latencies
+
+
+async def _run(
+    writer: DbSessionFactory,
+    num_readers: int,
+    duration: float,
+    project_rowid: int,
+) -> tuple[int, list[float]]:
+    stop = asyncio.Event()
+    ingestion = asyncio.create_task(_ingest(writer, project_rowid, stop))
+    queries = [asyncio.create_task(_query(writer.reader, stop)) for _ in range(num_readers)]
+    await asyncio.sleep(duration)
+    stop.set()
+    num_spans = await ingestion
+    return num_spans, [
+        latency for latencies in await asyncio.gather(*queries) for latency in latencies
+    ]
+
+
+async def main(duration: float, num_readers: int, pool_size: int, initial_spans: int) -> None:
+    random.seed(0)
+    app.DB_MUTEX = asyncio.Lock()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        connection_str = f"sqlite:///{os.path.join(temp_dir, 'benchmark.db')}"
+        engine = aio_sqlite_engine(get_async_db_url(connection_str), migrate=False)
+        async with engine.begin() as conn:
+            await conn.run_sync(models.Base.metadata.create_all)
+            project_rowid = await conn.scalar(
+                insert(models.Project).values(name="benchmark").returning(models.Project.id)
+            )
+        assert project_rowid is not None
+        shared = DbSessionFactory(db=app._db(engine), dialect=engine.dialect.name)
+        stop = asyncio.Event()
+        ingestion = asyncio.create_task(_ingest(shared, project_rowid, stop))
+        while (await _count_spans(shared)) < initial_spans:
+            await asyncio.sleep(0.1)
+        stop.set()
+        await ingestion
+        reader_engine = create_reader_engine(connection_str, pool_size=pool_size)
+        assert reader_engine is not None
+        pooled = DbSessionFactory(
+            db=app._db(engine),
+            dialect=engine.dialect.name,
+            read_db=app._db(reader_engine, bypass_lock=True),
+        )
+        print(
+            f"{num_readers} concurrent readers for {duration}s each with ingestion, "
+            f"reader pool of {pool_size}"
+        )
+        print(f"{'reads':<10}{'queries':>10}{'p50 (ms)':>10}{'p95 (ms)':>10}{'spans/s':>10}")
+        for name, db in (("shared", shared), ("pooled", pooled)):
+            num_spans, latencies = await _run(db, num_readers, duration, project_rowid)
+            p50, p95 = (
+                statistics.quantiles(latencies, n=100)[49],
+                statistics.quantiles(latencies, n=100)[94],
+            )
+            print(
+                f"{name:<10}{len(latencies):>10}{p50 * 1000:>10.1f}{p95 * 1000:>10.1f}"
+                f"{num_spans / duration:>10.0f}"
+            )
+        await reader_engine.dispose()
+        await engine.dispose()
+
+
+async def _count_spans(db: DbSessionFactory) -> int:
+    async with db() as session:
+        return await session.scalar(select(func.count(models.Span.id))) or 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--num-readers", type=int, default=8)
+    parser.add_argument("--pool-size", type=int, default=4)
+    parser.add_argument("--initial-spans", type=int, default=20_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.duration, args.num_readers, args.pool_size, args.initial_spans))
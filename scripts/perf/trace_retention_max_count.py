@@ -0,0 +1,157 @@
+# /// script
+# dependencies = [
+#   "arize-phoenix",
+# ]
+# ///
+"""
+Measures count-based trace retention on a SQLite database file with many projects:
+
+- the start time cutoffs of a policy's projects, computed per project by walking the index on
+  `(project_rowid, start_time)`, against the single cutoff across all traces that the sweeper
+  used to compute, which sorted the whole table and kept the most recent traces of the database
+  rather than of each project;
+- the per-project cutoffs without that index, i.e. with the indexes the table used to have;
+- the number of traces started before the per-project cutoffs, which the sweeper hands over to
+  the `TraceDeleter`, against the number before the global cutoff.
+
+Usage:
+
+    python scripts/perf/trace_retention_max_count.py --num-projects 50 --num-traces 1000000
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+from secrets import token_hex
+from time import perf_counter
+from typing import Any, Awaitable, Callable
+
+import sqlalchemy as sa
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import phoenix.server.app as app
+from phoenix.db import models
+from phoenix.db.engines import aio_sqlite_engine
+from phoenix.db.types.trace_retention import MaxCountRule
+from phoenix.server.types import DbSessionFactory
+
+_BATCH_SIZE = 50_000
+
+
+async def _insert_traces(db: DbSessionFactory, num_projects: int, num_traces: int) -> list[int]:
+    now = datetime.now(timezone.utc)
+    async with db() as session:
+        project_rowids = list(
+            await session.scalars(
+                sa.insert(models.Project).returning(models.Project.id),
+                [{"name": f"project-{i}"} for i in range(num_projects)],
+            )
+        )
+    for start in range(0, num_traces, _BATCH_SIZE):
+        async with db() as session:
+            await session.execute(
+                sa.insert(models.Trace),
+                [
+                    {
+                        "project_rowid": project_rowids[i % num_projects],
+                        "trace_id": token_hex(16),
+                        "start_time": now - timedelta(seconds=i),
+                        "end_time": now - timedelta(seconds=i) + timedelta(milliseconds=100),
+                    }
+                    for i in range(start, min(start + _BATCH_SIZE, num_traces))
+                ],
+            )
+    return project_rowids
+
+
+async def _get_global_cutoff(session: AsyncSession, max_count: int) -> Any:
+    return await session.scalar(
+        sa.select(models.Trace.start_time)
+        .order_by(models.Trace.start_time.desc())
+        .offset(max_count - 1)
+        .limit(1)
+    )
+
+
+def _global_filter(max_count: int) -> sa.ColumnElement[bool]:
+    return models.Trace.start_time < (
+        sa.select(models.Trace.start_time)
+        .order_by(models.Trace.start_time.desc())
+        .offset(max_count - 1)
+        .limit(1)
+        .scalar_subquery()
+    )
+
+
+async def _time(db: DbSessionFactory, fn: Callable[[AsyncSession], Awaitable[Any]]) -> float:
+    async with db() as session:
+        start_time = perf_counter()
+        await fn(session)
+        return perf_counter() - start_time
+
+
+async def main(num_projects: int, num_traces: int, max_count: int) -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        url = make_url(f"sqlite+aiosqlite:///{os.path.join(temp_dir, 'benchmark.db')}")
+        engine = aio_sqlite_engine(url, migrate=False)
+        async with engine.begin() as conn:
+            await conn.run_sync(models.Base.metadata.create_all)
+        db = DbSessionFactory(db=app._db(engine, bypass_lock=True), dialect="sqlite")
+        start_time = perf_counter()
+        project_rowids = await _insert_traces(db, num_projects, num_traces)
+        print(f"inserted {num_traces} traces in {perf_counter() - start_time:.1f}s")
+        async with engine.begin() as conn:
+            await conn.execute(sa.text("ANALYZE"))
+        rule = MaxCountRule(max_count=max_count)
+
+        async def per_project_cutoffs(session: AsyncSession) -> None:
+            for project_rowid in project_rowids:
+                await rule.get_start_time_cutoff(session, project_rowid)
+
+        async def count(session: AsyncSession, where: sa.ColumnElement[bool]) -> int:
+            stmt = sa.select(sa.func.count()).select_from(models.Trace).where(where)
+            return int(await session.scalar(stmt) or 0)
+
+        print(f"{num_projects} projects, {num_traces} traces, max_count={max_count}")
+        print(f"{'':<46}{'seconds':>10}")
+        timings = {
+            "global cutoff (before)": await _time(
+                db, lambda session: _get_global_cutoff(session, max_count)
+            ),
+            "per-project cutoffs": await _time(db, per_project_cutoffs),
+        }
+        async with db() as session:
+            matched_globally = await count(
+                session,
+                models.Trace.project_rowid.in_(project_rowids) & _global_filter(max_count),
+            )
+            matched_per_project = 0
+            for project_rowid in project_rowids:
+                if cutoff := await rule.get_start_time_cutoff(session, project_rowid):
+                    matched_per_project += await count(
+                        session,
+                        (models.Trace.project_rowid == project_rowid)
+                        & (models.Trace.start_time < cutoff),
+                    )
+        async with engine.begin() as conn:
+            await conn.execute(sa.text("DROP INDEX ix_traces_project_rowid_start_time"))
+        timings["per-project cutoffs without the index"] = await _time(db, per_project_cutoffs)
+        for name, seconds in timings.items():
+            print(f"{name:<46}{seconds:>10.3f}")
+        print(
+            f"traces to delete: {matched_globally} with the global cutoff, "
+            f"{matched_per_project} with per-project cutoffs"
+        )
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-projects", type=int, default=50)
+    parser.add_argument("--num-traces", type=int, default=1_000_000)
+    parser.add_argument("--max-count", type=int, default=10_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.num_projects, args.num_traces, args.max_count))
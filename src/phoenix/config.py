@@ -97,6 +97,36 @@ ENV_PHOENIX_DATABASE_ALLOCATED_STORAGE_CAPACITY_GIBIBYTES = (
 The allocated storage capacity for the Phoenix database in gibibytes (2^30 bytes). Use float for
 fractional value. This is currently used only by the UI for informational displays.
 """
+ENV_PHOENIX_SQL_DATABASE_READER_POOL_SIZE = "PHOENIX_SQL_DATABASE_READER_POOL_SIZE"
+"""
+The number of read-only connections to open to a SQLite database file, in addition to the single
+connection through which all writes go, so that queries run concurrently with ingestion instead of
+waiting for their turn on the shared connection. This has no effect on PostgreSQL or on in-memory
+SQLite databases. Defaults to 0, in which case reads and writes share the single connection.
+"""
+ENV_PHOENIX_TRACE_DELETION_BATCH_SIZE = "PHOENIX_TRACE_DELETION_BATCH_SIZE"
+"""
+The number of traces deleted per transaction, along with their spans and annotations, when
+traces are deleted by retention policies or when projects are cleared or deleted. Defaults to 1000.
+"""
+ENV_PHOENIX_TRACE_DELETION_MAX_TRACES_PER_SECOND = "PHOENIX_TRACE_DELETION_MAX_TRACES_PER_SECOND"
+"""
+The maximum rate at which traces are deleted by retention policies or when projects are cleared or
+deleted, so that large deletions leave room for ingestion and queries. Defaults to no limit, in
+which case other work still runs between batches.
+"""
+ENV_PHOENIX_ENABLE_FULL_TEXT_SEARCH = "PHOENIX_ENABLE_FULL_TEXT_SEARCH"
+"""
+Whether to build and maintain a full-text search index over the input and output values of spans.
+When enabled, substring filters on span and session input/output are served by the index. This uses
+an FTS5 trigram table on SQLite and the pg_trgm extension on PostgreSQL. Defaults to false.
+"""
+ENV_PHOENIX_EMBEDDINGS_MMAP_DIR = "PHOENIX_EMBEDDINGS_MMAP_DIR"
+"""
+A directory in which to memory-map the embedding matrices of the inferences loaded by the server,
+instead of holding them in memory. Each server run writes new files to the directory. Unset by
+default, in which case the matrices are held in memory.
+"""
 ENV_PHOENIX_ENABLE_PROMETHEUS = "PHOENIX_ENABLE_PROMETHEUS"
 """
 Whether to enable Prometheus. Defaults to false.
@@ -279,6 +309,31 @@ When set to true, clients must provide valid certificates signed by the CA speci
 PHOENIX_TLS_CA_FILE.
 """
 
+# Playground settings
+ENV_PHOENIX_PLAYGROUND_MAX_CONCURRENCY = "PHOENIX_PLAYGROUND_MAX_CONCURRENCY"
+"""
+The maximum number of concurrent LLM requests made by a single playground run over a dataset.
+Can be overridden for a specific provider via PHOENIX_PLAYGROUND_<PROVIDER>_MAX_CONCURRENCY,
+e.g. PHOENIX_PLAYGROUND_OPENAI_MAX_CONCURRENCY. Defaults to 3.
+"""
+ENV_PHOENIX_PLAYGROUND_MAX_REQUESTS_PER_SECOND = "PHOENIX_PLAYGROUND_MAX_REQUESTS_PER_SECOND"
+"""
+The maximum rate (requests per second) at which the playground sends requests to an LLM
+provider. The rate adapts downward when the provider responds with rate limit errors. Can be
+overridden for a specific provider via PHOENIX_PLAYGROUND_<PROVIDER>_MAX_REQUESTS_PER_SECOND,
+e.g. PHOENIX_PLAYGROUND_ANTHROPIC_MAX_REQUESTS_PER_SECOND. Defaults to 3.
+"""
+ENV_PHOENIX_PLAYGROUND_WRITE_BATCH_SIZE = "PHOENIX_PLAYGROUND_WRITE_BATCH_SIZE"
+"""
+The number of completed playground results that are accumulated before they are written to the
+database in a single batch. Defaults to 10.
+"""
+ENV_PHOENIX_PLAYGROUND_WRITE_INTERVAL_SECONDS = "PHOENIX_PLAYGROUND_WRITE_INTERVAL_SECONDS"
+"""
+The maximum number of seconds completed playground results are held before they are written to
+the database, regardless of the batch size. Defaults to 10.
+"""
+
 
 @dataclass(frozen=True)
 class TLSConfig:
@@ -889,6 +944,60 @@ class OAuth2ClientConfig:
         )
 
 
+@dataclass(frozen=True)
+class PlaygroundProviderConfig:
+    max_concurrency: int
+    max_requests_per_second: float
+
+    @classmethod
+    def from_env(cls, provider: str) -> "PlaygroundProviderConfig":
+        """
+        Reads the playground settings for a provider, e.g. "OPENAI" or "AZURE_OPENAI". Provider
+        specific environment variables take precedence over the global playground settings.
+        """
+        provider_upper = provider.upper()
+        max_concurrency = _int_val(
+            f"PHOENIX_PLAYGROUND_{provider_upper}_MAX_CONCURRENCY",
+            _int_val(ENV_PHOENIX_PLAYGROUND_MAX_CONCURRENCY, 3),
+        )
+        if max_concurrency <= 0:
+            raise ValueError(
+                f"The maximum playground concurrency for {provider} must be a positive integer"
+            )
+        max_requests_per_second = _float_val(
+            f"PHOENIX_PLAYGROUND_{provider_upper}_MAX_REQUESTS_PER_SECOND",
+            _float_val(ENV_PHOENIX_PLAYGROUND_MAX_REQUESTS_PER_SECOND, 3.0),
+        )
+        if max_requests_per_second <= 0:
+            raise ValueError(
+                f"The maximum playground request rate for {provider} must be a positive number"
+            )
+        return cls(
+            max_concurrency=max_concurrency,
+            max_requests_per_second=max_requests_per_second,
+        )
+
+
+def get_env_playground_write_batch_size() -> int:
+    """
+    Gets the value of the PHOENIX_PLAYGROUND_WRITE_BATCH_SIZE environment variable.
+    """
+    if (batch_size := _int_val(ENV_PHOENIX_PLAYGROUND_WRITE_BATCH_SIZE, 10)) <= 0:
+        raise ValueError(f"{ENV_PHOENIX_PLAYGROUND_WRITE_BATCH_SIZE} must be a positive integer")
+    return batch_size
+
+
+def get_env_playground_write_interval() -> timedelta:
+    """
+    Gets the value of the PHOENIX_PLAYGROUND_WRITE_INTERVAL_SECONDS environment variable.
+    """
+    if (seconds := _float_val(ENV_PHOENIX_PLAYGROUND_WRITE_INTERVAL_SECONDS, 10.0)) <= 0:
+        raise ValueError(
+            f"{ENV_PHOENIX_PLAYGROUND_WRITE_INTERVAL_SECONDS} must be a positive number"
+        )
+    return timedelta(seconds=seconds)
+
+
 def get_env_oauth2_settings() -> list[OAuth2ClientConfig]:
     """
     Get OAuth2 settings from environment variables.
@@ -1174,6 +1283,49 @@ def get_env_database_allocated_storage_capacity_gibibytes() -> Optional[float]:
     return _float_val(ENV_PHOENIX_DATABASE_ALLOCATED_STORAGE_CAPACITY_GIBIBYTES)
 
 
+def get_env_sql_database_reader_pool_size() -> int:
+    pool_size = _int_val(ENV_PHOENIX_SQL_DATABASE_READER_POOL_SIZE, 0)
+    if pool_size < 0:
+        raise ValueError(
+            f"Invalid value for environment variable {ENV_PHOENIX_SQL_DATABASE_READER_POOL_SIZE}: "
+            f"{pool_size}. Value must be a non-negative integer."
+        )
+    return pool_size
+
+
+def get_env_trace_deletion_batch_size() -> int:
+    batch_size = _int_val(ENV_PHOENIX_TRACE_DELETION_BATCH_SIZE, 1000)
+    if batch_size <= 0:
+        raise ValueError(
+            f"Invalid value for environment variable {ENV_PHOENIX_TRACE_DELETION_BATCH_SIZE}: "
+            f"{batch_size}. Value must be a positive integer."
+        )
+    return batch_size
+
+
+def get_env_trace_deletion_max_traces_per_second() -> Optional[float]:
+    max_traces_per_second = _float_val(ENV_PHOENIX_TRACE_DELETION_MAX_TRACES_PER_SECOND)
+    if max_traces_per_second is not None and max_traces_per_second <= 0:
+        raise ValueError(
+            "Invalid value for environment variable "
+            f"{ENV_PHOENIX_TRACE_DELETION_MAX_TRACES_PER_SECOND}: {max_traces_per_second}. "
+            "Value must be a positive number."
+        )
+    return max_traces_per_second
+
+
+def get_env_enable_full_text_search() -> bool:
+    return _bool_val(ENV_PHOENIX_ENABLE_FULL_TEXT_SEARCH, False)
+
+
+def get_env_embeddings_mmap_dir() -> Optional[Path]:
+    if not (mmap_dir := getenv(ENV_PHOENIX_EMBEDDINGS_MMAP_DIR)):
+        return None
+    path = Path(mmap_dir)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
 def get_env_enable_prometheus() -> bool:
     if (enable_promotheus := getenv(ENV_PHOENIX_ENABLE_PROMETHEUS)) is None or (
         enable_promotheus_lower := enable_promotheus.lower()
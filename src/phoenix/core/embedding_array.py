@@ -0,0 +1,200 @@
+import builtins
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+from pandas.api.extensions import ExtensionArray, ExtensionDtype, register_extension_dtype
+from pandas.api.indexers import check_array_indexer
+from typing_extensions import TypeAlias
+
+Matrix: TypeAlias = npt.NDArray[np.float32]
+Mask: TypeAlias = npt.NDArray[np.bool_]
+
+
+@register_extension_dtype
+class EmbeddingDtype(ExtensionDtype):
+    """The dtype of an `EmbeddingArray`, whose scalars are 1-D float32 arrays."""
+
+    name = "embedding[float32]"
+    type = np.ndarray
+    kind = "O"
+    na_value = np.nan
+
+    @classmethod
+    def construct_array_type(cls) -> builtins.type["EmbeddingArray"]:
+        return EmbeddingArray
+
+    def __from_arrow__(self, array: Any) -> "EmbeddingArray":
+        return EmbeddingArray.from_vectors(array.to_pylist())
+
+
+def _is_vector(value: Any) -> bool:
+    # Scalar values, e.g. None/NaN, are excluded by checking the presence of dunder method
+    # __len__.
+    return hasattr(value, "__len__") and not isinstance(value, str)
+
+
+class EmbeddingArray(ExtensionArray):
+    """
+    A column of embedding vectors stored as one contiguous 2-D float32 matrix, with a mask for
+    the rows that hold valid vectors, so that slicing a column is slicing the matrix, and
+    aggregations over vectors are array operations instead of loops over objects. Missing
+    (or malformed) vectors are zero rows in the matrix that are excluded by the mask.
+    """
+
+    def __init__(self, values: Matrix, mask: Mask) -> None:
+        assert values.ndim == 2 and mask.shape == (len(values),)
+        self._values = values
+        self._mask = mask
+
+    @classmethod
+    def from_vectors(
+        cls,
+        vectors: Iterable[Any],
+        path: Optional[Path] = None,
+    ) -> "EmbeddingArray":
+        """
+        Stacks the vectors into a matrix, which is memory-mapped to a new .npy file at `path`
+        if specified. Vectors of a length other than that of the first vector are treated as
+        missing.
+        """
+        if not isinstance(vectors, (Sequence, np.ndarray)):
+            vectors = list(vectors)
+        n_dims = next((len(v) for v in vectors if _is_vector(v)), 0)
+        shape = (len(vectors), n_dims)
+        values: Matrix
+        if path is None:
+            values = np.zeros(shape, dtype=np.float32)
+        else:
+            values = np.lib.format.open_memmap(path, mode="w+", dtype=np.float32, shape=shape)
+        mask = np.zeros(len(vectors), dtype=np.bool_)
+        for i, vector in enumerate(vectors):
+            if _is_vector(vector) and len(vector) == n_dims:
+                values[i] = vector
+                mask[i] = True
+        return cls(values, mask)
+
+    @property
+    def matrix(self) -> Matrix:
+        """The matrix of all rows, including the zero rows of missing vectors."""
+        return self._values
+
+    @property
+    def mask(self) -> Mask:
+        return self._mask
+
+    def valid_vectors(self) -> Matrix:
+        """The matrix of the valid vectors, which is a view when no vector is missing."""
+        if self._mask.all():
+            return self._values
+        return self._values[self._mask]
+
+    # ExtensionArray interface
+
+    @classmethod
+    def _from_sequence(
+        cls,
+        scalars: Any,
+        *,
+        dtype: Any = None,
+        copy: bool = False,
+    ) -> "EmbeddingArray":
+        if isinstance(scalars, EmbeddingArray):
+            return scalars.copy() if copy else scalars
+        return cls.from_vectors(scalars)
+
+    @classmethod
+    def _from_factorized(cls, values: Any, original: "EmbeddingArray") -> "EmbeddingArray":
+        return cls.from_vectors(values)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat: Sequence["EmbeddingArray"]) -> "EmbeddingArray":
+        # empty arrays carry no information about the number of dimensions
+        arrays = [array for array in to_concat if len(array)] or list(to_concat[:1])
+        return cls(
+            np.concatenate([array._values for array in arrays]),
+            np.concatenate([array._mask for array in arrays]),
+        )
+
+    @property
+    def dtype(self) -> EmbeddingDtype:
+        return EmbeddingDtype()
+
+    @property
+    def nbytes(self) -> int:
+        return self._values.nbytes + self._mask.nbytes
+
+    def __len__(self) -> int:
+        return len(self._mask)
+
+    def __getitem__(self, item: Any) -> Any:
+        if pd.api.types.is_integer(item):
+            return self._values[item] if self._mask[item] else np.nan
+        item = check_array_indexer(self, item)  # type: ignore[no-untyped-call]
+        return type(self)(self._values[item], self._mask[item])
+
+    def __eq__(self, other: Any) -> Any:
+        if not isinstance(other, EmbeddingArray) or len(other) != len(self):
+            return np.zeros(len(self), dtype=np.bool_)
+        if self._values.shape[1] != other._values.shape[1]:
+            return np.zeros(len(self), dtype=np.bool_)
+        return (self._values == other._values).all(axis=1) & self._mask & other._mask
+
+    def __array__(self, dtype: Any = None, copy: Optional[bool] = None) -> npt.NDArray[Any]:
+        ans = np.full(len(self), np.nan, dtype=object)
+        for i in np.flatnonzero(self._mask):
+            ans[i] = self._values[i]
+        return ans
+
+    def __arrow_array__(self, type: Any = None) -> Any:
+        import pyarrow as pa
+
+        length, dimension = self._values.shape
+        if length * dimension > np.iinfo(np.int32).max:
+            return pa.array(
+                [vector if valid else None for vector, valid in zip(self._values, self._mask)],
+                type=type,
+            )
+        # The offsets of the lists index into the rows of the matrix, whose buffer is shared with
+        # arrow instead of being copied into a list of vectors.
+        array = pa.ListArray.from_arrays(
+            pa.array(np.arange(0, (length + 1) * dimension, dimension), pa.int32()),
+            pa.array(np.ascontiguousarray(self._values).reshape(-1), pa.float32()),
+            mask=pa.array(~self._mask, pa.bool_()),
+        )
+        return array if type is None else array.cast(type)
+
+    def isna(self) -> Mask:
+        return ~self._mask
+
+    def take(
+        self,
+        indices: Union[Sequence[int], Sequence[np.integer[Any]], npt.NDArray[np.integer[Any]]],
+        *,
+        allow_fill: bool = False,
+        fill_value: Any = None,
+    ) -> "EmbeddingArray":
+        indices = np.asarray(indices, dtype=np.intp)
+        if not allow_fill:
+            return type(self)(self._values.take(indices, axis=0), self._mask.take(indices))
+        if (indices < -1).any():
+            raise ValueError("indices must be -1 or non-negative when allow_fill is True")
+        fill = indices == -1
+        if len(self) == 0:
+            if not fill.all():
+                raise IndexError("cannot take from an empty array")
+            return type(self)(
+                np.zeros((len(indices), self._values.shape[1]), dtype=np.float32),
+                np.zeros(len(indices), dtype=np.bool_),
+            )
+        # fill values other than NA are not supported, as vectors are not scalars
+        positions = np.where(fill, 0, indices)
+        values = self._values.take(positions, axis=0)
+        values[fill] = 0
+        return type(self)(values, self._mask.take(positions) & ~fill)
+
+    def copy(self) -> "EmbeddingArray":
+        return type(self)(np.array(self._values), self._mask.copy())
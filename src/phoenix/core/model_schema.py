@@ -1,6 +1,7 @@
 import json
 import math
 import re
+import shutil
 import threading
 from abc import ABC, abstractmethod
 from collections import defaultdict
@@ -11,7 +12,9 @@ from datetime import datetime, timedelta, timezone
 from enum import Enum, IntEnum, auto, unique
 from functools import cached_property
 from itertools import chain, groupby, repeat, starmap
+from pathlib import Path
 from random import random
+from tempfile import mkdtemp
 from typing import (
     Any,
     BinaryIO,
@@ -25,11 +28,13 @@ from typing import (
     overload,
 )
 from uuid import uuid4
-from weakref import ProxyType, proxy
+from weakref import ProxyType, finalize, proxy
 
 import numpy as np
 import numpy.typing as npt
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from pandas.core.dtypes.common import (
     is_bool_dtype,
     is_datetime64_any_dtype,
@@ -40,6 +45,7 @@ from typing_extensions import TypeAlias, TypeGuard
 from wrapt import ObjectProxy
 
 from phoenix.config import GENERATED_INFERENCES_NAME_PREFIX
+from phoenix.core.embedding_array import EmbeddingArray
 from phoenix.datetime_utils import floor_to_minute
 
 
@@ -725,6 +731,11 @@ class Inferences(Events):
         return super().__getitem__(key)
 
 
+_EXPORT_ROW_GROUP_SIZE = 10_000
+_DATASET_NAME_COLUMN = "__phoenix_dataset_name__"
+_CLUSTER_ID_COLUMN = "__phoenix_cluster_id__"
+
+
 @dataclass(frozen=True, repr=False)
 class Model:
     """A Model consists of a set of dataframes and a set of Dimensions.
@@ -756,6 +767,7 @@ class Model:
         df_already_sorted_by_time: bool = False,
         # TODO: Consider moving validations here.
         df_already_validated: bool = False,
+        embedding_mmap_dir: Optional[Path] = None,
     ):
         # memoization
         object.__setattr__(
@@ -846,6 +858,14 @@ class Model:
                 ),
             )
 
+        # The memory-mapped embeddings of the model are stored in a directory
+        # of their own, which is deleted along with the model, or when the
+        # interpreter exits, e.g. when the server shuts down.
+        mmap_dir: Optional[Path] = None
+        if embedding_mmap_dir is not None:
+            mmap_dir = Path(mkdtemp(prefix="model-", dir=embedding_mmap_dir))
+            finalize(self, shutil.rmtree, mmap_dir, ignore_errors=True)
+
         # Add PREDICTION_ID if missing.
         # Add TIMESTAMP if missing.
         # If needed, normalize the timestamps values.
@@ -887,6 +907,25 @@ class Model:
             # Set time column as index for use by pd.Grouper.
             df = df.set_index(dim_time.name, drop=False)
 
+            # Store the vectors of each embedding dimension as one contiguous
+            # matrix (optionally memory-mapped from disk), in lieu of a column
+            # of per-row arrays.
+            embedding_dims = (
+                embedding_dim
+                for embedding_dim in self._dimensions.values()
+                if isinstance(embedding_dim, EmbeddingDimension)
+                and embedding_dim.name in df.columns
+            )
+            for i, embedding_dim in enumerate(list(embedding_dims)):
+                df[embedding_dim.name] = EmbeddingArray.from_vectors(
+                    df[embedding_dim.name].to_numpy(),
+                    path=(
+                        None
+                        if mmap_dir is None
+                        else mmap_dir / f"{inferences_role.name.lower()}-{i}.npy"
+                    ),
+                )
+
             # Update dataset since its dataframe may have changed.
             self._inference_sets[inferences_role] = self._new_inferences(
                 df, name=dataset.name, role=inferences_role
@@ -902,13 +941,17 @@ class Model:
         row_numbers: Mapping[InferencesRole, Iterable[int]],
         parquet_file: BinaryIO,
         cluster_ids: Optional[Mapping[InferencesRole, Mapping[int, str]]] = None,
+        row_group_size: int = _EXPORT_ROW_GROUP_SIZE,
+        progress: Optional[Callable[[int, int], None]] = None,
     ) -> None:
         """
         Given row numbers, exports dataframe subset into parquet file.
         Duplicate rows are removed. If the model hase more than one dataset, a
         new column is added to the dataframe containing the dataset name of
         each row in the exported data. The name of the added column will be
-        `__phoenix_dataset_name__`.
+        `__phoenix_dataset_name__`. The subset is written one row group at a
+        time, taken from one dataset at a time, so that it is never held in
+        memory as a whole.
 
         Parameters
         ----------
@@ -921,30 +964,65 @@ class Model:
             If cluster_ids is non-empty, a new column is inserted to the
             dataframe containing the cluster IDs of each row in the exported
             data. The name of the added column name is `__phoenix_cluster_id__`.
+        row_group_size: int
+            maximum number of rows in each row group of the parquet file
+        progress: Optional[Callable[[int, int], None]]
+            called with the number of rows written so far and the total
+            number of rows after each row group is written
         """
-        export_dataframes = [pd.DataFrame()]
         model_has_multiple_inference_sets = (
             sum(not df.empty for df in self._inference_sets.values()) > 1
         )
+        subsets: list[tuple[InferencesRole, Inferences, "npt.NDArray[np.intp]"]] = []
+        schemas: list[pa.Schema] = [pa.schema([])]
         for inferences_role, numbers in row_numbers.items():
             df = self._inference_sets[inferences_role]
-            columns = [
-                df.columns.get_loc(column_name)
+            rows = np.array(sorted(set(numbers)), dtype=np.intp)
+            subsets.append((inferences_role, df, rows))
+            fields = [
+                pa.field(column_name, _arrow_type(df[column_name], rows))
                 for column_name in self._original_columns_by_role[inferences_role]
             ]
-            rows = pd.Series(sorted(set(numbers)))
-            filtered_df = df.iloc[rows, columns].reset_index(drop=True)
             if model_has_multiple_inference_sets:
-                filtered_df["__phoenix_dataset_name__"] = df.display_name
-            if cluster_ids and (ids := cluster_ids.get(inferences_role)):
-                filtered_df["__phoenix_cluster_id__"] = rows.apply(ids.get)
-            export_dataframes.append(filtered_df)
-        pd.concat(export_dataframes).to_parquet(
+                fields.append(pa.field(_DATASET_NAME_COLUMN, pa.string()))
+            if cluster_ids and cluster_ids.get(inferences_role):
+                fields.append(pa.field(_CLUSTER_ID_COLUMN, pa.string()))
+            schemas.append(pa.schema(fields))
+        schema = pa.unify_schemas(schemas, promote_options="permissive")
+        total = sum(len(rows) for _, _, rows in subsets)
+        written = 0
+        with pq.ParquetWriter(
             parquet_file,
-            index=False,
+            schema,
             allow_truncated_timestamps=True,
             coerce_timestamps="ms",
-        )
+        ) as writer:
+            for inferences_role, df, rows in subsets:
+                ids = cluster_ids.get(inferences_role) if cluster_ids else None
+                for start in range(0, len(rows), row_group_size):
+                    chunk = rows[start : start + row_group_size]
+                    arrays: list["pa.Array[Any]"] = []
+                    for schema_field in schema:
+                        if schema_field.name == _DATASET_NAME_COLUMN:
+                            arrays.append(pa.repeat(df.display_name, len(chunk)))
+                        elif schema_field.name == _CLUSTER_ID_COLUMN and ids:
+                            arrays.append(pa.array(list(map(ids.get, chunk.tolist())), pa.string()))
+                        elif schema_field.name in df.columns:
+                            arrays.append(
+                                pa.Array.from_pandas(
+                                    df[schema_field.name].iloc[chunk],
+                                    type=schema_field.type,
+                                )
+                            )
+                        else:
+                            arrays.append(pa.nulls(len(chunk), schema_field.type))
+                    writer.write_table(
+                        pa.Table.from_arrays(arrays, schema=schema),
+                        row_group_size=row_group_size,
+                    )
+                    written += len(chunk)
+                    if progress:
+                        progress(written, total)
 
     @cached_property
     def scalar_dimensions(self) -> tuple[ScalarDimension, ...]:
@@ -1278,6 +1356,19 @@ class Schema(SchemaSpec):
             raise ValueError(f"invalid json data: {repr(data)}") from e
 
 
+def _arrow_type(column: "pd.Series[Any]", rows: "npt.NDArray[np.intp]") -> pa.DataType:
+    """
+    Returns the arrow type of the given rows of a column without converting them, which for
+    columns of Python objects is inferred from the rows themselves.
+    """
+    if isinstance(column.array, EmbeddingArray):
+        return pa.list_(pa.float32())
+    if column.dtype == object:
+        values = column.to_numpy()[rows]
+        return pa.infer_type(values, pd.isna(values))
+    return pa.Schema.from_pandas(column.iloc[:0].to_frame(), preserve_index=False).types[0]
+
+
 def _agg_min_max(series: "pd.Series[Any]") -> "pd.Series[Any]":
     return series.agg(["min", "max"])
 
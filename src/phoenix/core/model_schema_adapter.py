@@ -1,6 +1,7 @@
 from collections.abc import Iterable, Sized
 from itertools import chain
 from operator import itemgetter
+from pathlib import Path
 from typing import Optional, Union
 
 import pandas as pd
@@ -18,7 +19,10 @@ ColumnName: TypeAlias = str
 DisplayName: TypeAlias = str
 
 
-def create_model_from_inferences(*inference_sets: Optional[Inferences]) -> Model:
+def create_model_from_inferences(
+    *inference_sets: Optional[Inferences],
+    embedding_mmap_dir: Optional[Path] = None,
+) -> Model:
     # TODO: move this validation into model_schema.Model.
     if len(inference_sets) > 1 and inference_sets[0] is not None:
         # Check that for each embedding dimension all vectors
@@ -132,6 +136,7 @@ def create_model_from_inferences(*inference_sets: Optional[Inferences]) -> Model
         timestamps_already_normalized=True,
         df_already_sorted_by_time=True,
         df_already_validated=True,
+        embedding_mmap_dir=embedding_mmap_dir,
     )
 
 
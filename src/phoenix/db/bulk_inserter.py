@@ -17,6 +17,7 @@ from phoenix.db.insertion.evaluation import (
     InsertEvaluationError,
     insert_evaluation,
 )
+from phoenix.db.insertion.experiment_run import ExperimentRunInsertion, insert_experiment_runs
 from phoenix.db.insertion.helpers import DataManipulation, DataManipulationEvent
 from phoenix.db.insertion.span import SpanInsertionEvent, insert_span
 from phoenix.db.insertion.span_annotation import SpanAnnotationQueueInserter
@@ -72,6 +73,9 @@ class BulkInserter:
         self._evaluations: list[pb.Evaluation] = (
             [] if initial_batch_of_evaluations is None else list(initial_batch_of_evaluations)
         )
+        self._experiment_runs: list[
+            tuple[tuple[ExperimentRunInsertion, ...], asyncio.Future[None]]
+        ] = []
         self._task: Optional[asyncio.Task[None]] = None
         self._event_queue = event_queue
         self._enable_prometheus = enable_prometheus
@@ -115,6 +119,20 @@ class BulkInserter:
     async def _queue_evaluation(self, evaluation: pb.Evaluation) -> None:
         self._evaluations.append(evaluation)
 
+    def queue_experiment_runs(self, *insertions: ExperimentRunInsertion) -> asyncio.Future[None]:
+        """
+        Queues experiment runs produced by the server itself (e.g. by the playground), along with
+        the spans recording them, so that they are written by the inserter's task instead of by
+        the caller. The returned future resolves once the rows are written, at which point the
+        row ids are populated on the ORM objects.
+        """
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        if insertions:
+            self._experiment_runs.append((insertions, future))
+        else:
+            future.set_result(None)
+        return future
+
     async def _process_events(self, events: Iterable[Optional[DataManipulationEvent]]) -> None: ...
 
     async def _bulk_insert(self) -> None:
@@ -127,12 +145,14 @@ class BulkInserter:
             or not self._operations.empty()
             or self._spans
             or self._evaluations
+            or self._experiment_runs
         ):
             if (
                 self._queue_inserters.empty
                 and self._operations.empty()
                 and not self._spans
                 and not self._evaluations
+                and not self._experiment_runs
             ):
                 await asyncio.sleep(self._sleep)
                 continue
@@ -169,6 +189,10 @@ class BulkInserter:
             if evaluations_buffer:
                 await self._insert_evaluations(evaluations_buffer)
                 evaluations_buffer = None
+            if self._experiment_runs:
+                experiment_runs_buffer = self._experiment_runs
+                self._experiment_runs = []
+                await self._insert_experiment_runs(experiment_runs_buffer)
             async for event in self._queue_inserters.insert():
                 self._event_queue.put(event)
             await asyncio.sleep(self._sleep)
@@ -240,6 +264,48 @@ class BulkInserter:
                     BULK_LOADER_EXCEPTIONS.inc()
                 logger.exception("Failed to insert evaluations")
 
+    async def _insert_experiment_runs(
+        self,
+        batches: list[tuple[tuple[ExperimentRunInsertion, ...], asyncio.Future[None]]],
+    ) -> None:
+        project_ids: set[ProjectRowId] = set()
+        i = 0
+        while i < len(batches):
+            # Each transaction holds whole batches so that every future is resolved exactly once.
+            chunk: list[tuple[tuple[ExperimentRunInsertion, ...], asyncio.Future[None]]] = []
+            num_ops = 0
+            while i < len(batches) and (not chunk or num_ops < self._max_ops_per_transaction):
+                chunk.append(batches[i])
+                num_ops += len(batches[i][0])
+                i += 1
+            try:
+                start = perf_counter()
+                async with self._db() as session:
+                    project_ids.update(
+                        await insert_experiment_runs(
+                            session, *(ins for insertions, _ in chunk for ins in insertions)
+                        )
+                    )
+                if self._enable_prometheus:
+                    from phoenix.server.prometheus import BULK_LOADER_INSERTION_TIME
+
+                    BULK_LOADER_INSERTION_TIME.observe(perf_counter() - start)
+            except Exception as error:
+                if self._enable_prometheus:
+                    from phoenix.server.prometheus import BULK_LOADER_EXCEPTIONS
+
+                    BULK_LOADER_EXCEPTIONS.inc()
+                logger.exception("Failed to insert experiment runs")
+                for _, future in chunk:
+                    if not future.done():
+                        future.set_exception(error)
+            else:
+                for _, future in chunk:
+                    if not future.done():
+                        future.set_result(None)
+        if project_ids:
+            self._event_queue.put(SpanInsertEvent(tuple(project_ids)))
+
 
 class _QueueInserters:
     def __init__(
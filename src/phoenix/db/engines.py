@@ -7,13 +7,13 @@ from collections.abc import Callable
 from datetime import datetime
 from enum import Enum
 from sqlite3 import Connection
-from typing import Any
+from typing import Any, Optional
 
 import aiosqlite
 import numpy as np
 import sqlalchemy
 import sqlean
-from sqlalchemy import URL, StaticPool, event, make_url
+from sqlalchemy import URL, AsyncAdaptedQueuePool, StaticPool, event, make_url
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from typing_extensions import assert_never
 
@@ -39,6 +39,12 @@ def set_sqlite_pragma(connection: Connection, _: Any) -> None:
     cursor.close()
 
 
+def set_sqlite_query_only(connection: Connection, _: Any) -> None:
+    cursor = connection.cursor()
+    cursor.execute("PRAGMA query_only = ON;")
+    cursor.close()
+
+
 def get_printable_db_url(connection_str: str) -> str:
     return make_url(connection_str).render_as_string(hide_password=True)
 
@@ -117,20 +123,11 @@ def aio_sqlite_engine(
     if database.startswith(":memory:") and shared_cache:
         url = url.set(query={**url.query, "cache": "shared"}, database=":memory:")
     database = url.render_as_string().partition("///")[-1]
-
-    def async_creator() -> aiosqlite.Connection:
-        conn = aiosqlite.Connection(
-            lambda: sqlean.connect(f"file:{database}", uri=True),
-            iter_chunk_size=64,
-        )
-        conn.daemon = True
-        return conn
-
     engine = create_async_engine(
         url=url,
         echo=log_to_stdout,
         json_serializer=_dumps,
-        async_creator=async_creator,
+        async_creator=_sqlite_async_creator(database),
         poolclass=StaticPool,
     )
     event.listen(engine.sync_engine, "connect", set_sqlite_pragma)
@@ -154,6 +151,73 @@ def aio_sqlite_engine(
     return engine
 
 
+def aio_sqlite_reader_engine(
+    url: URL,
+    pool_size: int,
+    log_to_stdout: bool = False,
+) -> AsyncEngine:
+    """
+    Creates an engine with a bounded pool of read-only connections to a SQLite database file, to
+    serve reads concurrently with the single connection of the engine made by `aio_sqlite_engine`,
+    which remains the only writer. This relies on the database being in WAL mode, where readers
+    do not block the writer and vice versa, so it is not supported for in-memory databases.
+    """
+    database = url.database or ""
+    if database.startswith("file:"):
+        database = database[5:]
+    if not database or database.startswith(":memory:"):
+        raise ValueError("A reader engine requires a SQLite database file")
+    if pool_size < 1:
+        raise ValueError("pool_size must be a positive integer")
+    database = url.render_as_string().partition("///")[-1]
+    engine = create_async_engine(
+        url=url,
+        echo=log_to_stdout,
+        json_serializer=_dumps,
+        async_creator=_sqlite_async_creator(database),
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=pool_size,
+        max_overflow=0,
+    )
+    event.listen(engine.sync_engine, "connect", set_sqlite_pragma)
+    event.listen(engine.sync_engine, "connect", set_sqlite_query_only)
+    return engine
+
+
+def create_reader_engine(
+    connection_str: str,
+    pool_size: int,
+    log_to_stdout: bool = False,
+) -> Optional[AsyncEngine]:
+    """
+    Creates an engine for read-only connections if the database is a SQLite database file and
+    `pool_size` is positive, and returns None otherwise, i.e. when reads should share the engine
+    made by `create_engine`.
+    """
+    url = make_url(connection_str)
+    if SupportedSQLDialect(url.get_backend_name()) is not SupportedSQLDialect.SQLITE:
+        return None
+    if pool_size < 1 or not url.database or ":memory:" in url.database:
+        return None
+    return aio_sqlite_reader_engine(
+        url=get_async_db_url(url.render_as_string(hide_password=False)),
+        pool_size=pool_size,
+        log_to_stdout=log_to_stdout,
+    )
+
+
+def _sqlite_async_creator(database: str) -> Callable[[], aiosqlite.Connection]:
+    def async_creator() -> aiosqlite.Connection:
+        conn = aiosqlite.Connection(
+            lambda: sqlean.connect(f"file:{database}", uri=True),
+            iter_chunk_size=64,
+        )
+        conn.daemon = True
+        return conn
+
+    return async_creator
+
+
 def set_postgresql_search_path(schema: str) -> Callable[[Connection, Any], None]:
     def _(connection: Connection, _: Any) -> None:
         cursor = connection.cursor()
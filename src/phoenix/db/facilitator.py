@@ -26,10 +26,12 @@ from phoenix.auth import (
 from phoenix.config import (
     get_env_admins,
     get_env_default_admin_initial_password,
+    get_env_enable_full_text_search,
 )
 from phoenix.db import models
 from phoenix.db.constants import DEFAULT_PROJECT_TRACE_RETENTION_POLICY_ID
 from phoenix.db.enums import COLUMN_ENUMS, UserRole
+from phoenix.db.full_text_search import ensure_span_io_index
 from phoenix.db.types.trace_retention import (
     MaxDaysRule,
     TraceRetentionCronExpression,
@@ -65,6 +67,7 @@ class Facilitator:
             _get_system_user_id,
             partial(_ensure_admins, email_sender=self._email_sender),
             _ensure_default_project_trace_retention_policy,
+            _ensure_span_io_index,
         ):
             await fn(self._db)
 
@@ -260,3 +263,17 @@ async def _ensure_default_project_trace_retention_policy(db: DbSessionFactory) -
                 }
             ],
         )
+
+
+async def _ensure_span_io_index(db: DbSessionFactory) -> None:
+    """
+    Creates or drops the full-text search index on span input and output values according to the
+    configuration, and records on the session factory whether the index can be used by queries.
+    """
+    async with db() as session:
+        enabled = await ensure_span_io_index(
+            session,
+            db.dialect,
+            enabled=get_env_enable_full_text_search(),
+        )
+    db.span_io_index_enabled = db.reader.span_io_index_enabled = enabled
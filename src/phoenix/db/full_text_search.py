@@ -0,0 +1,201 @@
+"""
+An optional full-text search index over the input and output values of spans, used to serve
+substring filters (e.g. the input/output filter on sessions) without scanning every span.
+
+On SQLite, the index is a contentless FTS5 table with the trigram tokenizer, kept in sync with the
+spans table by triggers so that it is maintained at span-insert time. On PostgreSQL, the index is a
+pair of GIN expression indexes using the trigram operator classes from the pg_trgm extension.
+
+Trigram indexes cannot answer queries for substrings shorter than three characters, so those fall
+back to a plain scan.
+"""
+
+import logging
+
+from openinference.semconv.trace import SpanAttributes
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    String,
+    and_,
+    literal_column,
+    or_,
+    select,
+    table,
+    text,
+)
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlean.dbapi2 import OperationalError as SQLiteOperationalError  # type: ignore[import-untyped]
+from typing_extensions import assert_never
+
+from phoenix.db import models
+from phoenix.db.helpers import SupportedSQLDialect
+
+logger = logging.getLogger(__name__)
+
+SPAN_IO_FTS_TABLE = "span_io_fts"
+MIN_SUBSTRING_LENGTH = 3
+
+_INPUT_VALUE = SpanAttributes.INPUT_VALUE.split(".")
+_OUTPUT_VALUE = SpanAttributes.OUTPUT_VALUE.split(".")
+
+_SQLITE_INSERT_IO = (
+    f"INSERT INTO {SPAN_IO_FTS_TABLE}(rowid, input_value, output_value) "
+    "SELECT {row}.id, "
+    "json_extract({row}.attributes, '$.input.value'), "
+    "json_extract({row}.attributes, '$.output.value') "
+    "{from_clause}"
+    "WHERE json_extract({row}.attributes, '$.input.value') IS NOT NULL "
+    "OR json_extract({row}.attributes, '$.output.value') IS NOT NULL;"
+)
+_SQLITE_BACKFILL_IO = _SQLITE_INSERT_IO.format(row="spans", from_clause="FROM spans ")
+_SQLITE_INSERT_NEW_IO = _SQLITE_INSERT_IO.format(row="NEW", from_clause="")
+_SQLITE_DELETE_OLD_IO = f"DELETE FROM {SPAN_IO_FTS_TABLE} WHERE rowid = OLD.id;"
+_SQLITE_TRIGGERS = {
+    "spans_ai_span_io_fts": f"AFTER INSERT ON spans BEGIN {_SQLITE_INSERT_NEW_IO} END",
+    "spans_ad_span_io_fts": f"AFTER DELETE ON spans BEGIN {_SQLITE_DELETE_OLD_IO} END",
+    "spans_au_span_io_fts": (
+        "AFTER UPDATE OF attributes ON spans BEGIN "
+        f"{_SQLITE_DELETE_OLD_IO} {_SQLITE_INSERT_NEW_IO} END"
+    ),
+}
+
+_POSTGRESQL_INDEXES = {
+    "ix_spans_input_value_trgm": "{input,value}",
+    "ix_spans_output_value_trgm": "{output,value}",
+}
+
+
+async def ensure_span_io_index(
+    session: AsyncSession,
+    dialect: SupportedSQLDialect,
+    *,
+    enabled: bool,
+) -> bool:
+    """
+    Creates (and backfills) the full-text search index when `enabled` is true, or drops it
+    otherwise, so that a stale index is never consulted. Returns whether the index is available.
+    On PostgreSQL, the session must not have been used yet, since its connection is switched to
+    autocommit for the indexes to be built concurrently.
+    """
+    if dialect is SupportedSQLDialect.SQLITE:
+        return await _ensure_sqlite_index(session, enabled=enabled)
+    if dialect is SupportedSQLDialect.POSTGRESQL:
+        return await _ensure_postgresql_index(session, enabled=enabled)
+    assert_never(dialect)
+
+
+async def _ensure_sqlite_index(session: AsyncSession, *, enabled: bool) -> bool:
+    if not enabled:
+        for name in _SQLITE_TRIGGERS:
+            await session.execute(text(f"DROP TRIGGER IF EXISTS {name}"))
+        await session.execute(text(f"DROP TABLE IF EXISTS {SPAN_IO_FTS_TABLE}"))
+        return False
+    exists = await session.scalar(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": SPAN_IO_FTS_TABLE},
+    )
+    try:
+        async with session.begin_nested():
+            if not exists:
+                await session.execute(
+                    text(
+                        f"CREATE VIRTUAL TABLE {SPAN_IO_FTS_TABLE} USING fts5("
+                        "input_value, output_value, "
+                        "content='', contentless_delete=1, tokenize='trigram case_sensitive 1')"
+                    )
+                )
+                await session.execute(text(_SQLITE_BACKFILL_IO))
+            for name, definition in _SQLITE_TRIGGERS.items():
+                await session.execute(text(f"CREATE TRIGGER IF NOT EXISTS {name} {definition}"))
+    except (DBAPIError, SQLiteOperationalError):
+        # e.g. when SQLite is built without FTS5, or is older than 3.43.0 (contentless_delete)
+        logger.warning(
+            "Unable to create the full-text search index on span input and output values. "
+            "Full-text search on span input and output values will be disabled."
+        )
+        return False
+    return True
+
+
+async def _ensure_postgresql_index(session: AsyncSession, *, enabled: bool) -> bool:
+    # The indexes are built and dropped concurrently, so that writes to the spans table are not
+    # blocked while a large table is indexed, which requires running outside of a transaction.
+    connection = await session.connection(execution_options={"isolation_level": "AUTOCOMMIT"})
+    if not enabled:
+        for name in _POSTGRESQL_INDEXES:
+            await connection.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+        return False
+    try:
+        await connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    except DBAPIError:
+        logger.warning(
+            "Unable to create the pg_trgm extension. Full-text search on span input and output "
+            "values will be disabled."
+        )
+        return False
+    for name, path in _POSTGRESQL_INDEXES.items():
+        try:
+            # A concurrent build that failed, e.g. because the server stopped midway, leaves an
+            # invalid index behind, which would otherwise be kept by IF NOT EXISTS.
+            if await connection.scalar(
+                text("SELECT NOT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"),
+                {"name": name},
+            ):
+                await connection.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+            await connection.execute(
+                text(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON spans "
+                    f"USING gin ((attributes #>> '{path}') gin_trgm_ops)"
+                )
+            )
+        except DBAPIError:
+            logger.warning(
+                f"Unable to create the index {name}. Full-text search on span input and output "
+                "values will be disabled."
+            )
+            return False
+    return True
+
+
+def span_io_contains(
+    substring: str,
+    dialect: SupportedSQLDialect,
+    *,
+    indexed: bool,
+) -> ColumnElement[bool]:
+    """
+    Returns a condition on `models.Span` that is true when either the input value or the output
+    value of the span contains `substring`. The condition goes through the full-text search index
+    when `indexed` is true.
+    """
+    if not indexed or len(substring) < MIN_SUBSTRING_LENGTH:
+        return or_(
+            models.TextContains(models.Span.attributes[_INPUT_VALUE].as_string(), substring),
+            models.TextContains(models.Span.attributes[_OUTPUT_VALUE].as_string(), substring),
+        )
+    if dialect is SupportedSQLDialect.SQLITE:
+        # A phrase query on trigrams finds the rows containing every trigram of the substring
+        # in sequence. The exact check afterwards only runs on those candidate rows.
+        phrase = '"' + substring.replace('"', '""') + '"'
+        candidates = (
+            select(literal_column("rowid", Integer))
+            .select_from(table(SPAN_IO_FTS_TABLE))
+            .where(literal_column(SPAN_IO_FTS_TABLE).op("MATCH")(phrase))
+        )
+        return and_(
+            models.Span.id.in_(candidates),
+            span_io_contains(substring, dialect, indexed=False),
+        )
+    if dialect is SupportedSQLDialect.POSTGRESQL:
+        # The path is rendered as a literal so that the expressions match those of the indexes.
+        return or_(
+            *(
+                models.Span.attributes.op("#>>", return_type=String)(
+                    literal_column(f"'{path}'")
+                ).contains(substring, autoescape=True)
+                for path in _POSTGRESQL_INDEXES.values()
+            )
+        )
+    assert_never(dialect)
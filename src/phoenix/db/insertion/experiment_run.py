@@ -0,0 +1,91 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import insert, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing_extensions import TypeAlias
+
+from phoenix.db import models
+from phoenix.db.insertion.helpers import as_kv
+from phoenix.db.insertion.span import root_span_io
+
+_ProjectRowId: TypeAlias = int
+
+
+@dataclass(frozen=True)
+class ExperimentRunInsertion:
+    """
+    An experiment run produced by the server itself (e.g. by the playground), together with the
+    span recording it, if any. The span is expected to reference its (unsaved) trace via
+    `span.trace`.
+    """
+
+    run: models.ExperimentRun
+    span: Optional[models.Span] = None
+
+
+async def insert_experiment_runs(
+    session: AsyncSession,
+    *insertions: ExperimentRunInsertion,
+) -> set[_ProjectRowId]:
+    """
+    Inserts the traces, spans and experiment runs using one multi-row INSERT statement per table,
+    and populates the row ids on the given (transient) ORM objects so that they can be returned
+    to clients afterwards.
+
+    Returns the row ids of the projects that received new spans.
+    """
+    spans = [ins.span for ins in insertions if ins.span is not None]
+    if spans:
+        traces = {span.trace.trace_id: span.trace for span in spans}
+        trace_rowids: dict[str, int] = {
+            trace_id: id_
+            for id_, trace_id in await session.execute(
+                insert(models.Trace)
+                .values([dict(as_kv(trace)) for trace in traces.values()])
+                .returning(models.Trace.id, models.Trace.trace_id)
+            )
+        }
+        for trace_id, trace in traces.items():
+            trace.id = trace_rowids[trace_id]
+        for span in spans:
+            span.trace_rowid = span.trace.id
+        span_rowids: dict[str, int] = {
+            span_id: id_
+            for id_, span_id in await session.execute(
+                insert(models.Span)
+                .values([dict(as_kv(span)) for span in spans])
+                .returning(models.Span.id, models.Span.span_id)
+            )
+        }
+        for span in spans:
+            span.id = span_rowids[span.span_id]
+        if root_spans := [span for span in spans if span.parent_id is None]:
+            await session.execute(
+                update(models.Trace),
+                [
+                    dict(
+                        id=span.trace.id,
+                        root_span_rowid=span.id,
+                        **root_span_io(span.attributes),
+                    )
+                    for span in root_spans
+                ],
+            )
+    runs = [ins.run for ins in insertions]
+    run_rowids: dict[tuple[int, int, int], int] = {
+        (experiment_id, dataset_example_id, repetition_number): id_
+        for id_, experiment_id, dataset_example_id, repetition_number in await session.execute(
+            insert(models.ExperimentRun)
+            .values([dict(as_kv(run)) for run in runs])
+            .returning(
+                models.ExperimentRun.id,
+                models.ExperimentRun.experiment_id,
+                models.ExperimentRun.dataset_example_id,
+                models.ExperimentRun.repetition_number,
+            )
+        )
+    }
+    for run in runs:
+        run.id = run_rowids[(run.experiment_id, run.dataset_example_id, run.repetition_number)]
+    return {span.trace.project_rowid for span in spans}
@@ -1,5 +1,7 @@
+from collections.abc import Mapping
 from dataclasses import asdict
-from typing import NamedTuple, Optional, cast
+from datetime import datetime
+from typing import Any, NamedTuple, Optional, cast
 
 from openinference.semconv.trace import SpanAttributes
 from sqlalchemy import func, insert, select, update
@@ -8,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from phoenix.db import models
 from phoenix.db.helpers import SupportedSQLDialect
 from phoenix.db.insertion.helpers import OnConflict, insert_on_conflict
+from phoenix.db.types.latency_sketch import LatencySketch
 from phoenix.trace.attributes import get_attribute_value
 from phoenix.trace.schemas import Span, SpanStatusCode
 
@@ -41,6 +44,11 @@ async def insert_span(
         select(models.Trace).filter_by(trace_id=trace_id)
     ) or models.Trace(trace_id=trace_id)
 
+    # Latency of the trace as already counted in the latency sketch of its session, if any.
+    previous_latency_ms: Optional[float] = None
+    if trace.id is not None and trace.project_session_rowid is not None:
+        previous_latency_ms = trace.latency_ms
+
     if trace.id is not None:
         # Trace record may need to be updated.
         if trace.end_time < span.end_time:
@@ -80,6 +88,7 @@ async def insert_span(
             project_session.start_time = trace.start_time
             project_session.end_time = trace.end_time
             project_session.project_id = project_rowid
+            project_session.trace_latency_ms_sketch = LatencySketch()
             session.add(project_session)
             await session.flush()
             assert project_session.id is not None
@@ -98,6 +107,8 @@ async def insert_span(
     assert project_session is None or (
         project_session.id is not None and project_session.id == trace.project_session_rowid
     )
+    if project_session is not None and previous_latency_ms != trace.latency_ms:
+        await _update_trace_latency_sketch(session, project_session, trace, previous_latency_ms)
 
     cumulative_error_count = int(span.status_code is SpanStatusCode.ERROR)
     try:
@@ -164,6 +175,13 @@ async def insert_span(
     )
     if span_rowid is None:
         return None
+    if span.parent_id is None:
+        trace.root_span_rowid = span_rowid
+        for key, value in root_span_io(span.attributes).items():
+            setattr(trace, key, value)
+        await session.flush()
+        if project_session is not None:
+            await _update_session_io_pointers_with_trace(session, project_session, trace)
     # Propagate cumulative values to ancestors. This is usually a no-op, since
     # the parent usually arrives after the child. But in the event that a
     # child arrives after its parent, we need to make sure that all the
@@ -191,3 +209,158 @@ async def insert_span(
         )
     )
     return SpanInsertionEvent(project_rowid)
+
+
+def root_span_io(attributes: Mapping[str, Any]) -> dict[str, Optional[str]]:
+    """
+    Returns the values of the columns on the trace that hold the input and output of its root
+    span, given the attributes of the root span.
+    """
+    values: dict[str, Optional[str]] = {}
+    for prefix, value_key, mime_type_key in (
+        ("input", SpanAttributes.INPUT_VALUE, SpanAttributes.INPUT_MIME_TYPE),
+        ("output", SpanAttributes.OUTPUT_VALUE, SpanAttributes.OUTPUT_MIME_TYPE),
+    ):
+        value = get_attribute_value(attributes, value_key)
+        mime_type = get_attribute_value(attributes, mime_type_key)
+        values[f"{prefix}_value_first_101_chars"] = None if value is None else str(value)[:101]
+        values[f"{prefix}_mime_type"] = None if mime_type is None else str(mime_type)
+    return values
+
+
+async def update_session_io_pointers(session: AsyncSession, *project_session_rowids: int) -> None:
+    """
+    Points the sessions to their first and last traces that have root spans, i.e. the traces
+    holding the first input and the last output of the sessions, e.g. after traces have been
+    deleted from the sessions.
+    """
+    if not project_session_rowids:
+        return
+    traces = (
+        select(models.Trace.id)
+        .where(models.Trace.project_session_rowid == models.ProjectSession.id)
+        .where(models.Trace.root_span_rowid.isnot(None))
+        .limit(1)
+    )
+    await session.execute(
+        update(models.ProjectSession)
+        .where(models.ProjectSession.id.in_(project_session_rowids))
+        .values(
+            first_input_trace_rowid=traces.order_by(
+                models.Trace.start_time.asc(), models.Trace.id.asc()
+            ).scalar_subquery(),
+            last_output_trace_rowid=traces.order_by(
+                models.Trace.start_time.desc(), models.Trace.id.desc()
+            ).scalar_subquery(),
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def _update_session_io_pointers_with_trace(
+    session: AsyncSession,
+    project_session: models.ProjectSession,
+    trace: models.Trace,
+) -> None:
+    """
+    Points the session to the trace, whose root span has just arrived, if the trace now holds
+    the first input or the last output of the session. Only the traces currently pointed to are
+    compared with the trace, instead of all traces of the session.
+    """
+    first_rowid = project_session.first_input_trace_rowid
+    last_rowid = project_session.last_output_trace_rowid
+    # Traces pointed to that have since been deleted, if any, are simply replaced.
+    start_times: dict[int, datetime] = {}
+    if pointers := {rowid for rowid in (first_rowid, last_rowid) if rowid is not None}:
+        start_times = {
+            rowid: start_time
+            for rowid, start_time in await session.execute(
+                select(models.Trace.id, models.Trace.start_time).where(
+                    models.Trace.id.in_(pointers)
+                )
+            )
+        }
+    key = (trace.start_time, trace.id)
+    if (
+        first_rowid is None
+        or first_rowid not in start_times
+        or key < (start_times[first_rowid], first_rowid)
+    ):
+        project_session.first_input_trace_rowid = trace.id
+    if (
+        last_rowid is None
+        or last_rowid not in start_times
+        or (start_times[last_rowid], last_rowid) < key
+    ):
+        project_session.last_output_trace_rowid = trace.id
+
+
+async def update_session_trace_latency_sketches(
+    session: AsyncSession, *project_session_rowids: int
+) -> None:
+    """
+    Rebuilds the trace latency sketches and quantiles of the sessions from their remaining
+    traces, e.g. after traces have been deleted from the sessions. Sessions left without traces
+    are expected to be deleted, and are skipped.
+    """
+    if not project_session_rowids:
+        return
+    latencies_ms: dict[int, list[float]] = {}
+    for project_session_rowid, start_time, end_time in await session.execute(
+        select(
+            models.Trace.project_session_rowid,
+            models.Trace.start_time,
+            models.Trace.end_time,
+        ).where(models.Trace.project_session_rowid.in_(project_session_rowids))
+    ):
+        assert project_session_rowid is not None
+        # Latencies are computed in Python, so that a latency is always mapped to the same bin.
+        latencies_ms.setdefault(project_session_rowid, []).append(
+            (end_time - start_time).total_seconds() * 1000
+        )
+    if not latencies_ms:
+        return
+    params = []
+    for project_session_rowid, values in latencies_ms.items():
+        sketch = LatencySketch.from_values(values)
+        params.append(
+            {
+                "id": project_session_rowid,
+                "trace_latency_ms_sketch": sketch,
+                "trace_latency_ms_p50": sketch.quantile(0.5),
+                "trace_latency_ms_p99": sketch.quantile(0.99),
+            }
+        )
+    await session.execute(update(models.ProjectSession), params)
+
+
+async def _update_trace_latency_sketch(
+    session: AsyncSession,
+    project_session: models.ProjectSession,
+    trace: models.Trace,
+    previous_latency_ms: Optional[float],
+) -> None:
+    """
+    Replaces the previous latency of the trace, if any, with its current latency in the latency
+    sketch of the session. A session recorded before sketches existed gets its sketch built from
+    all of its traces.
+    """
+    if (sketch := project_session.trace_latency_ms_sketch) is None:
+        # Latencies are computed in Python, as they are for removals below, so that
+        # a latency is always mapped to the same bin.
+        sketch = LatencySketch.from_values(
+            (end_time - start_time).total_seconds() * 1000
+            for start_time, end_time in await session.execute(
+                select(models.Trace.start_time, models.Trace.end_time).filter_by(
+                    project_session_rowid=project_session.id
+                )
+            )
+        )
+    else:
+        sketch = sketch.model_copy(deep=True)
+        if previous_latency_ms is not None:
+            sketch.remove(previous_latency_ms)
+        sketch.add(trace.latency_ms)
+    project_session.trace_latency_ms_sketch = sketch
+    project_session.trace_latency_ms_p50 = sketch.quantile(0.5)
+    project_session.trace_latency_ms_p99 = sketch.quantile(0.99)
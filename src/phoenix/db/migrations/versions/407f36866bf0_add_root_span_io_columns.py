@@ -0,0 +1,163 @@
+"""add root span io columns to traces and project sessions
+
+Revision ID: 407f36866bf0
+Revises: 8a3764fe7f1a
+Create Date: 2025-05-02 10:21:43.815347
+
+"""
+
+from datetime import datetime
+from typing import Any, Optional, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from openinference.semconv.trace import SpanAttributes
+from sqlalchemy import JSON, Dialect, MetaData, TypeDecorator, func, select, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+# revision identifiers, used by Alembic.
+revision: str = "407f36866bf0"
+down_revision: Union[str, None] = "8a3764fe7f1a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+class JSONB(JSON):
+    # See https://docs.sqlalchemy.org/en/20/core/custom_types.html
+    __visit_name__ = "JSONB"
+
+
+@compiles(JSONB, "sqlite")
+def _(*args: Any, **kwargs: Any) -> str:
+    # See https://docs.sqlalchemy.org/en/20/core/custom_types.html
+    return "JSONB"
+
+
+JSON_ = (
+    JSON()
+    .with_variant(
+        postgresql.JSONB(),
+        "postgresql",
+    )
+    .with_variant(
+        JSONB(),
+        "sqlite",
+    )
+)
+
+
+class JsonDict(TypeDecorator[dict[str, Any]]):
+    # See # See https://docs.sqlalchemy.org/en/20/core/custom_types.html
+    cache_ok = True
+    impl = JSON_
+
+    def process_bind_param(self, value: Optional[dict[str, Any]], _: Dialect) -> dict[str, Any]:
+        return value if isinstance(value, dict) else {}
+
+
+class Base(DeclarativeBase):
+    # Enforce best practices for naming constraints
+    # https://alembic.sqlalchemy.org/en/latest/naming.html#integration-of-naming-conventions-into-operations-autogenerate
+    metadata = MetaData(
+        naming_convention={
+            "ix": "ix_%(table_name)s_%(column_0_N_name)s",
+            "uq": "uq_%(table_name)s_%(column_0_N_name)s",
+            "ck": "ck_%(table_name)s_`%(constraint_name)s`",
+            "fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s",
+            "pk": "pk_%(table_name)s",
+        }
+    )
+    type_annotation_map = {
+        dict[str, Any]: JsonDict,
+    }
+
+
+class ProjectSession(Base):
+    __tablename__ = "project_sessions"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    first_input_trace_rowid: Mapped[Optional[int]]
+    last_output_trace_rowid: Mapped[Optional[int]]
+
+
+class Trace(Base):
+    __tablename__ = "traces"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    project_session_rowid: Mapped[Optional[int]]
+    start_time: Mapped[datetime]
+    root_span_rowid: Mapped[Optional[int]]
+    input_value_first_101_chars: Mapped[Optional[str]]
+    input_mime_type: Mapped[Optional[str]]
+    output_value_first_101_chars: Mapped[Optional[str]]
+    output_mime_type: Mapped[Optional[str]]
+
+
+class Span(Base):
+    __tablename__ = "spans"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    trace_rowid: Mapped[int]
+    parent_id: Mapped[Optional[str]]
+    attributes: Mapped[dict[str, Any]]
+
+
+INPUT_VALUE = SpanAttributes.INPUT_VALUE.split(".")
+INPUT_MIME_TYPE = SpanAttributes.INPUT_MIME_TYPE.split(".")
+OUTPUT_VALUE = SpanAttributes.OUTPUT_VALUE.split(".")
+OUTPUT_MIME_TYPE = SpanAttributes.OUTPUT_MIME_TYPE.split(".")
+
+
+def upgrade() -> None:
+    op.add_column("traces", sa.Column("root_span_rowid", sa.Integer, nullable=True))
+    op.add_column("traces", sa.Column("input_value_first_101_chars", sa.String, nullable=True))
+    op.add_column("traces", sa.Column("input_mime_type", sa.String, nullable=True))
+    op.add_column("traces", sa.Column("output_value_first_101_chars", sa.String, nullable=True))
+    op.add_column("traces", sa.Column("output_mime_type", sa.String, nullable=True))
+    op.add_column(
+        "project_sessions", sa.Column("first_input_trace_rowid", sa.Integer, nullable=True)
+    )
+    op.add_column(
+        "project_sessions", sa.Column("last_output_trace_rowid", sa.Integer, nullable=True)
+    )
+    op.execute(
+        update(Trace)
+        .where(Trace.id == Span.trace_rowid)
+        .where(Span.parent_id.is_(None))
+        .values(
+            root_span_rowid=Span.id,
+            input_value_first_101_chars=func.substr(
+                Span.attributes[INPUT_VALUE].as_string(), 1, 101
+            ),
+            input_mime_type=Span.attributes[INPUT_MIME_TYPE].as_string(),
+            output_value_first_101_chars=func.substr(
+                Span.attributes[OUTPUT_VALUE].as_string(), 1, 101
+            ),
+            output_mime_type=Span.attributes[OUTPUT_MIME_TYPE].as_string(),
+        )
+    )
+    traces = (
+        select(Trace.id)
+        .where(Trace.project_session_rowid == ProjectSession.id)
+        .where(Trace.root_span_rowid.isnot(None))
+        .limit(1)
+    )
+    op.execute(
+        update(ProjectSession).values(
+            first_input_trace_rowid=traces.order_by(
+                Trace.start_time.asc(), Trace.id.asc()
+            ).scalar_subquery(),
+            last_output_trace_rowid=traces.order_by(
+                Trace.start_time.desc(), Trace.id.desc()
+            ).scalar_subquery(),
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("project_sessions", "last_output_trace_rowid")
+    op.drop_column("project_sessions", "first_input_trace_rowid")
+    op.drop_column("traces", "output_mime_type")
+    op.drop_column("traces", "output_value_first_101_chars")
+    op.drop_column("traces", "input_mime_type")
+    op.drop_column("traces", "input_value_first_101_chars")
+    op.drop_column("traces", "root_span_rowid")
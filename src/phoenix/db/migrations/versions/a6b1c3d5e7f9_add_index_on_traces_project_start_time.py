@@ -0,0 +1,29 @@
+"""add index on the project and start time of traces
+
+Revision ID: a6b1c3d5e7f9
+Revises: e2f4a7c9b1d3
+Create Date: 2025-05-14 09:12:45.602318
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a6b1c3d5e7f9"
+down_revision: Union[str, None] = "e2f4a7c9b1d3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_traces_project_rowid_start_time",
+        "traces",
+        ["project_rowid", "start_time"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_traces_project_rowid_start_time")
@@ -0,0 +1,183 @@
+"""add trace latency sketch to project sessions
+
+Revision ID: c1f2a8d9e0b3
+Revises: 407f36866bf0
+Create Date: 2025-05-06 14:02:17.530214
+
+"""
+
+import math
+from datetime import datetime
+from typing import Any, Optional, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import JSON, MetaData, bindparam, select, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+# revision identifiers, used by Alembic.
+revision: str = "c1f2a8d9e0b3"
+down_revision: Union[str, None] = "407f36866bf0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+class JSONB(JSON):
+    # See https://docs.sqlalchemy.org/en/20/core/custom_types.html
+    __visit_name__ = "JSONB"
+
+
+@compiles(JSONB, "sqlite")
+def _(*args: Any, **kwargs: Any) -> str:
+    # See https://docs.sqlalchemy.org/en/20/core/custom_types.html
+    return "JSONB"
+
+
+JSON_ = (
+    JSON()
+    .with_variant(
+        postgresql.JSONB(),
+        "postgresql",
+    )
+    .with_variant(
+        JSONB(),
+        "sqlite",
+    )
+)
+
+
+class Base(DeclarativeBase):
+    # Enforce best practices for naming constraints
+    # https://alembic.sqlalchemy.org/en/latest/naming.html#integration-of-naming-conventions-into-operations-autogenerate
+    metadata = MetaData(
+        naming_convention={
+            "ix": "ix_%(table_name)s_%(column_0_N_name)s",
+            "uq": "uq_%(table_name)s_%(column_0_N_name)s",
+            "ck": "ck_%(table_name)s_`%(constraint_name)s`",
+            "fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s",
+            "pk": "pk_%(table_name)s",
+        }
+    )
+
+
+class ProjectSession(Base):
+    __tablename__ = "project_sessions"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    trace_latency_ms_sketch: Mapped[Optional[dict[str, Any]]] = mapped_column(JSON_)
+    trace_latency_ms_p50: Mapped[Optional[float]]
+    trace_latency_ms_p99: Mapped[Optional[float]]
+
+
+class Trace(Base):
+    __tablename__ = "traces"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    project_session_rowid: Mapped[Optional[int]]
+    start_time: Mapped[datetime] = mapped_column(sa.TIMESTAMP(timezone=True))
+    end_time: Mapped[datetime] = mapped_column(sa.TIMESTAMP(timezone=True))
+
+
+# A copy of `phoenix.db.types.latency_sketch.LatencySketch` as of this revision, so that the
+# backfilled sketches are the same as those built by the server.
+RELATIVE_ACCURACY = 0.01
+GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+BATCH_SIZE = 1000
+
+
+def _sketch(latencies: list[float]) -> dict[str, Any]:
+    zero_count = 0
+    bins: dict[int, int] = {}
+    for latency in latencies:
+        if latency <= 0:
+            zero_count += 1
+        else:
+            index = math.ceil(math.log(latency) / math.log(GAMMA))
+            bins[index] = bins.get(index, 0) + 1
+    return {"relative_accuracy": RELATIVE_ACCURACY, "zero_count": zero_count, "bins": bins}
+
+
+def _quantile(sketch: dict[str, Any], probability: float) -> Optional[float]:
+    zero_count, bins = sketch["zero_count"], sketch["bins"]
+    if not (count := zero_count + sum(bins.values())):
+        return None
+    rank = probability * (count - 1)
+    cumulative_count = zero_count
+    if rank < cumulative_count:
+        return 0.0
+    for index in sorted(bins):
+        cumulative_count += bins[index]
+        if rank < cumulative_count:
+            break
+    return float(2 * GAMMA**index / (GAMMA + 1))
+
+
+def _backfill_sketches() -> None:
+    connection = op.get_bind()
+    stmt = (
+        update(ProjectSession)
+        .where(ProjectSession.id == bindparam("session_rowid"))
+        .values(
+            trace_latency_ms_sketch=bindparam("sketch", type_=JSON_),
+            trace_latency_ms_p50=bindparam("p50"),
+            trace_latency_ms_p99=bindparam("p99"),
+        )
+    )
+    last_session_rowid = 0
+    while session_rowids := list(
+        connection.scalars(
+            select(ProjectSession.id)
+            .where(ProjectSession.id > last_session_rowid)
+            .order_by(ProjectSession.id)
+            .limit(BATCH_SIZE)
+        )
+    ):
+        last_session_rowid = session_rowids[-1]
+        latencies: dict[Optional[int], list[float]] = {}
+        for session_rowid, start_time, end_time in connection.execute(
+            select(Trace.project_session_rowid, Trace.start_time, Trace.end_time).where(
+                Trace.project_session_rowid.in_(session_rowids)
+            )
+        ):
+            # computed in Python, as by the server, so that a latency maps to the same bin
+            latency_ms = (end_time - start_time).total_seconds() * 1000
+            latencies.setdefault(session_rowid, []).append(latency_ms)
+        if not latencies:
+            continue
+        params = []
+        for session_rowid, session_latencies in latencies.items():
+            sketch = _sketch(session_latencies)
+            params.append(
+                {
+                    "session_rowid": session_rowid,
+                    "sketch": sketch,
+                    "p50": _quantile(sketch, 0.5),
+                    "p99": _quantile(sketch, 0.99),
+                }
+            )
+        connection.execute(stmt, params)
+
+
+def upgrade() -> None:
+    op.add_column("project_sessions", sa.Column("trace_latency_ms_sketch", JSON_, nullable=True))
+    op.add_column("project_sessions", sa.Column("trace_latency_ms_p50", sa.Float, nullable=True))
+    op.add_column("project_sessions", sa.Column("trace_latency_ms_p99", sa.Float, nullable=True))
+    op.create_index(
+        "ix_project_sessions_trace_latency_ms_p50",
+        "project_sessions",
+        ["trace_latency_ms_p50"],
+    )
+    op.create_index(
+        "ix_project_sessions_trace_latency_ms_p99",
+        "project_sessions",
+        ["trace_latency_ms_p99"],
+    )
+    _backfill_sketches()
+
+
+def downgrade() -> None:
+    op.drop_index("ix_project_sessions_trace_latency_ms_p99", "project_sessions")
+    op.drop_index("ix_project_sessions_trace_latency_ms_p50", "project_sessions")
+    op.drop_column("project_sessions", "trace_latency_ms_p99")
+    op.drop_column("project_sessions", "trace_latency_ms_p50")
+    op.drop_column("project_sessions", "trace_latency_ms_sketch")
@@ -0,0 +1,46 @@
+"""create trace deletion jobs table
+
+Revision ID: e2f4a7c9b1d3
+Revises: c1f2a8d9e0b3
+Create Date: 2025-05-12 10:41:03.218735
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2f4a7c9b1d3"
+down_revision: Union[str, None] = "c1f2a8d9e0b3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "trace_deletion_jobs",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column(
+            "project_id",
+            sa.Integer,
+            sa.ForeignKey("projects.id", ondelete="CASCADE"),
+            nullable=False,
+            index=True,
+        ),
+        sa.Column("max_trace_rowid", sa.Integer, nullable=False),
+        sa.Column("start_time_before", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("delete_project", sa.Boolean, nullable=False),
+        sa.Column("num_traces_deleted", sa.Integer, nullable=False, server_default="0"),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("trace_deletion_jobs")
@@ -52,6 +52,7 @@ from phoenix.db.types.annotation_configs import (
     AnnotationConfigType,
 )
 from phoenix.db.types.identifier import Identifier
+from phoenix.db.types.latency_sketch import LatencySketch
 from phoenix.db.types.model_provider import ModelProvider
 from phoenix.db.types.trace_retention import TraceRetentionCronExpression, TraceRetentionRule
 from phoenix.server.api.helpers.prompts.models import (
@@ -377,6 +378,22 @@ class _TraceRetentionRule(TypeDecorator[TraceRetentionRule]):
         return TraceRetentionRule.model_validate(value)
 
 
+class _LatencySketch(TypeDecorator[LatencySketch]):
+    # See # See https://docs.sqlalchemy.org/en/20/core/custom_types.html
+    cache_ok = True
+    impl = JSON_
+
+    def process_bind_param(
+        self, value: Optional[LatencySketch], _: Dialect
+    ) -> Optional[dict[str, Any]]:
+        return value.model_dump() if value is not None else None
+
+    def process_result_value(
+        self, value: Optional[dict[str, Any]], _: Dialect
+    ) -> Optional[LatencySketch]:
+        return LatencySketch.model_validate(value) if value is not None else None
+
+
 class _AnnotationConfig(TypeDecorator[AnnotationConfigType]):
     # See # See https://docs.sqlalchemy.org/en/20/core/custom_types.html
     cache_ok = True
@@ -471,6 +488,26 @@ class Project(Base):
     )
 
 
+class TraceDeletionJob(Base):
+    """
+    Deletes the traces of a project in batches, i.e. the traces that existed when the job was
+    created (up to `max_trace_rowid`) and, if given, that started before `start_time_before`,
+    followed by the project itself if `delete_project` is set. Jobs are deleted once done, so the
+    remaining ones are resumed after a restart.
+    """
+
+    __tablename__ = "trace_deletion_jobs"
+    project_id: Mapped[int] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        index=True,
+    )
+    max_trace_rowid: Mapped[int]
+    start_time_before: Mapped[Optional[datetime]] = mapped_column(UtcTimeStamp)
+    delete_project: Mapped[bool]
+    num_traces_deleted: Mapped[int] = mapped_column(server_default=text("0"))
+    created_at: Mapped[datetime] = mapped_column(UtcTimeStamp, server_default=func.now())
+
+
 class ProjectSession(Base):
     __tablename__ = "project_sessions"
     session_id: Mapped[str] = mapped_column(String, nullable=False, unique=True)
@@ -481,6 +518,19 @@ class ProjectSession(Base):
     )
     start_time: Mapped[datetime] = mapped_column(UtcTimeStamp, index=True, nullable=False)
     end_time: Mapped[datetime] = mapped_column(UtcTimeStamp, index=True, nullable=False)
+    # Pointers to the first and last traces (with root spans) of the session, so that the first
+    # input and the last output of the session can be looked up without scanning its spans. These
+    # are not foreign keys, because traces already reference sessions, and a pointer left dangling
+    # by a deleted trace is treated the same as a missing pointer.
+    first_input_trace_rowid: Mapped[Optional[int]]
+    last_output_trace_rowid: Mapped[Optional[int]]
+    # A sketch of the latencies of the traces of the session, kept up to date as spans arrive,
+    # along with the quantiles by which sessions can be sorted.
+    trace_latency_ms_sketch: Mapped[Optional[LatencySketch]] = mapped_column(
+        _LatencySketch, nullable=True
+    )
+    trace_latency_ms_p50: Mapped[Optional[float]] = mapped_column(index=True)
+    trace_latency_ms_p99: Mapped[Optional[float]] = mapped_column(index=True)
     traces: Mapped[list["Trace"]] = relationship(
         "Trace",
         back_populates="project_session",
@@ -502,6 +552,12 @@ class Trace(Base):
     )
     start_time: Mapped[datetime] = mapped_column(UtcTimeStamp, index=True)
     end_time: Mapped[datetime] = mapped_column(UtcTimeStamp)
+    # Input and output of the root span, copied from its attributes when it is inserted.
+    root_span_rowid: Mapped[Optional[int]]
+    input_value_first_101_chars: Mapped[Optional[str]]
+    input_mime_type: Mapped[Optional[str]]
+    output_value_first_101_chars: Mapped[Optional[str]]
+    output_mime_type: Mapped[Optional[str]]
 
     @hybrid_property
     def latency_ms(self) -> float:
@@ -534,9 +590,29 @@ class Trace(Base):
         UniqueConstraint(
             "trace_id",
         ),
+        Index("ix_traces_project_rowid_start_time", "project_rowid", "start_time"),
     )
 
 
+def _span_attribute(key: str) -> hybrid_property[Any]:
+    """
+    Makes a hybrid property for a span attribute, e.g. `llm.model_name`, whose SQL expression
+    extracts the attribute with a JSON path (`json_extract` on SQLite and `#>` on PostgreSQL) so
+    that only the attribute, and not the entire `attributes` column, is loaded from the database.
+    The property must be named after the key with dots replaced by underscores.
+    """
+    path = key.split(".")
+
+    def fget(self: "Span") -> Any:
+        return get_attribute_value(self.attributes, path)
+
+    def expr(cls: type["Span"]) -> ColumnElement[Any]:
+        return cls.attributes[path]
+
+    fget.__name__ = expr.__name__ = key.replace(".", "_")
+    return hybrid_property(fget, expr=expr)
+
+
 class Span(Base):
     __tablename__ = "spans"
     trace_rowid: Mapped[int] = mapped_column(
@@ -662,6 +738,15 @@ class Span(Base):
     def _num_documents_expression(cls) -> ColumnElement[int]:
         return NumDocuments(cls.attributes, cls.span_kind)
 
+    llm_provider = _span_attribute(SpanAttributes.LLM_PROVIDER)
+    llm_model_name = _span_attribute(SpanAttributes.LLM_MODEL_NAME)
+    llm_invocation_parameters = _span_attribute(SpanAttributes.LLM_INVOCATION_PARAMETERS)
+    llm_input_messages = _span_attribute(SpanAttributes.LLM_INPUT_MESSAGES)
+    llm_output_messages = _span_attribute(SpanAttributes.LLM_OUTPUT_MESSAGES)
+    llm_prompt_template_variables = _span_attribute(SpanAttributes.LLM_PROMPT_TEMPLATE_VARIABLES)
+    llm_tools = _span_attribute(SpanAttributes.LLM_TOOLS)
+    retrieval_documents = _span_attribute(SpanAttributes.RETRIEVAL_DOCUMENTS)
+
     @hybrid_property
     def cumulative_llm_token_count_total(self) -> int:
         return self.cumulative_llm_token_count_prompt + self.cumulative_llm_token_count_completion
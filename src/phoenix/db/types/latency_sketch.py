@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable
+from typing import Annotated, Optional
+
+from pydantic import BaseModel, Field
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+
+
+class LatencySketch(BaseModel):
+    """
+    A mergeable quantile sketch for latencies, following DDSketch
+    (https://arxiv.org/abs/1908.10693). Positive values are counted in logarithmically sized
+    bins, so that any quantile returned by the sketch is within `relative_accuracy` (relative
+    error) of a value of the same rank in the data, e.g. within 1% by default. Values can also
+    be removed, which allows the sketch to follow traces whose latencies change as their spans
+    arrive.
+    """
+
+    relative_accuracy: Annotated[float, Field(gt=0, lt=1)] = DEFAULT_RELATIVE_ACCURACY
+    zero_count: int = 0
+    bins: dict[int, int] = Field(default_factory=dict)
+
+    @classmethod
+    def from_values(
+        cls,
+        values: Iterable[float],
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+    ) -> LatencySketch:
+        sketch = cls(relative_accuracy=relative_accuracy)
+        for value in values:
+            sketch.add(value)
+        return sketch
+
+    @property
+    def _gamma(self) -> float:
+        return (1 + self.relative_accuracy) / (1 - self.relative_accuracy)
+
+    def _index(self, value: float) -> int:
+        return math.ceil(math.log(value) / math.log(self._gamma))
+
+    def _value(self, index: int) -> float:
+        return 2 * self._gamma**index / (self._gamma + 1)
+
+    @property
+    def count(self) -> int:
+        return self.zero_count + sum(self.bins.values())
+
+    def add(self, value: float, count: int = 1) -> None:
+        """
+        Adds `count` occurrences of `value` to the sketch. A negative `count` removes previously
+        added occurrences.
+        """
+        if value <= 0:
+            self.zero_count = max(0, self.zero_count + count)
+            return
+        index = self._index(value)
+        if (n := self.bins.get(index, 0) + count) > 0:
+            self.bins[index] = n
+        else:
+            self.bins.pop(index, None)
+
+    def remove(self, value: float) -> None:
+        self.add(value, -1)
+
+    def merge(self, other: LatencySketch) -> None:
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracies")
+        self.zero_count += other.zero_count
+        for index, count in other.bins.items():
+            self.bins[index] = self.bins.get(index, 0) + count
+
+    def quantile(self, probability: float) -> Optional[float]:
+        if not 0 <= probability <= 1:
+            raise ValueError("Probability must be between 0 and 1")
+        if not (count := self.count):
+            return None
+        rank = probability * (count - 1)
+        cumulative_count = self.zero_count
+        if rank < cumulative_count:
+            return 0.0
+        for index in sorted(self.bins):
+            cumulative_count += self.bins[index]
+            if rank < cumulative_count:
+                return self._value(index)
+        return self._value(max(self.bins))
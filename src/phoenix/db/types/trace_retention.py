@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
-from typing import Annotated, Iterable, Literal, Optional, Union
+from typing import Annotated, Literal, Optional, Union
 
 import sqlalchemy as sa
 from pydantic import AfterValidator, BaseModel, Field, RootModel
@@ -14,29 +14,34 @@ class _MaxDays(BaseModel):
     max_days: Annotated[float, Field(ge=0)]
 
     @property
-    def max_days_filter(self) -> sa.ColumnElement[bool]:
+    def max_days_cutoff(self) -> Optional[datetime]:
         if self.max_days <= 0:
-            return sa.literal(False)
-        from phoenix.db.models import Trace
-
-        return Trace.start_time < datetime.now(timezone.utc) - timedelta(days=self.max_days)
+            return None
+        return datetime.now(timezone.utc) - timedelta(days=self.max_days)
 
 
 class _MaxCount(BaseModel):
     max_count: Annotated[int, Field(ge=0)]
 
-    @property
-    def max_count_filter(self) -> sa.ColumnElement[bool]:
+    async def get_max_count_cutoff(
+        self,
+        session: AsyncSession,
+        project_rowid: int,
+    ) -> Optional[datetime]:
+        """
+        The start time of the `max_count`-th most recent trace of the project, which is found
+        by walking the index on `(project_rowid, start_time)`, or None if there are fewer traces.
+        """
         if self.max_count <= 0:
-            return sa.literal(False)
+            return None
         from phoenix.db.models import Trace
 
-        return Trace.start_time < (
+        return await session.scalar(
             sa.select(Trace.start_time)
+            .where(Trace.project_rowid == project_rowid)
             .order_by(Trace.start_time.desc())
             .offset(self.max_count - 1)
             .limit(1)
-            .scalar_subquery()
         )
 
 
@@ -46,22 +51,12 @@ class MaxDaysRule(_MaxDays, BaseModel):
     def __bool__(self) -> bool:
         return self.max_days > 0
 
-    async def delete_traces(
+    async def get_start_time_cutoff(
         self,
         session: AsyncSession,
-        project_rowids: Union[Iterable[int], sa.ScalarSelect[int]],
-    ) -> set[int]:
-        if self.max_days <= 0:
-            return set()
-        from phoenix.db.models import Trace
-
-        stmt = (
-            sa.delete(Trace)
-            .where(Trace.project_rowid.in_(project_rowids))
-            .where(self.max_days_filter)
-            .returning(Trace.project_rowid)
-        )
-        return set(await session.scalars(stmt))
+        project_rowid: int,
+    ) -> Optional[datetime]:
+        return self.max_days_cutoff
 
 
 class MaxCountRule(_MaxCount, BaseModel):
@@ -70,22 +65,12 @@ class MaxCountRule(_MaxCount, BaseModel):
     def __bool__(self) -> bool:
         return self.max_count > 0
 
-    async def delete_traces(
+    async def get_start_time_cutoff(
         self,
         session: AsyncSession,
-        project_rowids: Union[Iterable[int], sa.ScalarSelect[int]],
-    ) -> set[int]:
-        if self.max_count <= 0:
-            return set()
-        from phoenix.db.models import Trace
-
-        stmt = (
-            sa.delete(Trace)
-            .where(Trace.project_rowid.in_(project_rowids))
-            .where(self.max_count_filter)
-            .returning(Trace.project_rowid)
-        )
-        return set(await session.scalars(stmt))
+        project_rowid: int,
+    ) -> Optional[datetime]:
+        return await self.get_max_count_cutoff(session, project_rowid)
 
 
 class MaxDaysOrCountRule(_MaxDays, _MaxCount, BaseModel):
@@ -94,22 +79,20 @@ class MaxDaysOrCountRule(_MaxDays, _MaxCount, BaseModel):
     def __bool__(self) -> bool:
         return self.max_days > 0 or self.max_count > 0
 
-    async def delete_traces(
+    async def get_start_time_cutoff(
         self,
         session: AsyncSession,
-        project_rowids: Union[Iterable[int], sa.ScalarSelect[int]],
-    ) -> set[int]:
-        if self.max_days <= 0 and self.max_count <= 0:
-            return set()
-        from phoenix.db.models import Trace
-
-        stmt = (
-            sa.delete(Trace)
-            .where(Trace.project_rowid.in_(project_rowids))
-            .where(sa.or_(self.max_days_filter, self.max_count_filter))
-            .returning(Trace.project_rowid)
-        )
-        return set(await session.scalars(stmt))
+        project_rowid: int,
+    ) -> Optional[datetime]:
+        cutoffs = [
+            cutoff
+            for cutoff in (
+                self.max_days_cutoff,
+                await self.get_max_count_cutoff(session, project_rowid),
+            )
+            if cutoff is not None
+        ]
+        return max(cutoffs, default=None)
 
 
 class TraceRetentionRule(RootModel[Union[MaxDaysRule, MaxCountRule, MaxDaysOrCountRule]]):
@@ -120,12 +103,17 @@ class TraceRetentionRule(RootModel[Union[MaxDaysRule, MaxCountRule, MaxDaysOrCou
     def __bool__(self) -> bool:
         return bool(self.root)
 
-    async def delete_traces(
+    async def get_start_time_cutoff(
         self,
         session: AsyncSession,
-        project_rowids: Union[Iterable[int], sa.ScalarSelect[int]],
-    ) -> set[int]:
-        return await self.root.delete_traces(session, project_rowids)
+        project_rowid: int,
+    ) -> Optional[datetime]:
+        """
+        The time before which traces of the project that started are to be deleted by the rule,
+        or None if no trace is to be deleted. Traces starting at the same time as the oldest one
+        kept by a `max_count` are kept too. The traces are deleted by the `TraceDeleter`.
+        """
+        return await self.root.get_start_time_cutoff(session, project_rowid)
 
 
 def _time_of_next_run(
@@ -6,6 +6,7 @@ from functools import partial
 from typing import Any, Optional, cast
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 from typing_extensions import TypeAlias
 
@@ -13,6 +14,8 @@ from phoenix.core.model_schema import Column
 from phoenix.metrics import Metric, multi_calculate
 
 Histogram: TypeAlias = "pd.Series[int]"
+Codes: TypeAlias = npt.NDArray[np.intp]
+Labels: TypeAlias = "pd.Index[Any]"
 
 
 @dataclass(frozen=True)
@@ -28,6 +31,16 @@ class BinningMethod(ABC):
     @abstractmethod
     def histogram(self, data: "pd.Series[Any]") -> Histogram: ...
 
+    def codes(self, data: "pd.Series[Any]") -> Optional[tuple[Codes, Labels]]:
+        """
+        Returns the position of the bin of each value among the labels of the
+        bins, such that counting the positions gives the histogram, so that
+        histograms can be counted over subsets of the data without binning it
+        again. Values not counted by the histogram are assigned -1. Returns
+        None if the bins can't be determined independently of the subsets.
+        """
+        return None
+
     @abstractmethod
     def segmented_summary(
         self,
@@ -93,6 +106,20 @@ class IntervalBinning(BinningMethod):
         cut = pd.cut(numeric_data, bins)
         return cut.value_counts(dropna=self.dropna)
 
+    def codes(self, data: "pd.Series[Any]") -> Optional[tuple[Codes, Labels]]:
+        numeric_data = pd.to_numeric(data, errors="coerce")
+        bins = self.numeric_bins(numeric_data)
+        cut = pd.cut(numeric_data, bins)
+        codes = cut.cat.codes.to_numpy(dtype=np.intp)
+        categories = cut.cat.categories
+        if self.dropna:
+            return codes, pd.CategoricalIndex(categories, categories=categories)
+        # the missing value bin is labeled NaN and placed after the intervals
+        codes[codes < 0] = len(categories)
+        return codes, pd.CategoricalIndex(
+            pd.Categorical.from_codes([*range(len(categories)), -1], categories)
+        )
+
     def segmented_summary(
         self,
         segment_column: Column,
@@ -197,6 +224,12 @@ class QuantileBinning(IntervalBinning):
     +inf as the left- and right-most bin boundaries. Default values are the
     decile probabilities."""
 
+    def codes(self, data: "pd.Series[Any]") -> Optional[tuple[Codes, Labels]]:
+        if self.bins is None:
+            # the bins would depend on the data being binned
+            return None
+        return super().codes(data)
+
     def numeric_bins(self, data: "pd.Series[Any]") -> NumericBins:
         if self.bins is not None:
             return self.bins
@@ -268,6 +301,10 @@ class CategoricalBinning(BinningMethod):
             dropna=self.dropna,
         )
 
+    def codes(self, data: "pd.Series[Any]") -> Optional[tuple[Codes, Labels]]:
+        labels = self.histogram(data).index
+        return labels.get_indexer(data).astype(np.intp), labels  # type: ignore[no-untyped-call]
+
     def segmented_summary(
         self,
         segment_column: Column,
@@ -3,7 +3,7 @@ import warnings
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from functools import cached_property
-from typing import Union, cast
+from typing import Any, Optional, Union, cast
 
 import numpy as np
 import numpy.typing as npt
@@ -12,12 +12,16 @@ from scipy.spatial.distance import euclidean, jensenshannon
 from scipy.stats import entropy
 from typing_extensions import TypeAlias
 
+from phoenix.core.embedding_array import EmbeddingArray
 from phoenix.metrics import Metric
 
 from .mixins import (
+    Aggregate,
     DiscreteDivergence,
     DriftOperator,
+    Mergeable,
     NullaryOperator,
+    RowAggregate,
     UnaryOperator,
     VectorOperator,
     ZeroInitialValue,
@@ -25,32 +29,90 @@ from .mixins import (
 
 
 @dataclass(frozen=True)
-class Count(NullaryOperator, ZeroInitialValue, Metric):
+class Count(NullaryOperator, ZeroInitialValue, Mergeable, Metric):
     def calc(self, dataframe: pd.DataFrame) -> int:
         return len(dataframe)
 
+    def row_aggregates(self, dataframe: pd.DataFrame) -> Optional[tuple[Aggregate, ...]]:
+        return (RowAggregate(np.ones(len(dataframe), dtype=np.int64)),)
+
+    def merged_value(self, *aggregates: Any) -> int:
+        (count,) = aggregates
+        return int(count)
+
 
 @dataclass(frozen=True)
-class CountNotNull(UnaryOperator, ZeroInitialValue, Metric):
+class CountNotNull(UnaryOperator, ZeroInitialValue, Mergeable, Metric):
     def calc(self, dataframe: pd.DataFrame) -> int:
         return self.operand(dataframe).count()
 
+    def row_aggregates(self, dataframe: pd.DataFrame) -> Optional[tuple[Aggregate, ...]]:
+        return (RowAggregate(self.operand(dataframe).notna().to_numpy(dtype=np.int64)),)
+
+    def merged_value(self, *aggregates: Any) -> int:
+        (count,) = aggregates
+        return int(count)
+
 
 @dataclass(frozen=True)
-class Sum(UnaryOperator, Metric):
+class Sum(UnaryOperator, Mergeable, Metric):
     def calc(self, dataframe: pd.DataFrame) -> float:
         data = self.operand(dataframe)
         numeric_data = pd.to_numeric(data, errors="coerce")
         return cast(float, numeric_data.sum())
 
+    def row_aggregates(self, dataframe: pd.DataFrame) -> Optional[tuple[Aggregate, ...]]:
+        numeric_data = _numeric_values(self.operand(dataframe))
+        return (RowAggregate(np.nan_to_num(numeric_data, nan=0.0)),)
+
+    def merged_value(self, *aggregates: Any) -> float:
+        (total,) = aggregates
+        return float(total)
+
 
 Vector: TypeAlias = Union[float, npt.NDArray[np.float64]]
 
 
+def _numeric_values(data: "pd.Series[Any]") -> npt.NDArray[np.float64]:
+    return pd.to_numeric(data, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _embedding_array(data: "pd.Series[Any]") -> Optional[EmbeddingArray]:
+    """
+    Returns the vectors as an EmbeddingArray, or None if some of the values are
+    neither vectors of the same length nor missing.
+    """
+    if isinstance(array := data.array, EmbeddingArray):
+        return array
+    array = EmbeddingArray.from_vectors(data.to_numpy())
+    return array if array.mask.sum() == data.count() else None
+
+
+def _vector_aggregates(data: "pd.Series[Any]") -> Optional[tuple[Aggregate, ...]]:
+    if (array := _embedding_array(data)) is None:
+        return None
+    # missing vectors are zero rows in the matrix
+    return RowAggregate(array.matrix), RowAggregate(array.mask.astype(np.int64))
+
+
+def _mean_vector(data: "pd.Series[Any]") -> Vector:
+    if isinstance(array := data.array, EmbeddingArray):
+        vectors = array.valid_vectors()
+        return cast(Vector, vectors.mean(axis=0, dtype=np.float64)) if len(vectors) else np.nan
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        return cast(Vector, np.mean(data.dropna()))
+
+
 @dataclass(frozen=True)
-class VectorSum(UnaryOperator, VectorOperator, ZeroInitialValue, Metric):
+class VectorSum(UnaryOperator, VectorOperator, ZeroInitialValue, Mergeable, Metric):
     def calc(self, dataframe: pd.DataFrame) -> Vector:
         data = self.operand(dataframe)
+        if isinstance(array := data.array, EmbeddingArray):
+            vectors = array.valid_vectors()
+            if not len(vectors):
+                return cast(Vector, self.initial_value)
+            return cast(Vector, vectors.sum(axis=0, dtype=np.float64))
         return cast(
             Vector,
             np.sum(
@@ -59,39 +121,75 @@ class VectorSum(UnaryOperator, VectorOperator, ZeroInitialValue, Metric):
             ),
         )
 
+    def row_aggregates(self, dataframe: pd.DataFrame) -> Optional[tuple[Aggregate, ...]]:
+        return _vector_aggregates(self.operand(dataframe))
+
+    def merged_value(self, *aggregates: Any) -> Vector:
+        total, count = aggregates
+        return cast(Vector, total if count else self.initial_value)
+
 
 @dataclass(frozen=True)
-class Mean(UnaryOperator, Metric):
+class Mean(UnaryOperator, Mergeable, Metric):
     def calc(self, dataframe: pd.DataFrame) -> float:
         data = self.operand(dataframe)
         numeric_data = pd.to_numeric(data, errors="coerce")
         return numeric_data.mean()
 
+    def row_aggregates(self, dataframe: pd.DataFrame) -> Optional[tuple[Aggregate, ...]]:
+        numeric_data = _numeric_values(self.operand(dataframe))
+        return (
+            RowAggregate(np.nan_to_num(numeric_data, nan=0.0)),
+            RowAggregate((~np.isnan(numeric_data)).astype(np.int64)),
+        )
+
+    def merged_value(self, *aggregates: Any) -> float:
+        total, count = aggregates
+        return float(total / count) if count else np.nan
+
 
 @dataclass(frozen=True)
-class VectorMean(UnaryOperator, VectorOperator, Metric):
+class VectorMean(UnaryOperator, VectorOperator, Mergeable, Metric):
     def calc(self, dataframe: pd.DataFrame) -> Vector:
-        data = self.operand(dataframe)
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", category=RuntimeWarning)
-            return cast(Vector, np.mean(data.dropna()))
+        return _mean_vector(self.operand(dataframe))
+
+    def row_aggregates(self, dataframe: pd.DataFrame) -> Optional[tuple[Aggregate, ...]]:
+        return _vector_aggregates(self.operand(dataframe))
+
+    def merged_value(self, *aggregates: Any) -> Vector:
+        total, count = aggregates
+        return cast(Vector, total / count if count else np.nan)
 
 
 @dataclass(frozen=True)
-class Min(UnaryOperator, Metric):
+class Min(UnaryOperator, Mergeable, Metric):
     def calc(self, dataframe: pd.DataFrame) -> float:
         data = self.operand(dataframe)
         numeric_data = pd.to_numeric(data, errors="coerce")
         return cast(float, numeric_data.min())
 
+    def row_aggregates(self, dataframe: pd.DataFrame) -> Optional[tuple[Aggregate, ...]]:
+        return (RowAggregate(_numeric_values(self.operand(dataframe)), np.fmin),)
+
+    def merged_value(self, *aggregates: Any) -> float:
+        (minimum,) = aggregates
+        return float(minimum)
+
 
 @dataclass(frozen=True)
-class Max(UnaryOperator, Metric):
+class Max(UnaryOperator, Mergeable, Metric):
     def calc(self, dataframe: pd.DataFrame) -> float:
         data = self.operand(dataframe)
         numeric_data = pd.to_numeric(data, errors="coerce")
         return cast(float, numeric_data.max())
 
+    def row_aggregates(self, dataframe: pd.DataFrame) -> Optional[tuple[Aggregate, ...]]:
+        return (RowAggregate(_numeric_values(self.operand(dataframe)), np.fmax),)
+
+    def merged_value(self, *aggregates: Any) -> float:
+        (maximum,) = aggregates
+        return float(maximum)
+
 
 @dataclass(frozen=True)
 class Cardinality(UnaryOperator, Metric):
@@ -103,11 +201,19 @@ class Cardinality(UnaryOperator, Metric):
 
 
 @dataclass(frozen=True)
-class PercentEmpty(UnaryOperator, Metric):
+class PercentEmpty(UnaryOperator, Mergeable, Metric):
     def calc(self, dataframe: pd.DataFrame) -> float:
         data = self.operand(dataframe)
         return data.isna().mean() * 100
 
+    def row_aggregates(self, dataframe: pd.DataFrame) -> Optional[tuple[Aggregate, ...]]:
+        is_empty = self.operand(dataframe).isna().to_numpy(dtype=np.int64)
+        return RowAggregate(is_empty), RowAggregate(np.ones_like(is_empty))
+
+    def merged_value(self, *aggregates: Any) -> float:
+        empty_count, count = aggregates
+        return empty_count / count * 100 if count else np.nan
+
 
 @dataclass(frozen=True)
 class Quantile(UnaryOperator, Metric):
@@ -142,26 +248,35 @@ class Quantile(UnaryOperator, Metric):
 
 
 @dataclass(frozen=True)
-class EuclideanDistance(DriftOperator, VectorOperator):
+class EuclideanDistance(DriftOperator, VectorOperator, Mergeable):
     @cached_property
     def reference_value(self) -> Vector:
-        data = self.operand(self.reference_data)
-        return cast(Vector, np.mean(data.dropna()))
+        return _mean_vector(self.operand(self.reference_data))
 
     def calc(self, dataframe: pd.DataFrame) -> float:
         if dataframe.empty or (
             isinstance(self.reference_value, float) and not math.isfinite(self.reference_value)
         ):
             return np.nan
-        data = self.operand(dataframe)
         return cast(
             float,
             euclidean(
-                np.mean(data.dropna()),
+                _mean_vector(self.operand(dataframe)),
                 self.reference_value,
             ),
         )
 
+    def row_aggregates(self, dataframe: pd.DataFrame) -> Optional[tuple[Aggregate, ...]]:
+        return _vector_aggregates(self.operand(dataframe))
+
+    def merged_value(self, *aggregates: Any) -> float:
+        total, count = aggregates
+        if not count or (
+            isinstance(self.reference_value, float) and not math.isfinite(self.reference_value)
+        ):
+            return np.nan
+        return cast(float, euclidean(total / count, self.reference_value))
+
 
 Distribution: TypeAlias = "pd.Series[float]"
 Divergence: TypeAlias = Callable[[Distribution, Distribution], float]
@@ -11,9 +11,10 @@ from collections.abc import Callable
 from dataclasses import dataclass, field, fields, replace
 from functools import cached_property
 from itertools import repeat
-from typing import TYPE_CHECKING, Any, Iterator, Mapping, Optional
+from typing import TYPE_CHECKING, Any, Iterator, Mapping, Optional, Union
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 from typing_extensions import TypeAlias
 
@@ -41,6 +42,60 @@ class VectorOperator(ABC):
     shape: int = 0
 
 
+@dataclass(frozen=True)
+class RowAggregate:
+    """
+    Values of the rows of a dataframe, e.g. the numeric values of a column, to
+    be aggregated over buckets of rows by `ufunc`, which is one of np.add,
+    np.fmin or np.fmax.
+    """
+
+    values: npt.NDArray[Any]
+    ufunc: np.ufunc = np.add
+
+
+@dataclass(frozen=True)
+class CodeCounts:
+    """
+    Integer codes of the rows of a dataframe, i.e. positions in `labels`, e.g.
+    the bins of a histogram, to be aggregated over buckets of rows as the count
+    of each code. Negative codes are not counted.
+    """
+
+    codes: npt.NDArray[np.intp]
+    labels: "pd.Index[Any]"
+
+
+Aggregate: TypeAlias = Union[RowAggregate, CodeCounts]
+
+
+@dataclass(frozen=True)
+class Mergeable(ABC):
+    """
+    Metrics that can be computed from aggregates, e.g. counts and sums, that are
+    mergeable across buckets of rows, so that a time series can aggregate each
+    bucket of rows once and merge the buckets for each of its (overlapping)
+    evaluation windows, instead of computing the metric on each window anew.
+    """
+
+    @abstractmethod
+    def row_aggregates(self, dataframe: pd.DataFrame) -> Optional[tuple[Aggregate, ...]]:
+        """
+        Returns the aggregates of the rows of the dataframe, or None if the
+        metric can't be computed from aggregates for this dataframe, e.g. when
+        its vectors are of unequal lengths.
+        """
+
+    @abstractmethod
+    def merged_value(self, *aggregates: Any) -> Any:
+        """
+        Returns the value of the metric from the aggregates merged over the
+        rows of a window, which are in the same order as the row aggregates,
+        e.g. a sum for RowAggregate with np.add, and a histogram of the
+        observed labels for CodeCounts.
+        """
+
+
 @dataclass(frozen=True)
 class NullaryOperator(Metric, ABC):
     def operands(self) -> list[Column]:
@@ -180,7 +235,7 @@ class Discretizer(ABC):
 
 
 @dataclass(frozen=True)
-class DiscreteDivergence(Discretizer, DriftOperator, ABC):
+class DiscreteDivergence(Discretizer, DriftOperator, Mergeable, ABC):
     """See https://en.wikipedia.org/wiki/Divergence_(statistics%29"""
 
     normalize: Normalizer = AdditiveSmoothing(pseudocount=1)
@@ -210,9 +265,21 @@ class DiscreteDivergence(Discretizer, DriftOperator, ABC):
 
     def calc(self, dataframe: pd.DataFrame) -> float:
         data = self.operand(dataframe)
+        return self._divergence_from_histogram(self.histogram(data))
+
+    def row_aggregates(self, dataframe: pd.DataFrame) -> Optional[tuple[Aggregate, ...]]:
+        if (codes := self.binning_method.codes(self.operand(dataframe))) is None:
+            return None
+        return (CodeCounts(*codes),)
+
+    def merged_value(self, *aggregates: Any) -> float:
+        (histogram,) = aggregates
+        return self._divergence_from_histogram(histogram)
+
+    def _divergence_from_histogram(self, histogram: Histogram) -> float:
         # outer-join histograms and fill in zeros for missing categories
         merged_counts = pd.merge(
-            self.histogram(data).rename("primary_histogram"),
+            histogram.rename("primary_histogram"),
             self.reference_histogram,
             left_index=True,
             right_index=True,
@@ -1,8 +1,10 @@
 from collections.abc import Iterable
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Optional, cast
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 from sklearn.metrics import ndcg_score
 
@@ -104,3 +106,125 @@ class RetrievalMetrics:
         if self.has_nan:
             return np.nan
         return 0.0
+
+
+class BatchedRetrievalMetrics:
+    """
+    Same as `RetrievalMetrics`, but for many lists of evaluation scores at once,
+    e.g. the retrieved documents of many spans, so that each metric is computed
+    for all the lists together with NumPy, instead of one list at a time. The
+    lists are stored as a matrix (lists × positions) padded with zeros, along
+    with the length of each list. Each metric returns an array with one value
+    per list, and is memoized by its arguments.
+    """
+
+    def __init__(
+        self,
+        eval_scores: npt.NDArray[np.float64],
+        lengths: npt.NDArray[np.intp],
+    ) -> None:
+        """
+        Parameters
+        ----------
+        eval_scores: array, shape = (n_lists, n_positions)
+            The evaluation scores of each list, sorted in the ranking order.
+            Positions beyond the length of each list are ignored.
+        lengths: array, shape = (n_lists,)
+            The number of evaluation scores in each list.
+        """
+        lengths = np.asarray(lengths, dtype=np.intp)
+        eval_scores = np.array(eval_scores, dtype=float, ndmin=2).reshape(len(lengths), -1)
+        if eval_scores.shape[1] == 0:
+            eval_scores = np.zeros((len(lengths), 1))
+        eval_scores[np.arange(eval_scores.shape[1]) >= lengths[:, np.newaxis]] = 0
+        self._eval_scores = eval_scores
+        self._lengths = lengths
+        self._ndcg_results: dict[Optional[int], npt.NDArray[np.float64]] = {}
+        self._precision_results: dict[Optional[int], npt.NDArray[np.float64]] = {}
+
+    @classmethod
+    def from_lists(cls, eval_scores: Iterable[Iterable[float]]) -> "BatchedRetrievalMetrics":
+        arrays = [np.fromiter(scores, dtype=float) for scores in eval_scores]
+        lengths = np.array([len(array) for array in arrays], dtype=np.intp)
+        padded = np.zeros((len(arrays), max(lengths, default=0)))
+        for i, array in enumerate(arrays):
+            padded[i, : len(array)] = array
+        return cls(padded, lengths)
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    @cached_property
+    def _has_nan(self) -> npt.NDArray[np.bool_]:
+        return cast(npt.NDArray[np.bool_], ~np.all(np.isfinite(self._eval_scores), axis=1))
+
+    def _cutoffs(self, k: Optional[int]) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.bool_]]:
+        """
+        Returns the `k` of each list (its length if `k` is None), and the mask
+        of the positions before it.
+        """
+        ks = self._lengths if k is None else np.full_like(self._lengths, k)
+        return ks, np.arange(self._eval_scores.shape[1]) < ks[:, np.newaxis]
+
+    def ndcg(self, k: Optional[int] = None) -> npt.NDArray[np.float64]:
+        """
+        Same as `RetrievalMetrics.ndcg`, except that lists with negative scores
+        get `NaN` instead of raising an error.
+        """
+        if (result := self._ndcg_results.get(k)) is not None:
+            return result
+        ks, cutoff = self._cutoffs(k)
+        scores = np.where(self._has_nan[:, np.newaxis], 0, self._eval_scores)
+        discount = cutoff / np.log2(np.arange(scores.shape[1]) + 2)
+        gain = np.sum(scores * discount, axis=1)
+        ideal_gain = np.sum(-np.sort(-scores, axis=1) * discount, axis=1)
+        # all-irrelevant lists get 0.0, same as sklearn.metrics.ndcg_score
+        result = np.divide(gain, ideal_gain, out=np.zeros_like(gain), where=ideal_gain != 0)
+        result[np.any(scores < 0, axis=1)] = np.nan
+        result[ks < 1] = 0.0
+        result[self._has_nan] = np.nan
+        self._ndcg_results[k] = result
+        return result
+
+    def precision(self, k: Optional[int] = None) -> npt.NDArray[np.float64]:
+        """
+        Same as `RetrievalMetrics.precision`.
+        """
+        if (result := self._precision_results.get(k)) is not None:
+            return result
+        ks, cutoff = self._cutoffs(k)
+        hits = np.count_nonzero((self._eval_scores != 0) & cutoff, axis=1)
+        result = np.divide(hits, ks, out=np.zeros(len(ks)), where=ks >= 1)
+        result[self._has_nan] = np.nan
+        self._precision_results[k] = result
+        return result
+
+    @cached_property
+    def _reciprocal_rank(self) -> npt.NDArray[np.float64]:
+        n_positions = self._eval_scores.shape[1]
+        is_finite = np.isfinite(self._eval_scores)
+        is_hit = is_finite & (self._eval_scores != 0)
+        first_hit = np.where(np.any(is_hit, axis=1), np.argmax(is_hit, axis=1), n_positions)
+        first_non_finite = np.where(
+            np.any(~is_finite, axis=1), np.argmax(~is_finite, axis=1), n_positions
+        )
+        result = np.where(first_hit < n_positions, 1 / (first_hit + 1), 0.0)
+        result[first_non_finite < first_hit] = np.nan
+        return result
+
+    def reciprocal_rank(self) -> npt.NDArray[np.float64]:
+        """
+        Same as `RetrievalMetrics.reciprocal_rank`.
+        """
+        return self._reciprocal_rank
+
+    @cached_property
+    def _hit(self) -> npt.NDArray[np.float64]:
+        is_hit = np.any((self._eval_scores != 0) & ~np.isnan(self._eval_scores), axis=1)
+        return np.where(is_hit, 1.0, np.where(self._has_nan, np.nan, 0.0))
+
+    def hit(self) -> npt.NDArray[np.float64]:
+        """
+        Same as `RetrievalMetrics.hit`.
+        """
+        return self._hit
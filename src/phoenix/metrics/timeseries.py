@@ -1,13 +1,26 @@
-from collections.abc import Callable, Iterable, Iterator
+import logging
+import warnings
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from functools import partial
-from itertools import accumulate, repeat
-from typing import cast
+from itertools import accumulate, repeat, takewhile
+from typing import Any, Optional, cast
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 from typing_extensions import TypeAlias
 
-from phoenix.metrics import Metric, multi_calculate
+from phoenix.metrics import Metric
+from phoenix.metrics.mixins import Aggregate, CodeCounts, Mergeable, RowAggregate
+
+logger = logging.getLogger(__name__)
+
+MAX_HISTOGRAM_BUCKET_COUNTS = 10_000_000
+"""Histograms with more bins than this number divided by the number of buckets
+are counted on each window instead of being merged from the buckets."""
 
 
 def timeseries(
@@ -62,34 +75,133 @@ def _aggregator(
     sampling_interval: timedelta,
 ) -> pd.DataFrame:
     """
-    Calls groupby on the dataframe and apply metric calculations on each group.
+    Computes the metrics on the evaluation window of each data point in the
+    time series.
     """
     calcs = tuple(metrics)
-    return pd.concat(
-        _results(
-            calcs=calcs,
-            dataframe=dataframe,
-            start_time=start_time,
-            end_time=end_time,
-            evaluation_window=evaluation_window,
-            sampling_interval=sampling_interval,
-        ),
-        verify_integrity=True,
+    windows = _Windows.from_parameters(
+        time_index=cast(pd.DatetimeIndex, dataframe.index),
+        start_time=start_time,
+        end_time=end_time,
+        evaluation_window=evaluation_window,
+        sampling_interval=sampling_interval,
+    )
+    if not windows.timestamps or not calcs:
+        return pd.DataFrame()
+    # rows outside all windows are irrelevant
+    row_offset = int(windows.bucket_rows[0])
+    dataframe = dataframe.iloc[row_offset : windows.bucket_rows[-1], :]
+    windows = windows.shift_rows(-row_offset)
+    index = pd.DatetimeIndex(windows.timestamps)
+    # NB: on ubuntu, we lose the timezone information when there is no data
+    if index.tzinfo is None:
+        index = index.tz_localize(timezone.utc)
+    return pd.DataFrame(
+        {calc.id(): pd.Series(_values(calc, dataframe, windows), index=index) for calc in calcs}
     )
 
 
-StartTime: TypeAlias = datetime
-EndTime: TypeAlias = datetime
+Timestamp: TypeAlias = datetime
+RowPosition: TypeAlias = int
 
 
-def _groupers(
+@dataclass(frozen=True)
+class _Windows:
+    """
+    The evaluation windows of the data points in a time series, and the buckets
+    of rows that they are made of. Buckets are the intervals between the edges
+    of the windows, i.e. the sampling intervals when the evaluation window is a
+    multiple of the sampling interval, so that each row falls in exactly one
+    bucket, and each window is a contiguous range of buckets, which overlapping
+    windows have in common.
+    """
+
+    timestamps: list[Timestamp]
+    """The end instant of each window, by which each point is labeled"""
+    bucket_starts: npt.NDArray[np.intp]
+    """The position of the first bucket of each window"""
+    bucket_stops: npt.NDArray[np.intp]
+    """The position after the last bucket of each window"""
+    bucket_rows: npt.NDArray[np.intp]
+    """The row position of each bucket edge, i.e. the rows of bucket i are
+    bucket_rows[i] (inclusive) to bucket_rows[i + 1] (exclusive)"""
+
+    @property
+    def row_intervals(self) -> Iterator[tuple[RowPosition, RowPosition]]:
+        return zip(
+            self.bucket_rows[self.bucket_starts].tolist(),
+            self.bucket_rows[self.bucket_stops].tolist(),
+        )
+
+    def shift_rows(self, offset: int) -> "_Windows":
+        return _Windows(
+            timestamps=self.timestamps,
+            bucket_starts=self.bucket_starts,
+            bucket_stops=self.bucket_stops,
+            bucket_rows=self.bucket_rows + offset,
+        )
+
+    @classmethod
+    def from_parameters(
+        cls,
+        time_index: pd.DatetimeIndex,
+        start_time: datetime,
+        end_time: datetime,
+        evaluation_window: timedelta,
+        sampling_interval: timedelta,
+    ) -> "_Windows":
+        timestamps = sorted(
+            _timestamps(
+                time_index=time_index,
+                start_time=start_time,
+                end_time=end_time,
+                evaluation_window=evaluation_window,
+                sampling_interval=sampling_interval,
+            )
+        )
+        window_starts = [timestamp - evaluation_window for timestamp in timestamps]
+        edges = sorted(set(window_starts).union(timestamps))
+        return cls(
+            timestamps=timestamps,
+            bucket_starts=_positions(edges, window_starts),
+            bucket_stops=_positions(edges, timestamps),
+            bucket_rows=_row_positions(time_index, edges),
+        )
+
+
+def _positions(edges: Sequence[datetime], times: Sequence[datetime]) -> npt.NDArray[np.intp]:
+    """
+    Returns the position of each time among the sorted edges.
+    """
+    return np.asarray([bisect_left(edges, time) for time in times], dtype=np.intp)
+
+
+def _row_positions(
+    time_index: pd.DatetimeIndex,
+    times: Sequence[datetime],
+) -> npt.NDArray[np.intp]:
+    """
+    Returns the position of the first row at or after each time.
+    """
+    if not len(times):
+        return np.zeros(0, dtype=np.intp)
+    return np.asarray(time_index.searchsorted(times), dtype=np.intp)
+
+
+def _timestamps(
+    time_index: pd.DatetimeIndex,
     start_time: datetime,
     end_time: datetime,
     evaluation_window: timedelta,
     sampling_interval: timedelta,
-) -> Iterator[tuple[StartTime, EndTime, pd.Grouper]]:
+) -> Iterator[Timestamp]:
     """
-    Yields pandas.Groupers from time series parameters.
+    Yields the timestamps of the data points in the time series. Each point is
+    the end instant (exclusive) of its evaluation window, and points are spaced
+    apart by the sampling interval, counting backward from the end time. Points
+    without data are skipped, except when the evaluation window is a multiple
+    of the sampling interval, in which case points within gaps in the data are
+    kept, i.e. they have data both before and after them.
     """
     if not sampling_interval:
         return
@@ -99,99 +211,199 @@ def _groupers(
         max_offset = evaluation_window
     else:
         max_offset = total_time_span
-    offsets = accumulate(
-        repeat(sampling_interval),
-        initial=timedelta(),
+    offsets = takewhile(
+        lambda offset: offset < max_offset,
+        accumulate(repeat(sampling_interval), initial=timedelta()),
     )
     for offset in offsets:
-        if offset >= max_offset:
-            return
-        # Each Grouper is like a row in a brick wall, where each brick is an
+        # Each offset is like a row in a brick wall, where each brick is an
         # evaluation window. By shifting each row of bricks by the sampling
         # interval, we can get all the brick's right edges to line up with the
-        # points of the time series, and together they will summarize data for
-        # the whole time series.
+        # points of the time series.
         #
         #                   evaluation window
         #                   ┌──┴──┐
-        #       ┌─────┬─────┬─────┬─────┐    offset groupers
+        #       ┌─────┬─────┬─────┬─────┐    offset rows of bricks
         #     ┌─┴───┬─┴───┬─┴───┬─┴───┬─┘0 │ by sampling interval
         #   ┌─┴───┬─┴───┬─┴───┬─┴───┬─┘1   │
         #   └─────┴─────┴─────┴─────┘2     ▼
-        #         ┌─┬─┬─┬─┬─┬─┬─┬─┬─┬─┬─┐    combine into
+        #         ┌─┬─┬─┬─┬─┬─┬─┬─┬─┬─┬─┐    points of the
         #         └─┴─┴─┴─┴─┴─┴─┴─┴─┴2┴1┘0   final time series
         #
-        grouper = pd.Grouper(  # type: ignore  # mypy finds the wrong Grouper
-            freq=evaluation_window,
-            origin=end_time,
-            offset=-offset,
-            # Each point in timeseries will be labeled by the end instant of
-            # its evaluation window.
-            label="right",
-            sort=False,
-        )
-        time_stop = end_time - offset
+        # Within each row, the bricks from the first to the last with data
+        # are kept.
+        row_stop = end_time - offset
         if divisible:
-            time_start = start_time - evaluation_window
+            row_start = start_time - evaluation_window
+            timestamps = [
+                row_stop - i * evaluation_window
+                for i in range((row_stop - start_time) // evaluation_window + 1)
+            ]
         else:
-            time_start = time_stop - evaluation_window
-        yield (
-            time_start,
-            time_stop,
-            grouper,
+            row_start = row_stop - evaluation_window
+            timestamps = [row_stop]
+        first_row, last_row = _row_positions(time_index, (row_start, row_stop))
+        window_stops = _row_positions(time_index, timestamps)
+        window_starts = _row_positions(
+            time_index, [timestamp - evaluation_window for timestamp in timestamps]
         )
+        for timestamp, window_start, window_stop in zip(timestamps, window_starts, window_stops):
+            if first_row < window_stop and window_start < last_row:
+                yield timestamp
 
 
-def _results(
-    calcs: Iterable[Metric],
+def _values(
+    metric: Metric,
     dataframe: pd.DataFrame,
-    start_time: datetime,
-    end_time: datetime,
-    evaluation_window: timedelta,
-    sampling_interval: timedelta,
-) -> Iterator[pd.DataFrame]:
+    windows: _Windows,
+) -> list[Any]:
     """
-    Yields metric results for each data point in time series.
+    Returns the values of the metric on the windows, merged from the aggregates
+    of the buckets if the metric is mergeable, or computed on each window
+    otherwise.
     """
-    yield pd.DataFrame()
-    calculate_metrics = partial(
-        multi_calculate,
-        calcs=calcs,
-    )
-    # pandas time indexing is end-inclusive
-    result_slice = slice(start_time, end_time)
-    for (
-        time_start,  # inclusive
-        time_stop,  # exclusive
-        group,
-    ) in _groupers(
-        start_time=start_time,
-        end_time=end_time,
-        evaluation_window=evaluation_window,
-        sampling_interval=sampling_interval,
+    if isinstance(metric, Mergeable) and (
+        merged_aggregates := _merged_aggregates(metric, dataframe, windows)
     ):
-        row_start, row_stop = row_interval_from_sorted_time_index(
-            time_index=cast(pd.DatetimeIndex, dataframe.index),
-            time_start=time_start,  # inclusive
-            time_stop=time_stop,  # exclusive
-        )
-        # pandas row indexing is stop-exclusive
-        row_slice = slice(row_start, row_stop)
-        filtered = dataframe.iloc[row_slice, :]
-        res = filtered.groupby(
-            group,
-            group_keys=True,
-        ).apply(
-            calculate_metrics,
-        )
+        return [_merged_value(metric, aggregates) for aggregates in zip(*merged_aggregates)]
+    return [metric(dataframe, subset_rows=slice(*rows)) for rows in windows.row_intervals]
+
+
+def _merged_value(metric: Metric, aggregates: Sequence[Any]) -> Any:
+    assert isinstance(metric, Mergeable)
+    # same as Metric.__call__
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            return metric.merged_value(*aggregates)
+    except (TypeError, ValueError, NotImplementedError) as exc:
+        logger.warning(exc, exc_info=True)
+        return metric.initial_value
+
+
+def _merged_aggregates(
+    metric: Mergeable,
+    dataframe: pd.DataFrame,
+    windows: _Windows,
+) -> Optional[list[Sequence[Any]]]:
+    """
+    Returns the aggregates of the metric merged over each window, or None if
+    the metric can't be computed from aggregates for the dataframe.
+    """
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            row_aggregates = metric.row_aggregates(dataframe)
+    except (TypeError, ValueError):
+        return None
+    if row_aggregates is None:
+        return None
+    n_buckets = len(windows.bucket_rows) - 1
+    if any(
+        isinstance(aggregate, CodeCounts)
+        and len(aggregate.labels) * n_buckets > MAX_HISTOGRAM_BUCKET_COUNTS
+        for aggregate in row_aggregates
+    ):
+        return None
+    return [_merge(aggregate, windows) for aggregate in row_aggregates]
+
 
-        # NB: on ubuntu, we lose the timezone information when there is no data
-        if res.index.tzinfo is None:  # type: ignore
-            res = res.set_axis(
-                res.index.tz_localize(  # type: ignore
-                    timezone.utc,
-                ),
-                axis=0,
+def _merge(aggregate: Aggregate, windows: _Windows) -> Sequence[Any]:
+    """
+    Aggregates the rows of each bucket, then merges the buckets of each window.
+    Integer counts are merged by differences of their cumulative sums over the
+    buckets, and float sums, minima and maxima by reducing over the buckets of
+    each window.
+    """
+    if isinstance(aggregate, CodeCounts):
+        counts = _bucket_code_counts(aggregate, windows.bucket_rows)
+        cumulative_counts = _cumsum(counts)
+        labels = aggregate.labels
+        histograms = []
+        for window_counts in (
+            cumulative_counts[windows.bucket_stops] - cumulative_counts[windows.bucket_starts]
+        ):
+            observed = np.flatnonzero(window_counts)
+            histograms.append(pd.Series(window_counts[observed], index=labels[observed]))
+        return histograms
+    bucket_values = _bucket_reduce(aggregate, windows.bucket_rows)
+    if aggregate.ufunc is np.add:
+        if bucket_values.dtype.kind != "f":
+            cumulative_values = _cumsum(bucket_values)
+            return cast(
+                Sequence[Any],
+                cumulative_values[windows.bucket_stops] - cumulative_values[windows.bucket_starts],
             )
+        # differences of cumulative float sums would carry the rounding errors of all the
+        # buckets before each window, e.g. losing a small window next to large ones
+        return cast(Sequence[Any], _window_sums(bucket_values, windows))
+    return [
+        aggregate.ufunc.reduce(bucket_values[start:stop], axis=0)
+        if start < stop
+        else np.full(bucket_values.shape[1:], np.nan)[()]
+        for start, stop in zip(windows.bucket_starts, windows.bucket_stops)
+    ]
+
+
+def _window_sums(bucket_values: npt.NDArray[Any], windows: _Windows) -> npt.NDArray[Any]:
+    """
+    Sums the buckets of each window with `np.add.reduceat`, given the starts and
+    stops of the windows as alternating indices, so that every other segment is
+    a window.
+    """
+    starts, stops = windows.bucket_starts, windows.bucket_stops
+    sums = np.zeros((len(starts), *bucket_values.shape[1:]), dtype=bucket_values.dtype)
+    # ufunc.reduceat doesn't handle empty windows, so they are left out
+    nonempty = np.flatnonzero(starts < stops)
+    if len(nonempty):
+        # padded so that the stop of a window ending at the last bucket is a valid index
+        padded = np.concatenate([bucket_values, np.zeros_like(bucket_values[:1])])
+        indices = np.stack([starts[nonempty], stops[nonempty]], axis=1).ravel()
+        sums[nonempty] = np.add.reduceat(padded, indices, axis=0)[::2]
+    return sums
+
+
+def _cumsum(values: npt.NDArray[Any]) -> npt.NDArray[Any]:
+    """
+    Returns the cumulative sums along the first axis, starting with zero.
+    """
+    cumulative_values = np.zeros((len(values) + 1, *values.shape[1:]), dtype=values.dtype)
+    np.cumsum(values, axis=0, out=cumulative_values[1:])
+    return cumulative_values
+
+
+def _bucket_reduce(
+    aggregate: RowAggregate,
+    bucket_rows: npt.NDArray[np.intp],
+) -> npt.NDArray[Any]:
+    values = aggregate.values
+    # floats are summed in double precision, e.g. for float32 embeddings
+    dtype = np.float64 if values.dtype.kind == "f" else values.dtype
+    identity = 0 if aggregate.ufunc is np.add else np.nan
+    reduced = np.full((len(bucket_rows) - 1, *values.shape[1:]), identity, dtype=dtype)
+    # ufunc.reduceat doesn't handle empty buckets, so they are left out
+    nonempty = np.flatnonzero(bucket_rows[:-1] < bucket_rows[1:])
+    if len(nonempty):
+        first_row, last_row = bucket_rows[0], bucket_rows[-1]
+        reduced[nonempty] = aggregate.ufunc.reduceat(
+            values[first_row:last_row],
+            bucket_rows[nonempty] - first_row,
+            axis=0,
+            dtype=dtype,
+        )
+    return reduced
+
 
-        yield res.loc[result_slice, :]
+def _bucket_code_counts(
+    aggregate: CodeCounts,
+    bucket_rows: npt.NDArray[np.intp],
+) -> npt.NDArray[np.int64]:
+    n_buckets, n_codes = len(bucket_rows) - 1, len(aggregate.labels)
+    first_row, last_row = bucket_rows[0], bucket_rows[-1]
+    codes = aggregate.codes[first_row:last_row]
+    buckets = np.repeat(np.arange(n_buckets), np.diff(bucket_rows))
+    counted = codes >= 0
+    return np.bincount(
+        buckets[counted] * n_codes + codes[counted],
+        minlength=n_buckets * n_codes,
+    ).reshape(n_buckets, n_codes)
@@ -0,0 +1,156 @@
+import asyncio
+import hashlib
+import multiprocessing
+from collections.abc import Awaitable, Callable, Hashable, Mapping, Sequence
+from multiprocessing.pool import Pool
+from typing import Any, Optional, TypeVar
+
+import numpy as np
+from cachetools import LRUCache
+
+from phoenix.pointcloud.clustering import RawCluster
+from phoenix.pointcloud.pointcloud import ClustersFinder, DimensionalityReducer, Matrix, Vector
+
+_IdType = TypeVar("_IdType", bound=Hashable)
+_T = TypeVar("_T")
+
+DEFAULT_CACHE_SIZE = 32
+DISCONNECT_POLL_INTERVAL_SECONDS = 1.0
+
+
+def _project(reducer: DimensionalityReducer, mat: Matrix, n_components: int) -> Matrix:
+    return reducer.project(mat, n_components=n_components)
+
+
+def _find_clusters(finder: ClustersFinder, mat: Matrix) -> list[RawCluster]:
+    return finder.find_clusters(mat)
+
+
+def digest(ids: Sequence[Hashable], *arrays: Matrix) -> str:
+    """
+    Returns a digest of the ids (and the arrays) of a point cloud, to be used in cache keys in
+    place of the ids themselves.
+    """
+    h = hashlib.sha256()
+    for id_ in ids:
+        h.update(str(id_).encode())
+        h.update(b"\0")
+    for arr in arrays:
+        h.update(np.ascontiguousarray(arr).tobytes())
+    return h.hexdigest()
+
+
+class PointCloudRunner:
+    """
+    Generates point clouds in a worker process, so that UMAP and HDBSCAN, which can take seconds
+    to minutes, do not block the event loop. Computations run one at a time, so that the worker
+    can be terminated when the client of a running computation disconnects. Projections and
+    clusters are memoized in LRU caches, so that re-opening a view skips the computation
+    altogether, and changing only the clustering parameters skips the projection.
+    """
+
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE) -> None:
+        self._projections: LRUCache[Hashable, Matrix] = LRUCache(maxsize=cache_size)
+        self._clusters: LRUCache[Hashable, list[RawCluster]] = LRUCache(maxsize=cache_size)
+        self._pool: Optional[Pool] = None
+        # Created lazily, since the runner is created before the event loop runs, and a lock
+        # created outside of the loop is bound to a different loop on Python < 3.10.
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def generate(
+        self,
+        key: Hashable,
+        reducer: DimensionalityReducer,
+        finder: ClustersFinder,
+        data: Mapping[_IdType, Vector],
+        n_components: int = 3,
+        is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None,
+    ) -> tuple[dict[_IdType, Vector], dict[str, set[_IdType]]]:
+        """
+        Same as `PointCloud.generate`, with the projections keyed by `key`, the ids of the data,
+        the reducer, and `n_components`, i.e. `key` must identify the vectors of the data, e.g.
+        by the name of their embedding dimension.
+        """
+        if not data:
+            return {}, {}
+        event_ids, vectors = zip(*data.items())
+        projection_key = (key, digest(event_ids), reducer, n_components)
+        if (projections := self._projections.get(projection_key)) is None:
+            projections = await self._run(
+                _project,
+                (reducer, np.stack(vectors), n_components),
+                is_disconnected,
+            )
+            self._projections[projection_key] = projections
+        clusters_key = (projection_key, finder)
+        if (clusters := self._clusters.get(clusters_key)) is None:
+            clusters = await self._run(_find_clusters, (finder, projections), is_disconnected)
+            self._clusters[clusters_key] = clusters
+        return dict(zip(event_ids, projections)), {
+            str(i): {event_ids[row_index] for row_index in cluster}
+            for i, cluster in enumerate(clusters)
+        }
+
+    async def find_clusters(
+        self,
+        finder: ClustersFinder,
+        mat: Matrix,
+        ids: Sequence[Hashable] = (),
+        is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None,
+    ) -> list[RawCluster]:
+        clusters_key = (digest(ids, mat), finder)
+        if (clusters := self._clusters.get(clusters_key)) is None:
+            clusters = await self._run(_find_clusters, (finder, mat), is_disconnected)
+            self._clusters[clusters_key] = clusters
+        return clusters
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool = None
+
+    async def _run(
+        self,
+        fn: Callable[..., _T],
+        args: tuple[Any, ...],
+        is_disconnected: Optional[Callable[[], Awaitable[bool]]],
+    ) -> _T:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if is_disconnected is not None and await is_disconnected():
+                raise asyncio.CancelledError
+            if self._pool is None:
+                # Spawned (rather than forked) because the server runs threads, e.g. for gRPC.
+                self._pool = multiprocessing.get_context("spawn").Pool(processes=1)
+            loop = asyncio.get_running_loop()
+            future: asyncio.Future[_T] = loop.create_future()
+
+            def set_result(result: _T) -> None:
+                if not future.done():
+                    future.set_result(result)
+
+            def set_exception(exception: BaseException) -> None:
+                if not future.done():
+                    future.set_exception(exception)
+
+            self._pool.apply_async(
+                fn,
+                args,
+                callback=lambda result: loop.call_soon_threadsafe(set_result, result),
+                error_callback=lambda exc: loop.call_soon_threadsafe(set_exception, exc),
+            )
+            try:
+                if is_disconnected is None:
+                    return await future
+                while True:
+                    done, _ = await asyncio.wait({future}, timeout=DISCONNECT_POLL_INTERVAL_SECONDS)
+                    if done:
+                        return future.result()
+                    if await is_disconnected():
+                        raise asyncio.CancelledError
+            except asyncio.CancelledError:
+                # The computation cannot be interrupted, so the worker is terminated instead,
+                # and a new one is spawned for the next computation.
+                self.shutdown()
+                raise
@@ -1,5 +1,6 @@
 from asyncio import get_running_loop
-from dataclasses import dataclass
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
 from functools import cached_property, partial
 from pathlib import Path
 from typing import Any, Optional, cast
@@ -13,6 +14,7 @@ from phoenix.auth import (
 )
 from phoenix.core.model_schema import Model
 from phoenix.db import models
+from phoenix.pointcloud.runner import PointCloudRunner
 from phoenix.server.api.dataloaders import (
     AnnotationSummaryDataLoader,
     AverageExperimentRunLatencyDataLoader,
@@ -26,6 +28,7 @@ from phoenix.server.api.dataloaders import (
     ExperimentErrorRatesDataLoader,
     ExperimentRunAnnotations,
     ExperimentRunCountsDataLoader,
+    ExperimentRunsByExampleDataLoader,
     ExperimentSequenceNumberDataLoader,
     LatencyMsQuantileDataLoader,
     MinStartOrMaxEndTimeDataLoader,
@@ -56,6 +59,8 @@ from phoenix.server.api.dataloaders import (
 from phoenix.server.bearer_auth import PhoenixUser
 from phoenix.server.dml_event import DmlEvent
 from phoenix.server.email.types import EmailSender
+from phoenix.server.project_change_notifier import ProjectChangeNotifier
+from phoenix.server.trace_deletion import TraceDeleter
 from phoenix.server.types import (
     CanGetLastUpdatedAt,
     CanPutItem,
@@ -65,49 +70,207 @@ from phoenix.server.types import (
 )
 
 
-@dataclass
 class DataLoaders:
-    average_experiment_run_latency: AverageExperimentRunLatencyDataLoader
-    dataset_example_revisions: DatasetExampleRevisionsDataLoader
-    dataset_example_spans: DatasetExampleSpansDataLoader
-    document_evaluation_summaries: DocumentEvaluationSummaryDataLoader
-    document_evaluations: DocumentEvaluationsDataLoader
-    document_retrieval_metrics: DocumentRetrievalMetricsDataLoader
-    annotation_summaries: AnnotationSummaryDataLoader
-    experiment_annotation_summaries: ExperimentAnnotationSummaryDataLoader
-    experiment_error_rates: ExperimentErrorRatesDataLoader
-    experiment_run_annotations: ExperimentRunAnnotations
-    experiment_run_counts: ExperimentRunCountsDataLoader
-    experiment_sequence_number: ExperimentSequenceNumberDataLoader
-    latency_ms_quantile: LatencyMsQuantileDataLoader
-    min_start_or_max_end_times: MinStartOrMaxEndTimeDataLoader
-    num_child_spans: NumChildSpansDataLoader
-    num_spans_per_trace: NumSpansPerTraceDataLoader
-    project_fields: TableFieldsDataLoader
-    projects_by_trace_retention_policy_id: ProjectIdsByTraceRetentionPolicyIdDataLoader
-    prompt_version_sequence_number: PromptVersionSequenceNumberDataLoader
-    record_counts: RecordCountDataLoader
-    session_first_inputs: SessionIODataLoader
-    session_last_outputs: SessionIODataLoader
-    session_num_traces: SessionNumTracesDataLoader
-    session_num_traces_with_error: SessionNumTracesWithErrorDataLoader
-    session_token_usages: SessionTokenUsagesDataLoader
-    session_trace_latency_ms_quantile: SessionTraceLatencyMsQuantileDataLoader
-    span_annotations: SpanAnnotationsDataLoader
-    span_by_id: SpanByIdDataLoader
-    span_dataset_examples: SpanDatasetExamplesDataLoader
-    span_descendants: SpanDescendantsDataLoader
-    span_fields: TableFieldsDataLoader
-    span_projects: SpanProjectsDataLoader
-    token_counts: TokenCountDataLoader
-    trace_by_trace_ids: TraceByTraceIdsDataLoader
-    trace_fields: TableFieldsDataLoader
-    trace_retention_policy_id_by_project_id: TraceRetentionPolicyIdByProjectIdDataLoader
-    project_trace_retention_policy_fields: TableFieldsDataLoader
-    trace_root_spans: TraceRootSpansDataLoader
-    project_by_name: ProjectByNameDataLoader
-    users: UsersDataLoader
-    user_roles: UserRolesDataLoader
+    """
+    The data loaders of a GraphQL request. Each one is made on first access, since a request
+    only uses a few of them, and those with a cache share the one configured for the server.
+    """
+
+    def __init__(
+        self,
+        db: DbSessionFactory,
+        cache_for_dataloaders: Optional[CacheForDataLoaders] = None,
+    ) -> None:
+        self._db = db
+        self._cache = cache_for_dataloaders
+
+    @cached_property
+    def average_experiment_run_latency(self) -> AverageExperimentRunLatencyDataLoader:
+        return AverageExperimentRunLatencyDataLoader(self._db)
+
+    @cached_property
+    def dataset_example_revisions(self) -> DatasetExampleRevisionsDataLoader:
+        return DatasetExampleRevisionsDataLoader(self._db)
+
+    @cached_property
+    def dataset_example_spans(self) -> DatasetExampleSpansDataLoader:
+        return DatasetExampleSpansDataLoader(self._db)
+
+    @cached_property
+    def document_evaluation_summaries(self) -> DocumentEvaluationSummaryDataLoader:
+        return DocumentEvaluationSummaryDataLoader(
+            self._db,
+            cache_map=self._cache.document_evaluation_summary if self._cache else None,
+        )
+
+    @cached_property
+    def document_evaluations(self) -> DocumentEvaluationsDataLoader:
+        return DocumentEvaluationsDataLoader(self._db)
+
+    @cached_property
+    def document_retrieval_metrics(self) -> DocumentRetrievalMetricsDataLoader:
+        return DocumentRetrievalMetricsDataLoader(self._db)
+
+    @cached_property
+    def annotation_summaries(self) -> AnnotationSummaryDataLoader:
+        return AnnotationSummaryDataLoader(
+            self._db,
+            cache_map=self._cache.annotation_summary if self._cache else None,
+        )
+
+    @cached_property
+    def experiment_annotation_summaries(self) -> ExperimentAnnotationSummaryDataLoader:
+        return ExperimentAnnotationSummaryDataLoader(self._db)
+
+    @cached_property
+    def experiment_error_rates(self) -> ExperimentErrorRatesDataLoader:
+        return ExperimentErrorRatesDataLoader(self._db)
+
+    @cached_property
+    def experiment_run_annotations(self) -> ExperimentRunAnnotations:
+        return ExperimentRunAnnotations(self._db)
+
+    @cached_property
+    def experiment_run_counts(self) -> ExperimentRunCountsDataLoader:
+        return ExperimentRunCountsDataLoader(self._db)
+
+    @cached_property
+    def experiment_runs_by_example(self) -> ExperimentRunsByExampleDataLoader:
+        return ExperimentRunsByExampleDataLoader(self._db)
+
+    @cached_property
+    def experiment_sequence_number(self) -> ExperimentSequenceNumberDataLoader:
+        return ExperimentSequenceNumberDataLoader(self._db)
+
+    @cached_property
+    def latency_ms_quantile(self) -> LatencyMsQuantileDataLoader:
+        return LatencyMsQuantileDataLoader(
+            self._db,
+            cache_map=self._cache.latency_ms_quantile if self._cache else None,
+        )
+
+    @cached_property
+    def min_start_or_max_end_times(self) -> MinStartOrMaxEndTimeDataLoader:
+        return MinStartOrMaxEndTimeDataLoader(
+            self._db,
+            cache_map=self._cache.min_start_or_max_end_time if self._cache else None,
+        )
+
+    @cached_property
+    def num_child_spans(self) -> NumChildSpansDataLoader:
+        return NumChildSpansDataLoader(self._db)
+
+    @cached_property
+    def num_spans_per_trace(self) -> NumSpansPerTraceDataLoader:
+        return NumSpansPerTraceDataLoader(self._db)
+
+    @cached_property
+    def project_fields(self) -> TableFieldsDataLoader:
+        return TableFieldsDataLoader(self._db, models.Project)
+
+    @cached_property
+    def projects_by_trace_retention_policy_id(self) -> ProjectIdsByTraceRetentionPolicyIdDataLoader:
+        return ProjectIdsByTraceRetentionPolicyIdDataLoader(self._db)
+
+    @cached_property
+    def prompt_version_sequence_number(self) -> PromptVersionSequenceNumberDataLoader:
+        return PromptVersionSequenceNumberDataLoader(self._db)
+
+    @cached_property
+    def record_counts(self) -> RecordCountDataLoader:
+        return RecordCountDataLoader(
+            self._db,
+            cache_map=self._cache.record_count if self._cache else None,
+        )
+
+    @cached_property
+    def session_first_inputs(self) -> SessionIODataLoader:
+        return SessionIODataLoader(self._db, "first_input")
+
+    @cached_property
+    def session_last_outputs(self) -> SessionIODataLoader:
+        return SessionIODataLoader(self._db, "last_output")
+
+    @cached_property
+    def session_num_traces(self) -> SessionNumTracesDataLoader:
+        return SessionNumTracesDataLoader(self._db)
+
+    @cached_property
+    def session_num_traces_with_error(self) -> SessionNumTracesWithErrorDataLoader:
+        return SessionNumTracesWithErrorDataLoader(self._db)
+
+    @cached_property
+    def session_token_usages(self) -> SessionTokenUsagesDataLoader:
+        return SessionTokenUsagesDataLoader(self._db)
+
+    @cached_property
+    def session_trace_latency_ms_quantile(self) -> SessionTraceLatencyMsQuantileDataLoader:
+        return SessionTraceLatencyMsQuantileDataLoader(self._db)
+
+    @cached_property
+    def span_annotations(self) -> SpanAnnotationsDataLoader:
+        return SpanAnnotationsDataLoader(self._db)
+
+    @cached_property
+    def span_by_id(self) -> SpanByIdDataLoader:
+        return SpanByIdDataLoader(self._db)
+
+    @cached_property
+    def span_dataset_examples(self) -> SpanDatasetExamplesDataLoader:
+        return SpanDatasetExamplesDataLoader(self._db)
+
+    @cached_property
+    def span_descendants(self) -> SpanDescendantsDataLoader:
+        return SpanDescendantsDataLoader(self._db)
+
+    @cached_property
+    def span_fields(self) -> TableFieldsDataLoader:
+        return TableFieldsDataLoader(self._db, models.Span)
+
+    @cached_property
+    def span_projects(self) -> SpanProjectsDataLoader:
+        return SpanProjectsDataLoader(self._db)
+
+    @cached_property
+    def token_counts(self) -> TokenCountDataLoader:
+        return TokenCountDataLoader(
+            self._db,
+            cache_map=self._cache.token_count if self._cache else None,
+        )
+
+    @cached_property
+    def trace_by_trace_ids(self) -> TraceByTraceIdsDataLoader:
+        return TraceByTraceIdsDataLoader(self._db)
+
+    @cached_property
+    def trace_fields(self) -> TableFieldsDataLoader:
+        return TableFieldsDataLoader(self._db, models.Trace)
+
+    @cached_property
+    def trace_retention_policy_id_by_project_id(
+        self,
+    ) -> TraceRetentionPolicyIdByProjectIdDataLoader:
+        return TraceRetentionPolicyIdByProjectIdDataLoader(self._db)
+
+    @cached_property
+    def project_trace_retention_policy_fields(self) -> TableFieldsDataLoader:
+        return TableFieldsDataLoader(self._db, models.ProjectTraceRetentionPolicy)
+
+    @cached_property
+    def trace_root_spans(self) -> TraceRootSpansDataLoader:
+        return TraceRootSpansDataLoader(self._db)
+
+    @cached_property
+    def project_by_name(self) -> ProjectByNameDataLoader:
+        return ProjectByNameDataLoader(self._db)
+
+    @cached_property
+    def users(self) -> UsersDataLoader:
+        return UsersDataLoader(self._db)
+
+    @cached_property
+    def user_roles(self) -> UserRolesDataLoader:
+        return UserRolesDataLoader(self._db)
 
 
 class _NoOp:
@@ -131,6 +294,10 @@ class Context(BaseContext):
     secret: Optional[str] = None
     token_store: Optional[TokenStore] = None
     email_sender: Optional[EmailSender] = None
+    queue_experiment_runs_for_bulk_insert: Optional[Callable[..., Awaitable[None]]] = None
+    point_cloud_runner: PointCloudRunner = field(default_factory=PointCloudRunner)
+    trace_deleter: Optional[TraceDeleter] = None
+    project_change_notifier: Optional[ProjectChangeNotifier] = None
 
     def get_secret(self) -> str:
         """A type-safe way to get the application secret. Throws an error if the secret is not set.
@@ -145,6 +312,23 @@ class Context(BaseContext):
             )
         return self.secret
 
+    def get_trace_deleter(self) -> TraceDeleter:
+        """
+        A type-safe way to get the trace deleter. Throws an error if the trace deleter is not set.
+        """
+        if self.trace_deleter is None:
+            raise ValueError("no trace deleter is set")
+        return self.trace_deleter
+
+    def get_project_change_notifier(self) -> ProjectChangeNotifier:
+        """
+        A type-safe way to get the project change notifier. Throws an error if the notifier is not
+        set.
+        """
+        if self.project_change_notifier is None:
+            raise ValueError("no project change notifier is set")
+        return self.project_change_notifier
+
     def get_request(self) -> StarletteRequest:
         """
         A type-safe way to get the request object. Throws an error if the request is not set.
@@ -161,6 +345,14 @@ class Context(BaseContext):
             raise ValueError("no response is set")
         return response
 
+    async def is_disconnected(self) -> bool:
+        """
+        Whether the client of the HTTP request has disconnected, e.g. by navigating away.
+        """
+        return isinstance(request := self.request, StarletteRequest) and (
+            await request.is_disconnected()
+        )
+
     async def is_valid_password(self, password: str, user: models.User) -> bool:
         return (
             (hash_ := user.password_hash) is not None
@@ -11,7 +11,7 @@ from typing_extensions import TypeAlias
 
 from phoenix.db import models
 from phoenix.db.helpers import SupportedSQLDialect, num_docs_col
-from phoenix.metrics.retrieval_metrics import RetrievalMetrics
+from phoenix.metrics.retrieval_metrics import BatchedRetrievalMetrics
 from phoenix.server.api.dataloaders.cache import TwoTierCache
 from phoenix.server.api.input_types.TimeRange import TimeRange
 from phoenix.server.api.types.DocumentEvaluationSummary import DocumentEvaluationSummary
@@ -94,17 +94,28 @@ class DocumentEvaluationSummaryDataLoader(DataLoader[Key, Result]):
                 stmt = _get_stmt(dialect, segment, *params.keys())
                 data = await session.stream(stmt)
                 async for eval_name, group in groupby(data, lambda d: d.name):
-                    metrics_collection = []
+                    # The scores of each span are a row in a matrix that is
+                    # padded to the largest number of documents, and the
+                    # metrics are computed for all spans at once.
+                    lengths: list[int] = []
+                    rows: list[int] = []
+                    positions: list[int] = []
+                    scores: list[float] = []
                     async for (_, num_docs), subgroup in groupby(
                         group, lambda g: (g.id, g.num_docs)
                     ):
-                        scores = [np.nan] * num_docs
                         for row in subgroup:
-                            scores[row.document_position] = row.score
-                        metrics_collection.append(RetrievalMetrics(scores))
+                            rows.append(len(lengths))
+                            positions.append(row.document_position)
+                            scores.append(row.score)
+                        lengths.append(num_docs)
+                    eval_scores = np.full((len(lengths), max(lengths, default=0)), np.nan)
+                    eval_scores[rows, positions] = scores
                     summary = DocumentEvaluationSummary(
                         evaluation_name=eval_name,
-                        metrics_collection=metrics_collection,
+                        metrics_collection=BatchedRetrievalMetrics(
+                            eval_scores, np.array(lengths, dtype=np.intp)
+                        ),
                     )
                     for position in params[eval_name]:
                         results[position] = summary
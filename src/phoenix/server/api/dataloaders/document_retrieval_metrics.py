@@ -8,7 +8,7 @@ from strawberry.dataloader import DataLoader
 from typing_extensions import TypeAlias
 
 from phoenix.db import models
-from phoenix.metrics.retrieval_metrics import RetrievalMetrics
+from phoenix.metrics.retrieval_metrics import BatchedRetrievalMetrics
 from phoenix.server.api.types.DocumentRetrievalMetrics import DocumentRetrievalMetrics
 from phoenix.server.types import DbSessionFactory
 
@@ -54,6 +54,9 @@ class DocumentRetrievalMetricsDataLoader(DataLoader[Key, Result]):
         requested_num_docs: defaultdict[tuple[RowId, EvalName], set[NumDocs]] = defaultdict(set)
         for row_id, eval_name, num_docs in results.keys():
             requested_num_docs[(row_id, eval_name)].add(num_docs)
+        # The metrics of all lists of scores are computed together as a batch.
+        batched_eval_scores: list[list[float]] = []
+        batched_names_and_keys: list[tuple[str, Key]] = []
         async with self._db() as session:
             data = await session.stream(stmt)
             async for (span_rowid, name), group in groupby(data, lambda r: (r.span_rowid, r.name)):
@@ -78,12 +81,14 @@ class DocumentRetrievalMetricsDataLoader(DataLoader[Key, Result]):
                         scores[row.document_position] = row.score
                 for eval_name in (name, None):
                     for num_docs in requested_num_docs.get((span_rowid, eval_name)) or ():
-                        metrics = RetrievalMetrics(scores[:num_docs])
-                        doc_metrics = DocumentRetrievalMetrics(
-                            evaluation_name=name, metrics=metrics
-                        )
-                        key = (span_rowid, eval_name, num_docs)
-                        results[key].append(doc_metrics)
+                        batched_eval_scores.append(scores[:num_docs])
+                        batched_names_and_keys.append((name, (span_rowid, eval_name, num_docs)))
+        batch = BatchedRetrievalMetrics.from_lists(batched_eval_scores)
+        for position, (name, key) in enumerate(batched_names_and_keys):
+            doc_metrics = DocumentRetrievalMetrics(
+                evaluation_name=name, batch=batch, position=position
+            )
+            results[key].append(doc_metrics)
         # Make sure to copy the result, so we don't return the same list
         # object to two different requesters.
         return [results[key].copy() for key in keys]
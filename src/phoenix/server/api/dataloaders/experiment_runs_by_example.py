@@ -0,0 +1,44 @@
+from collections import defaultdict
+
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload
+from strawberry.dataloader import DataLoader
+from typing_extensions import TypeAlias
+
+from phoenix.db import models
+from phoenix.server.types import DbSessionFactory
+
+ExperimentID: TypeAlias = int
+ExampleID: TypeAlias = int
+Key: TypeAlias = tuple[ExperimentID, ExampleID]
+Result: TypeAlias = list[models.ExperimentRun]
+
+
+class ExperimentRunsByExampleDataLoader(DataLoader[Key, Result]):
+    """
+    Loads the runs of an experiment on a dataset example, ordered by id, with the trace id of
+    each run.
+    """
+
+    def __init__(self, db: DbSessionFactory) -> None:
+        super().__init__(load_fn=self._load_fn)
+        self._db = db
+
+    async def _load_fn(self, keys: list[Key]) -> list[Result]:
+        experiment_ids = {experiment_id for experiment_id, _ in keys}
+        example_ids = {example_id for _, example_id in keys}
+        stmt = (
+            select(models.ExperimentRun)
+            .where(models.ExperimentRun.experiment_id.in_(experiment_ids))
+            .where(models.ExperimentRun.dataset_example_id.in_(example_ids))
+            .order_by(models.ExperimentRun.id)
+            .options(
+                joinedload(models.ExperimentRun.trace).load_only(models.Trace.trace_id),
+            )
+        )
+        runs: defaultdict[Key, Result] = defaultdict(list)
+        async with self._db() as session:
+            async for run in await session.stream_scalars(stmt):
+                # Over-fetched runs, i.e. those of keys not requested, are never read.
+                runs[(run.experiment_id, run.dataset_example_id)].append(run)
+        return [runs[key].copy() for key in keys]
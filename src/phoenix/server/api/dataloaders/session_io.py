@@ -1,38 +1,76 @@
 from functools import cached_property
-from typing import Literal, Optional, cast
+from typing import Literal, NamedTuple, Optional, cast
 
-from openinference.semconv.trace import SpanAttributes
-from sqlalchemy import Select, func, select
+from sqlalchemy import Select, and_, func, select
 from strawberry.dataloader import DataLoader
 from typing_extensions import TypeAlias, assert_never
 
 from phoenix.db import models
 from phoenix.server.types import DbSessionFactory
-from phoenix.trace.schemas import MimeType, SpanIOValue
+
+
+class SessionIO(NamedTuple):
+    span_rowid: int
+    value_first_101_chars: str
+    mime_type: Optional[str]
+
 
 Key: TypeAlias = int
-Result: TypeAlias = Optional[SpanIOValue]
+Result: TypeAlias = Optional[SessionIO]
 
 Kind = Literal["first_input", "last_output"]
 
 
 class SessionIODataLoader(DataLoader[Key, Result]):
+    """
+    Loads the first input or the last output of sessions from the root-span columns of the
+    traces that the sessions point to. Sessions without pointers (e.g. when the pointed-to trace
+    has been deleted) fall back to ranking the root spans of the sessions.
+    """
+
     def __init__(self, db: DbSessionFactory, kind: Kind) -> None:
         super().__init__(load_fn=self._load_fn)
         self._db = db
         self._kind = kind
 
+    def _stmt(self, *keys: Key) -> Select[tuple[int, int, Optional[str], Optional[str]]]:
+        if self._kind == "first_input":
+            pointer = models.ProjectSession.first_input_trace_rowid
+            value = models.Trace.input_value_first_101_chars
+            mime_type = models.Trace.input_mime_type
+        elif self._kind == "last_output":
+            pointer = models.ProjectSession.last_output_trace_rowid
+            value = models.Trace.output_value_first_101_chars
+            mime_type = models.Trace.output_mime_type
+        else:
+            assert_never(self._kind)
+        stmt = (
+            select(models.ProjectSession.id, models.Trace.root_span_rowid, value, mime_type)
+            .join_from(
+                models.ProjectSession,
+                models.Trace,
+                # a pointer can outlive its trace, whose rowid can then be reused by another
+                and_(
+                    models.Trace.id == pointer,
+                    models.Trace.project_session_rowid == models.ProjectSession.id,
+                ),
+            )
+            .where(models.ProjectSession.id.in_(keys))
+            .where(models.Trace.root_span_rowid.isnot(None))
+        )
+        return cast(Select[tuple[int, int, Optional[str], Optional[str]]], stmt)
+
     @cached_property
-    def _subq(self) -> Select[tuple[Optional[int], str, str, int]]:
+    def _fallback_subq(self) -> Select[tuple[Optional[int], int, str, str, int]]:
         stmt = (
-            select(models.Trace.project_session_rowid.label("id_"))
+            select(models.Trace.project_session_rowid.label("id_"), models.Span.id.label("span_id"))
             .join_from(models.Span, models.Trace)
             .where(models.Span.parent_id.is_(None))
         )
         if self._kind == "first_input":
             stmt = stmt.add_columns(
-                models.Span.attributes[INPUT_VALUE].as_string().label("value"),
-                models.Span.attributes[INPUT_MIME_TYPE].as_string().label("mime_type"),
+                models.Span.input_value_first_101_chars.label("value"),
+                models.Span.input_mime_type.as_string().label("mime_type"),
                 func.row_number()
                 .over(
                     partition_by=models.Trace.project_session_rowid,
@@ -42,8 +80,8 @@ class SessionIODataLoader(DataLoader[Key, Result]):
             )
         elif self._kind == "last_output":
             stmt = stmt.add_columns(
-                models.Span.attributes[OUTPUT_VALUE].as_string().label("value"),
-                models.Span.attributes[OUTPUT_MIME_TYPE].as_string().label("mime_type"),
+                models.Span.output_value_first_101_chars.label("value"),
+                models.Span.output_mime_type.as_string().label("mime_type"),
                 func.row_number()
                 .over(
                     partition_by=models.Trace.project_session_rowid,
@@ -53,27 +91,30 @@ class SessionIODataLoader(DataLoader[Key, Result]):
             )
         else:
             assert_never(self._kind)
-        return cast(Select[tuple[Optional[int], str, str, int]], stmt)
-
-    def _stmt(self, *keys: Key) -> Select[tuple[int, str, str]]:
-        subq = self._subq.where(models.Trace.project_session_rowid.in_(keys)).subquery()
-        return (
-            select(subq.c.id_, subq.c.value, subq.c.mime_type)
-            .filter_by(rank=1)
-            .where(subq.c.value.isnot(None))
-        )
+        return cast(Select[tuple[Optional[int], int, str, str, int]], stmt)
+
+    def _fallback_stmt(self, *keys: Key) -> Select[tuple[int, int, Optional[str], Optional[str]]]:
+        subq = self._fallback_subq.where(models.Trace.project_session_rowid.in_(keys)).subquery()
+        return select(subq.c.id_, subq.c.span_id, subq.c.value, subq.c.mime_type).filter_by(rank=1)
 
     async def _load_fn(self, keys: list[Key]) -> list[Result]:
+        result: dict[Key, Result] = {}
         async with self._db() as session:
-            result: dict[Key, SpanIOValue] = {
-                id_: SpanIOValue(value=value, mime_type=MimeType(mime_type))
-                async for id_, value, mime_type in await session.stream(self._stmt(*keys))
-                if id_ is not None
-            }
+            async for id_, span_rowid, value, mime_type in await session.stream(self._stmt(*keys)):
+                result[id_] = _session_io(span_rowid, value, mime_type)
+            if missing := [key for key in keys if key not in result]:
+                async for id_, span_rowid, value, mime_type in await session.stream(
+                    self._fallback_stmt(*missing)
+                ):
+                    result[id_] = _session_io(span_rowid, value, mime_type)
         return [result.get(key) for key in keys]
 
 
-INPUT_VALUE = SpanAttributes.INPUT_VALUE.split(".")
-INPUT_MIME_TYPE = SpanAttributes.INPUT_MIME_TYPE.split(".")
-OUTPUT_VALUE = SpanAttributes.OUTPUT_VALUE.split(".")
-OUTPUT_MIME_TYPE = SpanAttributes.OUTPUT_MIME_TYPE.split(".")
+def _session_io(
+    span_rowid: int,
+    value: Optional[str],
+    mime_type: Optional[str],
+) -> Result:
+    if value is None:
+        return None
+    return SessionIO(span_rowid=span_rowid, value_first_101_chars=value, mime_type=mime_type)
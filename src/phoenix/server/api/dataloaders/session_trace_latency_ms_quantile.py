@@ -3,18 +3,21 @@ from typing import Optional
 
 import numpy as np
 from aioitertools.itertools import groupby
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from strawberry.dataloader import DataLoader
 from typing_extensions import TypeAlias
 
 from phoenix.db import models
+from phoenix.db.types.latency_sketch import LatencySketch
 from phoenix.server.types import DbSessionFactory
 
 SessionId: TypeAlias = int
 Probability: TypeAlias = float
+Exact: TypeAlias = bool
 QuantileValue: TypeAlias = float
 
-Key: TypeAlias = tuple[SessionId, Probability]
+Key: TypeAlias = tuple[SessionId, Probability, Exact]
 Result: TypeAlias = Optional[QuantileValue]
 ResultPosition: TypeAlias = int
 
@@ -22,6 +25,13 @@ DEFAULT_VALUE: Result = None
 
 
 class SessionTraceLatencyMsQuantileDataLoader(DataLoader[Key, Result]):
+    """
+    Answers quantiles of trace latencies from the latency sketches of the sessions, which are
+    accurate to within the relative accuracy of the sketch (1% by default). Exact quantiles are
+    computed from the latencies of all traces of a session when requested, or when the sketch of
+    the session is missing or is out of date (e.g. after some of its traces have been deleted).
+    """
+
     def __init__(self, db: DbSessionFactory) -> None:
         super().__init__(load_fn=self._load_fn)
         self._db = db
@@ -31,18 +41,33 @@ class SessionTraceLatencyMsQuantileDataLoader(DataLoader[Key, Result]):
         argument_position_map: defaultdict[
             SessionId, defaultdict[Probability, list[ResultPosition]]
         ] = defaultdict(lambda: defaultdict(list))
-        session_rowids = {session_id for session_id, _ in keys}
-        for position, (session_id, probability) in enumerate(keys):
+        for position, (session_id, probability, _) in enumerate(keys):
             argument_position_map[session_id][probability].append(position)
-        stmt = (
-            select(
-                models.Trace.project_session_rowid,
-                models.Trace.latency_ms,
-            )
-            .where(models.Trace.project_session_rowid.in_(session_rowids))
-            .order_by(models.Trace.project_session_rowid)
-        )
+        exact_session_rowids = {session_id for session_id, _, exact in keys if exact}
         async with self._db() as session:
+            if (
+                sketched_session_rowids := {session_id for session_id, _, _ in keys}
+                - exact_session_rowids
+            ):
+                sketches = await self._sketches(session, sketched_session_rowids)
+                for session_id in sketched_session_rowids:
+                    if (sketch := sketches.get(session_id)) is None:
+                        exact_session_rowids.add(session_id)
+                        continue
+                    for probability, positions in argument_position_map[session_id].items():
+                        quantile_value = sketch.quantile(probability)
+                        for position in positions:
+                            results[position] = quantile_value
+            if not exact_session_rowids:
+                return results
+            stmt = (
+                select(
+                    models.Trace.project_session_rowid,
+                    models.Trace.latency_ms,
+                )
+                .where(models.Trace.project_session_rowid.in_(exact_session_rowids))
+                .order_by(models.Trace.project_session_rowid)
+            )
             data = await session.stream(stmt)
             async for project_session_rowid, group in groupby(
                 data, lambda row: row.project_session_rowid
@@ -53,3 +78,29 @@ class SessionTraceLatencyMsQuantileDataLoader(DataLoader[Key, Result]):
                     for position in positions:
                         results[position] = quantile_value
         return results
+
+    @staticmethod
+    async def _sketches(
+        session: AsyncSession,
+        session_rowids: set[SessionId],
+    ) -> dict[SessionId, LatencySketch]:
+        """
+        Returns the sketches of the sessions that are up to date, i.e. that account for exactly
+        as many latencies as there are traces in the session.
+        """
+        num_traces = (
+            select(func.count(models.Trace.id))
+            .where(models.Trace.project_session_rowid == models.ProjectSession.id)
+            .scalar_subquery()
+        )
+        stmt = select(
+            models.ProjectSession.id,
+            models.ProjectSession.trace_latency_ms_sketch,
+            num_traces.label("num_traces"),
+        ).where(models.ProjectSession.id.in_(session_rowids))
+        return {
+            row.id: row.trace_latency_ms_sketch
+            async for row in await session.stream(stmt)
+            if row.trace_latency_ms_sketch is not None
+            and row.trace_latency_ms_sketch.count == row.num_traces
+        }
@@ -34,6 +34,23 @@ class TableFieldsDataLoader(DataLoader[Key, Result]):
                     result[rowid, attr_strs[i]] = value
         return [result.get((rowid, str(attr))) for rowid, attr in keys]
 
+    async def prefetch(
+        self,
+        rowids: Iterable[RowId],
+        attrs: Iterable[QueryableAttribute[Any]],
+    ) -> None:
+        """
+        Loads the attributes of the rows in one query and primes the cache with them, e.g. with
+        the columns selected of a page of rows, so that loading them needs no further queries.
+        Keys already in the cache are left as they are.
+        """
+        attrs = list(attrs)
+        keys = [(rowid, attr) for rowid in rowids for attr in attrs]
+        if not keys:
+            return
+        for key, value in zip(keys, await self._load_fn(keys)):
+            self.prime(key, value)
+
 
 def _get_stmt(
     keys: Iterable[tuple[RowId, QueryableAttribute[Any]]],
@@ -3,6 +3,7 @@ import operator
 from abc import ABC, abstractmethod
 from copy import deepcopy
 from dataclasses import dataclass, field
+from functools import lru_cache
 from hashlib import sha256
 from typing import Any, Callable, Literal, Optional, Union, get_args
 
@@ -47,6 +48,11 @@ SupportedExperimentRunAttributeName: TypeAlias = Literal["output", "error", "lat
 SupportedExperimentRunEvalAttributeName: TypeAlias = Literal["score", "explanation", "label"]
 EvalName: TypeAlias = str
 
+FILTER_CONDITION_CACHE_SIZE = 256
+"""
+The number of compiled filter conditions to keep, keyed by the condition and the experiments.
+"""
+
 
 def update_examples_query_with_filter_condition(
     query: Select[Any], filter_condition: str, experiment_ids: list[int]
@@ -86,17 +92,32 @@ def update_examples_query_with_filter_condition(
 
 def compile_sqlalchemy_filter_condition(
     filter_condition: str, experiment_ids: list[int]
+) -> tuple[Any, "SQLAlchemyTransformer"]:
+    """
+    Compiles the filter condition into a SQLAlchemy expression. Compilations are cached, so
+    the same condition on the same experiments, e.g. when paging through a comparison, is
+    parsed and compiled only once. The returned expression and transformer must therefore not
+    be mutated.
+    """
+    return _compile_sqlalchemy_filter_condition(filter_condition, tuple(experiment_ids))
+
+
+@lru_cache(maxsize=FILTER_CONDITION_CACHE_SIZE)
+def _compile_sqlalchemy_filter_condition(
+    filter_condition: str, experiment_ids: tuple[int, ...]
 ) -> tuple[Any, "SQLAlchemyTransformer"]:
     try:
         original_tree = ast.parse(filter_condition, mode="eval")
     except SyntaxError as error:
         raise ExperimentRunFilterConditionSyntaxError(str(error))
 
-    trees_with_bound_attribute_names = _bind_free_attribute_names(original_tree, experiment_ids)
+    trees_with_bound_attribute_names = _bind_free_attribute_names(
+        original_tree, list(experiment_ids)
+    )
     has_free_attribute_names = bool(trees_with_bound_attribute_names)
     if has_free_attribute_names:
         # compile the filter condition once for each experiment and return the disjunction
-        sqlalchemy_transformer = SQLAlchemyTransformer(experiment_ids=experiment_ids)
+        sqlalchemy_transformer = SQLAlchemyTransformer(experiment_ids=list(experiment_ids))
         compiled_filter_conditions: dict[ExperimentID, BinaryExpression[Any]] = {}
         for experiment_id, tree in trees_with_bound_attribute_names.items():
             sqlalchemy_tree = sqlalchemy_transformer.visit(tree)
@@ -109,7 +130,7 @@ def compile_sqlalchemy_filter_condition(
         return or_(*compiled_filter_conditions.values()), sqlalchemy_transformer
 
     # compile the filter condition once for all experiments
-    sqlalchemy_transformer = SQLAlchemyTransformer(experiment_ids)
+    sqlalchemy_transformer = SQLAlchemyTransformer(list(experiment_ids))
     sqlalchemy_tree = sqlalchemy_transformer.visit(original_tree)
     node = sqlalchemy_tree.body
     if not isinstance(node, BooleanExpression):
@@ -21,8 +21,9 @@ from strawberry import UNSET
 from strawberry.scalars import JSON as JSONScalarType
 from typing_extensions import TypeAlias, assert_never
 
-from phoenix.config import getenv
+from phoenix.config import PlaygroundProviderConfig, getenv
 from phoenix.evals.models.rate_limiters import (
+    AdaptiveTokenBucket,
     AsyncCallable,
     GenericType,
     ParameterSpec,
@@ -99,23 +100,72 @@ class KeyedSingleton:
         return cls._instances[instance_key]
 
 
+class _NonBlockingAdaptiveTokenBucket(AdaptiveTokenBucket):
+    """
+    An adaptive token bucket whose cooldown after a rate limit error is awaited by the caller
+    instead of blocking the thread (and therefore the server's event loop).
+    """
+
+    def reduce_rate(self, request_start_time: float) -> bool:
+        """
+        Reduces the rate after a rate limit error and returns whether the rate was reduced, i.e.
+        whether the caller should cool down before retrying.
+        """
+        now = time.time()
+        if request_start_time < (self.last_error + self.cooldown):
+            # do not reduce the rate for concurrent requests
+            return False
+        self.rate = max(self.rate * self.rate_reduction_factor, self.minimum_rate)
+        # reset request tokens on a rate limit error
+        self.tokens = 0
+        self.last_checked = now
+        self.last_rate_update = now
+        self.last_error = now
+        return True
+
+
 class PlaygroundRateLimiter(RateLimiter, KeyedSingleton):
     """
     A rate rate limiter class that will be instantiated once per `singleton_key`.
+
+    The limiter starts at the provider's configured maximum request rate (see
+    `PlaygroundProviderConfig`) and adapts downward when the provider responds with rate limit
+    errors. Because the instance is shared by every playground client of the same provider, the
+    adapted rate is only initialized once.
     """
 
-    def __init__(self, singleton_key: Hashable, rate_limit_error: Optional[type[BaseException]]):
+    def __init__(
+        self,
+        singleton_key: GenerativeProviderKey,
+        rate_limit_error: Optional[type[BaseException]],
+    ):
+        if getattr(self, "_initialized", False):
+            return
+        config = PlaygroundProviderConfig.from_env(singleton_key.name)
         super().__init__(
             rate_limit_error=rate_limit_error,
             max_rate_limit_retries=3,
-            initial_per_second_request_rate=1.0,
-            maximum_per_second_request_rate=3.0,
+            initial_per_second_request_rate=config.max_requests_per_second,
+            maximum_per_second_request_rate=config.max_requests_per_second,
             enforcement_window_minutes=0.05,
             rate_reduction_factor=0.5,
             rate_increase_factor=0.01,
             cooldown_seconds=5,
             verbose=False,
         )
+        self._throttler = self._non_blocking_throttler = _NonBlockingAdaptiveTokenBucket(
+            initial_per_second_request_rate=config.max_requests_per_second,
+            maximum_per_second_request_rate=config.max_requests_per_second,
+            enforcement_window_minutes=0.05,
+            rate_reduction_factor=0.5,
+            rate_increase_factor=0.01,
+            cooldown_seconds=5,
+        )
+        self._initialized = True
+
+    async def _on_rate_limit_error(self, request_start_time: float) -> None:
+        if self._non_blocking_throttler.reduce_rate(request_start_time):
+            await asyncio.sleep(self._non_blocking_throttler.cooldown)
 
     # TODO: update the rate limiter class in phoenix.evals to support decorated sync functions
     def _alimit(
@@ -145,7 +195,7 @@ class PlaygroundRateLimiter(RateLimiter, KeyedSingleton):
             except self._rate_limit_error:
                 async with self._rate_limit_handling_lock:
                     self._rate_limit_handling.clear()  # prevent new requests from starting
-                    self._throttler.on_rate_limit_error(request_start_time, verbose=self._verbose)
+                    await self._on_rate_limit_error(request_start_time)
                     try:
                         for _attempt in range(self._max_rate_limit_retries):
                             try:
@@ -157,9 +207,7 @@ class PlaygroundRateLimiter(RateLimiter, KeyedSingleton):
                                 else:
                                     return maybe_coroutine
                             except self._rate_limit_error:
-                                self._throttler.on_rate_limit_error(
-                                    request_start_time, verbose=self._verbose
-                                )
+                                await self._on_rate_limit_error(request_start_time)
                                 continue
                     finally:
                         self._rate_limit_handling.set()  # allow new requests to start
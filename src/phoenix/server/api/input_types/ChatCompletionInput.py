@@ -41,3 +41,11 @@ class ChatCompletionOverDatasetInput:
     experiment_description: Optional[str] = None
     experiment_metadata: Optional[JSON] = strawberry.field(default_factory=dict)
     prompt_name: Optional[Identifier] = None
+    max_concurrency: Optional[int] = strawberry.field(
+        default=None,
+        description="Overrides the server's maximum number of concurrent requests for this run",
+    )
+    max_requests_per_second: Optional[float] = strawberry.field(
+        default=None,
+        description="Limits the rate at which requests are started for this run",
+    )
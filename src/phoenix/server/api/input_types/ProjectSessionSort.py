@@ -13,6 +13,8 @@ class ProjectSessionColumn(Enum):
     endTime = auto()
     tokenCountTotal = auto()
     numTraces = auto()
+    traceLatencyMsP50 = auto()
+    traceLatencyMsP99 = auto()
 
     @property
     def data_type(self) -> CursorSortColumnDataType:
@@ -20,6 +22,11 @@ class ProjectSessionColumn(Enum):
             return CursorSortColumnDataType.INT
         if self is ProjectSessionColumn.startTime or self is ProjectSessionColumn.endTime:
             return CursorSortColumnDataType.DATETIME
+        if (
+            self is ProjectSessionColumn.traceLatencyMsP50
+            or self is ProjectSessionColumn.traceLatencyMsP99
+        ):
+            return CursorSortColumnDataType.FLOAT
         assert_never(self)
 
 
@@ -1,6 +1,9 @@
 import asyncio
+import logging
 from collections import defaultdict
+from collections.abc import Callable
 from datetime import datetime
+from functools import partial
 from typing import Optional
 
 import strawberry
@@ -15,6 +18,8 @@ from phoenix.server.api.types.Event import parse_event_ids_by_inferences_role, u
 from phoenix.server.api.types.ExportedFile import ExportedFile
 from phoenix.server.api.types.InferencesRole import AncillaryInferencesRole, InferencesRole
 
+logger = logging.getLogger(__name__)
+
 
 @strawberry.type
 class ExportEventsMutationMixin:
@@ -44,9 +49,12 @@ class ExportEventsMutationMixin:
             loop = asyncio.get_running_loop()
             await loop.run_in_executor(
                 None,
-                info.context.model.export_rows_as_parquet_file,
-                exclude_corpus_row_ids,
-                fd,
+                partial(
+                    info.context.model.export_rows_as_parquet_file,
+                    exclude_corpus_row_ids,
+                    fd,
+                    progress=_log_progress(file_name),
+                ),
             )
         return ExportedFile(file_name=file_name)
 
@@ -72,14 +80,24 @@ class ExportEventsMutationMixin:
             loop = asyncio.get_running_loop()
             await loop.run_in_executor(
                 None,
-                info.context.model.export_rows_as_parquet_file,
-                row_numbers,
-                fd,
-                cluster_ids,
+                partial(
+                    info.context.model.export_rows_as_parquet_file,
+                    row_numbers,
+                    fd,
+                    cluster_ids,
+                    progress=_log_progress(file_name),
+                ),
             )
         return ExportedFile(file_name=file_name)
 
 
+def _log_progress(file_name: str) -> Callable[[int, int], None]:
+    def log(written: int, total: int) -> None:
+        logger.info(f"Exported {written} of {total} rows to {file_name}.parquet")
+
+    return log
+
+
 def _unpack_clusters(
     clusters: list[ClusterInput],
 ) -> tuple[dict[ms.InferencesRole, list[int]], dict[ms.InferencesRole, dict[int, str]]]:
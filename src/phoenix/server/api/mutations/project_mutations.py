@@ -1,5 +1,5 @@
 import strawberry
-from sqlalchemy import delete, select
+from sqlalchemy import select
 from sqlalchemy.orm import load_only
 from strawberry.relay import GlobalID
 from strawberry.types import Info
@@ -11,7 +11,6 @@ from phoenix.server.api.context import Context
 from phoenix.server.api.input_types.ClearProjectInput import ClearProjectInput
 from phoenix.server.api.queries import Query
 from phoenix.server.api.types.node import from_global_id_with_expected_type
-from phoenix.server.dml_event import ProjectDeleteEvent, SpanDeleteEvent
 
 
 @strawberry.type
@@ -29,8 +28,7 @@ class ProjectMutationMixin:
                 raise ValueError(f"Unknown project: {id}")
             if project.name == DEFAULT_PROJECT_NAME:
                 raise ValueError(f"Cannot delete the {DEFAULT_PROJECT_NAME} project")
-            await session.delete(project)
-        info.context.event_queue.put(ProjectDeleteEvent((project_id,)))
+        await info.context.get_trace_deleter().delete(project_id, delete_project=True)
         return Query()
 
     @strawberry.mutation(permission_classes=[IsNotReadOnly])  # type: ignore
@@ -38,20 +36,8 @@ class ProjectMutationMixin:
         project_id = from_global_id_with_expected_type(
             global_id=input.id, expected_type_name="Project"
         )
-        delete_statement = (
-            delete(models.Trace)
-            .where(models.Trace.project_rowid == project_id)
-            .returning(models.Trace.project_session_rowid)
+        await info.context.get_trace_deleter().delete(
+            project_id,
+            start_time_before=input.end_time or None,
         )
-        if input.end_time:
-            delete_statement = delete_statement.where(models.Trace.start_time < input.end_time)
-        async with info.context.db() as session:
-            deleted_trace_project_session_ids = await session.scalars(delete_statement)
-            if deleted_trace_project_session_ids:
-                await session.execute(
-                    delete(models.ProjectSession).where(
-                        models.ProjectSession.id.in_(set(deleted_trace_project_session_ids))
-                    )
-                )
-        info.context.event_queue.put(SpanDeleteEvent((project_id,)))
         return Query()
@@ -6,6 +6,10 @@ from strawberry.relay import GlobalID
 from strawberry.types import Info
 
 from phoenix.db import models
+from phoenix.db.insertion.span import (
+    update_session_io_pointers,
+    update_session_trace_latency_sketches,
+)
 from phoenix.server.api.auth import IsNotReadOnly
 from phoenix.server.api.context import Context
 from phoenix.server.api.exceptions import BadRequest
@@ -70,5 +74,7 @@ class TraceMutationMixin:
                         )
                     )
                 )
+                await update_session_io_pointers(session, *session_ids)
+                await update_session_trace_latency_sketches(session, *session_ids)
             info.context.event_queue.put(SpanDeleteEvent(project_ids))
         return Query()
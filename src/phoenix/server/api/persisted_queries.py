@@ -0,0 +1,157 @@
+"""
+Automatic persisted queries, with which a client sends the SHA-256 hash of a query in place of
+its text once the server has seen the text, and a cache of the parsed and validated documents of
+queries, so that neither the upload nor the parsing and validation of the large queries that the
+UI sends over and over is repeated for every request.
+
+See https://www.apollographql.com/docs/apollo-server/performance/apq for the protocol.
+"""
+
+from collections.abc import Iterator
+from hashlib import sha256
+from typing import Any, Optional
+
+from cachetools import LRUCache
+from graphql import DocumentNode, GraphQLError, parse
+from graphql.validation import ASTValidationRule
+from strawberry.extensions import SchemaExtension
+from strawberry.fastapi import GraphQLRouter
+from strawberry.http import GraphQLRequestData
+from strawberry.http.async_base_view import AsyncHTTPRequestAdapter
+from strawberry.http.exceptions import HTTPException
+from strawberry.schema.schema import validate_document
+from strawberry.types import ExecutionResult
+
+PERSISTED_QUERY_NOT_FOUND = "PersistedQueryNotFound"
+
+_MAX_PERSISTED_QUERIES = 1_000
+_MAX_CACHED_DOCUMENTS = 128
+
+
+class PersistedQueryNotFound(Exception):
+    """
+    An error raised when a client sends the hash of a query that the server has not seen.
+    """
+
+
+class PersistedQueries:
+    """
+    The texts of the queries that clients have sent, keyed by their SHA-256 hashes.
+    """
+
+    def __init__(self, maxsize: int = _MAX_PERSISTED_QUERIES) -> None:
+        self._queries: LRUCache[str, str] = LRUCache(maxsize)
+
+    def get_query(self, query: Optional[str], extensions: Any) -> Optional[str]:
+        """
+        Returns the query of a request, which is looked up by its hash if the request has none.
+        A query sent with its hash is remembered, and the remembered text is returned even then,
+        so that the same string is used as the key of the document cache for every request.
+        """
+        if not isinstance(extensions, dict) or "persistedQuery" not in extensions:
+            return query
+        persisted_query = extensions["persistedQuery"]
+        if not isinstance(persisted_query, dict) or persisted_query.get("version") != 1:
+            raise HTTPException(400, "Unsupported persisted query version")
+        if not isinstance(sha256_hash := persisted_query.get("sha256Hash"), str):
+            raise HTTPException(400, "Persisted query hash is missing")
+        if query is None:
+            if (persisted := self._queries.get(sha256_hash)) is None:
+                raise PersistedQueryNotFound
+            return persisted
+        if sha256(query.encode()).hexdigest() != sha256_hash:
+            raise HTTPException(400, "Persisted query hash does not match the query")
+        if (persisted := self._queries.get(sha256_hash)) is None:
+            self._queries[sha256_hash] = persisted = query
+        return persisted
+
+
+class PersistedQueriesGraphQLRouter(GraphQLRouter[Any, Any]):
+    """
+    A GraphQL router that resolves the queries of requests sent with their hashes.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        persisted_queries: Optional[PersistedQueries] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self._persisted_queries = persisted_queries or PersistedQueries()
+
+    async def parse_http_body(self, request: AsyncHTTPRequestAdapter) -> GraphQLRequestData:
+        request_data = await super().parse_http_body(request)
+        if (
+            request.method == "POST"
+            and "application/json" in (request.content_type or "")
+            and b"persistedQuery" in (body := await request.get_body())
+            and isinstance(data := self.parse_json(body), dict)
+        ):
+            request_data.query = self._persisted_queries.get_query(
+                request_data.query, data.get("extensions")
+            )
+        return request_data
+
+    async def execute_operation(self, *args: Any, **kwargs: Any) -> Any:
+        try:
+            return await super().execute_operation(*args, **kwargs)
+        except PersistedQueryNotFound:
+            error = GraphQLError(
+                PERSISTED_QUERY_NOT_FOUND,
+                extensions={"code": "PERSISTED_QUERY_NOT_FOUND"},
+            )
+            return ExecutionResult(data=None, errors=[error])
+
+
+def get_document_cache_extension(
+    maxsize: int = _MAX_CACHED_DOCUMENTS,
+) -> type[SchemaExtension]:
+    """
+    Makes a schema extension that caches the parsed documents of queries, keyed by the query
+    text, and which of them are valid. The extension is instantiated for each request, unlike
+    strawberry's `ParserCache` and `ValidationCache` instances, whose execution context would be
+    shared by concurrent requests.
+    """
+    documents: LRUCache[str, DocumentNode] = LRUCache(maxsize)
+    valid: LRUCache[tuple[str, tuple[type[ASTValidationRule], ...]], bool] = LRUCache(maxsize)
+
+    class DocumentCache(SchemaExtension):
+        def on_parse(self) -> Iterator[None]:
+            context = self.execution_context
+            if (query := context.query) and not context.graphql_document:
+                if (document := documents.get(query)) is None:
+                    try:
+                        document = parse(query)
+                    except Exception:
+                        # the error is reported when the query is parsed again by strawberry
+                        yield
+                        return
+                    documents[query] = document
+                context.graphql_document = document
+            yield
+
+        def on_validate(self) -> Iterator[None]:
+            context = self.execution_context
+            if (
+                (query := context.query)
+                and (document := context.graphql_document) is not None
+                and document is documents.get(query)
+                and context.validation_rules
+                and context.errors is None
+            ):
+                key = (query, context.validation_rules)
+                if valid.get(key):
+                    context.errors = []
+                else:
+                    errors: list[GraphQLError] = validate_document(
+                        context.schema._schema,
+                        document,
+                        context.validation_rules,
+                    )
+                    if not errors:
+                        valid[key] = True
+                    context.errors = errors
+            yield
+
+    return DocumentCache
@@ -1,11 +1,12 @@
 from collections import defaultdict
 from datetime import datetime
-from typing import Iterable, Iterator, Optional, Union, cast
+from typing import Any, Iterable, Iterator, Optional, Union, cast
 
 import numpy as np
 import numpy.typing as npt
 import strawberry
-from sqlalchemy import and_, distinct, func, select, text
+from sqlalchemy import Select, and_, distinct, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 from starlette.authentication import UnauthenticatedUser
 from strawberry import ID, UNSET
@@ -58,7 +59,12 @@ from phoenix.server.api.types.EmbeddingDimension import (
 )
 from phoenix.server.api.types.Event import create_event_id, unpack_event_id
 from phoenix.server.api.types.Experiment import Experiment
-from phoenix.server.api.types.ExperimentComparison import ExperimentComparison, RunComparisonItem
+from phoenix.server.api.types.ExperimentAnnotationSummary import ExperimentAnnotationSummary
+from phoenix.server.api.types.ExperimentComparison import (
+    ExperimentComparison,
+    ExperimentComparisonAggregate,
+    RunComparisonItem,
+)
 from phoenix.server.api.types.ExperimentRun import ExperimentRun, to_gql_experiment_run
 from phoenix.server.api.types.Functionality import Functionality
 from phoenix.server.api.types.GenerativeModel import GenerativeModel
@@ -66,7 +72,13 @@ from phoenix.server.api.types.GenerativeProvider import GenerativeProvider, Gene
 from phoenix.server.api.types.InferencesRole import AncillaryInferencesRole, InferencesRole
 from phoenix.server.api.types.Model import Model
 from phoenix.server.api.types.node import from_global_id, from_global_id_with_expected_type
-from phoenix.server.api.types.pagination import ConnectionArgs, CursorString, connection_from_list
+from phoenix.server.api.types.pagination import (
+    ConnectionArgs,
+    Cursor,
+    CursorString,
+    connection_from_cursors_and_nodes,
+    connection_from_list,
+)
 from phoenix.server.api.types.Project import Project
 from phoenix.server.api.types.ProjectSession import ProjectSession, to_gql_project_session
 from phoenix.server.api.types.ProjectTraceRetentionPolicy import ProjectTraceRetentionPolicy
@@ -169,7 +181,7 @@ class Query:
             .order_by(models.User.email)
             .options(joinedload(models.User.role))
         )
-        async with info.context.db() as session:
+        async with info.context.db.reader() as session:
             users = await session.stream_scalars(stmt)
             data = [to_gql_user(user) async for user in users]
         return connection_from_list(data=data, args=args)
@@ -179,7 +191,7 @@ class Query:
         self,
         info: Info[Context, None],
     ) -> list[UserRole]:
-        async with info.context.db() as session:
+        async with info.context.db.reader() as session:
             roles = await session.scalars(
                 select(models.UserRole).where(models.UserRole.name != enums.UserRole.SYSTEM.value)
             )
@@ -199,7 +211,7 @@ class Query:
             .join(models.UserRole)
             .where(models.UserRole.name != enums.UserRole.SYSTEM.value)
         )
-        async with info.context.db() as session:
+        async with info.context.db.reader() as session:
             api_keys = await session.scalars(stmt)
         return [to_gql_api_key(api_key) for api_key in api_keys]
 
@@ -211,7 +223,7 @@ class Query:
             .join(models.UserRole)
             .where(models.UserRole.name == enums.UserRole.SYSTEM.value)
         )
-        async with info.context.db() as session:
+        async with info.context.db.reader() as session:
             api_keys = await session.scalars(stmt)
         return [
             SystemApiKey(
@@ -261,7 +273,7 @@ class Query:
         if filter:
             stmt = stmt.where(getattr(models.Project, filter.col.value).ilike(f"%{filter.value}%"))
         stmt = exclude_experiment_projects(stmt)
-        async with info.context.db() as session:
+        async with info.context.db.reader() as session:
             projects = await session.stream_scalars(stmt)
             data = [
                 Project(
@@ -296,7 +308,7 @@ class Query:
         if sort:
             sort_col = getattr(models.Dataset, sort.col.value)
             stmt = stmt.order_by(sort_col.desc() if sort.dir is SortDir.desc else sort_col.asc())
-        async with info.context.db() as session:
+        async with info.context.db.reader() as session:
             datasets = await session.scalars(stmt)
         return connection_from_list(
             data=[to_gql_dataset(dataset) for dataset in datasets], args=args
@@ -313,74 +325,11 @@ class Query:
         experiment_ids: list[GlobalID],
         filter_condition: Optional[str] = UNSET,
     ) -> list[ExperimentComparison]:
-        experiment_ids_ = [
-            from_global_id_with_expected_type(experiment_id, OrmExperiment.__name__)
-            for experiment_id in experiment_ids
-        ]
-        if len(set(experiment_ids_)) != len(experiment_ids_):
-            raise ValueError("Experiment IDs must be unique.")
-
-        async with info.context.db() as session:
-            validation_result = (
-                await session.execute(
-                    select(
-                        func.count(distinct(OrmVersion.dataset_id)),
-                        func.max(OrmVersion.dataset_id),
-                        func.max(OrmVersion.id),
-                        func.count(OrmExperiment.id),
-                    )
-                    .select_from(OrmVersion)
-                    .join(
-                        OrmExperiment,
-                        OrmExperiment.dataset_version_id == OrmVersion.id,
-                    )
-                    .where(
-                        OrmExperiment.id.in_(experiment_ids_),
-                    )
-                )
-            ).first()
-            if validation_result is None:
-                raise ValueError("No experiments could be found for input IDs.")
-
-            num_datasets, dataset_id, version_id, num_resolved_experiment_ids = validation_result
-            if num_datasets != 1:
-                raise ValueError("Experiments must belong to the same dataset.")
-            if num_resolved_experiment_ids != len(experiment_ids_):
-                raise ValueError("Unable to resolve one or more experiment IDs.")
-
-            revision_ids = (
-                select(func.max(OrmRevision.id))
-                .join(OrmExample, OrmExample.id == OrmRevision.dataset_example_id)
-                .where(
-                    and_(
-                        OrmRevision.dataset_version_id <= version_id,
-                        OrmExample.dataset_id == dataset_id,
-                    )
-                )
-                .group_by(OrmRevision.dataset_example_id)
-                .scalar_subquery()
-            )
-            examples_query = (
-                select(OrmExample)
-                .distinct(OrmExample.id)
-                .join(
-                    OrmRevision,
-                    onclause=and_(
-                        OrmExample.id == OrmRevision.dataset_example_id,
-                        OrmRevision.id.in_(revision_ids),
-                        OrmRevision.revision_kind != "DELETE",
-                    ),
-                )
-                .order_by(OrmExample.id.desc())
+        experiment_ids_ = _experiment_rowids(experiment_ids)
+        async with info.context.db.reader() as session:
+            version_id, examples_query = await _comparison_examples_query(
+                session, experiment_ids_, filter_condition
             )
-
-            if filter_condition:
-                examples_query = update_examples_query_with_filter_condition(
-                    query=examples_query,
-                    filter_condition=filter_condition,
-                    experiment_ids=experiment_ids_,
-                )
-
             examples = (await session.scalars(examples_query)).all()
 
             ExampleID: TypeAlias = int
@@ -427,6 +376,165 @@ class Query:
             )
         return experiment_comparisons
 
+    @strawberry.field
+    async def compare_experiments_connection(
+        self,
+        info: Info[Context, None],
+        experiment_ids: list[GlobalID],
+        filter_condition: Optional[str] = UNSET,
+        first: Optional[int] = 50,
+        after: Optional[CursorString] = UNSET,
+    ) -> Connection[ExperimentComparison]:
+        """
+        The comparisons of `compare_experiments` a page at a time, where the runs are loaded
+        only for the examples on the page.
+        """
+        experiment_ids_ = _experiment_rowids(experiment_ids)
+        async with info.context.db.reader() as session:
+            version_id, examples_query = await _comparison_examples_query(
+                session, experiment_ids_, filter_condition
+            )
+            if after:
+                cursor = Cursor.from_string(after)
+                # examples are ordered by descending id
+                examples_query = examples_query.where(OrmExample.id < cursor.rowid)
+            if first is not None:
+                examples_query = examples_query.limit(
+                    first + 1  # over-fetch by one to determine whether there's a next page
+                )
+            examples = (await session.scalars(examples_query)).all()
+        has_next_page = False
+        if first is not None and len(examples) > first:
+            examples, has_next_page = examples[:first], True
+        runs = iter(
+            await info.context.data_loaders.experiment_runs_by_example.load_many(
+                [
+                    (experiment_id, example.id)
+                    for example in examples
+                    for experiment_id in experiment_ids_
+                ]
+            )
+        )
+        cursors_and_nodes = []
+        for example in examples:
+            run_comparison_items = [
+                RunComparisonItem(
+                    experiment_id=GlobalID(Experiment.__name__, str(experiment_id)),
+                    runs=[to_gql_experiment_run(run) for run in next(runs)],
+                )
+                for experiment_id in experiment_ids_
+            ]
+            experiment_comparison = ExperimentComparison(
+                example=DatasetExample(
+                    id_attr=example.id,
+                    created_at=example.created_at,
+                    version_id=version_id,
+                ),
+                run_comparison_items=run_comparison_items,
+            )
+            cursors_and_nodes.append((Cursor(rowid=example.id), experiment_comparison))
+        return connection_from_cursors_and_nodes(
+            cursors_and_nodes,
+            has_previous_page=False,
+            has_next_page=has_next_page,
+        )
+
+    @strawberry.field
+    async def compare_experiments_aggregates(
+        self,
+        info: Info[Context, None],
+        experiment_ids: list[GlobalID],
+        filter_condition: Optional[str] = UNSET,
+    ) -> list[ExperimentComparisonAggregate]:
+        """
+        Aggregates of the runs of each experiment over all the compared examples, so that a
+        paginated comparison does not need every row to summarize the experiments.
+        """
+        experiment_ids_ = _experiment_rowids(experiment_ids)
+        async with info.context.db.reader() as session:
+            _, examples_query = await _comparison_examples_query(
+                session, experiment_ids_, filter_condition
+            )
+            example_ids = examples_query.with_only_columns(OrmExample.id).order_by(None)
+            compared_runs = and_(
+                OrmExperimentRun.experiment_id.in_(experiment_ids_),
+                OrmExperimentRun.dataset_example_id.in_(example_ids),
+            )
+            run_aggregates = {
+                run_experiment_id: (run_count, error_count, latency_seconds)
+                async for run_experiment_id, run_count, error_count, latency_seconds in (
+                    await session.stream(
+                        select(
+                            OrmExperimentRun.experiment_id,
+                            func.count(OrmExperimentRun.id),
+                            func.count(OrmExperimentRun.error),
+                            func.avg(
+                                func.extract("epoch", OrmExperimentRun.end_time)
+                                - func.extract("epoch", OrmExperimentRun.start_time)
+                            ),
+                        )
+                        .where(compared_runs)
+                        .group_by(OrmExperimentRun.experiment_id)
+                    )
+                )
+            }
+            annotation_summaries: defaultdict[int, list[ExperimentAnnotationSummary]] = defaultdict(
+                list
+            )
+            async for (
+                experiment_id,
+                annotation_name,
+                min_score,
+                max_score,
+                mean_score,
+                count,
+                error_count,
+            ) in await session.stream(
+                select(
+                    OrmExperimentRun.experiment_id,
+                    models.ExperimentRunAnnotation.name,
+                    func.min(models.ExperimentRunAnnotation.score),
+                    func.max(models.ExperimentRunAnnotation.score),
+                    func.avg(models.ExperimentRunAnnotation.score),
+                    func.count(),
+                    func.count(models.ExperimentRunAnnotation.error),
+                )
+                .join(
+                    OrmExperimentRun,
+                    models.ExperimentRunAnnotation.experiment_run_id == OrmExperimentRun.id,
+                )
+                .where(compared_runs)
+                .group_by(OrmExperimentRun.experiment_id, models.ExperimentRunAnnotation.name)
+                .order_by(models.ExperimentRunAnnotation.name)
+            ):
+                annotation_summaries[experiment_id].append(
+                    ExperimentAnnotationSummary(
+                        annotation_name=annotation_name,
+                        min_score=min_score,
+                        max_score=max_score,
+                        mean_score=mean_score,
+                        count=count,
+                        error_count=error_count,
+                    )
+                )
+        aggregates = []
+        for experiment_rowid in experiment_ids_:
+            run_count, run_error_count, latency_seconds = run_aggregates.get(
+                experiment_rowid, (0, 0, None)
+            )
+            aggregates.append(
+                ExperimentComparisonAggregate(
+                    experiment_id=GlobalID(Experiment.__name__, str(experiment_rowid)),
+                    run_count=run_count,
+                    error_rate=run_error_count / run_count if run_count else None,
+                    average_run_latency_ms=(
+                        latency_seconds * 1000 if latency_seconds is not None else None
+                    ),
+                    annotation_summaries=annotation_summaries[experiment_rowid],
+                )
+            )
+        return aggregates
+
     @strawberry.field
     async def validate_experiment_run_filter_condition(
         self,
@@ -473,7 +581,7 @@ class Query:
             return to_gql_embedding_dimension(node_id, embedding_dimension)
         elif type_name == "Project":
             project_stmt = select(models.Project).filter_by(id=node_id)
-            async with info.context.db() as session:
+            async with info.context.db.reader() as session:
                 project = await session.scalar(project_stmt)
             if project is None:
                 raise NotFound(f"Unknown project: {id}")
@@ -483,7 +591,7 @@ class Query:
             )
         elif type_name == "Trace":
             trace_stmt = select(models.Trace).filter_by(id=node_id)
-            async with info.context.db() as session:
+            async with info.context.db.reader() as session:
                 trace = await session.scalar(trace_stmt)
             if trace is None:
                 raise NotFound(f"Unknown trace: {id}")
@@ -496,14 +604,14 @@ class Query:
                 )
                 .where(models.Span.id == node_id)
             )
-            async with info.context.db() as session:
+            async with info.context.db.reader() as session:
                 span = await session.scalar(span_stmt)
             if span is None:
                 raise NotFound(f"Unknown span: {id}")
             return Span(span_rowid=span.id, db_span=span)
         elif type_name == Dataset.__name__:
             dataset_stmt = select(models.Dataset).where(models.Dataset.id == node_id)
-            async with info.context.db() as session:
+            async with info.context.db.reader() as session:
                 if (dataset := await session.scalar(dataset_stmt)) is None:
                     raise NotFound(f"Unknown dataset: {id}")
             return to_gql_dataset(dataset)
@@ -514,7 +622,7 @@ class Query:
                 .where(models.DatasetExampleRevision.dataset_example_id == example_id)
                 .scalar_subquery()
             )
-            async with info.context.db() as session:
+            async with info.context.db.reader() as session:
                 example = await session.scalar(
                     select(models.DatasetExample)
                     .join(
@@ -537,7 +645,7 @@ class Query:
                 created_at=example.created_at,
             )
         elif type_name == Experiment.__name__:
-            async with info.context.db() as session:
+            async with info.context.db.reader() as session:
                 experiment = await session.scalar(
                     select(models.Experiment).where(models.Experiment.id == node_id)
                 )
@@ -553,7 +661,7 @@ class Query:
                 metadata=experiment.metadata_,
             )
         elif type_name == ExperimentRun.__name__:
-            async with info.context.db() as session:
+            async with info.context.db.reader() as session:
                 if not (
                     run := await session.scalar(
                         select(models.ExperimentRun)
@@ -568,7 +676,7 @@ class Query:
         elif type_name == User.__name__:
             if int((user := info.context.user).identity) != node_id and not user.is_admin:
                 raise Unauthorized(MSG_ADMIN_ONLY)
-            async with info.context.db() as session:
+            async with info.context.db.reader() as session:
                 if not (
                     user := await session.scalar(
                         select(models.User).where(models.User.id == node_id)
@@ -577,7 +685,7 @@ class Query:
                     raise NotFound(f"Unknown user: {id}")
             return to_gql_user(user)
         elif type_name == ProjectSession.__name__:
-            async with info.context.db() as session:
+            async with info.context.db.reader() as session:
                 if not (
                     project_session := await session.scalar(
                         select(models.ProjectSession).filter_by(id=node_id)
@@ -586,7 +694,7 @@ class Query:
                     raise NotFound(f"Unknown user: {id}")
             return to_gql_project_session(project_session)
         elif type_name == Prompt.__name__:
-            async with info.context.db() as session:
+            async with info.context.db.reader() as session:
                 if orm_prompt := await session.scalar(
                     select(models.Prompt).where(models.Prompt.id == node_id)
                 ):
@@ -594,7 +702,7 @@ class Query:
                 else:
                     raise NotFound(f"Unknown prompt: {id}")
         elif type_name == PromptVersion.__name__:
-            async with info.context.db() as session:
+            async with info.context.db.reader() as session:
                 if orm_prompt_version := await session.scalar(
                     select(models.PromptVersion).where(models.PromptVersion.id == node_id)
                 ):
@@ -602,7 +710,7 @@ class Query:
                 else:
                     raise NotFound(f"Unknown prompt version: {id}")
         elif type_name == PromptLabel.__name__:
-            async with info.context.db() as session:
+            async with info.context.db.reader() as session:
                 if not (
                     prompt_label := await session.scalar(
                         select(models.PromptLabel).where(models.PromptLabel.id == node_id)
@@ -611,12 +719,12 @@ class Query:
                     raise NotFound(f"Unknown prompt label: {id}")
             return to_gql_prompt_label(prompt_label)
         elif type_name == PromptVersionTag.__name__:
-            async with info.context.db() as session:
+            async with info.context.db.reader() as session:
                 if not (prompt_version_tag := await session.get(models.PromptVersionTag, node_id)):
                     raise NotFound(f"Unknown prompt version tag: {id}")
             return to_gql_prompt_version_tag(prompt_version_tag)
         elif type_name == ProjectTraceRetentionPolicy.__name__:
-            async with info.context.db() as session:
+            async with info.context.db.reader() as session:
                 db_policy = await session.scalar(
                     select(models.ProjectTraceRetentionPolicy).filter_by(id=node_id)
                 )
@@ -624,13 +732,13 @@ class Query:
                     raise NotFound(f"Unknown project trace retention policy: {id}")
             return ProjectTraceRetentionPolicy(id=db_policy.id, db_policy=db_policy)
         elif type_name == SpanAnnotation.__name__:
-            async with info.context.db() as session:
+            async with info.context.db.reader() as session:
                 span_annotation = await session.get(models.SpanAnnotation, node_id)
                 if not span_annotation:
                     raise NotFound(f"Unknown span annotation: {id}")
             return to_gql_span_annotation(span_annotation)
         elif type_name == TraceAnnotation.__name__:
-            async with info.context.db() as session:
+            async with info.context.db.reader() as session:
                 trace_annotation = await session.get(models.TraceAnnotation, node_id)
                 if not trace_annotation:
                     raise NotFound(f"Unknown trace annotation: {id}")
@@ -646,7 +754,7 @@ class Query:
             return None
         if isinstance(user, UnauthenticatedUser):
             return None
-        async with info.context.db() as session:
+        async with info.context.db.reader() as session:
             if (
                 user := await session.scalar(
                     select(models.User)
@@ -673,7 +781,7 @@ class Query:
             before=before if isinstance(before, CursorString) else None,
         )
         stmt = select(models.Prompt)
-        async with info.context.db() as session:
+        async with info.context.db.reader() as session:
             orm_prompts = await session.stream_scalars(stmt)
             data = [to_gql_prompt_from_orm(orm_prompt) async for orm_prompt in orm_prompts]
             return connection_from_list(
@@ -696,7 +804,7 @@ class Query:
             last=last,
             before=before if isinstance(before, CursorString) else None,
         )
-        async with info.context.db() as session:
+        async with info.context.db.reader() as session:
             prompt_labels = await session.stream_scalars(select(models.PromptLabel))
             data = [to_gql_prompt_label(prompt_label) async for prompt_label in prompt_labels]
             return connection_from_list(
@@ -719,7 +827,7 @@ class Query:
             last=last,
             before=before if isinstance(before, CursorString) else None,
         )
-        async with info.context.db() as session:
+        async with info.context.db.reader() as session:
             configs = await session.stream_scalars(
                 select(models.AnnotationConfig).order_by(models.AnnotationConfig.name)
             )
@@ -739,7 +847,7 @@ class Query:
         )
 
     @strawberry.field
-    def hdbscan_clustering(
+    async def hdbscan_clustering(
         self,
         info: Info[Context, None],
         event_ids: Annotated[
@@ -839,11 +947,16 @@ class Query:
             + grouped_coordinates[AncillaryInferencesRole.corpus]
         )
 
-        clusters = Hdbscan(
-            min_cluster_size=min_cluster_size,
-            min_samples=cluster_min_samples,
-            cluster_selection_epsilon=cluster_selection_epsilon,
-        ).find_clusters(stacked_coordinates)
+        clusters = await info.context.point_cloud_runner.find_clusters(
+            Hdbscan(
+                min_cluster_size=min_cluster_size,
+                min_samples=cluster_min_samples,
+                cluster_selection_epsilon=cluster_selection_epsilon,
+            ),
+            stacked_coordinates,
+            ids=stacked_event_ids,
+            is_disconnected=info.context.is_disconnected,
+        )
 
         clustered_events = {
             str(i): {stacked_event_ids[row_idx] for row_idx in cluster}
@@ -862,7 +975,7 @@ class Query:
         stmt = select(models.ProjectTraceRetentionPolicy).filter_by(
             id=DEFAULT_PROJECT_TRACE_RETENTION_POLICY_ID
         )
-        async with info.context.db() as session:
+        async with info.context.db.reader() as session:
             db_policy = await session.scalar(stmt)
         assert db_policy
         return ProjectTraceRetentionPolicy(id=db_policy.id, db_policy=db_policy)
@@ -885,7 +998,7 @@ class Query:
         stmt = select(models.ProjectTraceRetentionPolicy).order_by(
             models.ProjectTraceRetentionPolicy.id
         )
-        async with info.context.db() as session:
+        async with info.context.db.reader() as session:
             result = await session.stream_scalars(stmt)
             data = [
                 ProjectTraceRetentionPolicy(id=db_policy.id, db_policy=db_policy)
@@ -910,7 +1023,7 @@ class Query:
         if info.context.db.dialect is SupportedSQLDialect.SQLITE:
             # TODO: temporary workaround until we can figure out why
             # the dbstat query takes longer than expected
-            async with info.context.db() as session:
+            async with info.context.db.reader() as session:
                 page_count = await session.scalar(text("PRAGMA page_count;"))
                 free_pages = await session.scalar(text("PRAGMA freelist_count;"))
                 page_size = await session.scalar(text("PRAGMA page_size;"))
@@ -929,7 +1042,7 @@ class Query:
                 AND n.nspname = '{getenv(ENV_PHOENIX_SQL_DATABASE_SCHEMA) or "public"}';
             """)
             try:
-                async with info.context.db() as session:
+                async with info.context.db.reader() as session:
                     stats = cast(Iterable[tuple[str, int]], await session.execute(stmt))
             except Exception:
                 # TODO: temporary workaround until we can reproduce the error
@@ -942,6 +1055,88 @@ class Query:
         ]
 
 
+def _experiment_rowids(experiment_ids: list[GlobalID]) -> list[int]:
+    experiment_rowids = [
+        from_global_id_with_expected_type(experiment_id, OrmExperiment.__name__)
+        for experiment_id in experiment_ids
+    ]
+    if len(set(experiment_rowids)) != len(experiment_rowids):
+        raise ValueError("Experiment IDs must be unique.")
+    return experiment_rowids
+
+
+async def _comparison_examples_query(
+    session: AsyncSession,
+    experiment_ids: list[int],
+    filter_condition: Optional[str],
+) -> tuple[int, Select[Any]]:
+    """
+    Validates that the experiments belong to the same dataset and returns the id of the latest
+    dataset version among them, and the query for the examples of that version that match the
+    filter condition, in descending order of id.
+    """
+    validation_result = (
+        await session.execute(
+            select(
+                func.count(distinct(OrmVersion.dataset_id)),
+                func.max(OrmVersion.dataset_id),
+                func.max(OrmVersion.id),
+                func.count(OrmExperiment.id),
+            )
+            .select_from(OrmVersion)
+            .join(
+                OrmExperiment,
+                OrmExperiment.dataset_version_id == OrmVersion.id,
+            )
+            .where(
+                OrmExperiment.id.in_(experiment_ids),
+            )
+        )
+    ).first()
+    if validation_result is None:
+        raise ValueError("No experiments could be found for input IDs.")
+
+    num_datasets, dataset_id, version_id, num_resolved_experiment_ids = validation_result
+    if num_datasets != 1:
+        raise ValueError("Experiments must belong to the same dataset.")
+    if num_resolved_experiment_ids != len(experiment_ids):
+        raise ValueError("Unable to resolve one or more experiment IDs.")
+
+    revision_ids = (
+        select(func.max(OrmRevision.id))
+        .join(OrmExample, OrmExample.id == OrmRevision.dataset_example_id)
+        .where(
+            and_(
+                OrmRevision.dataset_version_id <= version_id,
+                OrmExample.dataset_id == dataset_id,
+            )
+        )
+        .group_by(OrmRevision.dataset_example_id)
+        .scalar_subquery()
+    )
+    examples_query = (
+        select(OrmExample)
+        .distinct(OrmExample.id)
+        .join(
+            OrmRevision,
+            onclause=and_(
+                OrmExample.id == OrmRevision.dataset_example_id,
+                OrmRevision.id.in_(revision_ids),
+                OrmRevision.revision_kind != "DELETE",
+            ),
+        )
+        .order_by(OrmExample.id.desc())
+    )
+
+    if filter_condition:
+        examples_query = update_examples_query_with_filter_condition(
+            query=examples_query,
+            filter_condition=filter_condition,
+            experiment_ids=experiment_ids,
+        )
+    return version_id, examples_query
+
+
 def _consolidate_sqlite_db_table_stats(
     stats: Iterable[tuple[str, int]],
 ) -> Iterator[tuple[str, int]]:
@@ -1,13 +1,17 @@
 from datetime import datetime
-from typing import Optional, cast
+from typing import Literal, Optional, cast
 
 import pandas as pd
 import pyarrow as pa
+from typing_extensions import TypeAlias
 
+ArrowCompression: TypeAlias = Literal["zstd", "lz4"]
 
-def table_to_bytes(table: pa.Table) -> bytes:
+
+def table_to_bytes(table: pa.Table, compression: Optional[ArrowCompression] = None) -> bytes:
     sink = pa.BufferOutputStream()
-    with pa.ipc.new_stream(sink, table.schema) as writer:
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
         writer.write_table(table)
     return cast(bytes, sink.getvalue().to_pybytes())
 
@@ -16,6 +20,6 @@ def from_iso_format(value: Optional[str]) -> Optional[datetime]:
     return datetime.fromisoformat(value) if value else None
 
 
-def df_to_bytes(df: pd.DataFrame) -> bytes:
+def df_to_bytes(df: pd.DataFrame, compression: Optional[ArrowCompression] = None) -> bytes:
     pa_table = pa.Table.from_pandas(df)
-    return table_to_bytes(pa_table)
+    return table_to_bytes(pa_table, compression)
@@ -331,8 +331,7 @@ async def delete_project(
                 status_code=HTTP_403_FORBIDDEN,
                 detail="The default project cannot be deleted",
             )
-
-        await session.delete(project)
+    await request.app.state.trace_deleter.delete(project.id, delete_project=True)
     return None
 
 
@@ -3,7 +3,7 @@ from asyncio import get_running_loop
 from collections.abc import AsyncIterator
 from datetime import datetime, timezone
 from secrets import token_urlsafe
-from typing import Any, Literal, Optional
+from typing import Any, Literal, Optional, cast, get_args
 
 import pandas as pd
 from fastapi import APIRouter, Header, HTTPException, Query
@@ -20,7 +20,7 @@ from phoenix.db import models
 from phoenix.db.helpers import SupportedSQLDialect
 from phoenix.db.insertion.helpers import as_kv, insert_on_conflict
 from phoenix.db.insertion.types import Precursors
-from phoenix.server.api.routers.utils import df_to_bytes
+from phoenix.server.api.routers.utils import ArrowCompression, df_to_bytes
 from phoenix.server.bearer_auth import PhoenixUser
 from phoenix.server.dml_event import SpanAnnotationInsertEvent
 from phoenix.trace.dsl import SpanQuery as SpanQuery_
@@ -102,7 +102,7 @@ async def query_spans_handler(
             detail=f"Invalid query: {e}",
             status_code=HTTP_422_UNPROCESSABLE_ENTITY,
         )
-    async with request.app.state.db() as session:
+    async with request.app.state.db.reader() as session:
         results = []
         for query in span_queries:
             results.append(
@@ -132,9 +132,11 @@ async def query_spans_handler(
             media_type=f"multipart/mixed; boundary={boundary_token}",
         )
 
+    compression = _get_arrow_compression(accept)
+
     async def content() -> AsyncIterator[bytes]:
         for result in results:
-            yield df_to_bytes(result)
+            yield await get_running_loop().run_in_executor(None, df_to_bytes, result, compression)
 
     return StreamingResponse(
         content=content(),
@@ -142,6 +144,27 @@ async def query_spans_handler(
     )
 
 
+def _get_arrow_compression(accept: Optional[str]) -> Optional[ArrowCompression]:
+    """
+    Reads the compression of the Arrow IPC stream from the `compression` parameter of the
+    requested media type, e.g. `application/x-pandas-arrow; compression=zstd`. Readers
+    decompress the buffers transparently, so the parameter is only set by clients that can.
+    """
+    if not accept:
+        return None
+    media_type, *params = (part.strip() for part in accept.split(";"))
+    if media_type != "application/x-pandas-arrow":
+        return None
+    for param in params:
+        key, _, value = param.partition("=")
+        if key.strip().lower() != "compression":
+            continue
+        compression = value.strip().lower()
+        if compression in get_args(ArrowCompression):
+            return cast(ArrowCompression, compression)
+    return None
+
+
 async def _json_multipart(
     results: list[pd.DataFrame],
     boundary_token: str,
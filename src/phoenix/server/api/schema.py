@@ -7,6 +7,7 @@ from strawberry.types.base import StrawberryObjectDefinition, StrawberryType
 
 from phoenix.server.api.exceptions import get_mask_errors_extension
 from phoenix.server.api.mutations import Mutation
+from phoenix.server.api.persisted_queries import get_document_cache_extension
 from phoenix.server.api.queries import Query
 from phoenix.server.api.subscriptions import Subscription
 from phoenix.server.api.types.ChatCompletionSubscriptionPayload import (
@@ -23,7 +24,12 @@ def build_graphql_schema(
     return strawberry.Schema(
         query=Query,
         mutation=Mutation,
-        extensions=list(chain(extensions or [], [get_mask_errors_extension()])),
+        extensions=list(
+            chain(
+                extensions or [],
+                [get_document_cache_extension(), get_mask_errors_extension()],
+            )
+        ),
         subscription=Subscription,
         types=_implementing_types(ChatCompletionSubscriptionPayload),
     )
@@ -1,7 +1,8 @@
 import asyncio
 import logging
+import time
 from collections.abc import AsyncIterator, Iterator
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from typing import (
     Any,
     AsyncGenerator,
@@ -23,9 +24,15 @@ from strawberry.relay.types import GlobalID
 from strawberry.types import Info
 from typing_extensions import TypeAlias, assert_never
 
-from phoenix.config import PLAYGROUND_PROJECT_NAME
+from phoenix.config import (
+    PLAYGROUND_PROJECT_NAME,
+    PlaygroundProviderConfig,
+    get_env_playground_write_batch_size,
+    get_env_playground_write_interval,
+)
 from phoenix.datetime_utils import local_now, normalize_datetime
 from phoenix.db import models
+from phoenix.db.insertion.experiment_run import ExperimentRunInsertion
 from phoenix.server.api.auth import IsLocked, IsNotReadOnly
 from phoenix.server.api.context import Context
 from phoenix.server.api.exceptions import BadRequest, CustomGraphQLError, NotFound
@@ -60,9 +67,9 @@ from phoenix.server.api.types.DatasetVersion import DatasetVersion
 from phoenix.server.api.types.Experiment import to_gql_experiment
 from phoenix.server.api.types.ExperimentRun import to_gql_experiment_run
 from phoenix.server.api.types.node import from_global_id_with_expected_type
+from phoenix.server.api.types.Project import Project
 from phoenix.server.api.types.Span import Span
 from phoenix.server.dml_event import SpanInsertEvent
-from phoenix.server.types import DbSessionFactory
 from phoenix.utilities.template_formatters import (
     FStringTemplateFormatter,
     MustacheTemplateFormatter,
@@ -187,6 +194,14 @@ class Subscription:
                 f"Failed to connect to LLM API for {provider_key.value} {input.model.name}: "
                 f"{str(error)}"
             )
+        if input.max_concurrency is not None and input.max_concurrency <= 0:
+            raise BadRequest("Max concurrency must be a positive integer")
+        if input.max_requests_per_second is not None and input.max_requests_per_second <= 0:
+            raise BadRequest("Max requests per second must be a positive number")
+        max_in_progress = (
+            input.max_concurrency
+            or PlaygroundProviderConfig.from_env(provider_key.name).max_concurrency
+        )
 
         dataset_id = from_global_id_with_expected_type(input.dataset_id, Dataset.__name__)
         version_id = (
@@ -307,13 +322,20 @@ class Subscription:
                 asyncio.Task[ChatCompletionSubscriptionPayload],
             ]
         ] = []
-        max_in_progress = 3
-        write_batch_size = 10
-        write_interval = timedelta(seconds=10)
+        write_batch_size = get_env_playground_write_batch_size()
+        write_interval = get_env_playground_write_interval()
         last_write_time = datetime.now()
+        start_interval = (
+            1 / input.max_requests_per_second if input.max_requests_per_second else None
+        )
+        next_start_time = time.monotonic()
         while not_started or in_progress:
             while not_started and len(in_progress) < max_in_progress:
                 ex_id, stream = not_started.pop()
+                if start_interval is not None:
+                    now = time.monotonic()
+                    stream = _delayed(stream, delay=max(next_start_time - now, 0))
+                    next_start_time = max(next_start_time, now) + start_interval
                 task = _create_task_with_timeout(stream)
                 in_progress.append((ex_id, stream, task))
             async_tasks_to_run = [task for _, _, task in in_progress]
@@ -355,17 +377,41 @@ class Subscription:
                     and not write_already_in_progress
                 ):
                     result_payloads_stream = _chat_completion_result_payloads(
-                        db=info.context.db, results=_drain_no_wait(results)
+                        context=info.context, results=_drain_no_wait(results)
                     )
                     task = _create_task_with_timeout(result_payloads_stream)
                     in_progress.append((None, result_payloads_stream, task))
                     last_write_time = datetime.now()
         if remaining_results := await _drain(results):
             async for result_payload in _chat_completion_result_payloads(
-                db=info.context.db, results=remaining_results
+                context=info.context, results=remaining_results
             ):
                 yield result_payload
 
+    @strawberry.subscription(
+        description=(
+            "Notifies of the projects whose data changed, e.g. with new spans or annotations,"
+            " among the given ones or any. Changes are coalesced into at most one notification"
+            " per time window."
+        ),
+    )  # type: ignore
+    async def project_changes(
+        self,
+        info: Info[Context, None],
+        project_ids: Optional[list[GlobalID]] = None,
+    ) -> AsyncIterator[list[Project]]:
+        project_rowids = (
+            None
+            if project_ids is None
+            else [
+                from_global_id_with_expected_type(project_id, Project.__name__)
+                for project_id in project_ids
+            ]
+        )
+        notifier = info.context.get_project_change_notifier()
+        async for changed in notifier.subscribe(project_rowids):
+            yield [Project(project_rowid=project_rowid) for project_rowid in sorted(changed)]
+
 
 async def _stream_chat_completion_over_dataset_example(
     *,
@@ -444,17 +490,22 @@ async def _stream_chat_completion_over_dataset_example(
 
 async def _chat_completion_result_payloads(
     *,
-    db: DbSessionFactory,
+    context: Context,
     results: Sequence[ChatCompletionResult],
 ) -> ChatStream:
     if not results:
         return
-    async with db() as session:
-        for _, span, run in results:
-            if span:
-                session.add(span)
-            session.add(run)
-        await session.flush()
+    if (queue_experiment_runs := context.queue_experiment_runs_for_bulk_insert) is not None:
+        # the bulk inserter writes the results alongside other ingestion, so this only waits
+        # for the row ids to be populated
+        await queue_experiment_runs(
+            *(ExperimentRunInsertion(run=run, span=span) for _, span, run in results)
+        )
+    else:
+        async with context.db() as session:
+            session.add_all(span for _, span, _ in results if span)
+            session.add_all(run for _, _, run in results)
+            await session.flush()
     for example_id, span, run in results:
         yield ChatCompletionSubscriptionResult(
             span=Span(span_rowid=span.id, db_span=span) if span else None,
@@ -463,6 +514,15 @@ async def _chat_completion_result_payloads(
         )
 
 
+async def _delayed(stream: ChatStream, delay: float) -> ChatStream:
+    """
+    Defers the start of the stream so that requests are spread out to honor a per-run rate.
+    """
+    await asyncio.sleep(delay)
+    async for payload in stream:
+        yield payload
+
+
 def _is_result_payloads_stream(
     stream: ChatStream,
 ) -> bool:
@@ -1,13 +1,12 @@
 import math
-from collections.abc import Iterable
-from functools import cached_property
-from typing import Any, Optional
+from typing import Optional
 
-import pandas as pd
+import numpy as np
+import numpy.typing as npt
 import strawberry
 from strawberry import UNSET, Private
 
-from phoenix.metrics.retrieval_metrics import RetrievalMetrics
+from phoenix.metrics.retrieval_metrics import BatchedRetrievalMetrics
 
 
 @strawberry.type(
@@ -16,17 +15,15 @@ from phoenix.metrics.retrieval_metrics import RetrievalMetrics
 )
 class DocumentEvaluationSummary:
     evaluation_name: str
-    metrics_collection: Private["pd.Series[Any]"]
+    metrics_collection: Private[BatchedRetrievalMetrics]
 
     def __init__(
         self,
         evaluation_name: str,
-        metrics_collection: Iterable[RetrievalMetrics],
+        metrics_collection: BatchedRetrievalMetrics,
     ) -> None:
         self.evaluation_name = evaluation_name
-        self.metrics_collection = pd.Series(metrics_collection, dtype=object)
-        self._cached_average_ndcg_results: dict[Optional[int], tuple[float, int]] = {}
-        self._cached_average_precision_results: dict[Optional[int], tuple[float, int]] = {}
+        self.metrics_collection = metrics_collection
 
     @strawberry.field
     def average_ndcg(self, k: Optional[int] = UNSET) -> Optional[float]:
@@ -69,27 +66,23 @@ class DocumentEvaluationSummary:
         return count
 
     def _average_ndcg(self, k: Optional[int] = None) -> tuple[float, int]:
-        if (result := self._cached_average_ndcg_results.get(k)) is not None:
-            return result
-        values = self.metrics_collection.apply(lambda m: m.ndcg(k))
-        result = (values.mean(), values.count())
-        self._cached_average_ndcg_results[k] = result
-        return result
+        return _average(self.metrics_collection.ndcg(k))
 
     def _average_precision(self, k: Optional[int] = None) -> tuple[float, int]:
-        if (result := self._cached_average_precision_results.get(k)) is not None:
-            return result
-        values = self.metrics_collection.apply(lambda m: m.precision(k))
-        result = (values.mean(), values.count())
-        self._cached_average_precision_results[k] = result
-        return result
-
-    @cached_property
+        return _average(self.metrics_collection.precision(k))
+
+    @property
     def _average_reciprocal_rank(self) -> tuple[float, int]:
-        values = self.metrics_collection.apply(lambda m: m.reciprocal_rank())
-        return values.mean(), values.count()
+        return _average(self.metrics_collection.reciprocal_rank())
 
-    @cached_property
+    @property
     def _average_hit(self) -> tuple[float, int]:
-        values = self.metrics_collection.apply(lambda m: m.hit())
-        return values.mean(), values.count()
+        return _average(self.metrics_collection.hit())
+
+
+def _average(values: npt.NDArray[np.float64]) -> tuple[float, int]:
+    """
+    Returns the mean and the count of the values that are not NaN.
+    """
+    values = values[~np.isnan(values)]
+    return (float(values.mean()) if len(values) else np.nan), len(values)
@@ -5,7 +5,7 @@ from typing import Optional
 import strawberry
 from strawberry import UNSET, Private
 
-from phoenix.metrics.retrieval_metrics import RetrievalMetrics
+from phoenix.metrics.retrieval_metrics import BatchedRetrievalMetrics, RetrievalMetrics
 
 
 def _clean_docstring(docstring: Optional[str]) -> Optional[str]:
@@ -24,24 +24,25 @@ _hit_docstring = _clean_docstring(RetrievalMetrics.hit.__doc__)
 )
 class DocumentRetrievalMetrics:
     evaluation_name: str
-    metrics: Private[RetrievalMetrics]
+    batch: Private[BatchedRetrievalMetrics]
+    position: Private[int]
 
     @strawberry.field(description=_ndcg_docstring)  # type: ignore
     def ndcg(self, k: Optional[int] = UNSET) -> Optional[float]:
-        value = self.metrics.ndcg(None if k is UNSET else k)
+        value = float(self.batch.ndcg(None if k is UNSET else k)[self.position])
         return value if math.isfinite(value) else None
 
     @strawberry.field(description=_precision_docstring)  # type: ignore
     def precision(self, k: Optional[int] = UNSET) -> Optional[float]:
-        value = self.metrics.precision(None if k is UNSET else k)
+        value = float(self.batch.precision(None if k is UNSET else k)[self.position])
         return value if math.isfinite(value) else None
 
     @strawberry.field(description=_reciprocal_rank_docstring)  # type: ignore
     def reciprocal_rank(self) -> Optional[float]:
-        value = self.metrics.reciprocal_rank()
+        value = float(self.batch.reciprocal_rank()[self.position])
         return value if math.isfinite(value) else None
 
     @strawberry.field(description=_hit_docstring)  # type: ignore
     def hit(self) -> Optional[float]:
-        value = self.metrics.hit()
+        value = float(self.batch.hit()[self.position])
         return value if math.isfinite(value) else None
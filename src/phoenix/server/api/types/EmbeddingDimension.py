@@ -1,5 +1,5 @@
 from collections import defaultdict
-from collections.abc import Iterable, Iterator
+from collections.abc import Iterable, Sequence
 from datetime import timedelta
 from itertools import chain, repeat
 from typing import Any, Optional, Union, cast
@@ -16,6 +16,7 @@ from typing_extensions import Annotated
 
 import phoenix.core.model_schema as ms
 from phoenix.core import model_schema
+from phoenix.core.embedding_array import EmbeddingArray
 from phoenix.core.model_schema import (
     ACTUAL_LABEL,
     ACTUAL_SCORE,
@@ -29,7 +30,6 @@ from phoenix.core.model_schema import (
 )
 from phoenix.metrics.timeseries import row_interval_from_sorted_time_index
 from phoenix.pointcloud.clustering import Hdbscan
-from phoenix.pointcloud.pointcloud import PointCloud
 from phoenix.pointcloud.projectors import Umap
 from phoenix.server.api.context import Context
 from phoenix.server.api.input_types.TimeRange import TimeRange
@@ -262,7 +262,7 @@ class EmbeddingDimension(Node):
         )
 
     @strawberry.field
-    def UMAPPoints(
+    async def UMAPPoints(
         self,
         info: Info[Context, None],
         time_range: Annotated[
@@ -315,7 +315,7 @@ class EmbeddingDimension(Node):
         ] = DEFAULT_CLUSTER_SELECTION_EPSILON,
     ) -> UMAPPoints:
         model = info.context.model
-        data: dict[ID, npt.NDArray[np.float64]] = {}
+        data: dict[ID, npt.NDArray[Any]] = {}
         retrievals: list[tuple[ID, Any, Any]] = []
         for inferences in model[Inferences]:
             inferences_id = inferences.role
@@ -330,23 +330,19 @@ class EmbeddingDimension(Node):
                     time_start=resolved_time_range.start,
                     time_stop=resolved_time_range.stop,
                 )
-            vector_column = self.dimension[inferences_id]
-            samples_collected = 0
-            for row_id in _row_indices(
+            embeddings = _embedding_array(self.dimension[inferences_id])
+            row_ids = _row_indices(
                 row_id_start,
                 row_id_stop,
                 shuffle=0 < n_samples < (row_id_stop - row_id_start),
-            ):
-                if samples_collected >= n_samples:
-                    break
-                embedding_vector = vector_column.iloc[row_id]
-                # Exclude scalar values, e.g. None/NaN, by checking the presence
-                # of dunder method __len__.
-                if not hasattr(embedding_vector, "__len__"):
-                    continue
+                # the same rows are sampled for the same view, so that its points can be cached
+                seed=(row_id_start, row_id_stop),
+            )
+            # Exclude rows without (valid) vectors.
+            row_ids = row_ids[embeddings.mask[row_ids]][: max(n_samples, 0)]
+            for row_id in row_ids.tolist():
                 event_id = create_event_id(row_id, inferences_id)
-                data[event_id] = embedding_vector
-                samples_collected += 1
+                data[event_id] = embeddings.matrix[row_id]
                 if isinstance(
                     self.dimension,
                     ms.RetrievalEmbeddingDimension,
@@ -365,11 +361,10 @@ class EmbeddingDimension(Node):
             ms.RetrievalEmbeddingDimension,
         ) and (corpus := info.context.corpus):
             corpus_inferences = corpus[PRIMARY]
-            for row_id, document_embedding_vector in enumerate(corpus_inferences[PROMPT]):
-                if not hasattr(document_embedding_vector, "__len__"):
-                    continue
+            corpus_embeddings = _embedding_array(corpus_inferences[PROMPT])
+            for row_id in np.flatnonzero(corpus_embeddings.mask).tolist():
                 event_id = create_event_id(row_id, AncillaryInferencesRole.corpus)
-                data[event_id] = document_embedding_vector
+                data[event_id] = corpus_embeddings.matrix[row_id]
             corpus_primary_key = corpus_inferences.primary_key
             for event_id, retrieval_ids, retrieval_scores in retrievals:
                 if not isinstance(retrieval_ids, Iterable):
@@ -392,8 +387,7 @@ class EmbeddingDimension(Node):
                         )
                     except KeyError:
                         continue
-                    document_embedding_vector = corpus_inferences[PROMPT].iloc[document_row_id]
-                    if not hasattr(document_embedding_vector, "__len__"):
+                    if not corpus_embeddings.mask[document_row_id]:
                         continue
                     context_retrievals.append(
                         Retrieval(
@@ -411,14 +405,18 @@ class EmbeddingDimension(Node):
         if not 2 <= n_components <= 3:
             raise Exception(f"n_components must be 2 or 3, got {n_components}")
 
-        vectors, clustered_events = PointCloud(
-            dimensionalityReducer=Umap(n_neighbors=n_neighbors, min_dist=min_dist),
-            clustersFinder=Hdbscan(
+        vectors, clustered_events = await info.context.point_cloud_runner.generate(
+            key=self.dimension.name,
+            reducer=Umap(n_neighbors=n_neighbors, min_dist=min_dist),
+            finder=Hdbscan(
                 min_cluster_size=min_cluster_size,
                 min_samples=cluster_min_samples,
                 cluster_selection_epsilon=cluster_selection_epsilon,
             ),
-        ).generate(data, n_components=n_components)
+            data=data,
+            n_components=n_components,
+            is_disconnected=info.context.is_disconnected,
+        )
 
         points: dict[Union[InferencesRole, AncillaryInferencesRole], list[UMAPPoint]] = defaultdict(
             list
@@ -476,13 +474,19 @@ def _row_indices(
     stop: int,
     /,
     shuffle: bool = False,
-) -> Iterator[int]:
-    if not shuffle:
-        yield from range(start, stop)
-        return
-    shuffled_indices = np.arange(start, stop)
-    np.random.shuffle(shuffled_indices)
-    yield from shuffled_indices  # type: ignore[misc,unused-ignore]
+    seed: Optional[Sequence[int]] = None,
+) -> npt.NDArray[np.intp]:
+    indices = np.arange(start, stop, dtype=np.intp)
+    if shuffle:
+        np.random.default_rng(seed).shuffle(indices)
+    return indices
+
+
+def _embedding_array(vectors: "pd.Series[Any]") -> EmbeddingArray:
+    if isinstance(array := vectors.array, EmbeddingArray):
+        return array
+    # e.g. the default column of NaNs for inferences without the dimension
+    return EmbeddingArray.from_vectors(vectors.to_numpy())
 
 
 def to_gql_embedding_dimension(
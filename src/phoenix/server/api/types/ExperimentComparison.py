@@ -1,7 +1,10 @@
+from typing import Optional
+
 import strawberry
 from strawberry.relay import GlobalID
 
 from phoenix.server.api.types.DatasetExample import DatasetExample
+from phoenix.server.api.types.ExperimentAnnotationSummary import ExperimentAnnotationSummary
 from phoenix.server.api.types.ExperimentRun import ExperimentRun
 
 
@@ -15,3 +18,17 @@ class RunComparisonItem:
 class ExperimentComparison:
     example: DatasetExample
     run_comparison_items: list[RunComparisonItem]
+
+
+@strawberry.type
+class ExperimentComparisonAggregate:
+    """
+    Aggregates of the runs of an experiment over the examples being compared, i.e. those
+    matching the filter condition of the comparison, if any.
+    """
+
+    experiment_id: GlobalID
+    run_count: int
+    error_rate: Optional[float]
+    average_run_latency_ms: Optional[float]
+    annotation_summaries: list[ExperimentAnnotationSummary]
@@ -6,8 +6,7 @@ from typing import TYPE_CHECKING, Annotated, Any, ClassVar, Optional
 
 import strawberry
 from aioitertools.itertools import islice
-from openinference.semconv.trace import SpanAttributes
-from sqlalchemy import desc, distinct, func, or_, select
+from sqlalchemy import and_, desc, distinct, func, or_, select
 from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.sql.expression import tuple_
 from strawberry import ID, UNSET, Private, lazy
@@ -17,6 +16,8 @@ from typing_extensions import assert_never
 
 from phoenix.datetime_utils import right_open_time_range
 from phoenix.db import models
+from phoenix.db.full_text_search import span_io_contains
+from phoenix.db.helpers import SupportedSQLDialect
 from phoenix.server.api.context import Context
 from phoenix.server.api.input_types.ProjectSessionSort import (
     ProjectSessionColumn,
@@ -37,7 +38,7 @@ from phoenix.server.api.types.pagination import (
 )
 from phoenix.server.api.types.ProjectSession import ProjectSession, to_gql_project_session
 from phoenix.server.api.types.SortDir import SortDir
-from phoenix.server.api.types.Span import Span
+from phoenix.server.api.types.Span import Span, prefetch_span_fields
 from phoenix.server.api.types.Trace import Trace
 from phoenix.server.api.types.ValidationResult import ValidationResult
 from phoenix.trace.dsl import SpanFilter
@@ -214,7 +215,7 @@ class Project(Node):
             .where(models.Trace.trace_id == str(trace_id))
             .where(models.Trace.project_rowid == self.project_rowid)
         )
-        async with info.context.db() as session:
+        async with info.context.db.reader() as session:
             if (trace := await session.scalar(stmt)) is None:
                 return None
         return Trace(trace_rowid=trace.id, db_trace=trace)
@@ -290,7 +291,7 @@ class Project(Node):
                 first + 1  # overfetch by one to determine whether there's a next page
             )
         cursors_and_nodes = []
-        async with info.context.db() as session:
+        async with info.context.db.reader() as session:
             span_records = await session.stream(stmt)
             async for span_record in islice(span_records, first):
                 span_rowid: int = span_record[0]
@@ -308,6 +309,7 @@ class Project(Node):
             except StopAsyncIteration:
                 has_next_page = False
 
+        await prefetch_span_fields(info, (span.span_rowid for _, span in cursors_and_nodes))
         return connection_from_cursors_and_nodes(
             cursors_and_nodes,
             has_previous_page=False,
@@ -338,15 +340,10 @@ class Project(Node):
                 .join_from(models.Trace, models.Span)
                 .where(models.Span.parent_id.is_(None))
                 .where(
-                    or_(
-                        models.TextContains(
-                            models.Span.attributes[INPUT_VALUE].as_string(),
-                            filter_io_substring,
-                        ),
-                        models.TextContains(
-                            models.Span.attributes[OUTPUT_VALUE].as_string(),
-                            filter_io_substring,
-                        ),
+                    span_io_contains(
+                        filter_io_substring,
+                        info.context.db.dialect,
+                        indexed=info.context.db.span_io_index_enabled,
                     )
                 )
             ).subquery()
@@ -357,6 +354,10 @@ class Project(Node):
                 key = table.start_time.label("key")
             elif sort.col is ProjectSessionColumn.endTime:
                 key = table.end_time.label("key")
+            elif sort.col is ProjectSessionColumn.traceLatencyMsP50:
+                key = table.trace_latency_ms_p50.label("key")
+            elif sort.col is ProjectSessionColumn.traceLatencyMsP99:
+                key = table.trace_latency_ms_p99.label("key")
             elif (
                 sort.col is ProjectSessionColumn.tokenCountTotal
                 or sort.col is ProjectSessionColumn.numTraces
@@ -385,20 +386,42 @@ class Project(Node):
             else:
                 assert_never(sort.col)
             stmt = stmt.add_columns(key)
+            # Only the latency quantiles of sessions without traces can be NULL. NULLs are sorted
+            # where the indexes put them, i.e. as the largest keys on PostgreSQL and as the
+            # smallest ones on SQLite, so that the indexes can serve the sort, and the cursor of
+            # a NULL key has no sort column.
+            nullable_key = sort.col in (
+                ProjectSessionColumn.traceLatencyMsP50,
+                ProjectSessionColumn.traceLatencyMsP99,
+            )
+            nulls_last = (info.context.db.dialect is SupportedSQLDialect.POSTGRESQL) is (
+                sort.dir is SortDir.asc
+            )
             if sort.dir is SortDir.asc:
-                stmt = stmt.order_by(key.asc(), table.id.asc())
+                order_by, id_order_by = key.asc(), table.id.asc()
             else:
-                stmt = stmt.order_by(key.desc(), table.id.desc())
+                order_by, id_order_by = key.desc(), table.id.desc()
+            stmt = stmt.order_by(
+                order_by.nulls_last() if nulls_last else order_by.nulls_first(),
+                id_order_by,
+            )
             if after:
                 cursor = Cursor.from_string(after)
-                assert cursor.sort_column is not None
                 compare = operator.lt if sort.dir is SortDir.desc else operator.gt
-                stmt = stmt.where(
-                    compare(
+                after_cursor: ColumnElement[bool]
+                if cursor.sort_column is None:
+                    assert nullable_key
+                    after_cursor = and_(key.is_(None), compare(table.id, cursor.rowid))
+                    if not nulls_last:
+                        after_cursor = or_(after_cursor, key.isnot(None))
+                else:
+                    after_cursor = compare(
                         tuple_(key, table.id),
                         (cursor.sort_column.value, cursor.rowid),
                     )
-                )
+                    if nullable_key and nulls_last:
+                        after_cursor = or_(after_cursor, key.is_(None))
+                stmt = stmt.where(after_cursor)
         else:
             stmt = stmt.order_by(table.id.desc())
             if after:
@@ -409,17 +432,18 @@ class Project(Node):
                 first + 1  # over-fetch by one to determine whether there's a next page
             )
         cursors_and_nodes = []
-        async with info.context.db() as session:
+        async with info.context.db.reader() as session:
             records = await session.stream(stmt)
             async for record in islice(records, first):
                 project_session = record[0]
                 cursor = Cursor(rowid=project_session.id)
                 if sort:
                     assert len(record) > 1
-                    cursor.sort_column = CursorSortColumn(
-                        type=sort.col.data_type,
-                        value=record[1],
-                    )
+                    if record[1] is not None:
+                        cursor.sort_column = CursorSortColumn(
+                            type=sort.col.data_type,
+                            value=record[1],
+                        )
                 cursors_and_nodes.append((cursor, to_gql_project_session(project_session)))
             has_next_page = True
             try:
@@ -445,7 +469,7 @@ class Project(Node):
             .join(models.Trace)
             .where(models.Trace.project_rowid == self.project_rowid)
         )
-        async with info.context.db() as session:
+        async with info.context.db.reader() as session:
             return list(await session.scalars(stmt))
 
     @strawberry.field(
@@ -462,7 +486,7 @@ class Project(Node):
             .join(models.Trace, models.Span.trace_rowid == models.Trace.id)
             .where(models.Trace.project_rowid == self.project_rowid)
         )
-        async with info.context.db() as session:
+        async with info.context.db.reader() as session:
             return list(await session.scalars(stmt))
 
     @strawberry.field(
@@ -482,7 +506,7 @@ class Project(Node):
         )
         if span_id:
             stmt = stmt.where(models.Span.span_id == str(span_id))
-        async with info.context.db() as session:
+        async with info.context.db.reader() as session:
             return list(await session.scalars(stmt))
 
     @strawberry.field
@@ -558,7 +582,7 @@ class Project(Node):
             last=last,
             before=before if isinstance(before, CursorString) else None,
         )
-        async with info.context.db() as session:
+        async with info.context.db.reader() as session:
             annotation_configs = await session.stream_scalars(
                 select(models.AnnotationConfig)
                 .join(
@@ -609,7 +633,3 @@ class Project(Node):
                 (self.project_rowid, models.Project.updated_at),
             )
         return updated_at
-
-
-INPUT_VALUE = SpanAttributes.INPUT_VALUE.split(".")
-OUTPUT_VALUE = SpanAttributes.OUTPUT_VALUE.split(".")
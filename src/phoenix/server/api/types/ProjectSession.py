@@ -11,7 +11,7 @@ from phoenix.db import models
 from phoenix.server.api.context import Context
 from phoenix.server.api.types.MimeType import MimeType
 from phoenix.server.api.types.pagination import ConnectionArgs, CursorString, connection_from_list
-from phoenix.server.api.types.SpanIOValue import SpanIOValue
+from phoenix.server.api.types.SpanIOValue import SpanIOValue, truncate_value
 from phoenix.server.api.types.TokenUsage import TokenUsage
 
 if TYPE_CHECKING:
@@ -56,8 +56,10 @@ class ProjectSession(Node):
         if record is None:
             return None
         return SpanIOValue(
-            mime_type=MimeType(record.mime_type.value),
-            cached_value=record.value,
+            span_rowid=record.span_rowid,
+            attr=models.Span.input_value,
+            truncated_value=truncate_value(record.value_first_101_chars),
+            mime_type=MimeType(record.mime_type),
         )
 
     @strawberry.field
@@ -69,8 +71,10 @@ class ProjectSession(Node):
         if record is None:
             return None
         return SpanIOValue(
-            mime_type=MimeType(record.mime_type.value),
-            cached_value=record.value,
+            span_rowid=record.span_rowid,
+            attr=models.Span.output_value,
+            truncated_value=truncate_value(record.value_first_101_chars),
+            mime_type=MimeType(record.mime_type),
         )
 
     @strawberry.field
@@ -107,19 +111,24 @@ class ProjectSession(Node):
             .order_by(models.Trace.start_time)
             .limit(first)
         )
-        async with info.context.db() as session:
+        async with info.context.db.reader() as session:
             traces = await session.stream_scalars(stmt)
             data = [Trace(trace_rowid=trace.id, db_trace=trace) async for trace in traces]
         return connection_from_list(data=data, args=args)
 
-    @strawberry.field
+    @strawberry.field(
+        description="The quantile of the latencies of the traces in the session. Unless `exact` "
+        "is true, the quantile is estimated from a sketch of the latencies, and is within 1% "
+        "(relative error) of a latency of the same rank."
+    )  # type: ignore
     async def trace_latency_ms_quantile(
         self,
         info: Info[Context, None],
         probability: float,
+        exact: bool = False,
     ) -> Optional[float]:
         return await info.context.data_loaders.session_trace_latency_ms_quantile.load(
-            (self.id_attr, probability)
+            (self.id_attr, probability, exact)
         )
 
 
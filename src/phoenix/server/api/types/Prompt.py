@@ -38,7 +38,7 @@ class Prompt(Node):
     async def version(
         self, info: Info[Context, None], version_id: Optional[GlobalID] = None
     ) -> PromptVersion:
-        async with info.context.db() as session:
+        async with info.context.db.reader() as session:
             if version_id:
                 v_id = from_global_id_with_expected_type(version_id, PromptVersion.__name__)
                 version = await session.scalar(
@@ -63,7 +63,7 @@ class Prompt(Node):
 
     @strawberry.field
     async def version_tags(self, info: Info[Context, None]) -> list[PromptVersionTag]:
-        async with info.context.db() as session:
+        async with info.context.db.reader() as session:
             stmt = select(models.PromptVersionTag).where(
                 models.PromptVersionTag.prompt_id == self.id_attr
             )
@@ -92,7 +92,7 @@ class Prompt(Node):
             .where(models.PromptVersion.prompt_id == self.id_attr)
             .order_by(models.PromptVersion.id.desc())
         )
-        async with info.context.db() as session:
+        async with info.context.db.reader() as session:
             data = [
                 to_gql_prompt_version(prompt_version, sequence_number)
                 async for prompt_version, sequence_number in await session.stream(stmt)
@@ -108,7 +108,7 @@ class Prompt(Node):
             global_id=self.source_prompt_id, expected_type_name=Prompt.__name__
         )
 
-        async with info.context.db() as session:
+        async with info.context.db.reader() as session:
             source_prompt = await session.scalar(
                 select(models.Prompt).where(models.Prompt.id == source_prompt_id)
             )
@@ -48,7 +48,7 @@ class PromptVersion(Node):
 
     @strawberry.field
     async def tags(self, info: Info[Context, None]) -> list[PromptVersionTag]:
-        async with info.context.db() as session:
+        async with info.context.db.reader() as session:
             stmt = select(models.PromptVersionTag).where(
                 models.PromptVersionTag.prompt_version_id == self.id_attr
             )
@@ -60,13 +60,13 @@ class PromptVersion(Node):
     async def user(self, info: Info[Context, None]) -> Optional[User]:
         if self.user_id is None:
             return None
-        async with info.context.db() as session:
+        async with info.context.db.reader() as session:
             user = await session.get(models.User, self.user_id)
         return to_gql_user(user) if user is not None else None
 
     @strawberry.field
     async def previous_version(self, info: Info[Context, None]) -> Optional["PromptVersion"]:
-        async with info.context.db() as session:
+        async with info.context.db.reader() as session:
             current_version = await session.get(models.PromptVersion, self.id_attr)
             if current_version is None:
                 return None
@@ -22,7 +22,7 @@ class PromptVersionTag(Node):
     async def user(self, info: Info[Context, None]) -> Optional[User]:
         if self.user_id is None:
             return None
-        async with info.context.db() as session:
+        async with info.context.db.reader() as session:
             user = await session.get(models.User, self.user_id)
         return to_gql_user(user) if user is not None else None
 
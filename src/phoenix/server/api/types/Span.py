@@ -11,9 +11,11 @@ import numpy as np
 import pandas as pd
 import strawberry
 from openinference.semconv.trace import SpanAttributes
+from sqlalchemy.orm import QueryableAttribute
 from strawberry import ID, UNSET
 from strawberry.relay import Connection, Node, NodeID
 from strawberry.types import Info
+from strawberry.types.nodes import SelectedField, Selection
 from typing_extensions import Annotated, TypeAlias
 
 import phoenix.trace.schemas as trace_schema
@@ -42,13 +44,115 @@ from phoenix.server.api.types.pagination import ConnectionArgs, CursorString, co
 from phoenix.server.api.types.SortDir import SortDir
 from phoenix.server.api.types.SpanAnnotation import SpanAnnotation, to_gql_span_annotation
 from phoenix.server.api.types.SpanIOValue import SpanIOValue, truncate_value
-from phoenix.trace.attributes import get_attribute_value
+
+SpanRowId: TypeAlias = int
 
 if TYPE_CHECKING:
     from phoenix.server.api.types.Project import Project
     from phoenix.server.api.types.Trace import Trace
 
 
+# Hybrid properties build a new SQL expression on each access, which is costly when done for every
+# resolved field and, since the expressions don't hash alike, defeats the cache of the span fields
+# data loader, so the ones loaded by the resolvers are built once.
+_LATENCY_MS = models.Span.latency_ms
+_INPUT_VALUE = models.Span.input_value
+_INPUT_VALUE_FIRST_101_CHARS = models.Span.input_value_first_101_chars
+_INPUT_MIME_TYPE = models.Span.input_mime_type
+_OUTPUT_VALUE = models.Span.output_value
+_OUTPUT_VALUE_FIRST_101_CHARS = models.Span.output_value_first_101_chars
+_OUTPUT_MIME_TYPE = models.Span.output_mime_type
+_METADATA = models.Span.metadata_
+_NUM_DOCUMENTS = models.Span.num_documents
+_CUMULATIVE_LLM_TOKEN_COUNT_TOTAL = models.Span.cumulative_llm_token_count_total
+_LLM_TOKEN_COUNT_TOTAL = models.Span.llm_token_count_total
+_LLM_PROVIDER = models.Span.llm_provider
+_LLM_MODEL_NAME = models.Span.llm_model_name
+_LLM_INVOCATION_PARAMETERS = models.Span.llm_invocation_parameters
+
+_EXAMPLE_REVISION_ATTRIBUTES: Mapping[str, QueryableAttribute[Any]] = {
+    SpanAttributes.INPUT_VALUE: _INPUT_VALUE,
+    SpanAttributes.INPUT_MIME_TYPE: _INPUT_MIME_TYPE,
+    SpanAttributes.OUTPUT_VALUE: _OUTPUT_VALUE,
+    SpanAttributes.OUTPUT_MIME_TYPE: _OUTPUT_MIME_TYPE,
+    SpanAttributes.LLM_INPUT_MESSAGES: models.Span.llm_input_messages,
+    SpanAttributes.LLM_OUTPUT_MESSAGES: models.Span.llm_output_messages,
+    SpanAttributes.LLM_PROMPT_TEMPLATE_VARIABLES: models.Span.llm_prompt_template_variables,
+    SpanAttributes.LLM_TOOLS: models.Span.llm_tools,
+    SpanAttributes.RETRIEVAL_DOCUMENTS: models.Span.retrieval_documents,
+}
+"""
+The attributes read by the dataset example helpers to translate a span into an example revision.
+"""
+
+_SPAN_FIELD_COLUMNS: Mapping[str, tuple[QueryableAttribute[Any], ...]] = {
+    "name": (models.Span.name,),
+    "statusCode": (models.Span.status_code,),
+    "statusMessage": (models.Span.status_message,),
+    "startTime": (models.Span.start_time,),
+    "endTime": (models.Span.end_time,),
+    "latencyMs": (_LATENCY_MS,),
+    "parentId": (models.Span.parent_id,),
+    "spanKind": (models.Span.span_kind,),
+    "spanId": (models.Span.span_id,),
+    "trace": (models.Span.trace_rowid,),
+    "context": (models.Span.span_id, models.Trace.trace_id),
+    "attributes": (models.Span.attributes,),
+    "metadata": (_METADATA,),
+    "numDocuments": (_NUM_DOCUMENTS,),
+    "tokenCountTotal": (_LLM_TOKEN_COUNT_TOTAL,),
+    "tokenCountPrompt": (models.Span.llm_token_count_prompt,),
+    "tokenCountCompletion": (models.Span.llm_token_count_completion,),
+    "input": (_INPUT_MIME_TYPE, _INPUT_VALUE_FIRST_101_CHARS),
+    "output": (_OUTPUT_MIME_TYPE, _OUTPUT_VALUE_FIRST_101_CHARS),
+    "events": (models.Span.events,),
+    "cumulativeTokenCountTotal": (_CUMULATIVE_LLM_TOKEN_COUNT_TOTAL,),
+    "cumulativeTokenCountPrompt": (models.Span.cumulative_llm_token_count_prompt,),
+    "cumulativeTokenCountCompletion": (models.Span.cumulative_llm_token_count_completion,),
+    "propagatedStatusCode": (models.Span.cumulative_error_count,),
+    "documentRetrievalMetrics": (_NUM_DOCUMENTS,),
+    "asExampleRevision": (models.Span.span_kind, *_EXAMPLE_REVISION_ATTRIBUTES.values()),
+    "invocationParameters": (_LLM_PROVIDER, _LLM_MODEL_NAME, _LLM_INVOCATION_PARAMETERS),
+}
+"""
+The columns loaded by the span fields data loader for each field of a span, by field name.
+"""
+
+
+async def prefetch_span_fields(
+    info: Info[Context, None],
+    span_rowids: Iterable[SpanRowId],
+) -> None:
+    """
+    Loads the columns of the fields selected of the nodes of a connection of spans, i.e. in
+    `edges { node { ... } }`, for all the spans of the page in one query, so that the fields
+    resolve from the cache of the span fields data loader.
+    """
+    columns: dict[str, QueryableAttribute[Any]] = {}
+    for field_name in _get_selected_node_field_names(info):
+        for column in _SPAN_FIELD_COLUMNS.get(field_name, ()):
+            columns[str(column)] = column
+    if columns:
+        await info.context.data_loaders.span_fields.prefetch(span_rowids, columns.values())
+
+
+def _get_selected_node_field_names(info: Info[Context, None]) -> set[str]:
+    field_names: set[str] = set()
+
+    def visit(selections: Iterable[Selection], path: tuple[str, ...]) -> None:
+        for selection in selections:
+            if not isinstance(selection, SelectedField):
+                visit(selection.selections, path)
+            elif not path:
+                field_names.add(selection.name)
+            elif selection.name == path[0]:
+                visit(selection.selections, path[1:])
+
+    for selected_field in info.selected_fields:
+        visit(selected_field.selections, ("edges", "node"))
+    return field_names
+
+
 @strawberry.enum
 class SpanKind(Enum):
     """
@@ -113,9 +217,6 @@ class SpanEvent:
 class SpanAsExampleRevision(ExampleRevision): ...
 
 
-SpanRowId: TypeAlias = int
-
-
 @strawberry.type
 class Span(Node):
     span_rowid: NodeID[SpanRowId]
@@ -194,7 +295,7 @@ class Span(Node):
         if self.db_span:
             return self.db_span.latency_ms
         value = await info.context.data_loaders.span_fields.load(
-            (self.span_rowid, models.Span.latency_ms),
+            (self.span_rowid, _LATENCY_MS),
         )
         return cast(float, value)
 
@@ -299,7 +400,7 @@ class Span(Node):
             value = self.db_span.metadata_
         else:
             value = await info.context.data_loaders.span_fields.load(
-                (self.span_rowid, models.Span.metadata_),
+                (self.span_rowid, _METADATA),
             )
         return _convert_metadata_to_string(value)
 
@@ -311,7 +412,7 @@ class Span(Node):
         if self.db_span:
             return self.db_span.num_documents
         value = await info.context.data_loaders.span_fields.load(
-            (self.span_rowid, models.Span.num_documents),
+            (self.span_rowid, _NUM_DOCUMENTS),
         )
         return cast(int, value)
 
@@ -323,7 +424,7 @@ class Span(Node):
         if self.db_span:
             return self.db_span.llm_token_count_total
         value = await info.context.data_loaders.span_fields.load(
-            (self.span_rowid, models.Span.llm_token_count_total),
+            (self.span_rowid, _LLM_TOKEN_COUNT_TOTAL),
         )
         return cast(Optional[int], value)
 
@@ -368,17 +469,17 @@ class Span(Node):
             )
         mime_type, input_value_first_101_chars = await gather(
             info.context.data_loaders.span_fields.load(
-                (self.span_rowid, models.Span.input_mime_type),
+                (self.span_rowid, _INPUT_MIME_TYPE),
             ),
             info.context.data_loaders.span_fields.load(
-                (self.span_rowid, models.Span.input_value_first_101_chars),
+                (self.span_rowid, _INPUT_VALUE_FIRST_101_CHARS),
             ),
         )
         if not input_value_first_101_chars:
             return None
         return SpanIOValue(
             span_rowid=self.span_rowid,
-            attr=models.Span.input_value,
+            attr=_INPUT_VALUE,
             truncated_value=truncate_value(input_value_first_101_chars),
             mime_type=MimeType(mime_type),
         )
@@ -400,17 +501,17 @@ class Span(Node):
             )
         mime_type, output_value_first_101_chars = await gather(
             info.context.data_loaders.span_fields.load(
-                (self.span_rowid, models.Span.output_mime_type),
+                (self.span_rowid, _OUTPUT_MIME_TYPE),
             ),
             info.context.data_loaders.span_fields.load(
-                (self.span_rowid, models.Span.output_value_first_101_chars),
+                (self.span_rowid, _OUTPUT_VALUE_FIRST_101_CHARS),
             ),
         )
         if not output_value_first_101_chars:
             return None
         return SpanIOValue(
             span_rowid=self.span_rowid,
-            attr=models.Span.output_value,
+            attr=_OUTPUT_VALUE,
             truncated_value=truncate_value(output_value_first_101_chars),
             mime_type=MimeType(mime_type),
         )
@@ -438,7 +539,7 @@ class Span(Node):
         if self.db_span:
             return self.db_span.cumulative_llm_token_count_total
         value = await info.context.data_loaders.span_fields.load(
-            (self.span_rowid, models.Span.cumulative_llm_token_count_total),
+            (self.span_rowid, _CUMULATIVE_LLM_TOKEN_COUNT_TOTAL),
         )
         return cast(Optional[int], value)
 
@@ -607,7 +708,7 @@ class Span(Node):
             self.db_span.num_documents
             if self.db_span
             else await info.context.data_loaders.span_fields.load(
-                (self.span_rowid, models.Span.num_documents),
+                (self.span_rowid, _NUM_DOCUMENTS),
             )
         )
         if not num_documents:
@@ -650,7 +751,10 @@ class Span(Node):
             (self.span_rowid, max_depth or None),
         )
         data = [Span(span_rowid=span_rowid) for span_rowid in span_rowids]
-        return connection_from_list(data=data, args=args)
+        connection = connection_from_list(data=data, args=args)
+        # only the spans of the page are prefetched
+        await prefetch_span_fields(info, (edge.node.span_rowid for edge in connection.edges))
+        return connection
 
     @strawberry.field(
         description="The span's attributes translated into an example revision for a dataset",
@@ -659,11 +763,7 @@ class Span(Node):
         self,
         info: Info[Context, None],
     ) -> SpanAsExampleRevision:
-        span = (
-            self.db_span
-            if self.db_span
-            else await info.context.data_loaders.span_by_id.load(self.span_rowid)
-        )
+        span = self.db_span if self.db_span else await self._load_example_revision_span(info)
 
         # Fetch annotations associated with this span
         span_annotations = await self.span_annotations(info)
@@ -688,6 +788,29 @@ class Span(Node):
             metadata=metadata,
         )
 
+    async def _load_example_revision_span(self, info: Info[Context, None]) -> models.Span:
+        """
+        Loads only the span kind and the attributes read by the dataset example helpers, as
+        opposed to the entire `attributes` column, into a transient span.
+        """
+        span_kind, *values = await gather(
+            info.context.data_loaders.span_fields.load((self.span_rowid, models.Span.span_kind)),
+            *(
+                info.context.data_loaders.span_fields.load((self.span_rowid, attr))
+                for attr in _EXAMPLE_REVISION_ATTRIBUTES.values()
+            ),
+        )
+        attributes: dict[str, Any] = {}
+        for key, value in zip(_EXAMPLE_REVISION_ATTRIBUTES, values):
+            if value is None:
+                continue
+            *prefix, name = key.split(".")
+            node = attributes
+            for part in prefix:
+                node = node.setdefault(part, {})
+            node[name] = value
+        return models.Span(span_kind=span_kind, attributes=attributes)
+
     @strawberry.field(description="The project that this span belongs to.")  # type: ignore
     async def project(
         self,
@@ -717,15 +840,25 @@ class Span(Node):
         from phoenix.server.api.helpers.playground_clients import OpenAIStreamingClient
         from phoenix.server.api.helpers.playground_registry import PLAYGROUND_CLIENT_REGISTRY
 
-        db_span: models.Span = await info.context.data_loaders.span_by_id.load(self.span_rowid)
-        attributes = db_span.attributes
-        llm_provider = GenerativeProvider.get_model_provider_from_attributes(attributes)
+        if self.db_span:
+            provider = self.db_span.llm_provider
+            llm_model = self.db_span.llm_model_name
+            invocation_parameters = self.db_span.llm_invocation_parameters
+        else:
+            provider, llm_model, invocation_parameters = await gather(
+                info.context.data_loaders.span_fields.load(
+                    (self.span_rowid, _LLM_PROVIDER),
+                ),
+                info.context.data_loaders.span_fields.load(
+                    (self.span_rowid, _LLM_MODEL_NAME),
+                ),
+                info.context.data_loaders.span_fields.load(
+                    (self.span_rowid, _LLM_INVOCATION_PARAMETERS),
+                ),
+            )
+        llm_provider = GenerativeProvider.get_model_provider(provider, llm_model)
         if llm_provider is None:
             return []
-        llm_model = get_attribute_value(attributes, SpanAttributes.LLM_MODEL_NAME)
-        invocation_parameters = get_attribute_value(
-            attributes, SpanAttributes.LLM_INVOCATION_PARAMETERS
-        )
         if invocation_parameters is None:
             return []
         invocation_parameters = json.loads(invocation_parameters)
@@ -20,7 +20,7 @@ from phoenix.server.api.types.pagination import (
     connection_from_list,
 )
 from phoenix.server.api.types.SortDir import SortDir
-from phoenix.server.api.types.Span import Span
+from phoenix.server.api.types.Span import Span, prefetch_span_fields
 from phoenix.server.api.types.TraceAnnotation import TraceAnnotation, to_gql_trace_annotation
 
 if TYPE_CHECKING:
@@ -155,7 +155,7 @@ class Trace(Node):
         from phoenix.server.api.types.ProjectSession import to_gql_project_session
 
         stmt = select(models.ProjectSession).filter_by(id=project_session_rowid)
-        async with info.context.db() as session:
+        async with info.context.db.reader() as session:
             project_session = await session.scalar(stmt)
         if project_session is None:
             return None
@@ -202,10 +202,13 @@ class Trace(Node):
             .order_by(desc(models.Span.id))
             .limit(first)
         )
-        async with info.context.db() as session:
+        async with info.context.db.reader() as session:
             span_rowids = await session.stream_scalars(stmt)
             data = [Span(span_rowid=span_rowid) async for span_rowid in span_rowids]
-        return connection_from_list(data=data, args=args)
+        connection = connection_from_list(data=data, args=args)
+        # only the spans of the page are prefetched
+        await prefetch_span_fields(info, (edge.node.span_rowid for edge in connection.edges))
+        return connection
 
     @strawberry.field(description="Annotations associated with the trace.")  # type: ignore
     async def trace_annotations(
@@ -213,7 +216,7 @@ class Trace(Node):
         info: Info[Context, None],
         sort: Optional[TraceAnnotationSort] = None,
     ) -> list[TraceAnnotation]:
-        async with info.context.db() as session:
+        async with info.context.db.reader() as session:
             stmt = select(models.TraceAnnotation).filter_by(trace_rowid=self.trace_rowid)
             if sort:
                 sort_col = getattr(models.TraceAnnotation, sort.col.value)
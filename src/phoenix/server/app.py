@@ -1,14 +1,17 @@
 import asyncio
 import contextlib
+import hashlib
 import importlib
 import json
 import logging
 import os
+import re
 from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Sequence
 from contextlib import AbstractAsyncContextManager, AsyncExitStack
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from functools import cached_property
+from mimetypes import guess_type
 from pathlib import Path
 from types import MethodType
 from typing import (
@@ -29,17 +32,24 @@ from fastapi.utils import is_body_allowed_for_status_code
 from grpc.aio import ServerInterceptor
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from starlette.datastructures import Headers, MutableHeaders
 from starlette.datastructures import State as StarletteState
 from starlette.exceptions import HTTPException
 from starlette.middleware import Middleware
 from starlette.middleware.authentication import AuthenticationMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
-from starlette.responses import JSONResponse, PlainTextResponse, Response
-from starlette.staticfiles import StaticFiles
+from starlette.responses import (
+    FileResponse,
+    HTMLResponse,
+    JSONResponse,
+    PlainTextResponse,
+    Response,
+)
+from starlette.staticfiles import NotModifiedResponse, PathLike, StaticFiles
 from starlette.status import HTTP_401_UNAUTHORIZED
 from starlette.templating import Jinja2Templates
-from starlette.types import Scope, StatefulLifespan
+from starlette.types import ASGIApp, Message, Receive, Scope, Send, StatefulLifespan
 from strawberry.extensions import SchemaExtension
 from strawberry.fastapi import GraphQLRouter
 from strawberry.subscriptions import GRAPHQL_TRANSPORT_WS_PROTOCOL
@@ -57,6 +67,8 @@ from phoenix.config import (
     get_env_grpc_interceptor_paths,
     get_env_host,
     get_env_port,
+    get_env_trace_deletion_batch_size,
+    get_env_trace_deletion_max_traces_per_second,
     server_instrumentation_is_enabled,
     verify_server_environment_variables,
 )
@@ -67,48 +79,13 @@ from phoenix.db.engines import create_engine
 from phoenix.db.facilitator import Facilitator
 from phoenix.db.helpers import SupportedSQLDialect
 from phoenix.exceptions import PhoenixMigrationError
+from phoenix.pointcloud.runner import PointCloudRunner
 from phoenix.pointcloud.umap_parameters import UMAPParameters
 from phoenix.server.api.context import Context, DataLoaders
 from phoenix.server.api.dataloaders import (
-    AnnotationSummaryDataLoader,
-    AverageExperimentRunLatencyDataLoader,
     CacheForDataLoaders,
-    DatasetExampleRevisionsDataLoader,
-    DatasetExampleSpansDataLoader,
-    DocumentEvaluationsDataLoader,
-    DocumentEvaluationSummaryDataLoader,
-    DocumentRetrievalMetricsDataLoader,
-    ExperimentAnnotationSummaryDataLoader,
-    ExperimentErrorRatesDataLoader,
-    ExperimentRunAnnotations,
-    ExperimentRunCountsDataLoader,
-    ExperimentSequenceNumberDataLoader,
-    LatencyMsQuantileDataLoader,
-    MinStartOrMaxEndTimeDataLoader,
-    NumChildSpansDataLoader,
-    NumSpansPerTraceDataLoader,
-    ProjectByNameDataLoader,
-    ProjectIdsByTraceRetentionPolicyIdDataLoader,
-    PromptVersionSequenceNumberDataLoader,
-    RecordCountDataLoader,
-    SessionIODataLoader,
-    SessionNumTracesDataLoader,
-    SessionNumTracesWithErrorDataLoader,
-    SessionTokenUsagesDataLoader,
-    SessionTraceLatencyMsQuantileDataLoader,
-    SpanAnnotationsDataLoader,
-    SpanByIdDataLoader,
-    SpanDatasetExamplesDataLoader,
-    SpanDescendantsDataLoader,
-    SpanProjectsDataLoader,
-    TableFieldsDataLoader,
-    TokenCountDataLoader,
-    TraceByTraceIdsDataLoader,
-    TraceRetentionPolicyIdByProjectIdDataLoader,
-    TraceRootSpansDataLoader,
-    UserRolesDataLoader,
-    UsersDataLoader,
 )
+from phoenix.server.api.persisted_queries import PersistedQueriesGraphQLRouter
 from phoenix.server.api.routers import (
     auth_router,
     create_embeddings_router,
@@ -125,8 +102,10 @@ from phoenix.server.grpc_server import GrpcServer
 from phoenix.server.jwt_store import JwtStore
 from phoenix.server.middleware.gzip import GZipMiddleware
 from phoenix.server.oauth2 import OAuth2Clients
+from phoenix.server.project_change_notifier import ProjectChangeNotifier
 from phoenix.server.retention import TraceDataSweeper
 from phoenix.server.telemetry import initialize_opentelemetry_tracer_provider
+from phoenix.server.trace_deletion import TraceDeleter
 from phoenix.server.types import (
     CanGetLastUpdatedAt,
     CanPutItem,
@@ -212,13 +191,46 @@ class AppConfig(NamedTuple):
     oauth2_idps: Sequence[OAuth2Idp]
 
 
+_PRECOMPRESSED_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+"""
+Compressed copies of the web bundle's text assets written next to them at build time, in order
+of preference
+"""
+
+_HASHED_ASSET = re.compile(r"-[\w-]{8}\.\w+$")
+"""
+Vite names the files that it emits into the `assets` directory after a hash of their content
+"""
+
+_IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+def _accepted_encodings(accept_encoding: str) -> set[str]:
+    encodings = set()
+    for value in accept_encoding.split(","):
+        encoding, _, params = value.partition(";")
+        try:
+            q = float(params.replace(" ", "").removeprefix("q=") or 1)
+        except ValueError:
+            q = 1
+        if q > 0:
+            encodings.add(encoding.strip().lower())
+    return encodings
+
+
 class Static(StaticFiles):
-    "Static file serving with a fallback to index.html"
+    """
+    Static file serving with a fallback to index.html
+
+    Files are served from their precompressed copies when the client accepts them, files whose
+    names are hashed are cached indefinitely, and index.html is rendered once per root path.
+    """
 
     _app_config: AppConfig
 
     def __init__(self, *, app_config: AppConfig, **kwargs: Any):
         self._app_config = app_config
+        self._rendered_index: dict[str, tuple[bytes, str]] = {}
         super().__init__(**kwargs)
 
     @cached_property
@@ -242,61 +254,113 @@ class Static(StaticFiles):
             if e.status_code != 404:
                 raise e
             # Fallback to to the index.html
-            request = Request(scope)
-
-            response = templates.TemplateResponse(
-                "index.html",
-                context={
-                    "has_inferences": self._app_config.has_inferences,
-                    "has_corpus": self._app_config.has_corpus,
-                    "min_dist": self._app_config.min_dist,
-                    "n_neighbors": self._app_config.n_neighbors,
-                    "n_samples": self._app_config.n_samples,
-                    "basename": self._sanitize_basename(request.scope.get("root_path", "")),
-                    "platform_version": phoenix_version,
-                    "request": request,
-                    "is_development": self._app_config.is_development,
-                    "manifest": self._web_manifest,
-                    "authentication_enabled": self._app_config.authentication_enabled,
-                    "oauth2_idps": self._app_config.oauth2_idps,
-                },
-            )
+            response = self._index_response(scope)
         except Exception as e:
             raise e
         return response
 
-
-class RequestOriginHostnameValidator(BaseHTTPMiddleware):
-    def __init__(self, *args: Any, trusted_hostnames: list[str], **kwargs: Any) -> None:
-        super().__init__(*args, **kwargs)
-        self._trusted_hostnames = trusted_hostnames
-
-    async def dispatch(
+    def file_response(
         self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
+        full_path: PathLike,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
     ) -> Response:
-        headers = request.headers
-        for key in "origin", "referer":
-            if not (url := headers.get(key)):
-                continue
-            if urlparse(url).hostname not in self._trusted_hostnames:
-                return Response(f"untrusted {key}", status_code=HTTP_401_UNAUTHORIZED)
-        return await call_next(request)
+        request_headers = Headers(scope=scope)
+        headers = {"Vary": "Accept-Encoding"}
+        if Path(full_path).parent.name == "assets" and _HASHED_ASSET.search(str(full_path)):
+            headers["Cache-Control"] = _IMMUTABLE
+        path, media_type = full_path, None
+        if accepted_encodings := _accepted_encodings(request_headers.get("accept-encoding", "")):
+            for encoding, suffix in _PRECOMPRESSED_SUFFIXES.items():
+                if encoding not in accepted_encodings:
+                    continue
+                try:
+                    compressed_stat_result = os.stat(f"{full_path}{suffix}")
+                except OSError:
+                    continue
+                path, stat_result = f"{full_path}{suffix}", compressed_stat_result
+                media_type = guess_type(full_path)[0] or "text/plain"
+                headers["Content-Encoding"] = encoding
+                break
+        response = FileResponse(
+            path,
+            status_code=status_code,
+            headers=headers,
+            media_type=media_type,
+            stat_result=stat_result,
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
 
+    def _index_response(self, scope: Scope) -> Response:
+        basename = self._sanitize_basename(scope.get("root_path", ""))
+        if self._app_config.is_development or basename not in self._rendered_index:
+            content = (
+                templates.get_template("index.html")
+                .render(
+                    has_inferences=self._app_config.has_inferences,
+                    has_corpus=self._app_config.has_corpus,
+                    min_dist=self._app_config.min_dist,
+                    n_neighbors=self._app_config.n_neighbors,
+                    n_samples=self._app_config.n_samples,
+                    basename=basename,
+                    platform_version=phoenix_version,
+                    is_development=self._app_config.is_development,
+                    manifest=self._web_manifest,
+                    authentication_enabled=self._app_config.authentication_enabled,
+                    oauth2_idps=self._app_config.oauth2_idps,
+                )
+                .encode()
+            )
+            etag = f'"{hashlib.md5(content, usedforsecurity=False).hexdigest()}"'
+            self._rendered_index[basename] = (content, etag)
+        content, etag = self._rendered_index[basename]
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if self.is_not_modified(Headers(headers), Headers(scope=scope)):
+            return NotModifiedResponse(Headers(headers))
+        return HTMLResponse(content, headers=headers)
+
+
+class RequestOriginHostnameValidator:
+    def __init__(self, app: ASGIApp, *, trusted_hostnames: list[str]) -> None:
+        self._app = app
+        self._trusted_hostnames = trusted_hostnames
 
-class HeadersMiddleware(BaseHTTPMiddleware):
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            headers = Headers(scope=scope)
+            for key in "origin", "referer":
+                if not (url := headers.get(key)):
+                    continue
+                if urlparse(url).hostname not in self._trusted_hostnames:
+                    response = Response(f"untrusted {key}", status_code=HTTP_401_UNAUTHORIZED)
+                    await response(scope, receive, send)
+                    return
+        await self._app(scope, receive, send)
+
+
+class HeadersMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
         from phoenix.version import __version__ as phoenix_version
 
-        response = await call_next(request)
-        response.headers["x-colab-notebook-cache-control"] = "no-cache"
-        response.headers[PHOENIX_SERVER_VERSION_HEADER] = phoenix_version
-        return response
+        self._app = app
+        self._phoenix_version = phoenix_version
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["x-colab-notebook-cache-control"] = "no-cache"
+                headers[PHOENIX_SERVER_VERSION_HEADER] = self._phoenix_version
+            await send(message)
+
+        await self._app(scope, receive, send_with_headers)
 
 
 def user_fastapi_middlewares() -> list[Middleware]:
@@ -479,6 +543,7 @@ def _lifespan(
     bulk_inserter: BulkInserter,
     dml_event_handler: DmlEventHandler,
     trace_data_sweeper: Optional[TraceDataSweeper],
+    trace_deleter: TraceDeleter,
     token_store: Optional[TokenStore] = None,
     tracer_provider: Optional["TracerProvider"] = None,
     enable_prometheus: bool = False,
@@ -511,6 +576,7 @@ def _lifespan(
             )
             await stack.enter_async_context(grpc_server)
             await stack.enter_async_context(dml_event_handler)
+            await stack.enter_async_context(trace_deleter)
             if trace_data_sweeper:
                 await stack.enter_async_context(trace_data_sweeper)
             if scaffolder_config:
@@ -567,12 +633,17 @@ def create_graphql_router(
     secret: Optional[str] = None,
     token_store: Optional[TokenStore] = None,
     email_sender: Optional[EmailSender] = None,
+    queue_experiment_runs_for_bulk_insert: Optional[Callable[..., Awaitable[None]]] = None,
+    point_cloud_runner: Optional[PointCloudRunner] = None,
+    trace_deleter: Optional[TraceDeleter] = None,
+    project_change_notifier: Optional[ProjectChangeNotifier] = None,
 ) -> GraphQLRouter[Context, None]:
     """Creates the GraphQL router.
 
     Args:
         schema (BaseSchema): The GraphQL schema.
-        db (DbSessionFactory): The database session factory pointing to a SQL database.
+        db (DbSessionFactory): The database session factory pointing to a SQL database. The data
+            loaders use its reader.
         model (Model): The Model representing inferences (legacy)
         export_path (Path): the file path to export data to for download (legacy)
         last_updated_at (CanGetLastUpdatedAt): How to get the last updated timestamp for updates.
@@ -584,10 +655,22 @@ def create_graphql_router(
         secret (Optional[str], optional): The application secret for auth. Defaults to None.
         token_store (Optional[TokenStore], optional): The token store for auth. Defaults to None.
         email_sender (Optional[EmailSender], optional): The email sender. Defaults to None.
+        queue_experiment_runs_for_bulk_insert (Optional[Callable[..., Awaitable[None]]], optional):
+            Hands experiment runs produced by the server (e.g. by the playground) to the bulk
+            inserter. Defaults to None, in which case they are written by the resolver.
+        point_cloud_runner (Optional[PointCloudRunner], optional): Generates the UMAP point
+            clouds off the event loop, shared across requests for its caches. Defaults to None,
+            in which case one is created for the router.
+        trace_deleter (Optional[TraceDeleter], optional): Deletes the traces of projects in batches
+            when they are cleared or deleted. Defaults to None.
+        project_change_notifier (Optional[ProjectChangeNotifier], optional): Publishes the changes
+            of projects to the subscribers of `projectChanges`. Defaults to None.
 
     Returns:
         GraphQLRouter: The router mounted at /graphql
     """
+    point_cloud_runner = point_cloud_runner or PointCloudRunner()
+    reader = db.reader
 
     def get_context() -> Context:
         return Context(
@@ -597,94 +680,20 @@ def create_graphql_router(
             export_path=export_path,
             last_updated_at=last_updated_at,
             event_queue=event_queue,
-            data_loaders=DataLoaders(
-                average_experiment_run_latency=AverageExperimentRunLatencyDataLoader(db),
-                dataset_example_revisions=DatasetExampleRevisionsDataLoader(db),
-                dataset_example_spans=DatasetExampleSpansDataLoader(db),
-                document_evaluation_summaries=DocumentEvaluationSummaryDataLoader(
-                    db,
-                    cache_map=(
-                        cache_for_dataloaders.document_evaluation_summary
-                        if cache_for_dataloaders
-                        else None
-                    ),
-                ),
-                document_evaluations=DocumentEvaluationsDataLoader(db),
-                document_retrieval_metrics=DocumentRetrievalMetricsDataLoader(db),
-                annotation_summaries=AnnotationSummaryDataLoader(
-                    db,
-                    cache_map=(
-                        cache_for_dataloaders.annotation_summary if cache_for_dataloaders else None
-                    ),
-                ),
-                experiment_annotation_summaries=ExperimentAnnotationSummaryDataLoader(db),
-                experiment_error_rates=ExperimentErrorRatesDataLoader(db),
-                experiment_run_annotations=ExperimentRunAnnotations(db),
-                experiment_run_counts=ExperimentRunCountsDataLoader(db),
-                experiment_sequence_number=ExperimentSequenceNumberDataLoader(db),
-                latency_ms_quantile=LatencyMsQuantileDataLoader(
-                    db,
-                    cache_map=(
-                        cache_for_dataloaders.latency_ms_quantile if cache_for_dataloaders else None
-                    ),
-                ),
-                min_start_or_max_end_times=MinStartOrMaxEndTimeDataLoader(
-                    db,
-                    cache_map=(
-                        cache_for_dataloaders.min_start_or_max_end_time
-                        if cache_for_dataloaders
-                        else None
-                    ),
-                ),
-                num_child_spans=NumChildSpansDataLoader(db),
-                num_spans_per_trace=NumSpansPerTraceDataLoader(db),
-                project_fields=TableFieldsDataLoader(db, models.Project),
-                projects_by_trace_retention_policy_id=ProjectIdsByTraceRetentionPolicyIdDataLoader(
-                    db
-                ),
-                prompt_version_sequence_number=PromptVersionSequenceNumberDataLoader(db),
-                record_counts=RecordCountDataLoader(
-                    db,
-                    cache_map=cache_for_dataloaders.record_count if cache_for_dataloaders else None,
-                ),
-                session_first_inputs=SessionIODataLoader(db, "first_input"),
-                session_last_outputs=SessionIODataLoader(db, "last_output"),
-                session_num_traces=SessionNumTracesDataLoader(db),
-                session_num_traces_with_error=SessionNumTracesWithErrorDataLoader(db),
-                session_token_usages=SessionTokenUsagesDataLoader(db),
-                session_trace_latency_ms_quantile=SessionTraceLatencyMsQuantileDataLoader(db),
-                span_annotations=SpanAnnotationsDataLoader(db),
-                span_fields=TableFieldsDataLoader(db, models.Span),
-                span_by_id=SpanByIdDataLoader(db),
-                span_dataset_examples=SpanDatasetExamplesDataLoader(db),
-                span_descendants=SpanDescendantsDataLoader(db),
-                span_projects=SpanProjectsDataLoader(db),
-                token_counts=TokenCountDataLoader(
-                    db,
-                    cache_map=cache_for_dataloaders.token_count if cache_for_dataloaders else None,
-                ),
-                trace_by_trace_ids=TraceByTraceIdsDataLoader(db),
-                trace_fields=TableFieldsDataLoader(db, models.Trace),
-                trace_retention_policy_id_by_project_id=TraceRetentionPolicyIdByProjectIdDataLoader(
-                    db
-                ),
-                project_trace_retention_policy_fields=TableFieldsDataLoader(
-                    db, models.ProjectTraceRetentionPolicy
-                ),
-                trace_root_spans=TraceRootSpansDataLoader(db),
-                project_by_name=ProjectByNameDataLoader(db),
-                users=UsersDataLoader(db),
-                user_roles=UserRolesDataLoader(db),
-            ),
+            data_loaders=DataLoaders(reader, cache_for_dataloaders),
             cache_for_dataloaders=cache_for_dataloaders,
             read_only=read_only,
             auth_enabled=authentication_enabled,
             secret=secret,
             token_store=token_store,
             email_sender=email_sender,
+            queue_experiment_runs_for_bulk_insert=queue_experiment_runs_for_bulk_insert,
+            point_cloud_runner=point_cloud_runner,
+            trace_deleter=trace_deleter,
+            project_change_notifier=project_change_notifier,
         )
 
-    return GraphQLRouter(
+    return PersistedQueriesGraphQLRouter(
         graphql_schema,
         graphql_ide="graphiql",
         context_getter=get_context,
@@ -827,14 +836,22 @@ def create_app(
         )
     else:
         token_store = None
+    project_change_notifier = ProjectChangeNotifier()
     dml_event_handler = DmlEventHandler(
         db=db,
         cache_for_dataloaders=cache_for_dataloaders,
         last_updated_at=last_updated_at,
+        project_change_notifier=project_change_notifier,
+    )
+    trace_deleter = TraceDeleter(
+        db=db,
+        event_queue=dml_event_handler,
+        batch_size=get_env_trace_deletion_batch_size(),
+        max_traces_per_second=get_env_trace_deletion_max_traces_per_second(),
     )
     trace_data_sweeper = TraceDataSweeper(
         db=db,
-        dml_event_handler=dml_event_handler,
+        trace_deleter=trace_deleter,
     )
     bulk_inserter = bulk_inserter_factory(
         db,
@@ -866,6 +883,8 @@ def create_app(
 
         graphql_schema_extensions.append(_OpenTelemetryExtension)
 
+    point_cloud_runner = PointCloudRunner()
+    shutdown_callbacks_list.append(point_cloud_runner.shutdown)
     graphql_router = create_graphql_router(
         db=db,
         graphql_schema=build_graphql_schema(graphql_schema_extensions),
@@ -880,6 +899,10 @@ def create_app(
         secret=secret,
         token_store=token_store,
         email_sender=email_sender,
+        queue_experiment_runs_for_bulk_insert=bulk_inserter.queue_experiment_runs,
+        point_cloud_runner=point_cloud_runner,
+        trace_deleter=trace_deleter,
+        project_change_notifier=project_change_notifier,
     )
     if enable_prometheus:
         from phoenix.server.prometheus import PrometheusMiddleware
@@ -894,6 +917,7 @@ def create_app(
             bulk_inserter=bulk_inserter,
             dml_event_handler=dml_event_handler,
             trace_data_sweeper=trace_data_sweeper,
+            trace_deleter=trace_deleter,
             token_store=token_store,
             tracer_provider=tracer_provider,
             enable_prometheus=enable_prometheus,
@@ -950,6 +974,7 @@ def create_app(
     app.state.refresh_token_expiry = refresh_token_expiry
     app.state.oauth2_clients = OAuth2Clients.from_configs(oauth2_client_configs or [])
     app.state.db = db
+    app.state.trace_deleter = trace_deleter
     app.state.email_sender = email_sender
     app = _add_get_secret_method(app=app, secret=secret)
     app = _add_get_token_store_method(app=app, token_store=token_store)
@@ -28,8 +28,10 @@ from phoenix.server.dml_event import (
     SpanDmlEvent,
     TraceAnnotationDmlEvent,
 )
+from phoenix.server.project_change_notifier import ProjectChangeNotifier
 from phoenix.server.types import (
     BatchedCaller,
+    CanPutItem,
     CanSetLastUpdatedAt,
     DbSessionFactory,
 )
@@ -59,6 +61,7 @@ class _DmlEventQueue(Generic[_DmlEventT]):
 class _HandlerParams(TypedDict):
     db: DbSessionFactory
     last_updated_at: CanSetLastUpdatedAt
+    project_changes: Optional[CanPutItem[int]]
     cache_for_dataloaders: Optional[CacheForDataLoaders]
     sleep_seconds: float
 
@@ -67,10 +70,17 @@ class _HasLastUpdatedAt(ABC):
     def __init__(
         self,
         last_updated_at: CanSetLastUpdatedAt,
+        project_changes: Optional[CanPutItem[int]] = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
         self._last_updated_at = last_updated_at
+        self._project_changes = project_changes
+
+    def _set_last_updated_at(self, table: type[Base], id_: int) -> None:
+        self._last_updated_at.set(table, id_)
+        if table is Project and self._project_changes:
+            self._project_changes.put(id_)
 
 
 class _HasCacheForDataLoaders(ABC):
@@ -107,7 +117,7 @@ class _GenericDmlEventHandler(_DmlEventHandler[DmlEvent]):
                 self._update(e.table, id_)
 
     def _update(self, table: type[Base], id_: int) -> None:
-        self._last_updated_at.set(table, id_)
+        self._set_last_updated_at(table, id_)
 
 
 class _SpanDmlEventHandler(_DmlEventHandler[SpanDmlEvent]):
@@ -172,7 +182,7 @@ class _AnnotationDmlEventHandler(
     async def __call__(self) -> None:
         async with self._db() as session:
             async for row in await session.stream(self._get_stmt()):
-                self._last_updated_at.set(Project, row.id)
+                self._set_last_updated_at(Project, row.id)
                 if cache := self._cache_for_dataloaders:
                     self._clear(cache, row.id, row.name)
 
@@ -220,11 +230,14 @@ class DmlEventHandler:
         db: DbSessionFactory,
         last_updated_at: CanSetLastUpdatedAt,
         cache_for_dataloaders: Optional[CacheForDataLoaders] = None,
+        project_change_notifier: Optional[ProjectChangeNotifier] = None,
         sleep_seconds: float = 0.1,
     ) -> None:
+        self._project_change_notifier = project_change_notifier
         kwargs = _HandlerParams(
             db=db,
             last_updated_at=last_updated_at,
+            project_changes=project_change_notifier,
             cache_for_dataloaders=cache_for_dataloaders,
             sleep_seconds=sleep_seconds,
         )
@@ -240,9 +253,13 @@ class DmlEventHandler:
 
     async def __aenter__(self) -> None:
         await gather(*(h.start() for h in self._all_handlers))
+        if self._project_change_notifier:
+            await self._project_change_notifier.start()
 
     async def __aexit__(self, *args: Any, **kwargs: Any) -> None:
         await gather(*(h.stop() for h in self._all_handlers))
+        if self._project_change_notifier:
+            await self._project_change_notifier.stop()
 
     def put(self, event: DmlEvent) -> None:
         if not (isinstance(event, DmlEvent) and event):
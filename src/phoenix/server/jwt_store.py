@@ -4,12 +4,13 @@ from asyncio import create_task, gather, sleep
 from collections.abc import Callable, Coroutine
 from copy import deepcopy
 from dataclasses import replace
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from functools import cached_property, singledispatchmethod
-from typing import Any, Generic, Optional, TypeVar
+from typing import Any, Generic, Iterator, Optional, TypeVar
 
 from authlib.jose import jwt
 from authlib.jose.errors import JoseError
+from cachetools import LRUCache, TTLCache
 from sqlalchemy import Select, delete, select
 
 from phoenix.auth import (
@@ -41,10 +42,22 @@ from phoenix.server.types import (
     RefreshTokenId,
     TokenId,
     UserId,
+    UserTokenAttributes,
 )
 
 logger = logging.getLogger(__name__)
 
+# Bounds the number of tokens whose signature has been verified and the number of token IDs known
+# to be absent from the database, so that a burst of requests bearing the same tokens neither
+# re-verifies them nor queries the database for each request.
+_MAX_VERIFIED_TOKENS = 10_000
+_MAX_MISSING_TOKEN_IDS = 10_000
+# Expired tokens are deleted this many at a time, each batch in its own transaction.
+_EXPIRED_TOKENS_DELETE_BATCH_SIZE = 1_000
+# Overlap with which users updated before the high-water mark are looked at again, since a
+# transaction can commit after the high-water mark has passed the time of its update.
+_USERS_UPDATED_AT_OVERLAP = timedelta(minutes=1)
+
 
 class JwtStore:
     def __init__(
@@ -64,6 +77,7 @@ class JwtStore:
         self._access_token_store = _AccessTokenStore(*args, **kwargs)
         self._refresh_token_store = _RefreshTokenStore(*args, **kwargs)
         self._api_key_store = _ApiKeyStore(*args, **kwargs)
+        self._token_ids: LRUCache[Token, Optional[TokenId]] = LRUCache(maxsize=_MAX_VERIFIED_TOKENS)
 
     @cached_property
     def _stores(self) -> tuple[DaemonTask, ...]:
@@ -76,6 +90,15 @@ class JwtStore:
         await gather(*(s.__aexit__(*args, **kwargs) for s in self._stores))
 
     async def read(self, token: Token) -> Optional[ClaimSet]:
+        try:
+            token_id = self._token_ids[token]
+        except KeyError:
+            token_id = self._token_ids[token] = self._verify(token)
+        if token_id is None:
+            return None
+        return await self._get(token_id)
+
+    def _verify(self, token: Token) -> Optional[TokenId]:
         try:
             payload = jwt.decode(
                 s=token,
@@ -85,9 +108,7 @@ class JwtStore:
             return None
         if (jti := payload.get("jti")) is None:
             return None
-        if (token_id := TokenId.parse(jti)) is None:
-            return None
-        return await self._get(token_id)
+        return TokenId.parse(jti)
 
     @singledispatchmethod
     async def _get(self, _: TokenId) -> Optional[ClaimSet]:
@@ -222,6 +243,20 @@ class _Claims(Generic[_TokenIdT, _ClaimSetT]):
         claim = self._cache.pop(token_id, default)
         return deepcopy(claim) if claim else None
 
+    def __iter__(self) -> Iterator[_TokenIdT]:
+        return iter(list(self._cache))
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def items(self) -> Iterator[tuple[_TokenIdT, _ClaimSetT]]:
+        return iter(list(self._cache.items()))
+
+    def expire(self, now: datetime) -> None:
+        for token_id, claim in list(self._cache.items()):
+            if claim.expiration_time and claim.expiration_time < now:
+                del self._cache[token_id]
+
 
 class _Store(DaemonTask, Generic[_ClaimSetT, _TokenT, _TokenIdT, _RecordT], ABC):
     _table: type[_RecordT]
@@ -241,6 +276,16 @@ class _Store(DaemonTask, Generic[_ClaimSetT, _TokenT, _TokenIdT, _RecordT], ABC)
         self._db = db
         self._seconds = sleep_seconds
         self._claims: _Claims[_TokenIdT, _ClaimSetT] = _Claims()
+        self._missing: TTLCache[_TokenIdT, bool] = TTLCache(
+            maxsize=_MAX_MISSING_TOKEN_IDS,
+            ttl=sleep_seconds,
+        )
+        # High-water mark of the rows loaded into `_claims`. Rows are loaded incrementally above it,
+        # and `_claims` holds every unexpired row at or below it.
+        self._max_id = 0
+        # High-water mark of the `updated_at` of the users, above which users are checked for
+        # role changes.
+        self._users_updated_at: Optional[datetime] = None
         self._secret = secret
         self._algorithm = algorithm
 
@@ -253,17 +298,19 @@ class _Store(DaemonTask, Generic[_ClaimSetT, _TokenT, _TokenIdT, _RecordT], ABC)
     async def get(self, token_id: _TokenIdT) -> Optional[_ClaimSetT]:
         if claims := self._claims.get(token_id):
             return claims
+        if token_id in self._missing:
+            return None
         stmt = self._update_stmt.where(self._table.id == int(token_id))
         async with self._db() as session:
             record = (await session.execute(stmt)).first()
         if not record:
+            self._missing[token_id] = True
             return None
         token, role = record
-        _, claims = self._from_db(token, UserRole(role))
-        self._claims[token_id] = claims
-        return claims
+        return self._add(token, role)
 
     async def evict(self, token_id: _TokenIdT) -> Optional[_ClaimSetT]:
+        self._missing[token_id] = True
         return self._claims.pop(token_id, None)
 
     async def revoke(self, *token_ids: _TokenIdT) -> None:
@@ -292,16 +339,76 @@ class _Store(DaemonTask, Generic[_ClaimSetT, _TokenT, _TokenIdT, _RecordT], ABC)
         token = self._token(self._encode(claim))
         return token, token_id
 
+    def _add(self, record: _RecordT, role: str) -> _ClaimSetT:
+        token_id, claims = self._from_db(record, UserRole(role))
+        self._claims[token_id] = claims
+        self._missing.pop(token_id, None)
+        return claims
+
     async def _update(self) -> None:
-        claims: _Claims[_TokenIdT, _ClaimSetT] = _Claims()
+        """
+        Synchronizes `_claims` with the database without reloading every row: expired tokens are
+        deleted in batches, rows above the high-water mark are loaded, and the tokens of users
+        whose role has changed, as found among the users updated since the last check, are
+        reloaded. Tokens deleted by other processes, e.g. other replicas of the server, are
+        detected by comparing the IDs of the rows at or below the high-water mark with those held
+        in memory.
+        """
+        await self._delete_expired_tokens()
         async with self._db() as session:
             async with session.begin_nested():
-                await self._delete_expired_tokens(session)
+                await self._load_new_tokens(session)
             async with session.begin_nested():
-                async for record, role in await session.stream(self._update_stmt):
-                    token_id, claim_set = self._from_db(record, UserRole(role))
-                    claims[token_id] = claim_set
-        self._claims = claims
+                await self._reload_tokens_of_users_with_new_roles(session)
+            async with session.begin_nested():
+                await self._reconcile(session)
+
+    async def _load_new_tokens(self, session: Any) -> None:
+        stmt = self._update_stmt.where(self._table.id > self._max_id).order_by(self._table.id)
+        async for record, role in await session.stream(stmt):
+            self._add(record, role)
+            self._max_id = record.id
+
+    async def _reload_tokens_of_users_with_new_roles(self, session: Any) -> None:
+        user_roles: dict[int, UserRole] = {}
+        for _, claims in self._claims.items():
+            if claims.subject and isinstance(claims.attributes, UserTokenAttributes):
+                user_roles[int(claims.subject)] = claims.attributes.user_role
+        if not user_roles:
+            return
+        users = select(models.User.id, models.User.updated_at, models.UserRole.name).join_from(
+            models.User, models.UserRole
+        )
+        if self._users_updated_at is not None:
+            users = users.where(
+                models.User.updated_at >= self._users_updated_at - _USERS_UPDATED_AT_OVERLAP
+            )
+        user_ids = []
+        async for user_id, updated_at, role in await session.stream(users):
+            if self._users_updated_at is None or self._users_updated_at < updated_at:
+                self._users_updated_at = updated_at
+            if user_id in user_roles and UserRole(role) is not user_roles[user_id]:
+                user_ids.append(user_id)
+        if not user_ids:
+            return
+        stmt = self._update_stmt.where(self._table.user_id.in_(user_ids))
+        async for record, role in await session.stream(stmt):
+            self._add(record, role)
+
+    async def _reconcile(self, session: Any) -> None:
+        ids = set(
+            await session.scalars(select(self._table.id).where(self._table.id <= self._max_id))
+        )
+        loaded = {int(token_id) for token_id in self._claims if int(token_id) <= self._max_id}
+        if ids == loaded:
+            return
+        for id_ in loaded - ids:
+            await self.evict(self._token_id(id_))
+        # e.g. rows committed out of order of their IDs
+        if new_ids := ids - loaded:
+            stmt = self._update_stmt.where(self._table.id.in_(new_ids))
+            async for record, role in await session.stream(stmt):
+                self._add(record, role)
 
     @cached_property
     def _update_stmt(self) -> Select[tuple[_RecordT, str]]:
@@ -311,9 +418,22 @@ class _Store(DaemonTask, Generic[_ClaimSetT, _TokenT, _TokenIdT, _RecordT], ABC)
             .join_from(models.User, models.UserRole)
         )
 
-    async def _delete_expired_tokens(self, session: Any) -> None:
+    async def _delete_expired_tokens(self) -> None:
         now = datetime.now(timezone.utc)
-        await session.execute(delete(self._table).where(self._table.expires_at < now))
+        # Evicted locally as well, since another process may have deleted them already.
+        self._claims.expire(now)
+        expired = (
+            select(self._table.id)
+            .where(self._table.expires_at < now)
+            .limit(_EXPIRED_TOKENS_DELETE_BATCH_SIZE)
+            .scalar_subquery()
+        )
+        stmt = delete(self._table).where(self._table.id.in_(expired)).returning(self._table.id)
+        while True:
+            async with self._db() as session:
+                num_deleted = len((await session.scalars(stmt)).all())
+            if num_deleted < _EXPIRED_TOKENS_DELETE_BATCH_SIZE:
+                break
 
     async def _run(self) -> None:
         while self._running:
@@ -24,6 +24,7 @@ from phoenix.config import (
     get_env_database_schema,
     get_env_db_logging_level,
     get_env_disable_migrations,
+    get_env_embeddings_mmap_dir,
     get_env_enable_prometheus,
     get_env_grpc_port,
     get_env_host,
@@ -41,6 +42,7 @@ from phoenix.config import (
     get_env_smtp_port,
     get_env_smtp_username,
     get_env_smtp_validate_certs,
+    get_env_sql_database_reader_pool_size,
     get_env_tls_config,
     get_env_tls_enabled_for_grpc,
     get_env_tls_enabled_for_http,
@@ -48,6 +50,7 @@ from phoenix.config import (
 )
 from phoenix.core.model_schema_adapter import create_model_from_inferences
 from phoenix.db import get_printable_db_url
+from phoenix.db.engines import create_reader_engine
 from phoenix.inferences.fixtures import FIXTURES, get_inferences
 from phoenix.inferences.inferences import EMPTY_INFERENCES, Inferences
 from phoenix.logging import setup_logging
@@ -327,9 +330,11 @@ def main() -> None:
     host_root_path = get_env_host_root_path()
     read_only = args.read_only
 
+    embedding_mmap_dir = get_env_embeddings_mmap_dir()
     model = create_model_from_inferences(
         primary_inferences,
         reference_inferences,
+        embedding_mmap_dir=embedding_mmap_dir,
     )
 
     authentication_enabled, secret = get_env_auth_settings()
@@ -366,9 +371,24 @@ def main() -> None:
 
     engine = create_engine_and_run_migrations(db_connection_str)
     instrumentation_cleanups = instrument_engine_if_enabled(engine)
-    factory = DbSessionFactory(db=_db(engine), dialect=engine.dialect.name)
+    reader_engine = create_reader_engine(
+        db_connection_str,
+        pool_size=get_env_sql_database_reader_pool_size(),
+    )
+    if reader_engine:
+        instrumentation_cleanups.extend(instrument_engine_if_enabled(reader_engine))
+    factory = DbSessionFactory(
+        db=_db(engine),
+        dialect=engine.dialect.name,
+        read_db=_db(reader_engine, bypass_lock=True) if reader_engine else None,
+    )
     corpus_model = (
-        None if corpus_inferences is None else create_model_from_inferences(corpus_inferences)
+        None
+        if corpus_inferences is None
+        else create_model_from_inferences(
+            corpus_inferences,
+            embedding_mmap_dir=embedding_mmap_dir,
+        )
     )
 
     allowed_origins = get_env_allowed_origins()
@@ -10,13 +10,15 @@ class GZipMiddleware(_GZipMiddleware):
 
     This middleware adds a check to exclude multipart/mixed content types from compression,
     which is important for streaming responses where compression could interfere with delivery.
+    Arrow streams requested with compressed buffers are excluded as well, since compressing them
+    again costs time for little gain.
     """
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         if (
             scope.get("type") == "http"
             and isinstance(headers := scope.get("headers"), Iterable)
-            and _is_multipart(headers)
+            and (_is_multipart(headers) or _is_compressed_arrow(headers))
         ):
             scope["headers"] = list(_remove_accept_encoding(headers))
         await super().__call__(scope, receive, send)
@@ -34,6 +36,21 @@ def _is_multipart(
     return False
 
 
+def _is_compressed_arrow(
+    headers: Iterable[tuple[bytes, bytes]],
+) -> bool:
+    try:
+        for k, v in headers:
+            if k.decode().lower() == "accept" and (
+                "application/x-pandas-arrow" in (accept := v.decode().lower())
+                and "compression=" in accept
+            ):
+                return True
+    except Exception:
+        pass
+    return False
+
+
 def _remove_accept_encoding(
     headers: Iterable[tuple[bytes, bytes]],
 ) -> Iterator[tuple[bytes, bytes]]:
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from asyncio import Future, get_running_loop, shield
+from collections.abc import AsyncIterator, Iterable, Iterator
+from typing import Any, Optional
+
+from phoenix.server.types import BatchedCaller
+
+
+class _ProjectIds:
+    def __init__(self) -> None:
+        self._ids: set[int] = set()
+
+    @property
+    def empty(self) -> bool:
+        return not self._ids
+
+    def put(self, project_id: int) -> None:
+        self._ids.add(project_id)
+
+    def clear(self) -> None:
+        self._ids.clear()
+
+    def __iter__(self) -> Iterator[int]:
+        yield from self._ids
+
+
+_Notification = tuple[frozenset[int], "Future[Any]"]
+
+
+class ProjectChangeNotifier(BatchedCaller[int]):
+    """
+    Publishes the IDs of the projects whose data changed, compacted into one notification per
+    time window however many changes there were, to any number of subscribers.
+
+    The notifications form a chain of futures, each resolving to the IDs of a notification and
+    the future of the next one, so a notification is published once for all subscribers, and a
+    subscriber that falls behind merges the notifications it missed instead of queueing them.
+    """
+
+    _batch_factory = _ProjectIds
+
+    def __init__(self, *, sleep_seconds: float = 1.0, **kwargs: Any) -> None:
+        super().__init__(sleep_seconds=sleep_seconds, **kwargs)
+        self._next: Optional[Future[_Notification]] = None
+
+    def _get_next(self) -> Future[_Notification]:
+        if self._next is None:
+            self._next = get_running_loop().create_future()
+        return self._next
+
+    async def __call__(self) -> None:
+        current, self._next = self._get_next(), get_running_loop().create_future()
+        current.set_result((frozenset(self._batch), self._next))
+
+    async def subscribe(
+        self,
+        project_ids: Optional[Iterable[int]] = None,
+    ) -> AsyncIterator[frozenset[int]]:
+        """
+        Yields the IDs of the changed projects, among the given ones if any, as they change.
+        """
+        subscribed = None if project_ids is None else frozenset(project_ids)
+        future = self._get_next()
+        while True:
+            # shielded, as cancelling the subscriber would otherwise cancel the shared future
+            changed, future = await shield(future)
+            while future.done():
+                more, future = future.result()
+                changed |= more
+            if subscribed is not None:
+                changed &= subscribed
+            if changed:
+                yield changed
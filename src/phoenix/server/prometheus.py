@@ -12,10 +12,8 @@ from prometheus_client import (
     Summary,
     start_http_server,
 )
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
 from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 REQUESTS_PROCESSING_TIME = Summary(
     name="starlette_requests_processing_time_seconds_summary",
@@ -74,25 +72,38 @@ JWT_STORE_API_KEYS_ACTIVE = Gauge(
 )
 
 
-class PrometheusMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        for route in request.app.routes:
-            match, _ = route.matches(request.scope)
+class PrometheusMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self._app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+        for route in scope["app"].routes:
+            match, _ = route.matches(scope)
             if match is Match.FULL:
                 path = route.path
                 break
         else:
-            return await call_next(request)
-        method = request.method
+            await self._app(scope, receive, send)
+            return
+        method = scope["method"]
         start_time = time.perf_counter()
+
+        async def send_and_observe(message: Message) -> None:
+            # The processing time runs until the response starts, i.e. excludes streaming the body.
+            if message["type"] == "http.response.start":
+                REQUESTS_PROCESSING_TIME.labels(method=method, path=path).observe(
+                    time.perf_counter() - start_time
+                )
+            await send(message)
+
         try:
-            response = await call_next(request)
+            await self._app(scope, receive, send_and_observe)
         except BaseException as e:
             EXCEPTIONS.labels(method=method, path=path, exception_type=type(e).__name__).inc()
             raise
-        end_time = time.perf_counter()
-        REQUESTS_PROCESSING_TIME.labels(method=method, path=path).observe(end_time - start_time)
-        return response
 
 
 def start_prometheus() -> None:
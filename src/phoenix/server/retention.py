@@ -8,17 +8,16 @@ from sqlalchemy.orm import selectinload
 
 from phoenix.db.constants import DEFAULT_PROJECT_TRACE_RETENTION_POLICY_ID
 from phoenix.db.models import Project, ProjectTraceRetentionPolicy
-from phoenix.server.dml_event import SpanDeleteEvent
-from phoenix.server.dml_event_handler import DmlEventHandler
+from phoenix.server.trace_deletion import TraceDeleter
 from phoenix.server.types import DaemonTask, DbSessionFactory
 from phoenix.utilities import hour_of_week
 
 
 class TraceDataSweeper(DaemonTask):
-    def __init__(self, db: DbSessionFactory, dml_event_handler: DmlEventHandler):
+    def __init__(self, db: DbSessionFactory, trace_deleter: TraceDeleter):
         super().__init__()
         self._db = db
-        self._dml_event_handler = dml_event_handler
+        self._trace_deleter = trace_deleter
 
     async def _run(self) -> None:
         """Check hourly and apply policies."""
@@ -58,18 +57,25 @@ class TraceDataSweeper(DaemonTask):
         return True
 
     async def _apply(self, policy: ProjectTraceRetentionPolicy) -> None:
-        project_rowids = (
-            (
-                sa.select(Project.id)
-                .where(Project.trace_retention_policy_id.is_(None))
-                .scalar_subquery()
-            )
-            if policy.id == DEFAULT_PROJECT_TRACE_RETENTION_POLICY_ID
-            else [p.id for p in policy.projects]
-        )
         async with self._db() as session:
-            result = await policy.rule.delete_traces(session, project_rowids)
-        self._dml_event_handler.put(SpanDeleteEvent(tuple(result)))
+            project_rowids = (
+                list(
+                    await session.scalars(
+                        sa.select(Project.id).where(Project.trace_retention_policy_id.is_(None))
+                    )
+                )
+                if policy.id == DEFAULT_PROJECT_TRACE_RETENTION_POLICY_ID
+                else [p.id for p in policy.projects]
+            )
+            start_time_cutoffs = {
+                project_rowid: await policy.rule.get_start_time_cutoff(session, project_rowid)
+                for project_rowid in project_rowids
+            }
+        for project_rowid, start_time_cutoff in start_time_cutoffs.items():
+            if start_time_cutoff is not None:
+                await self._trace_deleter.enqueue(
+                    project_rowid, start_time_before=start_time_cutoff
+                )
 
     async def _sleep_until_next_hour(self) -> None:
         next_hour = self._now().replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
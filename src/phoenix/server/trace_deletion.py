@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import logging
+from asyncio import CancelledError, Event, Future, get_running_loop, shield, sleep
+from datetime import datetime
+from time import perf_counter
+from typing import Optional
+
+import sqlalchemy as sa
+
+from phoenix.db import models
+from phoenix.db.insertion.span import (
+    update_session_io_pointers,
+    update_session_trace_latency_sketches,
+)
+from phoenix.server.dml_event import DmlEvent, ProjectDeleteEvent, SpanDeleteEvent
+from phoenix.server.types import CanPutItem, DaemonTask, DbSessionFactory
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_RETRY_DELAY_SECONDS = 1.0
+MAX_RETRY_DELAY_SECONDS = 300.0
+
+
+class TraceDeleter(DaemonTask):
+    """
+    Deletes the traces of projects, e.g. for retention policies or when projects are cleared or
+    deleted, in batches of consecutive trace rowids, each in its own transaction, so that deleting
+    millions of spans does not hold the database (or, on SQLite, the server's only writer
+    connection) for minutes. Jobs are persisted in the `trace_deletion_jobs` table along with
+    their progress and run one at a time, and the ones left over by a restart are resumed when
+    the deleter starts.
+
+    Jobs awaited by a caller, e.g. when a user clears a project, run before the background ones,
+    e.g. of retention policies, which pause between batches to let them through. A failed job is
+    retried after a delay that doubles with each consecutive failure.
+    """
+
+    def __init__(
+        self,
+        db: DbSessionFactory,
+        event_queue: CanPutItem[DmlEvent],
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_traces_per_second: Optional[float] = None,
+        retry_delay_seconds: float = DEFAULT_RETRY_DELAY_SECONDS,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        if max_traces_per_second is not None and max_traces_per_second <= 0:
+            raise ValueError("max_traces_per_second must be positive")
+        if retry_delay_seconds <= 0:
+            raise ValueError("retry_delay_seconds must be positive")
+        super().__init__()
+        self._db = db
+        self._event_queue = event_queue
+        self._batch_size = batch_size
+        self._min_seconds_per_batch = (
+            batch_size / max_traces_per_second if max_traces_per_second else 0.0
+        )
+        self._retry_delay_seconds = retry_delay_seconds
+        self._wake_up = Event()
+        self._futures: dict[int, Future[int]] = {}
+        self._num_failures: dict[int, int] = {}
+        self._retry_after: dict[int, float] = {}
+
+    async def enqueue(
+        self,
+        project_rowid: int,
+        *,
+        start_time_before: Optional[datetime] = None,
+        delete_project: bool = False,
+    ) -> None:
+        """
+        Persists a job to delete the traces of the project that exist now and, if given, that
+        started before `start_time_before`, followed by the project itself if `delete_project` is
+        set. The job runs in the background.
+        """
+        await self._enqueue(
+            project_rowid,
+            start_time_before=start_time_before,
+            delete_project=delete_project,
+        )
+
+    async def delete(
+        self,
+        project_rowid: int,
+        *,
+        start_time_before: Optional[datetime] = None,
+        delete_project: bool = False,
+    ) -> int:
+        """
+        Like `enqueue`, but waits for the job to finish and returns the number of traces deleted.
+        The job keeps running if the caller is cancelled, e.g. when an HTTP client disconnects.
+        """
+        future: Future[int] = get_running_loop().create_future()
+        await self._enqueue(
+            project_rowid,
+            start_time_before=start_time_before,
+            delete_project=delete_project,
+            future=future,
+        )
+        return await shield(future)
+
+    async def _enqueue(
+        self,
+        project_rowid: int,
+        *,
+        start_time_before: Optional[datetime],
+        delete_project: bool,
+        future: Optional[Future[int]] = None,
+    ) -> None:
+        async with self._db() as session:
+            max_trace_rowid = await session.scalar(
+                sa.select(sa.func.max(models.Trace.id))
+                .where(models.Trace.project_rowid == project_rowid)
+                .where(_started_before(start_time_before))
+            )
+            if max_trace_rowid is None and not delete_project:
+                if future:
+                    future.set_result(0)
+                return
+            job_id = await session.scalar(
+                sa.insert(models.TraceDeletionJob)
+                .values(
+                    project_id=project_rowid,
+                    max_trace_rowid=max_trace_rowid or 0,
+                    start_time_before=start_time_before,
+                    delete_project=delete_project,
+                )
+                .returning(models.TraceDeletionJob.id)
+            )
+            assert job_id is not None
+        # The future is registered once the job is committed, as it makes background jobs pause.
+        if future:
+            self._futures[job_id] = future
+        self._wake_up.set()
+
+    async def start(self) -> None:
+        # Jobs left over by a restart are looked for before the server takes requests.
+        async with self._db() as session:
+            if await session.scalar(sa.select(sa.func.count(models.TraceDeletionJob.id))):
+                self._wake_up.set()
+        await super().start()
+
+    async def _run(self) -> None:
+        while self._running:
+            await self._wake_up.wait()
+            self._wake_up.clear()
+            for job_id in await self._get_job_ids():
+                if self._wake_up.is_set():
+                    # e.g. a job has been enqueued since, which may be awaited by a caller
+                    break
+                try:
+                    num_traces_deleted = await self._run_job(
+                        job_id, pausable=job_id not in self._futures
+                    )
+                except CancelledError:
+                    raise
+                except Exception as e:
+                    logger.exception(f"Failed to delete traces for job {job_id}")
+                    self._retry_later(job_id)
+                    if (future := self._futures.pop(job_id, None)) and not future.done():
+                        future.set_exception(e)
+                    continue
+                if num_traces_deleted is None:
+                    # paused for a job awaited by a caller, and resumed after it
+                    self._wake_up.set()
+                    break
+                self._num_failures.pop(job_id, None)
+                self._retry_after.pop(job_id, None)
+                if (future := self._futures.pop(job_id, None)) and not future.done():
+                    future.set_result(num_traces_deleted)
+
+    async def _get_job_ids(self) -> list[int]:
+        """
+        The jobs awaited by a caller followed by the others, oldest first, among the ones not
+        waiting to be retried.
+        """
+        # The jobs of these futures are committed, so they are found unless they are gone.
+        awaited_job_ids = set(self._futures)
+        async with self._db() as session:
+            job_ids = list(
+                await session.scalars(
+                    sa.select(models.TraceDeletionJob.id).order_by(models.TraceDeletionJob.id)
+                )
+            )
+        for id_ in awaited_job_ids.difference(job_ids):
+            # e.g. the project has been deleted by another job, along with this job
+            if (future := self._futures.pop(id_, None)) and not future.done():
+                future.set_result(0)
+        for id_ in self._retry_after.keys() - set(job_ids):
+            self._num_failures.pop(id_, None)
+            self._retry_after.pop(id_, None)
+        now = get_running_loop().time()
+        job_ids = [id_ for id_ in job_ids if self._retry_after.get(id_, now) <= now]
+        return sorted(job_ids, key=lambda id_: id_ not in self._futures)
+
+    def _retry_later(self, job_id: int) -> None:
+        # The job stays in the table and is retried after the delay, or after a restart.
+        num_failures = self._num_failures[job_id] = self._num_failures.get(job_id, 0) + 1
+        delay = min(self._retry_delay_seconds * 2 ** (num_failures - 1), MAX_RETRY_DELAY_SECONDS)
+        loop = get_running_loop()
+        self._retry_after[job_id] = loop.time() + delay
+        loop.call_later(delay, self._wake_up.set)
+
+    async def _run_job(self, job_id: int, *, pausable: bool = False) -> Optional[int]:
+        """
+        Runs the job and returns the number of traces deleted, or None if the job is `pausable`
+        and has paused between batches for a job awaited by a caller. Its progress is persisted,
+        so it picks up where it left off when it is run again.
+        """
+        async with self._db() as session:
+            job = await session.get(models.TraceDeletionJob, job_id)
+        if job is None:
+            # e.g. the project has been deleted by another job
+            return 0
+        project_rowid = job.project_id
+        num_traces_deleted = job.num_traces_deleted
+        traces = (
+            sa.select(models.Trace.id)
+            .where(models.Trace.project_rowid == project_rowid)
+            .where(models.Trace.id <= job.max_trace_rowid)
+            .where(_started_before(job.start_time_before))
+        )
+        while True:
+            start_time = perf_counter()
+            async with self._db() as session:
+                trace_rowids = list(
+                    await session.scalars(traces.order_by(models.Trace.id).limit(self._batch_size))
+                )
+                if not trace_rowids:
+                    break
+                # The traces matching the job in this range of rowids are those just selected.
+                project_session_rowids = set(
+                    await session.scalars(
+                        sa.delete(models.Trace)
+                        .where(models.Trace.id.between(trace_rowids[0], trace_rowids[-1]))
+                        .where(models.Trace.project_rowid == project_rowid)
+                        .where(_started_before(job.start_time_before))
+                        .returning(models.Trace.project_session_rowid)
+                    )
+                )
+                if project_session_rowids := {id_ for id_ in project_session_rowids if id_}:
+                    await session.execute(
+                        sa.delete(models.ProjectSession)
+                        .where(models.ProjectSession.id.in_(project_session_rowids))
+                        .where(
+                            ~sa.exists().where(
+                                models.Trace.project_session_rowid == models.ProjectSession.id
+                            )
+                        )
+                    )
+                    # A session whose traces are deleted over several batches survives the
+                    # batches before the last one, so its pointers are moved to its traces left,
+                    # and its latency sketch is rebuilt from them.
+                    await update_session_io_pointers(session, *project_session_rowids)
+                    await update_session_trace_latency_sketches(session, *project_session_rowids)
+                num_traces_deleted += len(trace_rowids)
+                await session.execute(
+                    sa.update(models.TraceDeletionJob)
+                    .where(models.TraceDeletionJob.id == job_id)
+                    .values(num_traces_deleted=num_traces_deleted)
+                )
+            self._event_queue.put(SpanDeleteEvent((project_rowid,)))
+            logger.debug(
+                f"Deleted {num_traces_deleted} traces so far for job {job_id} "
+                f"on project {project_rowid}"
+            )
+            await sleep(max(0.0, self._min_seconds_per_batch - (perf_counter() - start_time)))
+            if pausable and self._futures:
+                return None
+        async with self._db() as session:
+            if job.delete_project:
+                # The job is deleted along with the project by the cascade.
+                await session.execute(
+                    sa.delete(models.Project).where(models.Project.id == project_rowid)
+                )
+            else:
+                await session.execute(
+                    sa.delete(models.TraceDeletionJob).where(models.TraceDeletionJob.id == job_id)
+                )
+        if job.delete_project:
+            self._event_queue.put(ProjectDeleteEvent((project_rowid,)))
+        logger.info(
+            f"Deleted {num_traces_deleted} traces"
+            + (" and the project" if job.delete_project else "")
+            + f" for job {job_id} on project {project_rowid}"
+        )
+        return num_traces_deleted
+
+
+def _started_before(start_time: Optional[datetime]) -> sa.ColumnElement[bool]:
+    if start_time is None:
+        return sa.true()
+    return models.Trace.start_time < start_time
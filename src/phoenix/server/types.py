@@ -30,9 +30,19 @@ class DbSessionFactory:
         self,
         db: Callable[[], AbstractAsyncContextManager[AsyncSession]],
         dialect: str,
+        read_db: Optional[Callable[[], AbstractAsyncContextManager[AsyncSession]]] = None,
     ):
         self._db = db
         self.dialect = SupportedSQLDialect(dialect)
+        self.span_io_index_enabled = False
+        """Whether the full-text search index on span input and output values is available."""
+        self.reader: DbSessionFactory = self
+        """
+        The session factory for work that only reads, e.g. data loaders and queries. It is backed
+        by a pool of read-only connections when `read_db` is given, and is this factory otherwise.
+        """
+        if read_db is not None:
+            self.reader = DbSessionFactory(read_db, dialect)
 
     def __call__(self) -> AbstractAsyncContextManager[AsyncSession]:
         return self._db()
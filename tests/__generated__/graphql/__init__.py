@@ -549,6 +549,27 @@ class ExperimentComparison(BaseModel):
     runComparisonItems: list[RunComparisonItem]
 
 
+class ExperimentComparisonAggregate(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    annotationSummaries: list[ExperimentAnnotationSummary]
+    averageRunLatencyMs: Optional[float] = None
+    errorRate: Optional[float] = None
+    experimentId: str
+    runCount: int
+
+
+class ExperimentComparisonConnection(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    edges: list[ExperimentComparisonEdge] = Field(...)
+    pageInfo: PageInfo = Field(...)
+
+
+class ExperimentComparisonEdge(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    cursor: str = Field(...)
+    node: ExperimentComparison = Field(...)
+
+
 class ExperimentConnection(BaseModel):
     model_config = ConfigDict(frozen=True)
     edges: list[ExperimentEdge] = Field(...)
@@ -1537,6 +1558,8 @@ class ChatCompletionOverDatasetInput(BaseModel):
     experimentMetadata: Optional[dict[str, Any]] = {}
     experimentName: Optional[str] = None
     invocationParameters: list[InvocationParameterInput]
+    maxConcurrency: Optional[int] = None
+    maxRequestsPerSecond: Optional[float] = None
     messages: list[ChatCompletionMessageInput]
     model: GenerativeModelInput
     promptName: Optional[str] = None
@@ -1938,7 +1961,14 @@ class PerformanceMetricInput(BaseModel):
 
 class ProjectSessionSort(BaseModel):
     model_config = ConfigDict(frozen=True)
-    col: Literal["endTime", "numTraces", "startTime", "tokenCountTotal"]
+    col: Literal[
+        "endTime",
+        "numTraces",
+        "startTime",
+        "tokenCountTotal",
+        "traceLatencyMsP50",
+        "traceLatencyMsP99",
+    ]
     dir: Literal["asc", "desc"]
 
 
@@ -0,0 +1,128 @@
+from datetime import datetime, timedelta, timezone
+from secrets import token_hex
+from typing import Any
+
+import pytest
+from alembic.config import Config
+from phoenix.db.models import JSON_
+from sqlalchemy import Column, Engine, MetaData, Table, insert, select
+
+from . import _down, _up, _version_num
+
+
+def test_data_migration_for_root_span_io_columns(
+    _engine: Engine,
+    _alembic_config: Config,
+) -> None:
+    with pytest.raises(BaseException, match="alembic_version"):
+        _version_num(_engine)
+
+    _up(_engine, _alembic_config, "8a3764fe7f1a")
+
+    metadata = MetaData()
+    metadata.reflect(bind=_engine)
+    table_projects = metadata.tables["projects"]
+    table_project_sessions = metadata.tables["project_sessions"]
+    table_traces = metadata.tables["traces"]
+    table_spans = Table(
+        "spans",
+        MetaData(),
+        Column("attributes", JSON_),
+        Column("events", JSON_),
+        autoload_with=_engine,
+    )
+
+    start_time = datetime.now(timezone.utc)
+
+    def span(trace_rowid: int, parent_id: Any, attributes: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "span_id": token_hex(8),
+            "parent_id": parent_id,
+            "name": token_hex(4),
+            "span_kind": "LLM",
+            "trace_rowid": trace_rowid,
+            "start_time": start_time,
+            "end_time": start_time,
+            "status_message": "",
+            "cumulative_error_count": 0,
+            "cumulative_llm_token_count_prompt": 0,
+            "cumulative_llm_token_count_completion": 0,
+            "events": [],
+            "attributes": attributes,
+        }
+
+    with _engine.connect() as conn:
+        project_rowid = conn.scalar(
+            insert(table_projects).values(name=token_hex(8)).returning(table_projects.c.id)
+        )
+        session_rowid = conn.scalar(
+            insert(table_project_sessions)
+            .values(
+                session_id=token_hex(8),
+                project_id=project_rowid,
+                start_time=start_time,
+                end_time=start_time,
+            )
+            .returning(table_project_sessions.c.id)
+        )
+        trace_rowids = conn.scalars(
+            insert(table_traces).returning(table_traces.c.id),
+            [
+                {
+                    "trace_id": token_hex(16),
+                    "project_rowid": project_rowid,
+                    "project_session_rowid": session_rowid,
+                    "start_time": start_time + timedelta(seconds=i),
+                    "end_time": start_time + timedelta(seconds=i),
+                }
+                for i in range(3)
+            ],
+        ).all()
+        root_span_rowids = conn.scalars(
+            insert(table_spans).returning(table_spans.c.id),
+            [
+                span(
+                    trace_rowid,
+                    None,
+                    {
+                        "input": {"value": f"{i}" * 200, "mime_type": "text/plain"},
+                        "output": {"value": f"{-i}"},
+                    },
+                )
+                for i, trace_rowid in enumerate(trace_rowids)
+            ],
+        ).all()
+        conn.execute(
+            insert(table_spans),
+            [span(trace_rowid, token_hex(8), {}) for trace_rowid in trace_rowids],
+        )
+        conn.commit()
+
+    for _ in range(2):
+        _up(_engine, _alembic_config, "407f36866bf0")
+        metadata = MetaData()
+        metadata.reflect(bind=_engine)
+        table_project_sessions = metadata.tables["project_sessions"]
+        table_traces = metadata.tables["traces"]
+        with _engine.connect() as conn:
+            traces = conn.execute(
+                select(
+                    table_traces.c.root_span_rowid,
+                    table_traces.c.input_value_first_101_chars,
+                    table_traces.c.input_mime_type,
+                    table_traces.c.output_value_first_101_chars,
+                    table_traces.c.output_mime_type,
+                ).order_by(table_traces.c.id)
+            ).all()
+            pointers = conn.execute(
+                select(
+                    table_project_sessions.c.first_input_trace_rowid,
+                    table_project_sessions.c.last_output_trace_rowid,
+                )
+            ).one()
+        assert [tuple(trace) for trace in traces] == [
+            (root_span_rowid, f"{i}" * 101, "text/plain", f"{-i}", None)
+            for i, root_span_rowid in enumerate(root_span_rowids)
+        ]
+        assert tuple(pointers) == (trace_rowids[0], trace_rowids[-1])
+        _down(_engine, _alembic_config, "8a3764fe7f1a")
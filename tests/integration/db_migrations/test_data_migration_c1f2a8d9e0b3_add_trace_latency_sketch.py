@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta, timezone
+from secrets import token_hex
+
+import pytest
+from alembic.config import Config
+from phoenix.db.models import JSON_
+from phoenix.db.types.latency_sketch import LatencySketch
+from sqlalchemy import Column, Engine, MetaData, Table, insert, select
+
+from . import _down, _up, _version_num
+
+
+def test_data_migration_for_trace_latency_sketch(
+    _engine: Engine,
+    _alembic_config: Config,
+) -> None:
+    with pytest.raises(BaseException, match="alembic_version"):
+        _version_num(_engine)
+
+    _up(_engine, _alembic_config, "407f36866bf0")
+
+    metadata = MetaData()
+    metadata.reflect(bind=_engine)
+    table_projects = metadata.tables["projects"]
+    table_project_sessions = metadata.tables["project_sessions"]
+    table_traces = metadata.tables["traces"]
+
+    start_time = datetime.now(timezone.utc)
+    latencies_ms = [0, 1500, 250, 4000]
+
+    with _engine.connect() as conn:
+        project_rowid = conn.scalar(
+            insert(table_projects).values(name=token_hex(8)).returning(table_projects.c.id)
+        )
+        session_rowid, session_rowid_without_traces = conn.scalars(
+            insert(table_project_sessions).returning(table_project_sessions.c.id),
+            [
+                {
+                    "session_id": token_hex(8),
+                    "project_id": project_rowid,
+                    "start_time": start_time,
+                    "end_time": start_time,
+                }
+                for _ in range(2)
+            ],
+        ).all()
+        conn.execute(
+            insert(table_traces),
+            [
+                {
+                    "trace_id": token_hex(16),
+                    "project_rowid": project_rowid,
+                    "project_session_rowid": session_rowid,
+                    "start_time": start_time,
+                    "end_time": start_time + timedelta(milliseconds=latency_ms),
+                }
+                for latency_ms in latencies_ms
+            ],
+        )
+        conn.commit()
+
+    expected_sketch = LatencySketch.from_values(latencies_ms)
+    for _ in range(2):
+        _up(_engine, _alembic_config, "c1f2a8d9e0b3")
+        table_project_sessions = Table(
+            "project_sessions",
+            MetaData(),
+            Column("trace_latency_ms_sketch", JSON_),
+            autoload_with=_engine,
+        )
+        with _engine.connect() as conn:
+            rows = {
+                row.id: row
+                for row in conn.execute(
+                    select(
+                        table_project_sessions.c.id,
+                        table_project_sessions.c.trace_latency_ms_sketch,
+                        table_project_sessions.c.trace_latency_ms_p50,
+                        table_project_sessions.c.trace_latency_ms_p99,
+                    )
+                )
+            }
+        row = rows[session_rowid]
+        assert LatencySketch.model_validate(row.trace_latency_ms_sketch) == expected_sketch
+        assert row.trace_latency_ms_p50 == pytest.approx(expected_sketch.quantile(0.5))
+        assert row.trace_latency_ms_p99 == pytest.approx(expected_sketch.quantile(0.99))
+        row = rows[session_rowid_without_traces]
+        assert row.trace_latency_ms_sketch is None
+        assert row.trace_latency_ms_p50 is None
+        assert row.trace_latency_ms_p99 is None
+        _down(_engine, _alembic_config, "407f36866bf0")
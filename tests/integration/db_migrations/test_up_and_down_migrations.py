@@ -308,3 +308,23 @@ def test_up_and_down_migrations(
         _up(_engine, _alembic_config, "8a3764fe7f1a")
         _down(_engine, _alembic_config, "bb8139330879")
     _up(_engine, _alembic_config, "8a3764fe7f1a")
+
+    for _ in range(2):
+        _up(_engine, _alembic_config, "407f36866bf0")
+        _down(_engine, _alembic_config, "8a3764fe7f1a")
+    _up(_engine, _alembic_config, "407f36866bf0")
+
+    for _ in range(2):
+        _up(_engine, _alembic_config, "c1f2a8d9e0b3")
+        _down(_engine, _alembic_config, "407f36866bf0")
+    _up(_engine, _alembic_config, "c1f2a8d9e0b3")
+
+    for _ in range(2):
+        _up(_engine, _alembic_config, "e2f4a7c9b1d3")
+        _down(_engine, _alembic_config, "c1f2a8d9e0b3")
+    _up(_engine, _alembic_config, "e2f4a7c9b1d3")
+
+    for _ in range(2):
+        _up(_engine, _alembic_config, "a6b1c3d5e7f9")
+        _down(_engine, _alembic_config, "e2f4a7c9b1d3")
+    _up(_engine, _alembic_config, "a6b1c3d5e7f9")
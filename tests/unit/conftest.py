@@ -32,6 +32,7 @@ from phoenix.core.model_schema_adapter import create_model_from_inferences
 from phoenix.db import models
 from phoenix.db.bulk_inserter import BulkInserter
 from phoenix.db.engines import aio_postgresql_engine, aio_sqlite_engine
+from phoenix.db.insertion.experiment_run import ExperimentRunInsertion
 from phoenix.db.insertion.helpers import DataManipulation
 from phoenix.inferences.inferences import EMPTY_INFERENCES
 from phoenix.pointcloud.umap_parameters import get_umap_parameters
@@ -328,6 +329,20 @@ class TestBulkInserter(BulkInserter):
     async def _queue_evaluation_immediate(self, evaluation: pb.Evaluation) -> None:
         await self._insert_evaluations([evaluation])
 
+    def queue_experiment_runs(self, *insertions: ExperimentRunInsertion) -> asyncio.Future[None]:
+        # Insert immediately instead of waiting for the background task
+        future = super().queue_experiment_runs(*insertions)
+        batches, self._experiment_runs = self._experiment_runs, []
+        return asyncio.ensure_future(self._insert_then_await(batches, future))
+
+    async def _insert_then_await(
+        self,
+        batches: list[tuple[tuple[ExperimentRunInsertion, ...], asyncio.Future[None]]],
+        future: asyncio.Future[None],
+    ) -> None:
+        await self._insert_experiment_runs(batches)
+        await future
+
 
 @contextlib.asynccontextmanager
 async def patch_batched_caller() -> AsyncIterator[None]:
@@ -0,0 +1,89 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from phoenix.core.embedding_array import EmbeddingArray
+from phoenix.core.model_schema import Column
+from phoenix.metrics.metrics import EuclideanDistance, VectorMean, VectorSum
+
+vectors = [
+    np.array([1, 2, 3]),
+    None,
+    np.array([4, 5, 6]),
+    np.nan,
+    np.array([7, 8]),  # malformed
+    np.array([10, 11, 12]),
+]
+
+
+def test_from_vectors_masks_missing_and_malformed_vectors() -> None:
+    array = EmbeddingArray.from_vectors(vectors)
+    assert array.matrix.dtype == np.float32
+    assert array.matrix.flags.c_contiguous
+    assert array.mask.tolist() == [True, False, True, False, False, True]
+    assert array.valid_vectors().tolist() == [[1, 2, 3], [4, 5, 6], [10, 11, 12]]
+    series = pd.Series(array)
+    assert series.isna().tolist() == [False, True, False, True, True, False]
+    assert series.iloc[2].tolist() == [4, 5, 6]
+    assert np.isnan(series.iloc[1])
+    assert len(series.dropna()) == 3
+
+
+def test_slicing_and_concatenation_preserve_array_type() -> None:
+    df = pd.DataFrame({"v": EmbeddingArray.from_vectors(vectors), "g": [0, 0, 1, 1, 2, 2]})
+    assert isinstance(df.iloc[1:4]["v"].array, EmbeddingArray)
+    assert isinstance(df.sort_values("g", ascending=False)["v"].array, EmbeddingArray)
+    for _, group in df.groupby("g"):
+        assert isinstance(group["v"].array, EmbeddingArray)
+    concatenated = pd.concat([df.iloc[:2], df.iloc[:0], df.iloc[5:]])["v"].array
+    assert isinstance(concatenated, EmbeddingArray)
+    assert concatenated.mask.tolist() == [True, False, True]
+    assert concatenated.matrix[2].tolist() == [10, 11, 12]
+    filled = EmbeddingArray.from_vectors(vectors).take([0, -1], allow_fill=True)
+    assert filled.mask.tolist() == [True, False]
+
+
+def test_from_vectors_can_memory_map(tmp_path: Path) -> None:
+    path = tmp_path / "embeddings.npy"
+    array = EmbeddingArray.from_vectors(vectors, path=path)
+    assert isinstance(array.matrix, np.memmap)
+    array.matrix.flush()
+    assert np.load(path).tolist() == array.matrix.tolist()
+
+
+def test_parquet_roundtrip(tmp_path: Path) -> None:
+    path = tmp_path / "embeddings.parquet"
+    pd.DataFrame({"v": EmbeddingArray.from_vectors(vectors)}).to_parquet(path)
+    actual = pd.read_parquet(path)["v"]
+    assert isinstance(actual.array, EmbeddingArray)
+    assert actual.isna().tolist() == [False, True, False, True, True, False]
+    assert list(actual.iloc[5]) == [10, 11, 12]
+
+
+@pytest.mark.parametrize(
+    "metric",
+    [
+        VectorSum(operand=Column("v"), shape=3),
+        VectorMean(operand=Column("v"), shape=3),
+        EuclideanDistance(
+            operand=Column("v"),
+            reference_data=pd.DataFrame({"v": [np.array([0, 0, 0]), np.array([2, 2, 2])]}),
+        ),
+    ],
+)
+def test_vector_metrics_match_object_columns(
+    metric: VectorSum | VectorMean | EuclideanDistance,
+) -> None:
+    objects = pd.DataFrame({"v": pd.Series(vectors, dtype=object)})
+    objects.iloc[4, 0] = np.nan
+    embeddings = pd.DataFrame({"v": EmbeddingArray.from_vectors(vectors)})
+    assert np.allclose(
+        metric.get_value({metric.id(): metric.calc(objects)}),
+        metric.get_value({metric.id(): metric.calc(embeddings)}),
+    )
+    assert np.allclose(
+        metric.get_value({metric.id(): metric.calc(objects.iloc[[1, 2, 4]])}),
+        metric.get_value({metric.id(): metric.calc(embeddings.iloc[[1, 2, 4]])}),
+    )
@@ -1,10 +1,14 @@
+import gc
 from collections.abc import Iterable
+from io import BytesIO
 from itertools import chain
+from pathlib import Path
 from random import random
 from typing import Any, Union
 
 import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 import pytest
 from pandas.testing import assert_series_equal
 
@@ -335,6 +339,83 @@ def test_embedding_dimensions_extraction() -> None:
     ) == {"E": FEATURE, "F": TAG, "G": PROMPT}
 
 
+def test_embedding_mmap_files_are_deleted_with_the_model(tmp_path: Path) -> None:
+    model = Schema(prediction_id="A", features=[Embedding("B"), Embedding("C")])(
+        pd.DataFrame(
+            {
+                "A": ["a", "b"],
+                "B": [np.array([1, 2]), np.array([3, 4])],
+                "C": [np.array([5]), None],
+            }
+        ),
+        embedding_mmap_dir=tmp_path,
+    )
+    [mmap_dir] = tmp_path.iterdir()
+    assert sorted(path.name for path in mmap_dir.iterdir()) == ["primary-0.npy", "primary-1.npy"]
+    assert [vector.tolist() for vector in model[PRIMARY]["B"]] == [[1, 2], [3, 4]]
+    del model
+    gc.collect()
+    assert not list(tmp_path.iterdir())
+
+
+def test_export_rows_as_parquet_file() -> None:
+    model = Schema(
+        prediction_id="A",
+        features=["B", "C", "D", Embedding("E")],
+    )(
+        (
+            "primary",
+            pd.DataFrame(
+                {
+                    "A": ["a", "b", "c"],
+                    "B": [1, 2, 3],
+                    "C": [None, "x", None],
+                    "E": [np.array([1, 2]), None, np.array([3, 4])],
+                }
+            ),
+        ),
+        (
+            "reference",
+            pd.DataFrame(
+                {
+                    "A": ["d", "e"],
+                    "B": [0.5, None],
+                    "D": ["y", "z"],
+                    "E": [np.array([5, 6]), np.array([7, 8])],
+                }
+            ),
+        ),
+    )
+    progress: list[tuple[int, int]] = []
+    parquet_file = BytesIO()
+    model.export_rows_as_parquet_file(
+        {PRIMARY: [2, 0, 2, 1], REFERENCE: [1]},
+        parquet_file,
+        {PRIMARY: {0: "0", 2: "1"}},
+        row_group_size=2,
+        progress=lambda written, total: progress.append((written, total)),
+    )
+    assert progress == [(2, 4), (3, 4), (4, 4)]
+    assert pq.ParquetFile(parquet_file).metadata.num_row_groups == 3
+    df = pd.read_parquet(parquet_file)
+    assert df.columns.tolist() == [
+        "A",
+        "B",
+        "C",
+        "E",
+        "__phoenix_dataset_name__",
+        "__phoenix_cluster_id__",
+        "D",
+    ]
+    assert df["A"].tolist() == ["a", "b", "c", "e"]
+    assert df["B"].tolist()[:3] == [1, 2, 3] and np.isnan(df["B"].iloc[3])
+    assert df["C"].tolist() == [None, "x", None, None]
+    assert df["D"].tolist() == [None, None, None, "z"]
+    assert [None if v is None else v.tolist() for v in df["E"]] == [[1, 2], None, [3, 4], [7, 8]]
+    assert df["__phoenix_dataset_name__"].tolist() == ["primary"] * 3 + ["reference"]
+    assert df["__phoenix_cluster_id__"].tolist() == ["0", None, "1", None]
+
+
 def test_raise_if_dim_role_is_unassigned() -> None:
     with pytest.raises(ValueError):
         _ = Dimension()
@@ -0,0 +1,105 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, insert, select
+
+from phoenix.db import models
+from phoenix.db.insertion.experiment_run import ExperimentRunInsertion, insert_experiment_runs
+from phoenix.server.types import DbSessionFactory
+
+
+async def test_insert_experiment_runs(
+    db: DbSessionFactory,
+) -> None:
+    start_time = datetime.now(timezone.utc)
+    end_time = start_time + timedelta(seconds=1)
+    async with db() as session:
+        project_id = await session.scalar(
+            insert(models.Project).values(name="playground").returning(models.Project.id)
+        )
+        dataset_id = await session.scalar(
+            insert(models.Dataset).values(name="abc", metadata_={}).returning(models.Dataset.id)
+        )
+        version_id = await session.scalar(
+            insert(models.DatasetVersion)
+            .values(dataset_id=dataset_id, metadata_={})
+            .returning(models.DatasetVersion.id)
+        )
+        example_ids = list(
+            await session.scalars(
+                insert(models.DatasetExample)
+                .values([dict(dataset_id=dataset_id) for _ in range(3)])
+                .returning(models.DatasetExample.id)
+            )
+        )
+        experiment_id = await session.scalar(
+            insert(models.Experiment)
+            .values(
+                dataset_id=dataset_id,
+                dataset_version_id=version_id,
+                name="experiment",
+                repetitions=1,
+                metadata_={},
+            )
+            .returning(models.Experiment.id)
+        )
+    assert project_id is not None and experiment_id is not None
+    insertions = []
+    for i, example_id in enumerate(example_ids):
+        run = models.ExperimentRun(
+            experiment_id=experiment_id,
+            dataset_example_id=example_id,
+            repetition_number=1,
+            output={"task_output": i},
+            start_time=start_time,
+            end_time=end_time,
+        )
+        if i == 0:
+            # a run without a span, e.g. when the prompt template failed to format
+            insertions.append(ExperimentRunInsertion(run=run))
+            continue
+        trace = models.Trace(
+            project_rowid=project_id,
+            trace_id=f"trace-{i}",
+            start_time=start_time,
+            end_time=end_time,
+        )
+        span = models.Span(
+            span_id=f"span-{i}",
+            parent_id=None,
+            name="ChatCompletion",
+            span_kind="LLM",
+            start_time=start_time,
+            end_time=end_time,
+            attributes={},
+            events=[],
+            status_code="OK",
+            status_message="",
+            cumulative_error_count=0,
+            cumulative_llm_token_count_prompt=0,
+            cumulative_llm_token_count_completion=0,
+            trace=trace,
+        )
+        run.trace_id = trace.trace_id
+        insertions.append(ExperimentRunInsertion(run=run, span=span))
+    async with db() as session:
+        project_ids = await insert_experiment_runs(session, *insertions)
+    assert project_ids == {project_id}
+    async with db() as session:
+        assert await session.scalar(select(func.count(models.Trace.id))) == 2
+        span_rowids = dict(
+            (await session.execute(select(models.Span.span_id, models.Span.id))).tuples().all()
+        )
+        run_rowids = dict(
+            (
+                await session.execute(
+                    select(models.ExperimentRun.dataset_example_id, models.ExperimentRun.id)
+                )
+            )
+            .tuples()
+            .all()
+        )
+    for insertion in insertions:
+        assert insertion.run.id == run_rowids[insertion.run.dataset_example_id]
+        if (span := insertion.span) is not None:
+            assert span.id == span_rowids[span.span_id]
+            assert span.trace_rowid == span.trace.id
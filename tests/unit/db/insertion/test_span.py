@@ -0,0 +1,125 @@
+from datetime import datetime, timedelta, timezone
+from secrets import token_hex
+from typing import Any, Optional
+
+import pytest
+from sqlalchemy import select
+
+from phoenix.db import models
+from phoenix.db.insertion.span import insert_span
+from phoenix.server.types import DbSessionFactory
+from phoenix.trace.schemas import Span, SpanContext, SpanKind, SpanStatusCode
+
+
+def _span(
+    trace_id: str,
+    start_time: datetime,
+    attributes: dict[str, Any],
+    parent_id: Optional[str] = None,
+) -> Span:
+    return Span(
+        name="span",
+        context=SpanContext(trace_id=trace_id, span_id=token_hex(8)),
+        span_kind=SpanKind.LLM,
+        parent_id=parent_id,
+        start_time=start_time,
+        end_time=start_time + timedelta(seconds=1),
+        status_code=SpanStatusCode.OK,
+        status_message="",
+        attributes=attributes,
+        events=[],
+        conversation=None,
+    )
+
+
+async def test_insert_span_maintains_root_span_io(
+    db: DbSessionFactory,
+) -> None:
+    start_time = datetime.now(timezone.utc)
+    session_attributes = {"session": {"id": "abc"}}
+    trace_ids = [token_hex(16) for _ in range(3)]
+    spans = [
+        # a child span arriving before its root span should not be recorded as the root span
+        _span(trace_ids[1], start_time, {}, parent_id=token_hex(8)),
+        _span(
+            trace_ids[1],
+            start_time,
+            {
+                **session_attributes,
+                "input": {"value": "x" * 200, "mime_type": "text/plain"},
+                "output": {"value": "1"},
+            },
+        ),
+        _span(
+            trace_ids[2],
+            start_time + timedelta(seconds=1),
+            {**session_attributes, "output": {"value": "2"}},
+        ),
+        # an earlier trace arriving late becomes the first input of the session
+        _span(
+            trace_ids[0],
+            start_time - timedelta(seconds=1),
+            {**session_attributes, "input": {"value": "0"}},
+        ),
+    ]
+    for span in spans:
+        async with db() as session:
+            await insert_span(session, span, "abc")
+    async with db() as session:
+        traces = {trace.trace_id: trace for trace in await session.scalars(select(models.Trace))}
+        root_span_rowids = dict(
+            (
+                await session.execute(
+                    select(models.Span.trace_rowid, models.Span.id).where(
+                        models.Span.parent_id.is_(None)
+                    )
+                )
+            )
+            .tuples()
+            .all()
+        )
+        project_session = await session.scalar(select(models.ProjectSession))
+    for trace in traces.values():
+        assert trace.root_span_rowid == root_span_rowids[trace.id]
+    trace = traces[trace_ids[1]]
+    assert trace.input_value_first_101_chars == "x" * 101
+    assert trace.input_mime_type == "text/plain"
+    assert trace.output_value_first_101_chars == "1"
+    assert trace.output_mime_type is None
+    trace = traces[trace_ids[2]]
+    assert trace.input_value_first_101_chars is None
+    assert trace.output_value_first_101_chars == "2"
+    assert project_session is not None
+    assert project_session.first_input_trace_rowid == traces[trace_ids[0]].id
+    assert project_session.last_output_trace_rowid == traces[trace_ids[2]].id
+    sketch = project_session.trace_latency_ms_sketch
+    assert sketch is not None
+    assert sketch.count == len(traces)
+    assert project_session.trace_latency_ms_p50 == pytest.approx(1000, rel=0.01)
+    assert project_session.trace_latency_ms_p99 == pytest.approx(1000, rel=0.01)
+
+
+async def test_insert_span_maintains_trace_latency_sketch(
+    db: DbSessionFactory,
+) -> None:
+    start_time = datetime.now(timezone.utc)
+    attributes = {"session": {"id": "abc"}}
+    trace_ids = [token_hex(16) for _ in range(2)]
+    spans = [
+        _span(trace_ids[0], start_time, attributes),
+        _span(trace_ids[1], start_time, attributes),
+        # extends the latency of the second trace from 1 to 10 seconds
+        _span(trace_ids[1], start_time + timedelta(seconds=9), {}, parent_id=token_hex(8)),
+    ]
+    for span in spans:
+        async with db() as session:
+            await insert_span(session, span, "abc")
+    async with db() as session:
+        project_session = await session.scalar(select(models.ProjectSession))
+    assert project_session is not None
+    sketch = project_session.trace_latency_ms_sketch
+    assert sketch is not None
+    assert sketch.count == 2
+    assert sketch.quantile(0) == pytest.approx(1000, rel=0.01)
+    assert sketch.quantile(1) == pytest.approx(10000, rel=0.01)
+    assert project_session.trace_latency_ms_p99 == pytest.approx(1000, rel=0.01)
@@ -1,4 +1,11 @@
-from phoenix.db.engines import get_async_db_url
+from pathlib import Path
+
+import pytest
+import sqlean
+from sqlalchemy import func, insert, select
+
+from phoenix.db import models
+from phoenix.db.engines import aio_sqlite_engine, create_reader_engine, get_async_db_url
 
 
 def test_get_async_sqlite_db_url() -> None:
@@ -28,3 +35,37 @@ def test_get_async_postgresql_db_url() -> None:
     # NB(mikeldking): No idea why this fails to authenticate
     assert url.query["user"] == "user"
     assert url.query["password"] == "password"
+
+
+@pytest.mark.parametrize(
+    "connection_str,pool_size",
+    [
+        pytest.param("sqlite:///phoenix.db", 0, id="disabled"),
+        pytest.param("sqlite:///:memory:", 4, id="in-memory"),
+        pytest.param("postgresql://localhost:5432/phoenix", 4, id="postgresql"),
+    ],
+)
+def test_create_reader_engine_returns_none_when_reads_share_the_engine(
+    connection_str: str,
+    pool_size: int,
+) -> None:
+    assert create_reader_engine(connection_str, pool_size=pool_size) is None
+
+
+async def test_reader_engine_reads_concurrently_and_does_not_write(tmp_path: Path) -> None:
+    connection_str = f"sqlite:///{tmp_path / 'phoenix.db'}"
+    engine = aio_sqlite_engine(get_async_db_url(connection_str), migrate=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(models.Base.metadata.create_all)
+        await conn.execute(insert(models.Project).values(name="abc"))
+    reader_engine = create_reader_engine(connection_str, pool_size=2)
+    assert reader_engine is not None
+    try:
+        async with reader_engine.connect() as conn_1, reader_engine.connect() as conn_2:
+            assert await conn_1.scalar(select(func.count(models.Project.id))) == 1
+            assert await conn_2.scalar(select(func.count(models.Project.id))) == 1
+            with pytest.raises(sqlean.OperationalError, match="readonly"):
+                await conn_1.execute(insert(models.Project).values(name="xyz"))
+    finally:
+        await reader_engine.dispose()
+        await engine.dispose()
@@ -0,0 +1,113 @@
+from datetime import datetime, timezone
+from secrets import token_hex
+from typing import Any
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+from sqlalchemy import delete, insert, select
+
+from phoenix.config import ENV_PHOENIX_ENABLE_FULL_TEXT_SEARCH
+from phoenix.db import full_text_search, models
+from phoenix.db.facilitator import _ensure_span_io_index
+from phoenix.db.full_text_search import span_io_contains
+from phoenix.db.helpers import SupportedSQLDialect
+from phoenix.server.types import DbSessionFactory
+
+
+async def _insert_spans(db: DbSessionFactory, *attributes: dict[str, Any]) -> list[int]:
+    now = datetime.now(timezone.utc)
+    async with db() as session:
+        project_id = await session.scalar(
+            insert(models.Project).values(name=token_hex(8)).returning(models.Project.id)
+        )
+        trace_rowid = await session.scalar(
+            insert(models.Trace)
+            .values(project_rowid=project_id, trace_id=token_hex(16), start_time=now, end_time=now)
+            .returning(models.Trace.id)
+        )
+        return list(
+            await session.scalars(
+                insert(models.Span)
+                .values(
+                    [
+                        dict(
+                            trace_rowid=trace_rowid,
+                            span_id=token_hex(8),
+                            name="span",
+                            span_kind="LLM",
+                            start_time=now,
+                            end_time=now,
+                            attributes=attrs,
+                            events=[],
+                            status_code="OK",
+                            status_message="",
+                            cumulative_error_count=0,
+                            cumulative_llm_token_count_prompt=0,
+                            cumulative_llm_token_count_completion=0,
+                        )
+                        for attrs in attributes
+                    ]
+                )
+                .returning(models.Span.id)
+            )
+        )
+
+
+async def _matches(db: DbSessionFactory, substring: str, indexed: bool) -> set[int]:
+    async with db() as session:
+        return set(
+            await session.scalars(
+                select(models.Span.id).where(
+                    span_io_contains(substring, db.dialect, indexed=indexed)
+                )
+            )
+        )
+
+
+@pytest.mark.parametrize("substring", ["hello", "Hello", "lo wo", 'say "hi"', "%_", "xyz", "o"])
+async def test_span_io_contains_agrees_with_scan(
+    db: DbSessionFactory,
+    monkeypatch: MonkeyPatch,
+    substring: str,
+) -> None:
+    # spans inserted before the index is created are backfilled
+    span_ids = await _insert_spans(
+        db,
+        {"input": {"value": "hello world"}},
+        {"output": {"value": 'they say "hi"'}},
+    )
+    monkeypatch.setenv(ENV_PHOENIX_ENABLE_FULL_TEXT_SEARCH, "true")
+    await _ensure_span_io_index(db)
+    assert db.span_io_index_enabled
+    # spans inserted afterwards are indexed at insert time
+    span_ids += await _insert_spans(
+        db,
+        {"input": {"value": "HELLO WORLD"}, "output": {"value": "100%_done"}},
+        {"metadata": {"value": "hello"}},
+    )
+    expected = await _matches(db, substring, indexed=False)
+    assert await _matches(db, substring, indexed=True) == expected
+    async with db() as session:
+        await session.execute(delete(models.Span).where(models.Span.id.in_(span_ids[:2])))
+    expected = await _matches(db, substring, indexed=False)
+    assert await _matches(db, substring, indexed=True) == expected
+    monkeypatch.setenv(ENV_PHOENIX_ENABLE_FULL_TEXT_SEARCH, "false")
+    await _ensure_span_io_index(db)
+    assert not db.span_io_index_enabled
+
+
+async def test_index_is_disabled_when_it_cannot_be_created(
+    db: DbSessionFactory,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    if db.dialect is SupportedSQLDialect.SQLITE:
+        # e.g. as when SQLite is built without FTS5
+        monkeypatch.setattr(full_text_search, "_SQLITE_TRIGGERS", {"spans_ai_span_io_fts": "?"})
+    else:
+        monkeypatch.setattr(full_text_search, "_POSTGRESQL_INDEXES", {"ix_spans_trgm": "?"})
+    monkeypatch.setenv(ENV_PHOENIX_ENABLE_FULL_TEXT_SEARCH, "true")
+    await _ensure_span_io_index(db)
+    assert not db.span_io_index_enabled
+    # spans can still be inserted and searched
+    span_ids = await _insert_spans(db, {"input": {"value": "hello world"}})
+    assert await _matches(db, "hello", indexed=False) == set(span_ids)
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from phoenix.db.types.latency_sketch import LatencySketch
+
+
+@pytest.mark.parametrize("relative_accuracy", [0.01, 0.05])
+def test_quantile_is_within_relative_accuracy(relative_accuracy: float) -> None:
+    values = np.random.default_rng(42).lognormal(mean=7, sigma=2, size=10_000)
+    sketch = LatencySketch.from_values(values, relative_accuracy=relative_accuracy)
+    assert sketch.count == len(values)
+    for probability in (0, 0.01, 0.25, 0.5, 0.75, 0.9, 0.99, 1):
+        expected = np.quantile(values, probability, method="lower")
+        actual = sketch.quantile(probability)
+        assert actual == pytest.approx(expected, rel=relative_accuracy)
+
+
+def test_remove_and_merge() -> None:
+    sketch = LatencySketch.from_values([0, 10, 100, 1000])
+    sketch.remove(1000)
+    sketch.remove(0)
+    assert sketch.count == 2
+    assert sketch.quantile(1) == pytest.approx(100, rel=0.01)
+    sketch.merge(LatencySketch.from_values([1, 1, 1]))
+    assert sketch.count == 5
+    assert sketch.quantile(0.5) == pytest.approx(1, rel=0.01)
+    with pytest.raises(ValueError):
+        sketch.merge(LatencySketch(relative_accuracy=0.05))
+
+
+def test_empty_sketch_and_invalid_probability() -> None:
+    sketch = LatencySketch()
+    assert sketch.quantile(0.5) is None
+    with pytest.raises(ValueError):
+        sketch.quantile(1.5)
+    assert LatencySketch.model_validate(sketch.model_dump()) == sketch
@@ -1,11 +1,9 @@
-from collections import defaultdict
 from contextlib import nullcontext
 from datetime import datetime, timedelta, timezone
 from secrets import token_hex
-from typing import Any, Dict, Type, Union
+from typing import Any, Dict, Optional, Type, Union
 
 import pytest
-import sqlalchemy as sa
 from freezegun import freeze_time
 from pydantic import ValidationError
 
@@ -39,16 +37,15 @@ class TestMaxDaysMixin:
     @pytest.mark.parametrize(
         "max_days,expected",
         [
-            pytest.param(0, "false", id="zero_days"),
-            pytest.param(0.5, "traces.start_time < '2023-01-15 00:00:00+00:00'", id="half_days"),
+            pytest.param(0, None, id="zero_days"),
+            pytest.param(0.5, datetime(2023, 1, 15, 0, 0, 0, tzinfo=timezone.utc), id="half_days"),
         ],
     )
-    def test_filter(self, max_days: int, expected: str) -> None:
-        """Test that max_days_filter generates correct SQL query."""
+    def test_cutoff(self, max_days: float, expected: Optional[datetime]) -> None:
+        """Test that max_days_cutoff is max_days ago."""
         rule: _MaxDays = _MaxDays(max_days=max_days)
         with freeze_time("2023-01-15 12:00:00", tz_offset=0):
-            actual = str(rule.max_days_filter.compile(compile_kwargs={"literal_binds": True}))
-        assert actual == expected
+            assert rule.max_days_cutoff == expected
 
 
 class TestMaxCountMixin:
@@ -66,84 +63,82 @@ class TestMaxCountMixin:
         with nullcontext() if is_valid else pytest.raises(ValidationError):
             _MaxCount(max_count=max_count)
 
-    @pytest.mark.parametrize(
-        "max_count,expected",
-        [
-            pytest.param(0, "false", id="zero_count"),
-            pytest.param(
-                10,
-                "traces.start_time < (SELECT traces.start_time FROM traces "
-                "ORDER BY traces.start_time DESC LIMIT 1 OFFSET 9)",
-                id="ten_count",
-            ),
-        ],
-    )
-    def test_filter(self, max_count: int, expected: str) -> None:
-        """Test that max_count_filter generates correct SQL query."""
-        rule: _MaxCount = _MaxCount(max_count=max_count)
-        actual = str(rule.max_count_filter.compile(compile_kwargs={"literal_binds": True}))
-        actual = " ".join(actual.split())
-        assert actual == expected
-
-
-class TestTraceRetentionRuleMaxDays:
-    async def test_delete_traces(self, db: DbSessionFactory) -> None:
-        projects: defaultdict[int, list[int]] = defaultdict(list)
-        start_time = datetime.now(timezone.utc)
+    async def test_cutoff(self, db: DbSessionFactory) -> None:
+        """Test that get_max_count_cutoff is None when nothing is to be kept or deleted."""
         async with db() as session:
-            for _ in range(5):
-                project = models.Project(name=token_hex(8))
-                session.add(project)
-                await session.flush()
-                for i in range(5):
-                    trace = models.Trace(
-                        project_rowid=project.id,
-                        trace_id=token_hex(16),
-                        start_time=start_time - timedelta(days=i),
-                        end_time=datetime.now(timezone.utc),
-                    )
-                    session.add(trace)
-                    await session.flush()
-                    projects[project.id].append(trace.id)
-        rule = MaxDaysRule(max_days=1)
-        async with db() as session:
-            await rule.delete_traces(session, projects.keys())
-        async with db() as session:
-            remaining_traces = await session.scalars(
-                sa.select(models.Trace.id).where(models.Trace.project_rowid.in_(projects.keys()))
+            project = models.Project(name=token_hex(8))
+            session.add(project)
+            await session.flush()
+            session.add(
+                models.Trace(
+                    project_rowid=project.id,
+                    trace_id=token_hex(16),
+                    start_time=datetime.now(timezone.utc),
+                    end_time=datetime.now(timezone.utc),
+                )
             )
-        # only one trace remains per project
-        assert sorted(remaining_traces.all()) == sorted(traces[0] for traces in projects.values())
+            await session.flush()
+            assert await _MaxCount(max_count=0).get_max_count_cutoff(session, project.id) is None
+            assert await _MaxCount(max_count=2).get_max_count_cutoff(session, project.id) is None
 
 
 class TestTraceRetentionRuleMaxCount:
-    async def test_delete_traces(self, db: DbSessionFactory) -> None:
-        projects: defaultdict[int, list[int]] = defaultdict(list)
+    async def test_get_start_time_cutoff(self, db: DbSessionFactory) -> None:
         start_time = datetime.now(timezone.utc)
+        project_rowids = []
         async with db() as session:
-            for _ in range(5):
+            for j in range(2):
                 project = models.Project(name=token_hex(8))
                 session.add(project)
                 await session.flush()
-                for i in range(5):
-                    trace = models.Trace(
+                project_rowids.append(project.id)
+                session.add_all(
+                    models.Trace(
                         project_rowid=project.id,
                         trace_id=token_hex(16),
-                        start_time=start_time - timedelta(days=i),
-                        end_time=datetime.now(timezone.utc),
+                        start_time=start_time - timedelta(days=i + j),
+                        end_time=start_time,
                     )
-                    session.add(trace)
-                    await session.flush()
-                    projects[project.id].append(trace.id)
-        rule = MaxCountRule(max_count=1)
+                    for i in range(3)
+                )
+        rule = TraceRetentionRule(root=MaxCountRule(max_count=2))
         async with db() as session:
-            await rule.delete_traces(session, projects.keys())
+            cutoffs = [await rule.get_start_time_cutoff(session, id_) for id_ in project_rowids]
+            empty_project = models.Project(name=token_hex(8))
+            session.add(empty_project)
+            await session.flush()
+            assert await rule.get_start_time_cutoff(session, empty_project.id) is None
+        assert [cutoff and cutoff.replace(tzinfo=timezone.utc) for cutoff in cutoffs] == [
+            start_time - timedelta(days=1),
+            start_time - timedelta(days=2),
+        ]
+
+
+class TestTraceRetentionRuleMaxDaysOrCount:
+    async def test_get_start_time_cutoff(self, db: DbSessionFactory) -> None:
+        start_time = datetime.now(timezone.utc)
         async with db() as session:
-            remaining_traces = await session.scalars(
-                sa.select(models.Trace.id).where(models.Trace.project_rowid.in_(projects.keys()))
+            project = models.Project(name=token_hex(8))
+            session.add(project)
+            await session.flush()
+            session.add_all(
+                models.Trace(
+                    project_rowid=project.id,
+                    trace_id=token_hex(16),
+                    start_time=start_time - timedelta(days=i),
+                    end_time=start_time,
+                )
+                for i in range(5)
             )
-        # only one trace remains per project
-        assert sorted(remaining_traces.all()) == sorted(traces[0] for traces in projects.values())
+            await session.flush()
+            # the later of the two cutoffs deletes the more traces
+            by_count = TraceRetentionRule(root=MaxDaysOrCountRule(max_days=3.5, max_count=2))
+            cutoff = await by_count.get_start_time_cutoff(session, project.id)
+            assert cutoff and cutoff.replace(tzinfo=timezone.utc) == start_time - timedelta(days=1)
+            by_days = TraceRetentionRule(root=MaxDaysOrCountRule(max_days=0.5, max_count=4))
+            with freeze_time(start_time):
+                cutoff = await by_days.get_start_time_cutoff(session, project.id)
+            assert cutoff == start_time - timedelta(days=0.5)
 
 
 class TestTraceRetentionRule:
@@ -4,7 +4,7 @@ import numpy as np
 import pytest
 from sklearn.metrics import ndcg_score
 
-from phoenix.metrics.retrieval_metrics import RetrievalMetrics
+from phoenix.metrics.retrieval_metrics import BatchedRetrievalMetrics, RetrievalMetrics
 
 
 @pytest.mark.parametrize("k", [None, -1, 0, 1, 2, 1000])
@@ -70,3 +70,48 @@ def test_ranking_metrics_reciprocal_rank(scores: list[float], desired: float) ->
 def test_ranking_metrics_hit(scores: list[float], desired: float) -> None:
     actual = RetrievalMetrics(scores).hit()
     assert np.isclose(actual, desired, equal_nan=True)
+
+
+def test_batched_ranking_metrics_match_ranking_metrics() -> None:
+    rng = np.random.default_rng(12345)
+    eval_scores: list[list[float]] = [
+        [],
+        [0],
+        [1],
+        [0, 0, 1],
+        [np.nan, 1],
+        [np.nan],
+        [0, 2, np.nan],
+    ]
+    for _ in range(200):
+        scores = rng.choice([0, 0, 1, 0.5, 2, np.nan, np.inf], size=rng.integers(0, 8))
+        eval_scores.append(scores.tolist())
+    batch = BatchedRetrievalMetrics.from_lists(eval_scores)
+    for k in [None, -1, 0, 1, 2, 5, 1000]:
+        assert np.allclose(
+            batch.ndcg(k),
+            [RetrievalMetrics(scores).ndcg(k) for scores in eval_scores],
+            equal_nan=True,
+        )
+        assert np.allclose(
+            batch.precision(k),
+            [RetrievalMetrics(scores).precision(k) for scores in eval_scores],
+            equal_nan=True,
+        )
+    assert np.allclose(
+        batch.reciprocal_rank(),
+        [RetrievalMetrics(scores).reciprocal_rank() for scores in eval_scores],
+        equal_nan=True,
+    )
+    assert np.allclose(
+        batch.hit(),
+        [RetrievalMetrics(scores).hit() for scores in eval_scores],
+        equal_nan=True,
+    )
+
+
+def test_batched_ranking_metrics_ndcg_is_nan_for_negative_scores() -> None:
+    batch = BatchedRetrievalMetrics.from_lists([[-1, 2], [1, 2]])
+    assert np.isnan(batch.ndcg()[0])
+    assert np.isclose(batch.ndcg()[1], RetrievalMetrics([1, 2]).ndcg())
+    assert batch.ndcg(0)[0] == 0
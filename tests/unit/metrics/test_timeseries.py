@@ -5,10 +5,28 @@ from typing import NamedTuple, Union, cast
 import numpy as np
 import numpy.typing as npt
 import pandas as pd
+import pytest
 
+from phoenix.core.embedding_array import EmbeddingArray
 from phoenix.core.model_schema import Column
-from phoenix.metrics import Metric
-from phoenix.metrics.metrics import CountNotNull, EuclideanDistance, Mean, VectorMean, VectorSum
+from phoenix.metrics import Metric, binning
+from phoenix.metrics.metrics import (
+    PSI,
+    Cardinality,
+    Count,
+    CountNotNull,
+    EuclideanDistance,
+    JSDistance,
+    KLDivergence,
+    Max,
+    Mean,
+    Min,
+    PercentEmpty,
+    Quantile,
+    Sum,
+    VectorMean,
+    VectorSum,
+)
 from phoenix.metrics.timeseries import timeseries
 
 
@@ -305,6 +323,89 @@ def test_timeseries_empty_result() -> None:
     )
 
 
+@pytest.mark.parametrize("vectors", ["object", "embedding"])
+@pytest.mark.parametrize(
+    "evaluation_window,sampling_interval",
+    [
+        (timedelta(hours=72), timedelta(hours=24)),
+        (timedelta(hours=100), timedelta(hours=99)),
+        (timedelta(days=40), timedelta(days=10)),
+    ],
+)
+def test_timeseries_matches_metrics_on_each_window(
+    vectors: str,
+    evaluation_window: timedelta,
+    sampling_interval: timedelta,
+) -> None:
+    df = data.assign(
+        v=EmbeddingArray.from_vectors(data["v"].to_numpy()) if vectors == "embedding" else data["v"]
+    )
+    window_metrics = [
+        Count(),
+        CountNotNull(operand=Column("v")),
+        Sum(operand=Column("x")),
+        Mean(operand=Column("x")),
+        Min(operand=Column("x")),
+        Max(operand=Column("x")),
+        PercentEmpty(operand=Column("x")),
+        Quantile(operand=Column("x"), probability=0.9),
+        Cardinality(operand=Column("y")),
+        VectorSum(operand=Column("v"), shape=5),
+        VectorMean(operand=Column("v"), shape=5),
+        EuclideanDistance(operand=Column("v"), reference_data=reference_data),
+        PSI(operand=Column("y"), reference_data=reference_data),
+        JSDistance(
+            operand=Column("x"),
+            reference_data=reference_data,
+            binning_method=binning.QuantileBinning(reference_series=reference_data["x"]),
+        ),
+        # binned by the quantiles of each window, so computed on each window
+        KLDivergence(
+            operand=Column("x"),
+            reference_data=reference_data,
+            binning_method=binning.QuantileBinning(),
+        ),
+    ]
+    actual = df.pipe(
+        timeseries(
+            start_time=start,
+            end_time=stop,
+            evaluation_window=evaluation_window,
+            sampling_interval=sampling_interval,
+        ),
+        metrics=window_metrics,
+    )
+    assert len(actual)
+    for timestamp, row in actual.iterrows():
+        window = df.loc[(df.index >= timestamp - evaluation_window) & (df.index < timestamp)]
+        for metric in window_metrics:
+            assert np.allclose(
+                metric.get_value(row.to_dict()),
+                metric(window),
+                equal_nan=True,
+            ), (timestamp, metric)
+
+
+def test_timeseries_sums_are_not_lost_to_large_values_in_other_windows() -> None:
+    metric = Sum(operand=Column("x"))
+    df = pd.DataFrame(
+        {"x": [1e16, 1.0]},
+        index=pd.to_datetime(["2023-01-01 00:00Z", "2023-01-02 00:00Z"]),
+    )
+    actual = df.pipe(
+        timeseries(
+            start_time=pd.to_datetime("2023-01-01 00:00Z"),
+            end_time=pd.to_datetime("2023-01-03 00:00Z"),
+            evaluation_window=timedelta(days=1),
+            sampling_interval=timedelta(days=1),
+        ),
+        metrics=[metric],
+    )
+    # 1e16 + 1 rounds to 1e16, so the sum of the second day would be zero if taken as a
+    # difference of cumulative sums
+    assert metric.get_value(actual.iloc[-1].to_dict()) == 1.0
+
+
 def compare(expected: pd.DataFrame, actual: pd.DataFrame) -> None:
     assert len(expected) >= len(actual)
     for timestamp, row in expected.iterrows():
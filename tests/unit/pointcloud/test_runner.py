@@ -0,0 +1,102 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from phoenix.pointcloud import runner as runner_module
+from phoenix.pointcloud.runner import PointCloudRunner
+
+
+@dataclass(frozen=True)
+class RandomReducer:
+    sleep_seconds: float = 0
+
+    def project(self, mat: npt.NDArray[np.float64], n_components: int) -> npt.NDArray[np.float64]:
+        time.sleep(self.sleep_seconds)
+        return np.random.rand(len(mat), n_components)
+
+
+@dataclass(frozen=True)
+class ModuloClustersFinder:
+    n_clusters: int
+
+    def find_clusters(self, mat: npt.NDArray[np.float64]) -> list[set[int]]:
+        return [set(range(i, len(mat), self.n_clusters)) for i in range(self.n_clusters)]
+
+
+@pytest.fixture
+async def runner() -> AsyncIterator[PointCloudRunner]:
+    runner = PointCloudRunner()
+    yield runner
+    runner.shutdown()
+
+
+async def test_generate_memoizes_projections_and_clusters(runner: PointCloudRunner) -> None:
+    data = {str(i): np.random.rand(5) for i in range(10)}
+    points, clusters = await runner.generate("x", RandomReducer(), ModuloClustersFinder(2), data)
+    assert set(points) == set(data)
+    assert clusters == {"0": {"0", "2", "4", "6", "8"}, "1": {"1", "3", "5", "7", "9"}}
+    cached_points, _ = await runner.generate("x", RandomReducer(), ModuloClustersFinder(2), data)
+    assert all(np.array_equal(points[k], cached_points[k]) for k in data)
+    # changing only the clustering parameters re-uses the projections
+    cached_points, clusters = await runner.generate(
+        "x", RandomReducer(), ModuloClustersFinder(3), data
+    )
+    assert all(np.array_equal(points[k], cached_points[k]) for k in data)
+    assert len(clusters) == 3
+    # a different dimension, or a different sample, is projected again
+    new_points, _ = await runner.generate("y", RandomReducer(), ModuloClustersFinder(2), data)
+    assert not all(np.array_equal(points[k], new_points[k]) for k in data)
+    del data["0"]
+    new_points, _ = await runner.generate("x", RandomReducer(), ModuloClustersFinder(2), data)
+    assert not all(np.array_equal(points[k], new_points[k]) for k in data)
+
+
+async def test_generate_terminates_worker_when_client_disconnects(
+    runner: PointCloudRunner,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(runner_module, "DISCONNECT_POLL_INTERVAL_SECONDS", 0.1)
+    disconnected = False
+
+    async def is_disconnected() -> bool:
+        return disconnected
+
+    data = {str(i): np.random.rand(5) for i in range(10)}
+    task = asyncio.create_task(
+        runner.generate(
+            "x",
+            RandomReducer(sleep_seconds=600),
+            ModuloClustersFinder(2),
+            data,
+            is_disconnected=is_disconnected,
+        )
+    )
+    await asyncio.sleep(0.5)
+    disconnected = True
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(task, timeout=10)
+    # the next computation gets a new worker
+    points, _ = await runner.generate("x", RandomReducer(), ModuloClustersFinder(2), data)
+    assert set(points) == set(data)
+
+
+def test_runner_created_outside_of_event_loop() -> None:
+    # e.g. when the app is created, before the server starts the event loop
+    runner = PointCloudRunner()
+    data = {str(i): np.random.rand(5) for i in range(10)}
+
+    async def generate_concurrently() -> None:
+        await asyncio.gather(
+            runner.generate("x", RandomReducer(), ModuloClustersFinder(2), data),
+            runner.generate("y", RandomReducer(), ModuloClustersFinder(2), data),
+        )
+
+    try:
+        asyncio.run(generate_concurrently())
+    finally:
+        runner.shutdown()
@@ -28,13 +28,16 @@ async def test_session_trace_latency_ms_quantile(
         .sort_index()
         .to_list()
     )
-    keys: list[Key] = [
-        (
-            id_ + 1,
-            probability,
-        )
-        for id_ in range(20)
-        for probability in (0.25, 0.50, 0.75)
-    ]
-    actual = await SessionTraceLatencyMsQuantileDataLoader(db)._load_fn(keys)
-    assert actual == expected
+    for exact in (True, False):
+        # sessions without latency sketches fall back to exact quantiles
+        keys: list[Key] = [
+            (
+                id_ + 1,
+                probability,
+                exact,
+            )
+            for id_ in range(20)
+            for probability in (0.25, 0.50, 0.75)
+        ]
+        actual = await SessionTraceLatencyMsQuantileDataLoader(db)._load_fn(keys)
+        assert actual == expected
@@ -0,0 +1,69 @@
+import asyncio
+import time
+
+import pytest
+
+from phoenix.server.api.helpers.playground_clients import KeyedSingleton, PlaygroundRateLimiter
+from phoenix.server.api.types.GenerativeProvider import GenerativeProviderKey
+
+
+class _RateLimited(Exception):
+    pass
+
+
+@pytest.fixture(autouse=True)
+def _fresh_singletons(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(KeyedSingleton, "_instances", {})
+
+
+class TestPlaygroundRateLimiter:
+    async def test_throttles_requests_to_the_configured_rate(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setenv("PHOENIX_PLAYGROUND_OPENAI_MAX_REQUESTS_PER_SECOND", "20")
+        limiter = PlaygroundRateLimiter(GenerativeProviderKey.OPENAI, _RateLimited)
+        assert limiter._throttler.rate == 20
+
+        def request() -> float:
+            return time.monotonic()
+
+        throttled_request = limiter._alimit(request)
+        start_time = time.monotonic()
+        request_times = await asyncio.gather(*(throttled_request() for _ in range(5)))
+        assert max(request_times) - start_time >= 4 / 20
+
+    async def test_cools_down_without_blocking_the_event_loop(self) -> None:
+        limiter = PlaygroundRateLimiter(GenerativeProviderKey.OPENAI, _RateLimited)
+        limiter._non_blocking_throttler.cooldown = 0.1
+        initial_rate = limiter._throttler.rate
+        num_attempts = 0
+
+        def request() -> str:
+            nonlocal num_attempts
+            num_attempts += 1
+            if num_attempts == 1:
+                raise _RateLimited
+            return "ok"
+
+        num_ticks = 0
+
+        async def tick() -> None:
+            nonlocal num_ticks
+            while True:
+                await asyncio.sleep(0.01)
+                num_ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        try:
+            assert await limiter._alimit(request)() == "ok"
+        finally:
+            ticker.cancel()
+        assert num_attempts == 2
+        assert num_ticks >= 5, "the event loop runs other tasks during the cooldown"
+        # halved, and since increasing slowly
+        assert initial_rate * 0.5 <= limiter._throttler.rate < initial_rate * 0.6
+        # the adapted rate is kept by the limiter shared with the provider's next client
+        same_limiter = PlaygroundRateLimiter(GenerativeProviderKey.OPENAI, _RateLimited)
+        assert same_limiter is limiter
+        assert same_limiter._throttler.rate < initial_rate * 0.6
@@ -5,6 +5,7 @@ from sqlalchemy import func, insert, select
 from strawberry.relay import GlobalID
 
 from phoenix.db import models
+from phoenix.db.types.latency_sketch import LatencySketch
 from phoenix.server.types import DbSessionFactory
 from tests.unit.graphql import AsyncGraphQLClient
 
@@ -56,6 +57,12 @@ class TestTraceMutationMixin:
             project_session = await session.get(models.ProjectSession, session_id)
             assert project_session is not None
 
+            # Verify the latency sketch was rebuilt from the trace left, lasting one minute
+            sketch = LatencySketch.from_values([60_000.0])
+            assert project_session.trace_latency_ms_sketch == sketch
+            assert project_session.trace_latency_ms_p50 == sketch.quantile(0.5)
+            assert project_session.trace_latency_ms_p99 == sketch.quantile(0.99)
+
             # Verify trace was deleted
             trace = await session.get(models.Trace, trace_id)
             assert trace is None
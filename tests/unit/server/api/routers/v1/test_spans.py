@@ -2,6 +2,7 @@ from asyncio import sleep
 from datetime import datetime
 from random import getrandbits
 from typing import Any, cast
+from unittest.mock import patch
 
 import httpx
 import pandas as pd
@@ -12,6 +13,7 @@ from sqlalchemy import insert, select
 from phoenix import Client as LegacyClient
 from phoenix import TraceDataset
 from phoenix.client import Client
+from phoenix.client.resources import spans
 from phoenix.db import models
 from phoenix.server.types import DbSessionFactory
 from phoenix.trace.dsl import SpanQuery
@@ -51,6 +53,30 @@ async def test_querying_spans_with_new_client(
     assert legacy_df.equals(df)
 
 
+@pytest.mark.parametrize(
+    "media_type",
+    [
+        "application/x-pandas-arrow",
+        "application/x-pandas-arrow; compression=zstd",
+        "application/x-pandas-arrow; compression=lz4",
+    ],
+)
+async def test_querying_spans_with_new_client_in_arrow_matches_json(
+    px_client: Client,
+    dialect: str,
+    span_data_with_documents: Any,
+    media_type: str,
+) -> None:
+    with patch.object(spans, "_get_span_dataframe_media_type", lambda: "application/json"):
+        json_df = px_client.spans.get_spans_dataframe()
+    with patch.object(spans, "_get_span_dataframe_media_type", lambda: media_type):
+        df = px_client.spans.get_spans_dataframe()
+    assert not df.empty
+    pd.testing.assert_frame_equal(df, json_df)
+    for column in df.columns:
+        assert df[column].map(type).tolist() == json_df[column].map(type).tolist()
+
+
 @pytest.mark.parametrize("sync", [False, True])
 async def test_rest_span_annotation(
     db: DbSessionFactory,
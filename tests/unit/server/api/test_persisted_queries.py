@@ -0,0 +1,68 @@
+from hashlib import sha256
+from typing import Any, Callable
+
+import httpx
+import pytest
+
+from phoenix.server.api import persisted_queries
+from phoenix.server.api.schema import build_graphql_schema
+
+_QUERY = "query { __typename }"
+_EXTENSIONS = {"persistedQuery": {"version": 1, "sha256Hash": sha256(_QUERY.encode()).hexdigest()}}
+
+
+class TestPersistedQueries:
+    async def test_query_is_sent_once(
+        self,
+        httpx_client: httpx.AsyncClient,
+    ) -> None:
+        response = await httpx_client.post("/graphql", json={"extensions": _EXTENSIONS})
+        assert response.status_code == 200
+        assert response.json()["errors"][0]["message"] == "PersistedQueryNotFound"
+
+        response = await httpx_client.post(
+            "/graphql", json={"query": _QUERY, "extensions": _EXTENSIONS}
+        )
+        assert response.status_code == 200
+        assert response.json() == {"data": {"__typename": "Query"}}
+
+        response = await httpx_client.post("/graphql", json={"extensions": _EXTENSIONS})
+        assert response.status_code == 200
+        assert response.json() == {"data": {"__typename": "Query"}}
+
+    async def test_hash_must_match_query(
+        self,
+        httpx_client: httpx.AsyncClient,
+    ) -> None:
+        response = await httpx_client.post(
+            "/graphql", json={"query": "query { version }", "extensions": _EXTENSIONS}
+        )
+        assert response.status_code == 400
+
+
+class TestDocumentCache:
+    async def test_documents_are_parsed_and_validated_once(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        calls = {"parse": 0, "validate_document": 0}
+
+        def count(name: str) -> Callable[..., Any]:
+            fn = getattr(persisted_queries, name)
+
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                calls[name] += 1
+                return fn(*args, **kwargs)
+
+            return wrapper
+
+        for name in calls:
+            monkeypatch.setattr(persisted_queries, name, count(name))
+        schema = build_graphql_schema()
+        for _ in range(3):
+            result = await schema.execute(_QUERY)
+            assert not result.errors
+        for _ in range(2):
+            result = await schema.execute("query { notAField }")
+            assert result.errors
+        assert calls == {"parse": 2, "validate_document": 3}
@@ -168,6 +168,208 @@ async def test_compare_experiments_returns_expected_comparisons(
     }
 
 
+@pytest.mark.parametrize(
+    "filter_condition,expected_example_ids",
+    [
+        pytest.param(
+            "experiments[0].evals['correctness'].score > 0.5",
+            [1],
+            id="eval-of-one-experiment",
+        ),
+        pytest.param(
+            "evals['correctness'].score < 0.5",
+            [2],
+            id="eval-of-any-experiment",
+        ),
+        pytest.param(
+            "experiments[0].evals['correctness'].score < 0.5 "
+            "or experiments[2].evals['relevance'].label == 'relevant'",
+            [2, 1],
+            id="evals-of-two-experiments",
+        ),
+        pytest.param(
+            "evals['relevance'].label == 'relevant' and evals['correctness'].score is None",
+            [1],
+            id="missing-eval-of-same-run",
+        ),
+    ],
+)
+async def test_compare_experiments_filters_by_evals(
+    filter_condition: str,
+    expected_example_ids: list[int],
+    db: DbSessionFactory,
+    gql_client: AsyncGraphQLClient,
+    comparison_experiments: Any,
+) -> None:
+    async with db() as session:
+        await session.execute(
+            insert(models.ExperimentRunAnnotation),
+            [
+                dict(
+                    experiment_run_id=run_id,
+                    name=name,
+                    annotator_kind="CODE",
+                    label=label,
+                    score=score,
+                    metadata_={},
+                    start_time=datetime.now(pytz.utc),
+                    end_time=datetime.now(pytz.utc),
+                )
+                for run_id, name, label, score in (
+                    (3, "correctness", None, 1.0),
+                    (4, "correctness", None, 0.0),
+                    (6, "relevance", "relevant", None),
+                )
+            ],
+        )
+    query = """
+      query ($experimentIds: [GlobalID!]!, $filterCondition: String) {
+        compareExperiments(experimentIds: $experimentIds, filterCondition: $filterCondition) {
+          example {
+            id
+          }
+        }
+      }
+    """
+    response = await gql_client.execute(
+        query=query,
+        variables={
+            "experimentIds": [str(GlobalID("Experiment", str(id_))) for id_ in (2, 1, 3)],
+            "filterCondition": filter_condition,
+        },
+    )
+    assert not response.errors
+    assert (data := response.data) is not None
+    assert [comparison["example"]["id"] for comparison in data["compareExperiments"]] == [
+        str(GlobalID("DatasetExample", str(example_id))) for example_id in expected_example_ids
+    ]
+
+
+async def test_compare_experiments_connection_paginates_comparisons(
+    gql_client: AsyncGraphQLClient,
+    comparison_experiments: Any,
+) -> None:
+    query = """
+      query ($experimentIds: [GlobalID!]!, $after: String) {
+        compareExperimentsConnection(
+          experimentIds: $experimentIds
+          first: 1
+          after: $after
+        ) {
+          edges {
+            comparison: node {
+              example {
+                id
+              }
+              runComparisonItems {
+                experimentId
+                runs {
+                  id
+                }
+              }
+            }
+          }
+          pageInfo {
+            hasNextPage
+            endCursor
+          }
+        }
+      }
+    """
+    experiment_ids = [str(GlobalID("Experiment", str(id_))) for id_ in (2, 1, 3)]
+    expected_run_ids = {
+        2: [[4], [], [7, 8]],
+        1: [[3], [1], [5, 6]],
+    }
+    after = None
+    for example_id, has_next_page in ((2, True), (1, False)):
+        response = await gql_client.execute(
+            query=query,
+            variables={"experimentIds": experiment_ids, "after": after},
+        )
+        assert not response.errors
+        assert (data := response.data) is not None
+        connection = data["compareExperimentsConnection"]
+        assert connection["pageInfo"]["hasNextPage"] is has_next_page
+        [edge] = connection["edges"]
+        comparison = edge["comparison"]
+        assert comparison["example"]["id"] == str(GlobalID("DatasetExample", str(example_id)))
+        assert [item["experimentId"] for item in comparison["runComparisonItems"]] == (
+            experiment_ids
+        )
+        assert [
+            [run["id"] for run in item["runs"]] for item in comparison["runComparisonItems"]
+        ] == [
+            [str(GlobalID("ExperimentRun", str(run_id))) for run_id in run_ids]
+            for run_ids in expected_run_ids[example_id]
+        ]
+        after = connection["pageInfo"]["endCursor"]
+
+
+async def test_compare_experiments_connection_with_first_zero_returns_no_comparisons(
+    gql_client: AsyncGraphQLClient,
+    comparison_experiments: Any,
+) -> None:
+    query = """
+      query ($experimentIds: [GlobalID!]!) {
+        compareExperimentsConnection(experimentIds: $experimentIds, first: 0) {
+          edges {
+            cursor
+          }
+          pageInfo {
+            hasNextPage
+          }
+        }
+      }
+    """
+    experiment_ids = [str(GlobalID("Experiment", str(id_))) for id_ in (2, 1, 3)]
+    response = await gql_client.execute(query=query, variables={"experimentIds": experiment_ids})
+    assert not response.errors
+    assert (data := response.data) is not None
+    connection = data["compareExperimentsConnection"]
+    assert connection["edges"] == []
+    assert connection["pageInfo"]["hasNextPage"] is True
+
+
+async def test_compare_experiments_aggregates_returns_aggregates_of_compared_runs(
+    gql_client: AsyncGraphQLClient,
+    comparison_experiments: Any,
+) -> None:
+    query = """
+      query ($experimentIds: [GlobalID!]!) {
+        compareExperimentsAggregates(experimentIds: $experimentIds) {
+          experimentId
+          runCount
+          errorRate
+          averageRunLatencyMs
+          annotationSummaries {
+            annotationName
+          }
+        }
+      }
+    """
+    response = await gql_client.execute(
+        query=query,
+        variables={
+            "experimentIds": [str(GlobalID("Experiment", str(id_))) for id_ in (2, 1, 3)],
+        },
+    )
+    assert not response.errors
+    # runs on examples outside of the latest version, e.g. run 2 on example 4, are excluded
+    assert response.data == {
+        "compareExperimentsAggregates": [
+            {
+                "experimentId": str(GlobalID("Experiment", str(experiment_id))),
+                "runCount": run_count,
+                "errorRate": 0.0,
+                "averageRunLatencyMs": 0.0,
+                "annotationSummaries": [],
+            }
+            for experiment_id, run_count in ((2, 2), (1, 1), (3, 4))
+        ]
+    }
+
+
 @pytest.mark.skip(reason="TODO: re-enable this test after we figure out the issue with sqlite")
 async def test_db_table_stats(gql_client: AsyncGraphQLClient) -> None:
     query = """
@@ -1,8 +1,11 @@
+import asyncio
 import json
 import re
-from datetime import datetime
-from typing import Any, Optional
+from datetime import datetime, timezone
+from itertools import count
+from typing import Any, AsyncIterator, Optional
 
+import pytest
 from openinference.semconv.trace import (
     OpenInferenceMimeTypeValues,
     OpenInferenceSpanKindValues,
@@ -12,6 +15,8 @@ from opentelemetry.semconv.attributes.url_attributes import URL_FULL, URL_PATH
 from strawberry.relay.types import GlobalID
 from vcr.request import Request as VCRRequest
 
+from phoenix.db import models
+from phoenix.server.api.helpers.playground_clients import OpenAIStreamingClient
 from phoenix.server.api.types.ChatCompletionSubscriptionPayload import (
     ChatCompletionSubscriptionError,
     ChatCompletionSubscriptionExperiment,
@@ -24,6 +29,7 @@ from phoenix.server.api.types.DatasetExample import DatasetExample
 from phoenix.server.api.types.DatasetVersion import DatasetVersion
 from phoenix.server.api.types.Experiment import Experiment
 from phoenix.server.api.types.node import from_global_id
+from phoenix.server.types import DbSessionFactory
 from phoenix.trace.attributes import flatten, get_attribute_value
 from tests.unit.graphql import AsyncGraphQLClient
 from tests.unit.vcr import CustomVCR
@@ -1388,6 +1394,167 @@ class TestChatCompletionOverDatasetSubscription:
         assert (experiment := payloads[None].pop()["chatCompletionOverDataset"]["experiment"])
         assert isinstance(experiment["id"], str)
 
+    async def test_max_concurrency_overrides_the_provider_setting(
+        self,
+        gql_client: AsyncGraphQLClient,
+        openai_api_key: str,
+        cities_and_countries: list[tuple[str, str]],
+        playground_city_and_country_dataset: None,
+        custom_vcr: CustomVCR,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setenv("PHOENIX_PLAYGROUND_OPENAI_MAX_CONCURRENCY", "5")
+        num_in_progress = max_num_in_progress = 0
+        chat_completion_create = OpenAIStreamingClient.chat_completion_create
+
+        async def counting_chat_completion_create(
+            self: OpenAIStreamingClient, *args: Any, **kwargs: Any
+        ) -> AsyncIterator[Any]:
+            nonlocal num_in_progress, max_num_in_progress
+            num_in_progress += 1
+            max_num_in_progress = max(max_num_in_progress, num_in_progress)
+            try:
+                async for chunk in chat_completion_create(self, *args, **kwargs):
+                    yield chunk
+            finally:
+                num_in_progress -= 1
+
+        monkeypatch.setattr(
+            OpenAIStreamingClient, "chat_completion_create", counting_chat_completion_create
+        )
+        dataset_id = str(GlobalID(type_name=Dataset.__name__, node_id=str(1)))
+        variables = {
+            "input": {
+                "model": {"providerKey": "OPENAI", "name": "gpt-4"},
+                "datasetId": dataset_id,
+                "messages": [
+                    {
+                        "role": "USER",
+                        "content": (
+                            "What country is {city} in? "
+                            "Answer with the country name only without punctuation."
+                        ),
+                    }
+                ],
+                "templateFormat": "F_STRING",
+                "maxConcurrency": 1,
+            }
+        }
+        example_ids = set()
+        async with gql_client.subscription(
+            query=self.QUERY,
+            variables=variables,
+            operation_name="ChatCompletionOverDatasetSubscription",
+        ) as subscription:
+            custom_vcr.register_matcher(
+                _request_bodies_contain_same_city.__name__, _request_bodies_contain_same_city
+            )
+            with custom_vcr.use_cassette(match_on=[_request_bodies_contain_same_city.__name__]):
+                async for payload in subscription.stream():
+                    if (
+                        payload["chatCompletionOverDataset"]["__typename"]
+                        == ChatCompletionSubscriptionResult.__name__
+                    ):
+                        example_ids.add(payload["chatCompletionOverDataset"]["datasetExampleId"])
+        assert len(example_ids) == len(cities_and_countries)
+        assert max_num_in_progress == 1
+
+
+class TestProjectChangesSubscription:
+    QUERY = """
+      subscription ProjectChangesSubscription($projectIds: [GlobalID!]) {
+        projectChanges(projectIds: $projectIds) {
+          id
+          streamingLastUpdatedAt
+        }
+      }
+    """
+
+    async def test_notifies_of_changes_to_subscribed_projects(
+        self,
+        db: DbSessionFactory,
+        gql_client: AsyncGraphQLClient,
+    ) -> None:
+        project_rowids, span_rowids = [], []
+        async with db() as session:
+            for name in ("subscribed", "unsubscribed"):
+                project = models.Project(name=name)
+                session.add(project)
+                await session.flush()
+                project_rowids.append(project.id)
+                trace = models.Trace(
+                    project_rowid=project.id,
+                    trace_id=name,
+                    start_time=datetime.now(timezone.utc),
+                    end_time=datetime.now(timezone.utc),
+                )
+                session.add(trace)
+                await session.flush()
+                span = models.Span(
+                    trace_rowid=trace.id,
+                    span_id=name,
+                    name=name,
+                    span_kind="LLM",
+                    start_time=trace.start_time,
+                    end_time=trace.end_time,
+                    attributes={},
+                    events=[],
+                    status_code="OK",
+                    status_message="",
+                    cumulative_error_count=0,
+                    cumulative_llm_token_count_prompt=0,
+                    cumulative_llm_token_count_completion=0,
+                )
+                session.add(span)
+                await session.flush()
+                span_rowids.append(span.id)
+        subscribed_project_id = str(GlobalID("Project", str(project_rowids[0])))
+
+        async def annotate_spans() -> None:
+            # the spans are annotated until the subscription is notified, since it may not have
+            # started listening for changes by the time of the first annotations
+            for i in count():
+                for span_rowid in reversed(span_rowids):
+                    result = await gql_client.execute(
+                        query="""
+                          mutation ($input: [CreateSpanAnnotationInput!]!) {
+                            createSpanAnnotations(input: $input) {
+                              spanAnnotations {
+                                id
+                              }
+                            }
+                          }
+                        """,
+                        variables={
+                            "input": [
+                                {
+                                    "spanId": str(GlobalID("Span", str(span_rowid))),
+                                    "name": f"annotation-{i}",
+                                    "label": "label",
+                                    "annotatorKind": "HUMAN",
+                                    "metadata": {},
+                                    "source": "API",
+                                }
+                            ]
+                        },
+                    )
+                    assert not result.errors
+                await asyncio.sleep(0.05)
+
+        async with gql_client.subscription(
+            query=self.QUERY,
+            variables={"projectIds": [subscribed_project_id]},
+            operation_name="ProjectChangesSubscription",
+        ) as subscription:
+            task = asyncio.create_task(annotate_spans())
+            try:
+                payload = await subscription.stream().__anext__()
+            finally:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+        assert [project["id"] for project in payload["projectChanges"]] == [subscribed_project_id]
+        assert payload["projectChanges"][0]["streamingLastUpdatedAt"]
+
 
 def _request_bodies_contain_same_city(request1: VCRRequest, request2: VCRRequest) -> None:
     assert _extract_city(request1.body.decode()) == _extract_city(request2.body.decode())
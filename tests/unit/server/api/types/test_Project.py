@@ -7,11 +7,12 @@ from typing import Any
 
 import httpx
 import pytest
-from sqlalchemy import insert
+from sqlalchemy import insert, update
 from strawberry.relay import GlobalID
 
 from phoenix.config import DEFAULT_PROJECT_NAME
 from phoenix.db import models
+from phoenix.db.helpers import SupportedSQLDialect
 from phoenix.server.api.types.pagination import Cursor, CursorSortColumn, CursorSortColumnDataType
 from phoenix.server.api.types.Project import Project
 from phoenix.server.types import DbSessionFactory
@@ -1491,6 +1492,57 @@ class TestProject:
                 res = await self._node(field, project, httpx_client)
                 assert [e["node"]["id"] for e in res["edges"]] == expected
 
+    async def test_sessions_sort_trace_latency_ms_p50(
+        self,
+        db: DbSessionFactory,
+        _data: _Data,
+        httpx_client: httpx.AsyncClient,
+    ) -> None:
+        column = "traceLatencyMsP50"
+        project = _data.projects[0]
+        async with db() as session:
+            for project_session, p50 in zip(_data.project_sessions, [3.0, 1.0, None, 2.0]):
+                await session.execute(
+                    update(models.ProjectSession)
+                    .filter_by(id=project_session.id)
+                    .values(trace_latency_ms_p50=p50)
+                )
+        # sessions without latency sketches are sorted where the database's indexes put NULLs,
+        # and their cursors have no sort column
+        indices, cursors = [0, 3, 1], [b"1:FLOAT:3.0", b"4:FLOAT:2.0", b"2:FLOAT:1.0"]
+        if db.dialect is SupportedSQLDialect.POSTGRESQL:
+            indices, cursors = [2] + indices, [b"3"] + cursors
+        else:
+            indices, cursors = indices + [2], cursors + [b"3"]
+        result: list[str] = [_gid(_data.project_sessions[i]) for i in indices]
+
+        for direction, expected in {"desc": result, "asc": result[::-1]}.items():
+            field = "sessions(sort:{col:" + column + ",dir:" + direction + "}){edges{node{id}}}"
+            res = await self._node(field, project, httpx_client)
+            assert [e["node"]["id"] for e in res["edges"]] == expected
+
+        # Test pagination
+        first = 2
+        for direction, (afters, ids) in {
+            "desc": ([b""] + cursors, result),
+            "asc": ([b""] + cursors[::-1], result[::-1]),
+        }.items():
+            for i, after in enumerate(afters):
+                expected = ids[i : i + first]
+                field = (
+                    "sessions(sort:{col:"
+                    + column
+                    + ",dir:"
+                    + direction
+                    + "},first:"
+                    + str(first)
+                    + ',after:"'
+                    + base64.b64encode(after).decode()
+                    + '"){edges{node{id}}}'
+                )
+                res = await self._node(field, project, httpx_client)
+                assert [e["node"]["id"] for e in res["edges"]] == expected
+
     async def test_sessions_substring_search_looks_at_both_input_and_output(
         self,
         _data: _Data,
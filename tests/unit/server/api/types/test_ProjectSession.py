@@ -3,9 +3,11 @@ from typing import Any, NamedTuple
 
 import httpx
 import pytest
+from sqlalchemy import update
 from strawberry.relay import GlobalID
 
 from phoenix.db import models
+from phoenix.db.types.latency_sketch import LatencySketch
 from phoenix.server.api.types.ProjectSession import ProjectSession
 from phoenix.server.api.types.Trace import Trace
 from phoenix.server.types import DbSessionFactory
@@ -137,6 +139,46 @@ class TestProjectSession:
             "mimeType": "text",
         }
 
+    async def test_first_input_and_last_output_from_root_span_io_columns(
+        self,
+        db: DbSessionFactory,
+        _data: _Data,
+        httpx_client: httpx.AsyncClient,
+    ) -> None:
+        project_session, traces, spans = _data.project_sessions[0], _data.traces, _data.spans
+        async with db() as session:
+            for trace, span in zip(traces, spans):
+                await session.execute(
+                    update(models.Trace)
+                    .filter_by(id=trace.id)
+                    .values(
+                        root_span_rowid=span.id,
+                        input_value_first_101_chars=span.attributes["input"]["value"],
+                        input_mime_type="application/json",
+                        output_value_first_101_chars="truncated",
+                    )
+                )
+            await session.execute(
+                update(models.ProjectSession)
+                .filter_by(id=project_session.id)
+                .values(
+                    first_input_trace_rowid=traces[0].id,
+                    last_output_trace_rowid=traces[-1].id,
+                )
+            )
+        field = "firstInput{value truncatedValue mimeType}"
+        assert await self._node(field, project_session, httpx_client) == {
+            "value": "123",
+            "truncatedValue": "123",
+            "mimeType": "json",
+        }
+        field = "lastOutput{value truncatedValue mimeType}"
+        assert await self._node(field, project_session, httpx_client) == {
+            "value": "4321",
+            "truncatedValue": "truncated",
+            "mimeType": "text",
+        }
+
     async def test_traces(
         self,
         _data: _Data,
@@ -171,3 +213,31 @@ class TestProjectSession:
         project_sessions = _data.project_sessions
         field = "traceLatencyMsQuantile(probability: 0.5)"
         assert await self._node(field, project_sessions[0], httpx_client) == 10000.0
+
+    async def test_trace_latency_ms_quantile_from_sketch(
+        self,
+        db: DbSessionFactory,
+        _data: _Data,
+        httpx_client: httpx.AsyncClient,
+    ) -> None:
+        project_session = _data.project_sessions[0]
+        field = "traceLatencyMsQuantile(probability: 0.5)"
+        exact_field = "traceLatencyMsQuantile(probability: 0.5, exact: true)"
+        async with db() as session:
+            await session.execute(
+                update(models.ProjectSession)
+                .filter_by(id=project_session.id)
+                .values(trace_latency_ms_sketch=LatencySketch.from_values([20000.0, 20000.0]))
+            )
+        assert await self._node(field, project_session, httpx_client) == pytest.approx(
+            20000.0, rel=0.01
+        )
+        assert await self._node(exact_field, project_session, httpx_client) == 10000.0
+        async with db() as session:
+            await session.execute(
+                update(models.ProjectSession)
+                .filter_by(id=project_session.id)
+                .values(trace_latency_ms_sketch=LatencySketch.from_values([20000.0] * 3))
+            )
+        # a sketch that does not account for every trace of the session is not used
+        assert await self._node(field, project_session, httpx_client) == 10000.0
@@ -8,11 +8,15 @@ from typing import Any, Mapping, Optional
 import pytest
 from faker import Faker
 from openinference.semconv.trace import OpenInferenceMimeTypeValues, OpenInferenceSpanKindValues
-from sqlalchemy import insert
+from sqlalchemy import event, insert
 from strawberry.relay import GlobalID
 from typing_extensions import TypeAlias
 
 from phoenix.db import models
+from phoenix.server.api.helpers.dataset_helpers import (
+    get_dataset_example_input,
+    get_dataset_example_output,
+)
 from phoenix.server.api.types.node import from_global_id_with_expected_type
 from phoenix.server.api.types.Project import Project
 from phoenix.server.api.types.Span import Span
@@ -112,6 +116,179 @@ async def test_querying_spans_not_contained_in_datasets(
     assert actual_contained_in_dataset is False
 
 
+async def test_attribute_fields_match_those_computed_from_the_entire_attributes(
+    db: DbSessionFactory,
+    gql_client: AsyncGraphQLClient,
+) -> None:
+    attributes = {
+        "input": {"value": '{"question": "why?"}', "mime_type": "application/json"},
+        "output": {"value": "because", "mime_type": "text/plain"},
+        "llm": {
+            "provider": "openai",
+            "model_name": "gpt-4o",
+            "invocation_parameters": json.dumps({"temperature": 0.5, "seed": 42}),
+            "input_messages": [
+                {"message": {"role": "user", "content": fake.paragraph()}} for _ in range(3)
+            ],
+            "output_messages": [{"message": {"role": "assistant", "content": "because"}}],
+            "prompt_template": {"variables": {"question": "why?"}},
+            "tools": [{"tool": {"json_schema": json.dumps({"type": "function"})}}],
+        },
+        "metadata": {"padding": fake.paragraph()},
+    }
+    async with db() as session:
+        project_rowid = await session.scalar(
+            insert(models.Project).values(name="project-name").returning(models.Project.id)
+        )
+        trace_rowid = await session.scalar(
+            insert(models.Trace)
+            .values(
+                trace_id=token_hex(16),
+                project_rowid=project_rowid,
+                start_time=datetime.now(timezone.utc),
+                end_time=datetime.now(timezone.utc),
+            )
+            .returning(models.Trace.id)
+        )
+        span = models.Span(
+            trace_rowid=trace_rowid,
+            span_id=token_hex(8),
+            name="llm span",
+            span_kind="LLM",
+            start_time=datetime.now(timezone.utc),
+            end_time=datetime.now(timezone.utc),
+            attributes=attributes,
+            events=[],
+            status_code="OK",
+            status_message="",
+            cumulative_error_count=0,
+            cumulative_llm_token_count_prompt=0,
+            cumulative_llm_token_count_completion=0,
+        )
+        session.add(span)
+        await session.flush()
+    query = """
+      query ($spanId: GlobalID!) {
+        span: node(id: $spanId) {
+          ... on Span {
+            asExampleRevision {
+              input
+              output
+            }
+            invocationParameters {
+              ... on InvocationParameterBase {
+                invocationName
+              }
+            }
+          }
+        }
+      }
+    """
+    response = await gql_client.execute(
+        query=query,
+        variables={"spanId": str(GlobalID(Span.__name__, str(span.id)))},
+    )
+    assert not response.errors
+    assert (data := response.data) is not None
+    assert data["span"]["asExampleRevision"] == {
+        "input": get_dataset_example_input(span),
+        "output": get_dataset_example_output(span),
+    }
+    assert sorted(p["invocationName"] for p in data["span"]["invocationParameters"]) == [
+        "seed",
+        "temperature",
+    ]
+
+
+async def test_descendants_prefetches_the_fields_of_the_page_only(
+    request: pytest.FixtureRequest,
+    dialect: str,
+    db: DbSessionFactory,
+    gql_client: AsyncGraphQLClient,
+) -> None:
+    start_time = datetime.now(timezone.utc)
+    async with db() as session:
+        project = models.Project(name="project")
+        session.add(project)
+        await session.flush()
+        trace = models.Trace(
+            project_rowid=project.id,
+            trace_id=token_hex(16),
+            start_time=start_time,
+            end_time=start_time,
+        )
+        session.add(trace)
+        await session.flush()
+        spans = [
+            models.Span(
+                trace_rowid=trace.id,
+                span_id=span_id,
+                parent_id=None if i == 0 else "root",
+                name=f"span-{i}",
+                span_kind="CHAIN" if i == 0 else "LLM",
+                start_time=start_time,
+                end_time=start_time,
+                attributes={},
+                events=[],
+                status_code="OK",
+                status_message="",
+                cumulative_error_count=0,
+                cumulative_llm_token_count_prompt=0,
+                cumulative_llm_token_count_completion=0,
+            )
+            for i, span_id in enumerate(["root", *(token_hex(8) for _ in range(5))])
+        ]
+        session.add_all(spans)
+        await session.flush()
+    names = {span.id: span.name for span in spans}
+    queries: list[tuple[str, Any]] = []
+
+    def record_query(*args: Any) -> None:
+        _, _, statement, parameters, *_ = args
+        queries.append((statement, parameters))
+
+    engine = request.getfixturevalue(f"{dialect}_engine").sync_engine
+    event.listen(engine, "before_cursor_execute", record_query)
+    try:
+        response = await gql_client.execute(
+            query="""
+              query ($id: GlobalID!) {
+                node(id: $id) {
+                  ... on Span {
+                    descendants(first: 2) {
+                      edges {
+                        node {
+                          id
+                          name
+                          spanKind
+                        }
+                      }
+                    }
+                  }
+                }
+              }
+            """,
+            variables={"id": str(GlobalID(Span.__name__, str(spans[0].id)))},
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", record_query)
+    assert not response.errors
+    assert (data := response.data) is not None
+    nodes = [edge["node"] for edge in data["node"]["descendants"]["edges"]]
+    rowids = [
+        from_global_id_with_expected_type(GlobalID.from_id(node["id"]), Span.__name__)
+        for node in nodes
+    ]
+    assert len(rowids) == 2
+    assert [node["name"] for node in nodes] == [names[rowid] for rowid in rowids]
+    assert [node["spanKind"] for node in nodes] == ["llm", "llm"]
+    # the span, its descendants, and the fields of the spans of the page only in one query
+    assert len(queries) == 3
+    prefetch, parameters = queries[-1]
+    assert "spans.name" in prefetch and "spans.span_kind" in prefetch
+    assert sorted(parameters) == sorted(rowids)
+
+
 async def test_span_fields(
     gql_client: AsyncGraphQLClient,
     _span_data: tuple[models.Project, Mapping[int, models.Trace], Mapping[int, models.Span]],
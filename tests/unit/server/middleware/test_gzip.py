@@ -194,6 +194,31 @@ def test_remove_accept_encoding(
             ],
             id="multiple_accept_headers",
         ),
+        pytest.param(
+            {
+                "type": "http",
+                "headers": [
+                    (b"accept", b"application/x-pandas-arrow; compression=zstd"),
+                    (b"accept-encoding", b"gzip"),
+                ],
+            },
+            [(b"accept", b"application/x-pandas-arrow; compression=zstd")],
+            id="compressed_arrow_http_request",
+        ),
+        pytest.param(
+            {
+                "type": "http",
+                "headers": [
+                    (b"accept", b"application/x-pandas-arrow"),
+                    (b"accept-encoding", b"gzip"),
+                ],
+            },
+            [
+                (b"accept", b"application/x-pandas-arrow"),
+                (b"accept-encoding", b"gzip"),
+            ],
+            id="arrow_http_request",
+        ),
         # Non-HTTP requests
         pytest.param(
             {
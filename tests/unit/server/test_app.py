@@ -0,0 +1,155 @@
+import asyncio
+import json
+from pathlib import Path
+from typing import Optional
+from unittest.mock import patch
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.responses import PlainTextResponse
+from starlette.routing import Mount, Route
+from starlette.types import Message, Receive, Scope, Send
+
+from phoenix.server.app import (
+    AppConfig,
+    HeadersMiddleware,
+    RequestOriginHostnameValidator,
+    Static,
+    templates,
+)
+from phoenix.utilities.client import PHOENIX_SERVER_VERSION_HEADER
+
+
+def _app(*middlewares: Middleware) -> Starlette:
+    return Starlette(
+        routes=[Route("/", lambda _: PlainTextResponse("ok"))],
+        middleware=middlewares,
+    )
+
+
+class TestHeadersMiddleware:
+    async def test_headers_are_added(self) -> None:
+        transport = httpx.ASGITransport(_app(Middleware(HeadersMiddleware)))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/")
+        assert response.text == "ok"
+        assert response.headers["x-colab-notebook-cache-control"] == "no-cache"
+        assert response.headers[PHOENIX_SERVER_VERSION_HEADER]
+
+    async def test_streaming_response_is_not_buffered(self) -> None:
+        sent: list[Message] = []
+        first_chunk_sent = asyncio.Event()
+
+        async def app(scope: Scope, receive: Receive, send: Send) -> None:
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"a", "more_body": True})
+            # the middleware must pass the first chunk on before the response finishes
+            await asyncio.wait_for(first_chunk_sent.wait(), timeout=1)
+            await send({"type": "http.response.body", "body": b"b"})
+
+        async def send(message: Message) -> None:
+            sent.append(message)
+            if message.get("body") == b"a":
+                first_chunk_sent.set()
+
+        async def receive() -> Message:
+            return {"type": "http.request", "body": b""}
+
+        scope: Scope = {"type": "http", "method": "GET", "path": "/", "headers": []}
+        await HeadersMiddleware(app)(scope, receive, send)
+        assert [message.get("body") for message in sent] == [None, b"a", b"b"]
+        assert (b"x-colab-notebook-cache-control", b"no-cache") in sent[0]["headers"]
+
+
+class TestRequestOriginHostnameValidator:
+    async def test_untrusted_origin_is_rejected(self) -> None:
+        app = _app(Middleware(RequestOriginHostnameValidator, trusted_hostnames=["trusted.com"]))
+        transport = httpx.ASGITransport(app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            trusted = await client.get("/", headers={"origin": "https://trusted.com"})
+            untrusted = await client.get("/", headers={"referer": "https://untrusted.com/x"})
+        assert trusted.status_code == 200
+        assert untrusted.status_code == 401
+        assert untrusted.text == "untrusted referer"
+
+
+class TestStatic:
+    @pytest.fixture
+    def app(self, tmp_path: Path) -> Starlette:
+        (tmp_path / "assets").mkdir()
+        (tmp_path / "assets" / "index-AbCd12_-.js").write_text("console.log(1);" * 100)
+        (tmp_path / "assets" / "index-AbCd12_-.js.br").write_bytes(b"br")
+        (tmp_path / "assets" / "index-AbCd12_-.js.gz").write_bytes(b"gz")
+        (tmp_path / "modernizr.js").write_text("modernizr")
+        (tmp_path / ".vite").mkdir()
+        manifest = {"index.tsx": {"file": "assets/index-AbCd12_-.js"}}
+        (tmp_path / ".vite" / "manifest.json").write_text(json.dumps(manifest))
+        app_config = AppConfig(
+            has_inferences=False,
+            has_corpus=False,
+            min_dist=0.0,
+            n_neighbors=15,
+            n_samples=500,
+            is_development=False,
+            web_manifest_path=tmp_path / ".vite" / "manifest.json",
+            authentication_enabled=False,
+            oauth2_idps=[],
+        )
+        return Starlette(routes=[Mount("/", app=Static(directory=tmp_path, app_config=app_config))])
+
+    @pytest.mark.parametrize(
+        "accept_encoding, content_encoding, content",
+        [
+            pytest.param("gzip, deflate, br", "br", b"br", id="br"),
+            pytest.param("gzip, br;q=0", "gzip", b"gz", id="gzip"),
+            pytest.param("identity", None, b"console.log(1);" * 100, id="identity"),
+        ],
+    )
+    async def test_precompressed_assets_are_served(
+        self,
+        app: Starlette,
+        accept_encoding: str,
+        content_encoding: Optional[str],
+        content: bytes,
+    ) -> None:
+        transport = httpx.ASGITransport(app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            async with client.stream(
+                "GET", "/assets/index-AbCd12_-.js", headers={"accept-encoding": accept_encoding}
+            ) as response:
+                raw = b"".join([chunk async for chunk in response.aiter_raw()])
+        assert response.status_code == 200
+        assert response.headers.get("content-encoding") == content_encoding
+        assert response.headers["content-type"].startswith("text/javascript")
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+        assert raw == content
+
+    async def test_only_hashed_assets_are_immutable(self, app: Starlette) -> None:
+        transport = httpx.ASGITransport(app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/modernizr.js")
+            not_modified = await client.get(
+                "/modernizr.js", headers={"if-none-match": response.headers["etag"]}
+            )
+        assert response.status_code == 200
+        assert "cache-control" not in response.headers
+        assert not_modified.status_code == 304
+
+    async def test_index_is_rendered_once(self, app: Starlette) -> None:
+        transport = httpx.ASGITransport(app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            with patch.object(templates, "get_template", wraps=templates.get_template) as spy:
+                first = await client.get("/projects")
+                second = await client.get("/datasets")
+                not_modified = await client.get(
+                    "/projects", headers={"if-none-match": first.headers["etag"]}
+                )
+        assert spy.call_count == 1
+        assert first.status_code == second.status_code == 200
+        assert first.content == second.content
+        assert b"/assets/index-AbCd12_-.js" in first.content
+        assert first.headers["cache-control"] == "no-cache"
+        assert not_modified.status_code == 304
@@ -0,0 +1,126 @@
+from datetime import datetime, timedelta, timezone
+from secrets import token_bytes, token_hex
+
+import sqlalchemy as sa
+
+from phoenix.db import models
+from phoenix.db.enums import UserRole
+from phoenix.db.facilitator import _ensure_enums
+from phoenix.server.jwt_store import JwtStore
+from phoenix.server.types import ApiKeyAttributes, ApiKeyClaims, DbSessionFactory, UserId
+
+
+async def _sync(store: JwtStore) -> None:
+    for s in store._stores:
+        await s._update()  # type: ignore[attr-defined]
+
+
+async def _insert_user(db: DbSessionFactory, role: UserRole) -> int:
+    async with db() as session:
+        user = models.User(
+            email=f"{token_hex(4)}@example.com",
+            username=token_hex(4),
+            user_role_id=await session.scalar(
+                sa.select(models.UserRole.id).filter_by(name=role.value)
+            ),
+            reset_password=False,
+            password_hash=token_bytes(32),
+            password_salt=token_bytes(32),
+        )
+        session.add(user)
+        await session.flush()
+        return user.id
+
+
+def _api_key_claims(user_id: int, expiration_time: datetime) -> ApiKeyClaims:
+    return ApiKeyClaims(
+        subject=UserId(user_id),
+        issued_at=datetime.now(timezone.utc),
+        expiration_time=expiration_time,
+        attributes=ApiKeyAttributes(user_role=UserRole.MEMBER, name=token_hex(4)),
+    )
+
+
+class TestJwtStore:
+    async def test_changes_made_by_another_process_are_synchronized(
+        self,
+        db: DbSessionFactory,
+    ) -> None:
+        await _ensure_enums(db)
+        user_id = await _insert_user(db, UserRole.MEMBER)
+        this, other = JwtStore(db, token_hex(16)), JwtStore(db, token_hex(16))
+        await _sync(this)
+        expiration_time = datetime.now(timezone.utc) + timedelta(days=1)
+        tokens = [await other.create_api_key(_api_key_claims(user_id, expiration_time))]
+        tokens.append(await other.create_api_key(_api_key_claims(user_id, expiration_time)))
+        await _sync(this)
+        loaded = this._api_key_store._claims
+        assert set(loaded) == {token_id for _, token_id in tokens}
+
+        # the user's role is changed
+        async with db() as session:
+            await session.execute(
+                sa.update(models.User)
+                .where(models.User.id == user_id)
+                .values(
+                    user_role_id=sa.select(models.UserRole.id)
+                    .filter_by(name=UserRole.ADMIN.value)
+                    .scalar_subquery()
+                )
+            )
+        await _sync(this)
+        for _, token_id in tokens:
+            claims = loaded.get(token_id)
+            assert claims and claims.attributes and claims.attributes.user_role is UserRole.ADMIN
+
+        # a token is revoked
+        await other.revoke(tokens[0][1])
+        await _sync(this)
+        assert set(loaded) == {tokens[1][1]}
+        assert await this._api_key_store.get(tokens[0][1]) is None
+
+    async def test_tokens_with_ids_below_the_high_water_mark_are_synchronized(
+        self,
+        db: DbSessionFactory,
+    ) -> None:
+        await _ensure_enums(db)
+        user_id = await _insert_user(db, UserRole.MEMBER)
+        this, other = JwtStore(db, token_hex(16)), JwtStore(db, token_hex(16))
+        expiration_time = datetime.now(timezone.utc) + timedelta(days=1)
+        ids = [
+            int((await this.create_api_key(_api_key_claims(user_id, expiration_time)))[1])
+            for _ in range(6)
+        ]
+        await this.revoke(*(this._api_key_store._token_id(id_) for id_ in (ids[1], ids[4])))
+        await _sync(this)
+        # Another process deletes the first and last tokens, and commits two tokens whose IDs
+        # are below the high-water mark, e.g. out of order of their IDs, so that the count and
+        # the sum of the IDs are unchanged.
+        await other.revoke(*(this._api_key_store._token_id(id_) for id_ in (ids[0], ids[5])))
+        new_ids = [
+            int((await other.create_api_key(_api_key_claims(user_id, expiration_time)))[1])
+            for _ in range(2)
+        ]
+        async with db() as session:
+            for new_id, id_ in zip(new_ids, (ids[1], ids[4])):
+                await session.execute(
+                    sa.update(models.ApiKey).where(models.ApiKey.id == new_id).values(id=id_)
+                )
+        await _sync(this)
+        assert {int(token_id) for token_id in this._api_key_store._claims} == set(ids[1:5])
+
+    async def test_expired_tokens_are_deleted(
+        self,
+        db: DbSessionFactory,
+    ) -> None:
+        await _ensure_enums(db)
+        user_id = await _insert_user(db, UserRole.MEMBER)
+        store = JwtStore(db, token_hex(16))
+        now = datetime.now(timezone.utc)
+        _, expired = await store.create_api_key(_api_key_claims(user_id, now - timedelta(days=1)))
+        _, unexpired = await store.create_api_key(_api_key_claims(user_id, now + timedelta(days=1)))
+        await _sync(store)
+        async with db() as session:
+            remaining = set(await session.scalars(sa.select(models.ApiKey.id)))
+        assert remaining == {int(unexpired)}
+        assert set(store._api_key_store._claims) == {unexpired}
@@ -0,0 +1,30 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+from phoenix.server.project_change_notifier import ProjectChangeNotifier
+
+
+async def _next(subscription: AsyncIterator[frozenset[int]]) -> frozenset[int]:
+    return await asyncio.wait_for(subscription.__anext__(), 1)
+
+
+async def test_changes_are_coalesced_and_fanned_out() -> None:
+    notifier = ProjectChangeNotifier(sleep_seconds=0.01)
+    everything = notifier.subscribe()
+    some = notifier.subscribe([2])
+    lagging = notifier.subscribe([1, 3])
+    async with notifier:
+        cancelled = asyncio.create_task(_next(notifier.subscribe()))
+        listening = [asyncio.create_task(_next(s)) for s in (everything, some, lagging)]
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        for project_id in (1, 2, 2, 1):
+            notifier.put(project_id)
+        assert await asyncio.gather(*listening) == [{1, 2}, {2}, {1}]
+        notifier.put(3)
+        assert await _next(everything) == {3}
+        notifier.put(1)
+        assert await _next(everything) == {1}
+        # the subscriber that was not listening merges the notifications that it missed
+        assert await _next(lagging) == {1, 3}
+        assert cancelled.cancelled()
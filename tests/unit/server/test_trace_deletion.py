@@ -0,0 +1,251 @@
+from asyncio import Lock, sleep
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from secrets import token_hex
+from typing import Optional
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from phoenix.db import models
+from phoenix.db.insertion.span import insert_span
+from phoenix.db.types.latency_sketch import LatencySketch
+from phoenix.server.dml_event import DmlEvent, ProjectDeleteEvent, SpanDeleteEvent
+from phoenix.server.trace_deletion import TraceDeleter
+from phoenix.server.types import DbSessionFactory
+from phoenix.trace.schemas import Span, SpanContext, SpanKind, SpanStatusCode
+
+
+class _Events:
+    def __init__(self) -> None:
+        self.items: list[DmlEvent] = []
+
+    def put(self, item: DmlEvent) -> None:
+        self.items.append(item)
+
+
+def _serialized(db: DbSessionFactory) -> DbSessionFactory:
+    """
+    Serializes the sessions, as the server does on SQLite, for the tests that poll the database
+    while the deleter runs, since the sessions of the test engine share a single connection.
+    """
+    lock = Lock()
+
+    @asynccontextmanager
+    async def factory() -> AsyncIterator[AsyncSession]:
+        async with lock, db() as session:
+            yield session
+
+    return DbSessionFactory(db=factory, dialect=db.dialect.value)
+
+
+async def _insert_project(
+    db: DbSessionFactory,
+    num_traces: int,
+    base_time: datetime,
+) -> tuple[int, list[int]]:
+    async with db() as session:
+        project = models.Project(name=token_hex(8))
+        session.add(project)
+        await session.flush()
+        project_session = models.ProjectSession(
+            session_id=token_hex(8),
+            project_id=project.id,
+            start_time=base_time,
+            end_time=base_time + timedelta(seconds=num_traces),
+        )
+        session.add(project_session)
+        await session.flush()
+        traces = [
+            models.Trace(
+                project_rowid=project.id,
+                trace_id=token_hex(16),
+                start_time=base_time + timedelta(seconds=i),
+                end_time=base_time + timedelta(seconds=i + 1),
+                # only the oldest two traces belong to the session
+                project_session_rowid=project_session.id if i < 2 else None,
+            )
+            for i in range(num_traces)
+        ]
+        session.add_all(traces)
+        await session.flush()
+        return project.id, [trace.id for trace in traces]
+
+
+class TestTraceDeleter:
+    async def test_delete_in_batches(self, db: DbSessionFactory) -> None:
+        base_time = datetime.now(timezone.utc)
+        project_rowid, trace_rowids = await _insert_project(db, 7, base_time)
+        events = _Events()
+        deleter = TraceDeleter(db, events, batch_size=2)
+        async with deleter:
+            num_traces_deleted = await deleter.delete(
+                project_rowid, start_time_before=base_time + timedelta(seconds=5)
+            )
+        assert num_traces_deleted == 5
+        async with db() as session:
+            remaining = list(
+                await session.scalars(
+                    sa.select(models.Trace.id)
+                    .filter_by(project_rowid=project_rowid)
+                    .order_by(models.Trace.id)
+                )
+            )
+            num_sessions = await session.scalar(sa.select(sa.func.count(models.ProjectSession.id)))
+            num_jobs = await session.scalar(sa.select(sa.func.count(models.TraceDeletionJob.id)))
+        assert remaining == trace_rowids[5:]
+        assert num_sessions == 0, "the session is orphaned once its traces are deleted"
+        assert num_jobs == 0
+        assert events.items == [SpanDeleteEvent((project_rowid,))] * 3
+
+    async def test_sessions_are_updated_for_traces_left(self, db: DbSessionFactory) -> None:
+        base_time = datetime.now(timezone.utc)
+        for i in range(3):
+            async with db() as session:
+                await insert_span(
+                    session,
+                    Span(
+                        name="root",
+                        context=SpanContext(trace_id=token_hex(16), span_id=token_hex(8)),
+                        span_kind=SpanKind.LLM,
+                        parent_id=None,
+                        start_time=base_time + timedelta(seconds=i),
+                        end_time=base_time + timedelta(seconds=2 * i + 1),
+                        status_code=SpanStatusCode.OK,
+                        status_message="",
+                        attributes={
+                            "session": {"id": "abc"},
+                            "input": {"value": str(i)},
+                            "output": {"value": str(i)},
+                        },
+                        events=[],
+                        conversation=None,
+                    ),
+                    "abc",
+                )
+        async with db() as session:
+            project_rowid = await session.scalar(sa.select(models.Project.id).filter_by(name="abc"))
+            trace_rowids = list(
+                await session.scalars(sa.select(models.Trace.id).order_by(models.Trace.start_time))
+            )
+        assert project_rowid is not None
+        async with (deleter := TraceDeleter(db, _Events())):
+            # the first trace, holding the first input of the session
+            await deleter.delete(project_rowid, start_time_before=base_time + timedelta(seconds=1))
+        async with db() as session:
+            project_session = await session.scalar(sa.select(models.ProjectSession))
+        assert project_session is not None
+        assert project_session.first_input_trace_rowid == trace_rowids[1]
+        assert project_session.last_output_trace_rowid == trace_rowids[2]
+        # the latencies of the traces left are 2000 and 3000 ms
+        sketch = LatencySketch.from_values([2000.0, 3000.0])
+        assert project_session.trace_latency_ms_sketch == sketch
+        assert project_session.trace_latency_ms_p50 == sketch.quantile(0.5)
+        assert project_session.trace_latency_ms_p99 == sketch.quantile(0.99)
+
+    async def test_nothing_to_delete(self, db: DbSessionFactory) -> None:
+        base_time = datetime.now(timezone.utc)
+        project_rowid, trace_rowids = await _insert_project(db, 3, base_time)
+        async with (deleter := TraceDeleter(db, _Events())):
+            assert await deleter.delete(project_rowid, start_time_before=base_time) == 0
+        async with db() as session:
+            num_traces = await session.scalar(sa.select(sa.func.count(models.Trace.id)))
+        assert num_traces == len(trace_rowids)
+
+    async def test_delete_project(self, db: DbSessionFactory) -> None:
+        project_rowid, _ = await _insert_project(db, 3, datetime.now(timezone.utc))
+        events = _Events()
+        async with (deleter := TraceDeleter(db, events, batch_size=2)):
+            assert await deleter.delete(project_rowid, delete_project=True) == 3
+        async with db() as session:
+            assert await session.get(models.Project, project_rowid) is None
+            num_traces = await session.scalar(sa.select(sa.func.count(models.Trace.id)))
+        assert num_traces == 0
+        assert events.items[-1] == ProjectDeleteEvent((project_rowid,))
+
+    async def test_resume_leftover_job(self, db: DbSessionFactory) -> None:
+        db = _serialized(db)
+        project_rowid, trace_rowids = await _insert_project(db, 4, datetime.now(timezone.utc))
+        async with db() as session:
+            # a job interrupted by a restart after it had deleted the first trace
+            await session.execute(sa.delete(models.Trace).where(models.Trace.id == trace_rowids[0]))
+            session.add(
+                models.TraceDeletionJob(
+                    project_id=project_rowid,
+                    max_trace_rowid=trace_rowids[2],
+                    start_time_before=None,
+                    delete_project=False,
+                    num_traces_deleted=1,
+                )
+            )
+        async with TraceDeleter(db, _Events(), batch_size=1):
+            for _ in range(100):
+                async with db() as session:
+                    if not await session.scalar(
+                        sa.select(sa.func.count(models.TraceDeletionJob.id))
+                    ):
+                        break
+                await sleep(0.01)
+        async with db() as session:
+            remaining = list(
+                await session.scalars(sa.select(models.Trace.id).order_by(models.Trace.id))
+            )
+        assert remaining == trace_rowids[3:], "traces added after the job was created are kept"
+
+    async def test_failed_job_is_retried(self, db: DbSessionFactory) -> None:
+        db = _serialized(db)
+        project_rowid, _ = await _insert_project(db, 3, datetime.now(timezone.utc))
+        deleter = TraceDeleter(db, _Events(), retry_delay_seconds=0.01)
+        num_attempts = 0
+        run_job = deleter._run_job
+
+        async def fail_twice(job_id: int, *, pausable: bool = False) -> Optional[int]:
+            nonlocal num_attempts
+            num_attempts += 1
+            if num_attempts <= 2:
+                raise RuntimeError("database is locked")
+            return await run_job(job_id, pausable=pausable)
+
+        deleter._run_job = fail_twice  # type: ignore[method-assign]
+        async with deleter:
+            # retried without another job being enqueued to wake the deleter up
+            await deleter.enqueue(project_rowid)
+            for _ in range(100):
+                async with db() as session:
+                    if not await session.scalar(
+                        sa.select(sa.func.count(models.TraceDeletionJob.id))
+                    ):
+                        break
+                await sleep(0.01)
+        assert num_attempts == 3
+        async with db() as session:
+            num_traces = await session.scalar(sa.select(sa.func.count(models.Trace.id)))
+        assert num_traces == 0
+
+    async def test_awaited_job_runs_before_background_jobs(self, db: DbSessionFactory) -> None:
+        db = _serialized(db)
+        base_time = datetime.now(timezone.utc)
+        background_project_rowid, _ = await _insert_project(db, 10, base_time)
+        project_rowid, _ = await _insert_project(db, 3, base_time)
+        async with (deleter := TraceDeleter(db, _Events(), batch_size=1, max_traces_per_second=20)):
+            await deleter.enqueue(background_project_rowid)
+            await sleep(0.05)
+            assert await deleter.delete(project_rowid) == 3
+            async with db() as session:
+                num_traces_left = await session.scalar(
+                    sa.select(sa.func.count(models.Trace.id)).filter_by(
+                        project_rowid=background_project_rowid
+                    )
+                )
+            assert num_traces_left, "the background job is paused, not run to completion first"
+            for _ in range(100):
+                async with db() as session:
+                    if not await session.scalar(
+                        sa.select(sa.func.count(models.TraceDeletionJob.id))
+                    ):
+                        break
+                await sleep(0.05)
+        async with db() as session:
+            num_traces = await session.scalar(sa.select(sa.func.count(models.Trace.id)))
+        assert num_traces == 0, "the background job is resumed afterwards"
@@ -7,6 +7,7 @@ from starlette.datastructures import URL
 
 from phoenix.config import (
     ENV_PHOENIX_ADMINS,
+    PlaygroundProviderConfig,
     get_env_admins,
     get_env_phoenix_admin_secret,
     get_env_postgres_connection_str,
@@ -509,3 +510,68 @@ class TestGetEnvTlsEnabled:
 
         # Test gRPC TLS enablement
         assert get_env_tls_enabled_for_grpc() == expected_grpc
+
+
+class TestPlaygroundProviderConfig:
+    @pytest.mark.parametrize(
+        "env_vars, expected_max_concurrency, expected_max_requests_per_second",
+        [
+            pytest.param({}, 3, 3.0, id="defaults"),
+            pytest.param(
+                {
+                    "PHOENIX_PLAYGROUND_MAX_CONCURRENCY": "20",
+                    "PHOENIX_PLAYGROUND_MAX_REQUESTS_PER_SECOND": "50",
+                },
+                20,
+                50.0,
+                id="global_settings",
+            ),
+            pytest.param(
+                {
+                    "PHOENIX_PLAYGROUND_MAX_CONCURRENCY": "20",
+                    "PHOENIX_PLAYGROUND_MAX_REQUESTS_PER_SECOND": "50",
+                    "PHOENIX_PLAYGROUND_AZURE_OPENAI_MAX_CONCURRENCY": "5",
+                    "PHOENIX_PLAYGROUND_AZURE_OPENAI_MAX_REQUESTS_PER_SECOND": "2.5",
+                },
+                5,
+                2.5,
+                id="provider_overrides_global",
+            ),
+            pytest.param(
+                {
+                    "PHOENIX_PLAYGROUND_OPENAI_MAX_CONCURRENCY": "100",
+                },
+                3,
+                3.0,
+                id="other_provider_is_ignored",
+            ),
+        ],
+    )
+    def test_from_env(
+        self,
+        monkeypatch: MonkeyPatch,
+        env_vars: dict[str, str],
+        expected_max_concurrency: int,
+        expected_max_requests_per_second: float,
+    ) -> None:
+        for key, value in env_vars.items():
+            monkeypatch.setenv(key, value)
+        config = PlaygroundProviderConfig.from_env("AZURE_OPENAI")
+        assert config.max_concurrency == expected_max_concurrency
+        assert config.max_requests_per_second == expected_max_requests_per_second
+
+    @pytest.mark.parametrize(
+        "env_var, value",
+        [
+            pytest.param("PHOENIX_PLAYGROUND_MAX_CONCURRENCY", "0", id="zero_concurrency"),
+            pytest.param(
+                "PHOENIX_PLAYGROUND_AZURE_OPENAI_MAX_REQUESTS_PER_SECOND",
+                "-1",
+                id="negative_rate",
+            ),
+        ],
+    )
+    def test_invalid_values(self, monkeypatch: MonkeyPatch, env_var: str, value: str) -> None:
+        monkeypatch.setenv(env_var, value)
+        with pytest.raises(ValueError):
+            PlaygroundProviderConfig.from_env("AZURE_OPENAI")